@@ -0,0 +1,44 @@
+"""add appointment time exclusion
+
+Revision ID: 251f0141f4d8
+Revises: 8c3397f482dd
+Create Date: 2026-10-18 10:12:41.503112
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '251f0141f4d8'
+down_revision: Union[str, None] = '8c3397f482dd'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # btree_gist permite combinar `professional_id WITH =` e `tstzrange WITH &&` no mesmo índice GiST.
+    op.execute('CREATE EXTENSION IF NOT EXISTS btree_gist')
+
+    op.add_column('appointment', sa.Column('ends_at', sa.DateTime(timezone=True), nullable=True))
+    op.execute("UPDATE appointment SET ends_at = date_time + make_interval(mins => estimated_duration)")
+    op.alter_column('appointment', 'ends_at', nullable=False)
+
+    # Falha se já houver agendamentos sobrepostos; eles precisam ser resolvidos antes da migração.
+    op.execute(
+        """
+        ALTER TABLE appointment
+        ADD CONSTRAINT appointment_professional_time_excl
+        EXCLUDE USING gist (professional_id WITH =, tstzrange(date_time, ends_at, '[)') WITH &&)
+        WHERE (status <> 'CANCELED')
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('appointment_professional_time_excl', 'appointment')
+    op.drop_column('appointment', 'ends_at')
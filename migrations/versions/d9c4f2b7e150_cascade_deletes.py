@@ -0,0 +1,40 @@
+"""cascade deletes
+
+Revision ID: d9c4f2b7e150
+Revises: b5e2d8a41c96
+Create Date: 2026-10-18 23:04:17.281940
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd9c4f2b7e150'
+down_revision: Union[str, None] = 'b5e2d8a41c96'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Chaves estrangeiras que passam a remover os dependentes junto com o usuário ou a unidade.
+FOREIGN_KEYS = (
+    ('appointment', 'patient_id', 'user'),
+    ('appointment', 'professional_id', 'user'),
+    ('appointment_series', 'patient_id', 'user'),
+    ('appointment_series', 'professional_id', 'user'),
+    ('supply', 'unit_id', 'unit'),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, column, referent in FOREIGN_KEYS:
+        op.drop_constraint(f'{table}_{column}_fkey', table, type_='foreignkey')
+        op.create_foreign_key(f'{table}_{column}_fkey', table, referent, [column], ['id'], ondelete='CASCADE')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column, referent in FOREIGN_KEYS:
+        op.drop_constraint(f'{table}_{column}_fkey', table, type_='foreignkey')
+        op.create_foreign_key(f'{table}_{column}_fkey', table, referent, [column], ['id'])
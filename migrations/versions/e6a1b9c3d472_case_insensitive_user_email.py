@@ -0,0 +1,31 @@
+"""case insensitive user email
+
+Revision ID: e6a1b9c3d472
+Revises: d9c4f2b7e150
+Create Date: 2026-10-18 23:41:09.532817
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6a1b9c3d472'
+down_revision: Union[str, None] = 'd9c4f2b7e150'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Falha se já houver emails que só diferem nas maiúsculas; eles precisam ser resolvidos antes da migração.
+    op.create_index('ix_user_lower_email', 'user', [sa.text('lower(email)')], unique=True)
+    op.drop_constraint('user_email_key', 'user', type_='unique')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_unique_constraint('user_email_key', 'user', ['email'])
+    op.drop_index('ix_user_lower_email', table_name='user')
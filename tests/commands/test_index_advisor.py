@@ -0,0 +1,61 @@
+import pytest
+from sqlalchemy import Column, Engine, ForeignKey, Integer, MetaData, Table
+
+from vidaplus.commands.index_advisor import (
+    Finding,
+    Statement,
+    filtered_columns,
+    main,
+    missing_filter_indexes,
+    missing_foreign_key_indexes,
+)
+from vidaplus.models.config.base import Base
+
+
+def test_entities_have_no_unindexed_foreign_keys() -> None:
+    assert missing_foreign_key_indexes(Base.metadata) == []
+
+
+def test_unindexed_foreign_key_is_reported() -> None:
+    metadata = MetaData()
+    Table('parent', metadata, Column('id', Integer, primary_key=True))
+    Table('child', metadata, Column('id', Integer, primary_key=True), Column('parent_id', ForeignKey('parent.id')))
+
+    assert missing_foreign_key_indexes(metadata) == [
+        Finding('child', ('parent_id',), 'chave estrangeira para parent sem índice')
+    ]
+
+
+def test_filtered_columns_resolve_aliases() -> None:
+    query = (
+        'SELECT bed.id FROM bed LEFT OUTER JOIN unit AS unit_1 ON unit_1.id = bed.unit_id '
+        'WHERE bed.status = $1 AND unit_1.name ILIKE $2 AND "user".email = $3'
+    )
+
+    assert filtered_columns(query, ['bed', 'unit', 'user']) == {
+        'bed': {'status'},
+        'unit': {'id', 'name'},
+        'user': {'email'},
+    }
+
+
+def test_filters_without_index_are_ranked_by_total_time() -> None:
+    statements = [
+        Statement('SELECT * FROM supply WHERE supply.name = $1', 10, 5.0),
+        Statement('SELECT * FROM unit WHERE unit.address = $1', 3, 50.0),
+        Statement('SELECT * FROM supply WHERE supply.name = $1 AND supply.quantity < $2', 1, 1.0),
+        Statement('SELECT * FROM appointment WHERE appointment.professional_id = $1', 100, 500.0),
+    ]
+
+    findings = missing_filter_indexes(statements, Base.metadata)
+
+    assert [(finding.table, finding.columns) for finding in findings] == [
+        ('unit', ('address',)),
+        ('supply', ('name',)),
+        ('supply', ('name', 'quantity')),
+    ]
+
+
+def test_main_reports_nothing_for_current_schema(engine: Engine, capsys: pytest.CaptureFixture[str]) -> None:
+    assert main([]) == 0
+    assert capsys.readouterr().out == 'Nenhum índice faltando.\n'
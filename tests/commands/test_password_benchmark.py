@@ -0,0 +1,19 @@
+import pytest
+
+from vidaplus.commands.password_benchmark import HEADER, main
+
+
+def test_benchmark_reports_each_cost(capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv('PASSWORD_HASH_TARGET_MS', '1')
+
+    assert main(['--min-rounds', '4', '--max-rounds', '5', '--seconds', '0.01', '--workers', '1']) == 0
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[:2] == ['1 processo(s)', HEADER]
+    assert [int(line.split()[0]) for line in lines[2:4]] == [4, 5]  # noqa: PLR2004
+    assert lines[4].startswith('Custo calibrado para 1 ms: ')
+
+
+def test_benchmark_rejects_inverted_range() -> None:
+    with pytest.raises(SystemExit):
+        main(['--min-rounds', '6', '--max-rounds', '5'])
@@ -0,0 +1,21 @@
+import json
+
+import pytest
+
+from vidaplus.commands.serialization_benchmark import HEADER, after, before, main, make_users
+
+ROWS = 3
+
+
+def test_both_paths_produce_the_same_body() -> None:
+    users = make_users(ROWS)
+
+    assert json.loads(after(users)) == json.loads(before(users))
+
+
+def test_benchmark_reports_each_page_size(capsys: pytest.CaptureFixture[str]) -> None:
+    assert main(['--rows', '1', str(ROWS), '--repeat', '1']) == 0
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0] == HEADER
+    assert [int(line.split()[0]) for line in lines[1:]] == [1, ROWS]
@@ -0,0 +1,23 @@
+from pathlib import Path
+
+import pytest
+
+from vidaplus.commands.uuid_benchmark import GENERATORS, HEADER, main, measure
+
+ROWS = 5
+
+
+@pytest.mark.parametrize('version', GENERATORS)
+def test_measure_inserts_every_row(tmp_path: Path, version: str) -> None:
+    measurement = measure(version, ROWS, 2, tmp_path)
+
+    assert measurement.rows == ROWS
+    assert measurement.index_bytes > 0
+
+
+def test_benchmark_reports_both_versions(capsys: pytest.CaptureFixture[str]) -> None:
+    assert main(['--rows', str(ROWS)]) == 0
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0] == HEADER
+    assert [line.split()[0] for line in lines[1:]] == ['uuid4', 'uuid7']
@@ -14,15 +14,23 @@ from vidaplus.main.schemas.auth import ResponseAuthToken
 from vidaplus.main.schemas.bed import BedSchema
 from vidaplus.main.schemas.unit import UnitSchema
 from vidaplus.main.schemas.user import UserSchema
+from vidaplus.models.cache.appointment_interval_index import AppointmentIntervalIndex
+from vidaplus.models.cache.login_throttle import LoginThrottle, UnknownEmailCache
+from vidaplus.models.cache.revocation_list import RevocationList
+from vidaplus.models.cache.token_cache import TokenCache
 from vidaplus.models.config.base import Base
-from vidaplus.models.config.connection import DatabaseConnectionHandler
+from vidaplus.models.config.connection import DatabaseConnectionHandler, EngineRegistry
 from vidaplus.models.entities.appointment import Appointment
 from vidaplus.models.entities.bed import Bed
 from vidaplus.models.entities.unit import Unit
 from vidaplus.models.entities.user import User
 from vidaplus.run import app
+from vidaplus.services.password_hasher import hash_password
 from vidaplus.settings import Settings
 
+# Custo mínimo do bcrypt nos usuários das fixtures, que não precisam de um hash caro.
+PASSWORD_HASH_ROUNDS = 4
+
 
 @pytest.fixture
 def engine(monkeypatch: pytest.MonkeyPatch) -> Generator[Engine, None, None]:
@@ -30,7 +38,7 @@ def engine(monkeypatch: pytest.MonkeyPatch) -> Generator[Engine, None, None]:
 
     engine = create_engine(Settings().DATABASE_URL, connect_args={'check_same_thread': False}, poolclass=StaticPool)
 
-    monkeypatch.setattr(DatabaseConnectionHandler, '_DatabaseConnectionHandler__create_engine', lambda x: engine)
+    monkeypatch.setattr(EngineRegistry, 'get_engine', lambda: engine)
 
     Base.metadata.create_all(engine)
 
@@ -39,6 +47,45 @@ def engine(monkeypatch: pytest.MonkeyPatch) -> Generator[Engine, None, None]:
     Base.metadata.drop_all(engine)
 
 
+@pytest.fixture
+def appointment_index(monkeypatch: pytest.MonkeyPatch) -> Generator[AppointmentIntervalIndex, None, None]:
+    monkeypatch.setenv('APPOINTMENT_INDEX_ENABLED', 'true')
+    AppointmentIntervalIndex.reset()
+
+    index = AppointmentIntervalIndex.get_instance()
+    assert index is not None
+
+    yield index
+
+    AppointmentIntervalIndex.reset()
+
+
+@pytest.fixture
+def token_cache() -> Generator[TokenCache, None, None]:
+    TokenCache.reset()
+
+    cache = TokenCache.get_instance()
+    assert cache is not None
+
+    yield cache
+
+    TokenCache.reset()
+
+
+@pytest.fixture(autouse=True)
+def process_caches() -> Generator[None, None, None]:
+    # Os baldes, os emails desconhecidos e as revogações são por processo; cada teste começa com eles vazios.
+    LoginThrottle.reset()
+    UnknownEmailCache.reset()
+    RevocationList.reset()
+
+    yield
+
+    LoginThrottle.reset()
+    UnknownEmailCache.reset()
+    RevocationList.reset()
+
+
 @pytest.fixture
 def client(engine: Engine) -> Generator[TestClient, None, None]:
     with TestClient(app) as client:
@@ -50,7 +97,7 @@ def patient(engine: Engine) -> UserSchema:
     user = User(
         name='John Doe',
         email='johndoe@example.com',
-        password='ilovepotatos',
+        password=hash_password('ilovepotatos', PASSWORD_HASH_ROUNDS),
         role=Roles.PATIENT,
     )
 
@@ -67,7 +114,7 @@ def another_patient(engine: Engine) -> UserSchema:
     user = User(
         name='Jane Doe',
         email='janedoe@example.com',
-        password='ilovepotatos',
+        password=hash_password('ilovepotatos', PASSWORD_HASH_ROUNDS),
         role=Roles.PATIENT,
     )
 
@@ -84,7 +131,7 @@ def admin(engine: Engine) -> UserSchema:
     user = User(
         name='Admin',
         email='admin@example.com',
-        password='ilovepotatos',
+        password=hash_password('ilovepotatos', PASSWORD_HASH_ROUNDS),
         role=Roles.ADMIN,
     )
 
@@ -123,7 +170,7 @@ def healthcare_professional(engine: Engine) -> UserSchema:
     user = User(
         name='Healthcare Professional',
         email='healthcareprofessional@example.com',
-        password='iloveapples',
+        password=hash_password('iloveapples', PASSWORD_HASH_ROUNDS),
         role=Roles.HEALTHCARE_PROFESSIONAL,
     )
 
@@ -140,7 +187,7 @@ def another_healthcare_professional(engine: Engine) -> UserSchema:
     user = User(
         name='Another Healthcare Professional',
         email='anotherhealthcareprofessional@example.com',
-        password='iloveapples',
+        password=hash_password('iloveapples', PASSWORD_HASH_ROUNDS),
         role=Roles.HEALTHCARE_PROFESSIONAL,
     )
 
@@ -0,0 +1,34 @@
+from pathlib import Path
+from typing import Generator
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import Engine, NullPool, create_engine
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from vidaplus.models.config.base import Base
+from vidaplus.models.config.connection import AsyncEngineRegistry, EngineRegistry
+from vidaplus.run import create_app
+
+
+@pytest.fixture
+def engine(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Generator[Engine, None, None]:
+    database = tmp_path / 'vidaplus.db'
+
+    engine = create_engine(f'sqlite:///{database}', poolclass=NullPool)
+    async_engine = create_async_engine(f'sqlite+aiosqlite:///{database}', poolclass=NullPool)
+
+    monkeypatch.setattr(EngineRegistry, 'get_engine', lambda: engine)
+    monkeypatch.setattr(AsyncEngineRegistry, 'get_engine', lambda: async_engine)
+
+    Base.metadata.create_all(engine)
+
+    yield engine
+
+    Base.metadata.drop_all(engine)
+
+
+@pytest.fixture
+def client(engine: Engine) -> Generator[TestClient, None, None]:
+    with TestClient(create_app(asynchronous=True)) as client:
+        yield client
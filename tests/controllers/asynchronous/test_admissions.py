@@ -0,0 +1 @@
+from tests.controllers.test_admissions import *  # noqa: F403
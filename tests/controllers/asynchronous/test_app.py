@@ -0,0 +1,20 @@
+import asyncio
+
+from fastapi.routing import APIRoute
+
+from vidaplus.run import create_app
+
+
+def test_async_app_only_exposes_coroutine_routes() -> None:
+    routes = [route for route in create_app(asynchronous=True).routes if isinstance(route, APIRoute)]
+
+    assert routes
+    assert all(asyncio.iscoroutinefunction(route.endpoint) for route in routes)
+
+
+def test_async_and_sync_apps_expose_the_same_routes() -> None:
+    def signature(asynchronous: bool) -> set[tuple[str, frozenset[str]]]:
+        app = create_app(asynchronous=asynchronous)
+        return {(route.path, frozenset(route.methods)) for route in app.routes if isinstance(route, APIRoute)}
+
+    assert signature(asynchronous=True) == signature(asynchronous=False)
@@ -0,0 +1 @@
+from tests.controllers.test_appointments import *  # noqa: F403
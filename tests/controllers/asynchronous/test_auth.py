@@ -0,0 +1 @@
+from tests.controllers.test_auth import *  # noqa: F403
@@ -0,0 +1 @@
+from tests.controllers.test_beds import *  # noqa: F403
@@ -0,0 +1 @@
+from tests.controllers.test_healthcare_professionals import *  # noqa: F403
@@ -0,0 +1 @@
+from tests.controllers.test_patients import *  # noqa: F403
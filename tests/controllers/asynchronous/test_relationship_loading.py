@@ -0,0 +1 @@
+from tests.controllers.test_relationship_loading import *  # noqa: F403
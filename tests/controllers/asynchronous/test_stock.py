@@ -0,0 +1 @@
+from tests.controllers.test_stock import *  # noqa: F403
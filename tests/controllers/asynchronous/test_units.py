@@ -0,0 +1 @@
+from tests.controllers.test_units import *  # noqa: F403
@@ -4,6 +4,7 @@ from http import HTTPStatus
 from fastapi.testclient import TestClient
 
 from vidaplus.main.enums.bed_status import BedStatus
+from vidaplus.main.enums.bed_types import BedTypes
 from vidaplus.main.schemas.bed import BedSchema
 from vidaplus.main.schemas.user import UserSchema
 from vidaplus.models.config.connection import DatabaseConnectionHandler
@@ -13,7 +14,7 @@ from vidaplus.models.entities.bed import Bed
 def test_list_admissions_empty(client: TestClient) -> None:
     response = client.get('/api/internacoes/')
     assert response.status_code == HTTPStatus.OK
-    assert response.json() == []
+    assert response.json() == {'items': [], 'next_cursor': None}
 
 
 def test_create_admission_forbidden_for_non_admin(
@@ -69,7 +70,7 @@ def test_list_admissions_with_data(client: TestClient, admin_token: str, patient
     adm = client.post('/api/internacoes/', headers={'Authorization': f'Bearer {admin_token}'}, json=payload).json()
     response = client.get('/api/internacoes/')
     assert response.status_code == HTTPStatus.OK
-    ids = {a['id'] for a in response.json()}
+    ids = {a['id'] for a in response.json()['items']}
     assert adm['id'] in ids
 
 
@@ -155,3 +156,72 @@ def test_delete_admission_forbidden_for_non_admin(
     ).json()
     resp = client.delete(f'/api/internacoes/{adm["id"]}', headers={'Authorization': f'Bearer {token}'})
     assert resp.status_code == HTTPStatus.FORBIDDEN
+
+
+def bed_status(bed_id: int) -> BedStatus | None:
+    with DatabaseConnectionHandler() as db:
+        bed = db.session.get(Bed, bed_id)
+        return BedStatus(bed.status) if bed else None
+
+
+def test_create_admission_occupies_the_bed(
+    client: TestClient, admin_token: str, patient: UserSchema, bed: BedSchema
+) -> None:
+    headers = {'Authorization': f'Bearer {admin_token}'}
+    payload = {'patient_id': str(patient.id), 'bed_id': bed.id}
+
+    assert client.post('/api/internacoes/', headers=headers, json=payload).status_code == HTTPStatus.CREATED
+    assert bed_status(bed.id) == BedStatus.OCCUPIED
+
+    response = client.post('/api/internacoes/', headers=headers, json=payload)
+    assert response.status_code == HTTPStatus.CONFLICT
+    assert response.json()['detail'] == 'Leito não disponível'
+
+
+def test_allocate_admission_claims_an_available_bed(
+    client: TestClient, healthcare_professional_token: str, patient: UserSchema, bed: BedSchema
+) -> None:
+    payload = {'patient_id': str(patient.id), 'unit_id': bed.unit_id, 'type': bed.type}
+    response = client.post(
+        '/api/internacoes/alocacao', headers={'Authorization': f'Bearer {healthcare_professional_token}'}, json=payload
+    )
+
+    assert response.status_code == HTTPStatus.CREATED
+    assert response.json()['bed_id'] == bed.id
+    assert response.json()['patient_id'] == str(patient.id)
+    assert bed_status(bed.id) == BedStatus.OCCUPIED
+
+
+def test_allocate_admission_without_available_bed(
+    client: TestClient, admin_token: str, patient: UserSchema, bed: BedSchema
+) -> None:
+    headers = {'Authorization': f'Bearer {admin_token}'}
+    payload = {'patient_id': str(patient.id), 'unit_id': bed.unit_id, 'type': bed.type}
+
+    assert client.post('/api/internacoes/alocacao', headers=headers, json=payload).status_code == HTTPStatus.CREATED
+
+    # O único leito já foi ocupado, e não há leito de UTI na unidade.
+    for bed_type in (bed.type, BedTypes.ICU):
+        response = client.post('/api/internacoes/alocacao', headers=headers, json={**payload, 'type': bed_type})
+
+        assert response.status_code == HTTPStatus.CONFLICT
+        assert response.json()['detail'] == 'Nenhum leito disponível do tipo pedido na unidade'
+
+
+def test_allocate_admission_unit_not_found(client: TestClient, admin_token: str, patient: UserSchema) -> None:
+    payload = {'patient_id': str(patient.id), 'unit_id': 9999, 'type': BedTypes.STANDARD}
+    response = client.post(
+        '/api/internacoes/alocacao', headers={'Authorization': f'Bearer {admin_token}'}, json=payload
+    )
+
+    assert response.status_code == HTTPStatus.NOT_FOUND
+
+
+def test_allocate_admission_forbidden_for_patient(
+    client: TestClient, token: str, patient: UserSchema, bed: BedSchema
+) -> None:
+    payload = {'patient_id': str(patient.id), 'unit_id': bed.unit_id, 'type': bed.type}
+    response = client.post('/api/internacoes/alocacao', headers={'Authorization': f'Bearer {token}'}, json=payload)
+
+    assert response.status_code == HTTPStatus.FORBIDDEN
+    assert bed_status(bed.id) == BedStatus.AVAILABLE
@@ -1,13 +1,19 @@
+import json
 import random
 from datetime import datetime, timedelta
 from http import HTTPStatus
+from typing import Any
+from uuid import uuid4
 
+import pytest
 from fastapi.testclient import TestClient
 
 from vidaplus.main.enums.appointment_status import AppointmentStatus
 from vidaplus.main.enums.appointment_types import AppointmentTypes
 from vidaplus.main.schemas.appointment import AppointmentSchema
 from vidaplus.main.schemas.user import UserSchema
+from vidaplus.models.cache.appointment_interval_index import AppointmentIntervalIndex
+from vidaplus.services.appointment_series_service import materialize_due_series
 
 
 def test_create_appointment(
@@ -121,6 +127,47 @@ def test_create_conflicting_appointment(
     assert 'Já existe um agendamento no mesmo horário' in response2.json()['detail']
 
 
+def test_create_partially_overlapping_appointment(
+    client: TestClient, patient: UserSchema, healthcare_professional: UserSchema, token: str
+) -> None:
+    start = datetime.now() + timedelta(days=1)
+    base_data = {
+        'patient_id': str(patient.id),
+        'professional_id': str(healthcare_professional.id),
+        'date_time': start.isoformat(),
+        'type': AppointmentTypes.CONSULTATION,
+        'status': AppointmentStatus.SCHEDULED,
+        'estimated_duration': 60,
+        'location': 'Sala 205',
+        'notes': 'Conflito parcial',
+    }
+
+    response1 = client.post('/api/agendamentos', json=base_data, headers={'Authorization': f'Bearer {token}'})
+    assert response1.status_code == HTTPStatus.CREATED
+
+    overlapping = {**base_data, 'date_time': (start + timedelta(minutes=30)).isoformat()}
+    response2 = client.post('/api/agendamentos', json=overlapping, headers={'Authorization': f'Bearer {token}'})
+    assert response2.status_code == HTTPStatus.CONFLICT
+
+    back_to_back = {**base_data, 'date_time': (start + timedelta(minutes=60)).isoformat()}
+    response3 = client.post('/api/agendamentos', json=back_to_back, headers={'Authorization': f'Bearer {token}'})
+    assert response3.status_code == HTTPStatus.CREATED
+
+
+def test_create_appointment_over_canceled_one(client: TestClient, appointment: AppointmentSchema, token: str) -> None:
+    response = client.delete(f'/api/agendamentos/{appointment.id}', headers={'Authorization': f'Bearer {token}'})
+    assert response.status_code == HTTPStatus.NO_CONTENT
+
+    data = {
+        **appointment.model_dump(mode='json', exclude={'id', 'created_at', 'updated_at'}),
+        'status': AppointmentStatus.SCHEDULED,
+        'date_time': (appointment.date_time + timedelta(minutes=10)).isoformat(),
+    }
+
+    response = client.post('/api/agendamentos', json=data, headers={'Authorization': f'Bearer {token}'})
+    assert response.status_code == HTTPStatus.CREATED
+
+
 def test_create_appointment_with_missing_fields(client: TestClient, token: str) -> None:
     incomplete_data = {'date_time': datetime.now().isoformat(), 'type': AppointmentTypes.CONSULTATION}
 
@@ -241,7 +288,7 @@ def test_list_appointments_with_filters(
     # Lista todos os agendamentos
     response = client.get('/api/agendamentos', headers={'Authorization': f'Bearer {token}'})
     assert response.status_code == HTTPStatus.OK
-    assert len(response.json()) == APPOINTMENTS_COUNT
+    assert len(response.json()['items']) == APPOINTMENTS_COUNT
 
 
 def test_filter_by_patient_id(
@@ -267,7 +314,7 @@ def test_filter_by_patient_id(
 
     # Filtra por patient_id
     response = client.get(f'/api/agendamentos?patient_id={patient.id}', headers={'Authorization': f'Bearer {token}'})
-    appointments = response.json()
+    appointments = response.json()['items']
     assert len(appointments) == APPOINTMENT_COUNT
     assert all(appt['patient_id'] == str(patient.id) for appt in appointments)
 
@@ -303,7 +350,7 @@ def test_filter_by_date_range(
     response = client.get(
         f'/api/agendamentos?start_date={start_date}&end_date={end_date}', headers={'Authorization': f'Bearer {token}'}
     )
-    assert len(response.json()) == APPOINTMENT_COUNT
+    assert len(response.json()['items']) == APPOINTMENT_COUNT
 
 
 def test_invalid_date_filter(client: TestClient, token: str) -> None:
@@ -320,7 +367,7 @@ def test_empty_response(client: TestClient, token: str) -> None:
         headers={'Authorization': f'Bearer {token}'},
     )
     assert response.status_code == HTTPStatus.OK
-    assert len(response.json()) == APPOINTMENT_COUNT
+    assert len(response.json()['items']) == APPOINTMENT_COUNT
 
 
 def test_patient_cannot_list_all_appointments(
@@ -348,7 +395,7 @@ def test_patient_cannot_list_all_appointments(
     )
 
     response = client.get('/api/agendamentos', headers={'Authorization': f'Bearer {token}'})
-    assert len(response.json()) == APPOINTMENT_COUNT
+    assert len(response.json()['items']) == APPOINTMENT_COUNT
 
 
 def test_cancel_appointment(
@@ -375,6 +422,19 @@ def test_cancel_appointment_unauthorized(
     assert response.json() == {'detail': 'Not authenticated'}
 
 
+def test_cancel_another_patients_appointment(
+    client: TestClient, appointment: AppointmentSchema, another_patient: UserSchema, token: str
+) -> None:
+    login = client.post('/api/auth/token', json={'email': another_patient.email, 'password': 'ilovepotatos'})
+    headers = {'Authorization': f'Bearer {login.json()["access_token"]}'}
+
+    response = client.delete(f'/api/agendamentos/{appointment.id}', headers=headers)
+    items = client.get('/api/agendamentos', headers={'Authorization': f'Bearer {token}'}).json()['items']
+
+    assert response.status_code == HTTPStatus.FORBIDDEN
+    assert [item['status'] for item in items] == [AppointmentStatus.SCHEDULED]
+
+
 def test_update_appointment(
     client: TestClient, patient: UserSchema, appointment: AppointmentSchema, token: str
 ) -> None:
@@ -448,3 +508,534 @@ def test_update_appointment_unauthorized(
 
     assert response.status_code == HTTPStatus.UNAUTHORIZED
     assert response.json() == {'detail': 'Not authenticated'}
+
+
+def test_update_appointment_keeping_its_time_slot(
+    client: TestClient, appointment: AppointmentSchema, token: str
+) -> None:
+    data = appointment.model_dump(mode='json', exclude={'id', 'created_at', 'updated_at'})
+    data['notes'] = 'Mesmo horário'
+
+    response = client.put(
+        f'/api/agendamentos/{appointment.id}', json=data, headers={'Authorization': f'Bearer {token}'}
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()['notes'] == 'Mesmo horário'
+
+
+def test_update_appointment_into_conflict_is_rolled_back(
+    client: TestClient, appointment: AppointmentSchema, token: str
+) -> None:
+    headers = {'Authorization': f'Bearer {token}'}
+    data = appointment.model_dump(mode='json', exclude={'id', 'created_at', 'updated_at'})
+    data['date_time'] = (appointment.date_time + timedelta(hours=2)).isoformat()
+    other = client.post('/api/agendamentos', json=data, headers=headers).json()
+
+    data['date_time'] = (appointment.date_time + timedelta(minutes=10)).isoformat()
+    response = client.put(f'/api/agendamentos/{other["id"]}', json=data, headers=headers)
+    items = client.get('/api/agendamentos', headers=headers).json()['items']
+
+    assert response.status_code == HTTPStatus.CONFLICT
+    assert [item['date_time'] for item in items if item['id'] == other['id']] == [other['date_time']]
+
+
+def test_update_past_appointment(client: TestClient, appointment: AppointmentSchema, token: str) -> None:
+    data = appointment.model_dump(mode='json', exclude={'id', 'created_at', 'updated_at'})
+    data['date_time'] = (datetime.now() - timedelta(days=1)).isoformat()
+    client.put(f'/api/agendamentos/{appointment.id}', json=data, headers={'Authorization': f'Bearer {token}'})
+
+    data['notes'] = 'Tarde demais'
+    response = client.put(
+        f'/api/agendamentos/{appointment.id}', json=data, headers={'Authorization': f'Bearer {token}'}
+    )
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
+def test_conflicts_and_cancellations_with_appointment_index(
+    client: TestClient, appointment: AppointmentSchema, token: str, appointment_index: AppointmentIntervalIndex
+) -> None:
+    data = appointment.model_dump(mode='json', exclude={'id', 'created_at', 'updated_at'})
+    data['date_time'] = (appointment.date_time + timedelta(minutes=10)).isoformat()
+    headers = {'Authorization': f'Bearer {token}'}
+
+    conflicting = client.post('/api/agendamentos', json=data, headers=headers)
+    canceled = client.delete(f'/api/agendamentos/{appointment.id}', headers=headers)
+    created = client.post('/api/agendamentos', json=data, headers=headers)
+    conflicting_again = client.post('/api/agendamentos', json=data, headers=headers)
+
+    assert conflicting.status_code == HTTPStatus.CONFLICT
+    assert canceled.status_code == HTTPStatus.NO_CONTENT
+    assert created.status_code == HTTPStatus.CREATED
+    assert conflicting_again.status_code == HTTPStatus.CONFLICT
+    assert appointment_index.misses == 1
+
+
+def batch_item(patient: UserSchema, professional_id: str, date_time: datetime, duration: int = 30) -> dict:
+    return {
+        'patient_id': str(patient.id),
+        'professional_id': professional_id,
+        'date_time': date_time.isoformat(),
+        'type': AppointmentTypes.EXAM,
+        'status': AppointmentStatus.SCHEDULED,
+        'estimated_duration': duration,
+        'location': 'Sala de coleta',
+        'notes': 'Mutirão de exames',
+    }
+
+
+def test_create_appointments_batch(
+    client: TestClient, patient: UserSchema, healthcare_professional: UserSchema, admin_token: str
+) -> None:
+    BATCH_SIZE = 20
+    start = datetime.now() + timedelta(days=1)
+    data = [
+        batch_item(patient, str(healthcare_professional.id), start + timedelta(minutes=15 * i), duration=15)
+        for i in range(BATCH_SIZE)
+    ]
+
+    response = client.post('/api/agendamentos/lote', json=data, headers={'Authorization': f'Bearer {admin_token}'})
+    result = response.json()
+    listed = client.get('/api/agendamentos', headers={'Authorization': f'Bearer {admin_token}'})
+
+    assert response.status_code == HTTPStatus.CREATED
+    assert result['mode'] == 'ALL_OR_NOTHING'
+    assert result['created'] == BATCH_SIZE
+    assert [item['appointment']['date_time'] for item in result['results']] == [item['date_time'] for item in data]
+    assert len(listed.json()['items']) == BATCH_SIZE
+
+
+def invalid_batch(patient: UserSchema, healthcare_professional: UserSchema, appointment: AppointmentSchema) -> list:
+    start = datetime.now() + timedelta(days=1)
+    professional_id = str(healthcare_professional.id)
+    return [
+        batch_item(patient, professional_id, start),
+        batch_item(patient, professional_id, start + timedelta(minutes=10)),
+        batch_item(patient, professional_id, appointment.date_time + timedelta(minutes=10)),
+        batch_item(patient, professional_id, datetime.now() - timedelta(days=1)),
+        batch_item(patient, str(patient.id), start),
+    ]
+
+
+def test_create_appointments_batch_best_effort(
+    client: TestClient,
+    patient: UserSchema,
+    healthcare_professional: UserSchema,
+    appointment: AppointmentSchema,
+    admin_token: str,
+) -> None:
+    response = client.post(
+        '/api/agendamentos/lote',
+        params={'mode': 'BEST_EFFORT'},
+        json=invalid_batch(patient, healthcare_professional, appointment),
+        headers={'Authorization': f'Bearer {admin_token}'},
+    )
+    result = response.json()
+
+    assert response.status_code == HTTPStatus.MULTI_STATUS
+    assert result['created'] == 1
+    assert result['results'][0]['appointment']['id'] != appointment.id
+    assert [item['error'] for item in result['results']] == [
+        None,
+        'Já existe um agendamento no mesmo horário',
+        'Já existe um agendamento no mesmo horário',
+        'Não é possível agendar no passado',
+        'Usuário não encontrado',
+    ]
+
+
+def test_create_appointments_batch_with_unknown_patient(
+    client: TestClient, patient: UserSchema, healthcare_professional: UserSchema, admin_token: str
+) -> None:
+    start = datetime.now() + timedelta(days=1)
+    data = [batch_item(patient, str(healthcare_professional.id), start + timedelta(hours=i)) for i in range(2)]
+    data[0]['patient_id'] = str(uuid4())
+
+    response = client.post(
+        '/api/agendamentos/lote',
+        params={'mode': 'BEST_EFFORT'},
+        json=data,
+        headers={'Authorization': f'Bearer {admin_token}'},
+    )
+    result = response.json()
+
+    assert response.status_code == HTTPStatus.MULTI_STATUS
+    assert result['created'] == 1
+    assert [item['error'] for item in result['results']] == ['Usuário não encontrado', None]
+
+
+def test_create_appointments_batch_all_or_nothing(
+    client: TestClient,
+    patient: UserSchema,
+    healthcare_professional: UserSchema,
+    appointment: AppointmentSchema,
+    admin_token: str,
+) -> None:
+    response = client.post(
+        '/api/agendamentos/lote',
+        json=invalid_batch(patient, healthcare_professional, appointment),
+        headers={'Authorization': f'Bearer {admin_token}'},
+    )
+    result = response.json()
+    listed = client.get('/api/agendamentos', headers={'Authorization': f'Bearer {admin_token}'})
+
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+    assert result['created'] == 0
+    assert all(item['appointment'] is None for item in result['results'])
+    assert result['results'][0]['error'] is None
+    assert [appt['id'] for appt in listed.json()['items']] == [appointment.id]
+
+
+def test_create_appointments_batch_too_large(
+    client: TestClient,
+    patient: UserSchema,
+    healthcare_professional: UserSchema,
+    admin_token: str,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv('APPOINTMENT_BATCH_MAX_SIZE', '1')
+    start = datetime.now() + timedelta(days=1)
+    data = [batch_item(patient, str(healthcare_professional.id), start + timedelta(hours=i)) for i in range(2)]
+
+    response = client.post('/api/agendamentos/lote', json=data, headers={'Authorization': f'Bearer {admin_token}'})
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert response.json() == {'detail': 'O lote excede o tamanho máximo permitido'}
+
+
+def wall_time(value: str) -> datetime:
+    # O SQLite devolve horários ingênuos; as ocorrências expandidas da regra vêm com o fuso de `TIMEZONE`.
+    return datetime.fromisoformat(value).replace(tzinfo=None)
+
+
+def series_payload(
+    patient: UserSchema, healthcare_professional: UserSchema, starts_at: datetime, **rule: Any
+) -> dict[str, Any]:
+    return {
+        'patient_id': str(patient.id),
+        'professional_id': str(healthcare_professional.id),
+        'type': AppointmentTypes.CONSULTATION,
+        'estimated_duration': 30,
+        'location': 'Consultório 3',
+        'notes': 'Acompanhamento semanal',
+        'starts_at': starts_at.isoformat(),
+        'frequency': 'WEEKLY',
+        **rule,
+    }
+
+
+def test_create_appointment_series(
+    client: TestClient, patient: UserSchema, healthcare_professional: UserSchema, token: str
+) -> None:
+    OCCURRENCES = 12
+    MATERIALIZED = 4
+    starts_at = datetime.now() + timedelta(days=1)
+    headers = {'Authorization': f'Bearer {token}'}
+
+    response = client.post(
+        '/api/agendamentos/series',
+        json=series_payload(patient, healthcare_professional, starts_at, count=OCCURRENCES),
+        headers=headers,
+    )
+    series = response.json()
+    listed = client.get('/api/agendamentos', params={'patient_id': str(patient.id)}, headers=headers).json()['items']
+    materialized = [appointment for appointment in listed if appointment['id'] is not None]
+
+    assert response.status_code == HTTPStatus.CREATED
+    assert client.get(f'/api/agendamentos/series/{series["id"]}', headers=headers).json() == series
+    assert len(listed) == OCCURRENCES
+    assert all(appointment['series_id'] == series['id'] for appointment in listed)
+    assert len(materialized) == MATERIALIZED
+    assert sorted(wall_time(appointment['date_time']) for appointment in listed) == [
+        starts_at + timedelta(weeks=i) for i in range(OCCURRENCES)
+    ]
+
+
+@pytest.mark.parametrize('patient_id', ['unknown', 'professional'])
+def test_create_appointment_series_for_a_non_patient(
+    client: TestClient, patient: UserSchema, healthcare_professional: UserSchema, admin_token: str, patient_id: str
+) -> None:
+    data = series_payload(patient, healthcare_professional, datetime.now() + timedelta(days=1), count=3)
+    data['patient_id'] = str(uuid4() if patient_id == 'unknown' else healthcare_professional.id)
+
+    response = client.post('/api/agendamentos/series', json=data, headers={'Authorization': f'Bearer {admin_token}'})
+
+    assert response.status_code == HTTPStatus.NOT_FOUND
+    assert response.json()['detail'] == 'Usuário não encontrado'
+
+
+def test_appointment_series_materializes_in_the_background(
+    client: TestClient,
+    patient: UserSchema,
+    healthcare_professional: UserSchema,
+    token: str,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    WINDOW_DAYS = 3
+    starts_at = datetime.now() + timedelta(days=1)
+    headers = {'Authorization': f'Bearer {token}'}
+    monkeypatch.setenv('APPOINTMENT_SERIES_WINDOW_DAYS', '0')
+
+    client.post(
+        '/api/agendamentos/series',
+        json=series_payload(patient, healthcare_professional, starts_at, frequency='DAILY', count=5),
+        headers=headers,
+    )
+    virtual = client.get('/api/agendamentos', headers=headers).json()['items']
+
+    # As leituras só expandem a regra; quem grava as ocorrências que entram na janela é a tarefa de fundo.
+    monkeypatch.setenv('APPOINTMENT_SERIES_WINDOW_DAYS', str(WINDOW_DAYS))
+    still_virtual = client.get('/api/agendamentos', headers=headers).json()['items']
+    materialize_due_series()
+    in_range = client.get(
+        '/api/agendamentos',
+        params={
+            'start_date': (starts_at + timedelta(days=1)).isoformat(),
+            'end_date': (starts_at + timedelta(days=4)).isoformat(),
+        },
+        headers=headers,
+    ).json()['items']
+    listed = client.get('/api/agendamentos', headers=headers).json()['items']
+
+    assert [appointment['id'] for appointment in virtual] == [None] * 5
+    assert still_virtual == virtual
+    assert [wall_time(appointment['date_time']) for appointment in in_range] == [
+        starts_at + timedelta(days=i) for i in (2, 3)
+    ]
+    assert in_range[0]['id'] is not None
+    assert in_range[1]['id'] is None
+    assert len([appointment for appointment in listed if appointment['id'] is not None]) == WINDOW_DAYS
+
+
+def test_create_appointment_series_conflicting_as_a_group(
+    client: TestClient, patient: UserSchema, healthcare_professional: UserSchema, token: str
+) -> None:
+    OCCURRENCES = 3
+    starts_at = datetime.now() + timedelta(days=8)
+    headers = {'Authorization': f'Bearer {token}'}
+
+    created = client.post(
+        '/api/agendamentos/series',
+        json=series_payload(patient, healthcare_professional, starts_at, count=OCCURRENCES),
+        headers=headers,
+    )
+    # Só a segunda ocorrência desta série se sobrepõe à primeira da anterior.
+    overlapping = client.post(
+        '/api/agendamentos/series',
+        json=series_payload(
+            patient, healthcare_professional, starts_at - timedelta(weeks=1, minutes=-10), count=OCCURRENCES
+        ),
+        headers=headers,
+    )
+    listed = client.get('/api/agendamentos', headers=headers).json()['items']
+
+    assert created.status_code == HTTPStatus.CREATED
+    assert overlapping.status_code == HTTPStatus.CONFLICT
+    assert len(listed) == OCCURRENCES
+
+
+def test_appointment_conflicting_with_unmaterialized_occurrence(
+    client: TestClient, patient: UserSchema, healthcare_professional: UserSchema, token: str
+) -> None:
+    starts_at = datetime.now() + timedelta(days=1)
+    headers = {'Authorization': f'Bearer {token}'}
+    client.post(
+        '/api/agendamentos/series',
+        json=series_payload(
+            patient, healthcare_professional, starts_at, until=(starts_at + timedelta(weeks=10)).isoformat()
+        ),
+        headers=headers,
+    )
+    data = batch_item(patient, str(healthcare_professional.id), starts_at + timedelta(weeks=8, minutes=15))
+
+    response = client.post('/api/agendamentos', json=data, headers=headers)
+    availability = client.get(
+        f'/api/profissionais/{healthcare_professional.id}/disponibilidade',
+        params={
+            'start': (starts_at + timedelta(weeks=8)).isoformat(),
+            'end': (starts_at + timedelta(weeks=8, minutes=30)).isoformat(),
+            'duration': 15,
+        },
+        headers=headers,
+    )
+
+    assert response.status_code == HTTPStatus.CONFLICT
+    assert availability.json()['slots'] == []
+
+
+def test_cancel_appointment_series(
+    client: TestClient, patient: UserSchema, healthcare_professional: UserSchema, token: str
+) -> None:
+    MATERIALIZED = 4
+    headers = {'Authorization': f'Bearer {token}'}
+    series = client.post(
+        '/api/agendamentos/series',
+        json=series_payload(patient, healthcare_professional, datetime.now() + timedelta(days=1), count=8),
+        headers=headers,
+    ).json()
+
+    response = client.delete(f'/api/agendamentos/series/{series["id"]}', headers=headers)
+    scheduled = client.get('/api/agendamentos', params={'status': 'SCHEDULED'}, headers=headers)
+    canceled = client.get('/api/agendamentos', params={'status': 'CANCELED'}, headers=headers)
+
+    assert response.status_code == HTTPStatus.NO_CONTENT
+    assert client.get(f'/api/agendamentos/series/{series["id"]}', headers=headers).json()['status'] == 'CANCELED'
+    assert scheduled.json()['items'] == []
+    assert len(canceled.json()['items']) == MATERIALIZED
+
+
+def test_list_appointments_paginated_with_occurrences(
+    client: TestClient,
+    patient: UserSchema,
+    healthcare_professional: UserSchema,
+    token: str,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    PAGE_SIZE = 2
+    starts_at = (datetime.now() + timedelta(days=1)).replace(microsecond=0)
+    headers = {'Authorization': f'Bearer {token}'}
+    monkeypatch.setenv('APPOINTMENT_SERIES_WINDOW_DAYS', '0')
+    client.post(
+        '/api/agendamentos/series',
+        json=series_payload(patient, healthcare_professional, starts_at, frequency='DAILY', count=3),
+        headers=headers,
+    )
+
+    for offset in (timedelta(hours=3), timedelta(days=1, hours=2)):
+        data = batch_item(patient, str(healthcare_professional.id), starts_at + offset)
+        client.post('/api/agendamentos', json=data, headers=headers)
+
+    pages, cursor = [], None
+
+    while True:
+        params = {'limit': PAGE_SIZE, **({'cursor': cursor} if cursor else {})}
+        page = client.get('/api/agendamentos', params=params, headers=headers).json()
+        pages.append(page['items'])
+        cursor = page['next_cursor']
+
+        if cursor is None:
+            break
+
+    listed = [appointment for items in pages for appointment in items]
+
+    assert [len(items) for items in pages] == [2, 2, 1]
+    assert [wall_time(appointment['date_time']) for appointment in listed] == [
+        starts_at,
+        starts_at + timedelta(hours=3),
+        starts_at + timedelta(days=1),
+        starts_at + timedelta(days=1, hours=2),
+        starts_at + timedelta(days=2),
+    ]
+    assert [appointment['id'] is None for appointment in listed] == [True, False, True, False, True]
+
+
+def test_stream_appointments_with_occurrences(
+    client: TestClient,
+    patient: UserSchema,
+    healthcare_professional: UserSchema,
+    token: str,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    starts_at = (datetime.now() + timedelta(days=1)).replace(microsecond=0)
+    headers = {'Authorization': f'Bearer {token}'}
+    monkeypatch.setenv('APPOINTMENT_SERIES_WINDOW_DAYS', '1')
+    client.post(
+        '/api/agendamentos/series',
+        json=series_payload(patient, healthcare_professional, starts_at, frequency='DAILY', count=3),
+        headers=headers,
+    )
+    data = batch_item(patient, str(healthcare_professional.id), starts_at + timedelta(days=1, hours=2))
+    client.post('/api/agendamentos', json=data, headers=headers)
+
+    response = client.get('/api/agendamentos', headers={**headers, 'Accept': 'application/x-ndjson'})
+    streamed = [json.loads(line) for line in response.text.splitlines()]
+
+    assert response.status_code == HTTPStatus.OK
+    assert [wall_time(appointment['date_time']) for appointment in streamed] == [
+        starts_at,
+        starts_at + timedelta(days=1),
+        starts_at + timedelta(days=1, hours=2),
+        starts_at + timedelta(days=2),
+    ]
+    assert [appointment['id'] is None for appointment in streamed] == [False, True, False, True]
+    assert streamed == client.get('/api/agendamentos', headers=headers).json()['items']
+
+
+def test_cancel_appointment_series_not_found(client: TestClient, token: str) -> None:
+    response = client.delete('/api/agendamentos/series/1', headers={'Authorization': f'Bearer {token}'})
+
+    assert response.status_code == HTTPStatus.NOT_FOUND
+    assert response.json() == {'detail': 'Série de agendamentos não encontrada'}
+
+
+@pytest.mark.parametrize('rule', [{}, {'count': 1000}, {'until': '2000-01-01T00:00:00'}])
+def test_create_appointment_series_with_invalid_rule(
+    client: TestClient, patient: UserSchema, healthcare_professional: UserSchema, token: str, rule: dict
+) -> None:
+    response = client.post(
+        '/api/agendamentos/series',
+        json=series_payload(patient, healthcare_professional, datetime.now() + timedelta(days=1), **rule),
+        headers={'Authorization': f'Bearer {token}'},
+    )
+
+    assert response.status_code in {HTTPStatus.BAD_REQUEST, HTTPStatus.UNPROCESSABLE_ENTITY}
+
+
+def test_appointment_series_agenda_with_appointment_index(
+    client: TestClient,
+    patient: UserSchema,
+    healthcare_professional: UserSchema,
+    token: str,
+    appointment_index: AppointmentIntervalIndex,
+) -> None:
+    OCCURRENCES = 6
+    HITS = 2
+    headers = {'Authorization': f'Bearer {token}'}
+    url = f'/api/profissionais/{healthcare_professional.id}/agendamentos'
+
+    # A agenda é carregada antes da série: o índice precisa saber que agora há ocorrências a expandir.
+    assert client.get(url, headers=headers).json() == []
+
+    client.post(
+        '/api/agendamentos/series',
+        json=series_payload(patient, healthcare_professional, datetime.now() + timedelta(days=1), count=OCCURRENCES),
+        headers=headers,
+    )
+
+    agendas = [client.get(url, headers=headers).json() for _ in range(2)]
+
+    assert [len(agenda) for agenda in agendas] == [OCCURRENCES, OCCURRENCES]
+    assert agendas[0] == agendas[1]
+    assert any(appointment['id'] is None for appointment in agendas[0])
+    assert appointment_index.hits == HITS
+
+
+def test_list_appointments_not_modified(
+    client: TestClient, patient: UserSchema, appointment: AppointmentSchema, token: str
+) -> None:
+    params = {'patient_id': str(patient.id)}
+    tag = client.get('/api/agendamentos/', params=params, headers={'Authorization': f'Bearer {token}'}).headers['ETag']
+
+    cached = client.get('/api/agendamentos/', params=params, headers={'If-None-Match': tag})
+    assert cached.status_code == HTTPStatus.NOT_MODIFIED
+    assert not cached.content
+
+    client.delete(f'/api/agendamentos/{appointment.id}', headers={'Authorization': f'Bearer {token}'})
+
+    modified = client.get('/api/agendamentos/', params=params, headers={'If-None-Match': tag})
+    assert modified.status_code == HTTPStatus.OK
+    assert modified.json()['items'][0]['status'] == AppointmentStatus.CANCELED
+
+
+def test_update_appointment_if_match(client: TestClient, appointment: AppointmentSchema, token: str) -> None:
+    data = appointment.model_dump(mode='json', exclude={'id', 'created_at', 'updated_at', 'version'})
+    data['location'] = 'Sala 301'
+    headers = {'Authorization': f'Bearer {token}', 'If-Match': f'"{appointment.version}"'}
+
+    response = client.put(f'/api/agendamentos/{appointment.id}', json=data, headers=headers)
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers['ETag'] == f'"{appointment.version + 1}"'
+
+    stale = client.put(f'/api/agendamentos/{appointment.id}', json={**data, 'location': 'Sala 302'}, headers=headers)
+    assert stale.status_code == HTTPStatus.PRECONDITION_FAILED
@@ -1,8 +1,18 @@
 from http import HTTPStatus
 
+import pytest
 from fastapi.testclient import TestClient
 
 from vidaplus.main.schemas.user import UserSchema
+from vidaplus.models.cache.login_throttle import UnknownEmailCache
+from vidaplus.models.cache.revocation_list import RevocationList
+from vidaplus.models.config.connection import DatabaseConnectionHandler
+from vidaplus.models.entities.revoked_token import RevokedToken
+from vidaplus.services.auth_service import AuthService
+from vidaplus.settings import Settings
+
+# Exige autenticação e responde 404 para um usuário autenticado, sem efeitos colaterais.
+PROTECTED_URL = '/api/agendamentos/series/0'
 
 
 def test_get_access_token(client: TestClient, patient: UserSchema) -> None:
@@ -48,6 +58,12 @@ def test_get_access_token_with_inexistent_user(client: TestClient) -> None:
     assert response_data['detail'] == 'Email ou senha inválidos'
 
 
+def test_get_access_token_ignores_email_case(client: TestClient, patient: UserSchema) -> None:
+    response = client.post('/api/auth/token', json={'email': patient.email.upper(), 'password': 'ilovepotatos'})
+
+    assert response.status_code == HTTPStatus.OK
+
+
 def test_refresh_access_token(client: TestClient, token: str) -> None:
     response = client.post('/api/auth/refresh', headers={'Authorization': f'Bearer {token}'})
 
@@ -57,3 +73,111 @@ def test_refresh_access_token(client: TestClient, token: str) -> None:
     assert 'access_token' in response_data
     assert 'token_type' in response_data
     assert response_data['token_type'] == 'bearer'
+
+
+def test_get_access_token_throttles_repeated_attempts(client: TestClient, patient: UserSchema) -> None:
+    data = {'email': patient.email, 'password': 'wrong_password'}
+    burst = Settings().LOGIN_EMAIL_BURST
+
+    for _ in range(burst):
+        assert client.post('/api/auth/token', json=data).status_code == HTTPStatus.UNAUTHORIZED
+
+    response = client.post('/api/auth/token', json={**data, 'password': 'ilovepotatos'})
+
+    assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS
+    assert response.json()['detail'] == 'Muitas tentativas de login, tente novamente em instantes'
+
+
+def test_get_access_token_caches_unknown_email(client: TestClient) -> None:
+    data = {'email': 'ghost@example.com', 'password': 'ilovepotatos'}
+
+    assert client.post('/api/auth/token', json=data).status_code == HTTPStatus.UNAUTHORIZED
+    assert client.post('/api/auth/token', json=data).status_code == HTTPStatus.UNAUTHORIZED
+
+    unknown_emails = UnknownEmailCache.get_instance()
+    assert unknown_emails is not None
+    assert unknown_emails.hits == 1
+
+    # O cadastro retira o email do cache, e o login passa a funcionar na hora.
+    response = client.post('/api/pacientes', json={'name': 'Ghost', **data})
+    assert response.status_code == HTTPStatus.CREATED
+
+    assert client.post('/api/auth/token', json=data).status_code == HTTPStatus.OK
+
+
+def test_logout_revokes_token(client: TestClient, token: str) -> None:
+    headers = {'Authorization': f'Bearer {token}'}
+
+    assert client.get(PROTECTED_URL, headers=headers).status_code == HTTPStatus.NOT_FOUND
+    assert RevocationList.get_instance().lookups == 0
+
+    response = client.post('/api/auth/logout', headers=headers)
+    assert response.status_code == HTTPStatus.NO_CONTENT
+
+    response = client.get(PROTECTED_URL, headers=headers)
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+    assert response.json()['detail'] == 'Token revogado'
+
+    response = client.post('/api/auth/refresh', headers=headers)
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+
+
+def test_refresh_revokes_previous_token(client: TestClient, token: str) -> None:
+    response = client.post('/api/auth/refresh', headers={'Authorization': f'Bearer {token}'})
+    new_token = response.json()['access_token']
+
+    assert new_token != token
+    assert client.post('/api/auth/refresh', headers={'Authorization': f'Bearer {token}'}).status_code == (
+        HTTPStatus.UNAUTHORIZED
+    )
+    assert client.get(PROTECTED_URL, headers={'Authorization': f'Bearer {new_token}'}).status_code == (
+        HTTPStatus.NOT_FOUND
+    )
+
+
+def test_revocation_filter_is_rebuilt_at_startup(client: TestClient) -> None:
+    # A reconstrução fica com a tarefa de fundo; a primeira requisição só busca as revogações novas.
+    assert not RevocationList.get_instance().claim_rebuild()
+
+
+def test_revocations_from_other_processes_are_synced(
+    client: TestClient, token: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv('REVOCATION_SYNC_SECONDS', '0')
+    RevocationList.reset()
+    headers = {'Authorization': f'Bearer {token}'}
+
+    assert client.get(PROTECTED_URL, headers=headers).status_code == HTTPStatus.NOT_FOUND
+
+    # Outro processo revoga o token gravando direto na tabela.
+    data = AuthService.decode_access_token(token)
+    assert data.jti is not None
+
+    with DatabaseConnectionHandler() as db:
+        db.session.add(RevokedToken(jti=data.jti, expires_at=data.exp))
+        db.session.commit()
+
+    assert client.get(PROTECTED_URL, headers=headers).status_code == HTTPStatus.UNAUTHORIZED
+
+
+@pytest.mark.parametrize(
+    ('url', 'status'), [('/api/auth/logout', HTTPStatus.NO_CONTENT), ('/api/auth/refresh', HTTPStatus.UNAUTHORIZED)]
+)
+def test_concurrent_revocation_of_the_same_token(
+    client: TestClient, token: str, monkeypatch: pytest.MonkeyPatch, url: str, status: HTTPStatus
+) -> None:
+    monkeypatch.setenv('REVOCATION_SYNC_SECONDS', '3600')
+    RevocationList.reset()
+    headers = {'Authorization': f'Bearer {token}'}
+
+    assert client.get(PROTECTED_URL, headers=headers).status_code == HTTPStatus.NOT_FOUND
+
+    # Uma requisição concorrente revogou o token depois que esta passou pela verificação.
+    data = AuthService.decode_access_token(token)
+    assert data.jti is not None
+
+    with DatabaseConnectionHandler() as db:
+        db.session.add(RevokedToken(jti=data.jti, expires_at=data.exp))
+        db.session.commit()
+
+    assert client.post(url, headers=headers).status_code == status
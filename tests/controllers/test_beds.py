@@ -2,11 +2,14 @@ from http import HTTPStatus
 
 from fastapi.testclient import TestClient
 
+from vidaplus.main.schemas.bed import BedSchema
+from vidaplus.main.schemas.unit import UnitSchema
+
 
 def test_list_beds_empty(client: TestClient) -> None:
     response = client.get('/api/leitos/')
     assert response.status_code == HTTPStatus.OK
-    assert response.json() == []
+    assert response.json() == {'items': [], 'next_cursor': None}
 
 
 def test_create_bed_forbidden_for_non_admin(client: TestClient, token: str) -> None:
@@ -60,7 +63,7 @@ def test_list_beds_with_data(client: TestClient, admin_token: str) -> None:
 
     list_resp = client.get('/api/leitos/')
     assert list_resp.status_code == HTTPStatus.OK
-    beds = list_resp.json()
+    beds = list_resp.json()['items']
     ids = {b['id'] for b in beds}
     assert set(bed_ids).issubset(ids)
     # Check relation: all beds refer to the same unit
@@ -120,6 +123,16 @@ def test_update_bed_not_found(client: TestClient, admin_token: str) -> None:
     assert response.status_code == HTTPStatus.NOT_FOUND
 
 
+def test_update_missing_bed_with_existing_unit(client: TestClient, admin_token: str, unit: UnitSchema) -> None:
+    response = client.put(
+        '/api/leitos/9999',
+        headers={'Authorization': f'Bearer {admin_token}'},
+        json={'unit_id': unit.id, 'type': 'ICU', 'status': 'AVAILABLE'},
+    )
+    assert response.status_code == HTTPStatus.NOT_FOUND
+    assert response.json() == {'detail': 'Leito não encontrado'}
+
+
 def test_update_bed_success(client: TestClient, admin_token: str) -> None:
     unit_id = client.post(
         '/api/unidades/',
@@ -180,3 +193,55 @@ def test_delete_bed_success(client: TestClient, admin_token: str) -> None:
     assert response.status_code == HTTPStatus.NO_CONTENT
     get_resp = client.get(f'/api/leitos/{bed_id}')
     assert get_resp.status_code == HTTPStatus.NOT_FOUND
+
+
+def test_get_bed_not_modified(client: TestClient, bed: BedSchema) -> None:
+    response = client.get(f'/api/leitos/{bed.id}')
+    tag = response.headers['ETag']
+
+    cached = client.get(f'/api/leitos/{bed.id}', headers={'If-None-Match': tag})
+    assert cached.status_code == HTTPStatus.NOT_MODIFIED
+    assert cached.headers['ETag'] == tag
+    assert not cached.content
+
+    listed = client.get('/api/leitos/')
+    cached_list = client.get('/api/leitos/', headers={'If-None-Match': listed.headers['ETag']})
+    assert cached_list.status_code == HTTPStatus.NOT_MODIFIED
+
+
+def test_get_bed_modified_after_unit_update(
+    client: TestClient, admin_token: str, bed: BedSchema, unit: UnitSchema
+) -> None:
+    tag = client.get(f'/api/leitos/{bed.id}').headers['ETag']
+    client.put(
+        f'/api/unidades/{unit.id}',
+        headers={'Authorization': f'Bearer {admin_token}'},
+        json={'name': 'Unidade Renomeada', 'address': unit.address},
+    )
+
+    response = client.get(f'/api/leitos/{bed.id}', headers={'If-None-Match': tag})
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()['unit']['name'] == 'Unidade Renomeada'
+
+
+def test_update_bed_if_match(client: TestClient, admin_token: str, bed: BedSchema) -> None:
+    tag = client.get(f'/api/leitos/{bed.id}').headers['ETag']
+    payload = {'unit_id': bed.unit_id, 'type': 'ICU', 'status': 'AVAILABLE'}
+    headers = {'Authorization': f'Bearer {admin_token}', 'If-Match': tag}
+
+    response = client.put(f'/api/leitos/{bed.id}', headers=headers, json=payload)
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()['version'] == bed.version + 1
+    assert response.headers['ETag'] != tag
+
+    stale = client.put(f'/api/leitos/{bed.id}', headers=headers, json={**payload, 'status': 'OCCUPIED'})
+    assert stale.status_code == HTTPStatus.PRECONDITION_FAILED
+    assert client.get(f'/api/leitos/{bed.id}').json()['type'] == 'ICU'
+
+
+def test_update_bed_weak_if_match(client: TestClient, admin_token: str, bed: BedSchema) -> None:
+    payload = {'unit_id': bed.unit_id, 'type': 'ICU', 'status': 'AVAILABLE'}
+    headers = {'Authorization': f'Bearer {admin_token}', 'If-Match': f'W/"{bed.version}"'}
+
+    response = client.put(f'/api/leitos/{bed.id}', headers=headers, json=payload)
+    assert response.status_code == HTTPStatus.PRECONDITION_FAILED
@@ -1,11 +1,19 @@
+from datetime import datetime, timedelta
 from http import HTTPStatus
+from typing import Any
 from uuid import uuid4
 
+import pytest
 from fastapi.testclient import TestClient
 
+from vidaplus.main.enums.appointment_status import AppointmentStatus
+from vidaplus.main.enums.appointment_types import AppointmentTypes
 from vidaplus.main.enums.roles import Roles
 from vidaplus.main.schemas.appointment import AppointmentSchema
 from vidaplus.main.schemas.user import UserSchema
+from vidaplus.models.cache.appointment_interval_index import AppointmentIntervalIndex
+from vidaplus.models.repositories import appointment_repository
+from vidaplus.models.repositories.asynchronous import appointment_repository as async_appointment_repository
 
 
 def test_create_healthcare_professional(client: TestClient, admin: UserSchema, admin_token: str) -> None:
@@ -64,21 +72,22 @@ def test_get_healthcare_professionals(
     HEALTHCARE_PROFESSIONALS_COUNT = 2
 
     response = client.get('/api/profissionais', headers={'Authorization': f'Bearer {admin_token}'})
-    response_data = response.json()
+    response_data = response.json()['items']
+    first, second = sorted([healthcare_professional, another_healthcare_professional], key=lambda user: user.id)
 
     assert response.status_code == HTTPStatus.OK
     assert len(response_data) == HEALTHCARE_PROFESSIONALS_COUNT
-    assert response_data[0]['name'] == healthcare_professional.name
-    assert response_data[0]['email'] == healthcare_professional.email
-    assert response_data[0]['role'] == healthcare_professional.role
-    assert response_data[0]['id'] == str(healthcare_professional.id)
-    assert response_data[0]['created_at'] == healthcare_professional.created_at.isoformat()
+    assert response_data[0]['name'] == first.name
+    assert response_data[0]['email'] == first.email
+    assert response_data[0]['role'] == first.role
+    assert response_data[0]['id'] == str(first.id)
+    assert response_data[0]['created_at'] == first.created_at.isoformat()
     assert 'password' not in response_data[0]
-    assert response_data[1]['name'] == another_healthcare_professional.name
-    assert response_data[1]['email'] == another_healthcare_professional.email
-    assert response_data[1]['role'] == another_healthcare_professional.role
-    assert response_data[1]['id'] == str(another_healthcare_professional.id)
-    assert response_data[1]['created_at'] == another_healthcare_professional.created_at.isoformat()
+    assert response_data[1]['name'] == second.name
+    assert response_data[1]['email'] == second.email
+    assert response_data[1]['role'] == second.role
+    assert response_data[1]['id'] == str(second.id)
+    assert response_data[1]['created_at'] == second.created_at.isoformat()
     assert 'password' not in response_data[1]
 
 
@@ -145,6 +154,42 @@ def test_list_healthcare_professional_appointments(
     assert appt['updated_at'] == appointment.updated_at.isoformat()
 
 
+def test_list_healthcare_professional_appointments_from_index(  # noqa: PLR0913
+    client: TestClient,
+    healthcare_professional: UserSchema,
+    appointment: AppointmentSchema,
+    healthcare_professional_token: str,
+    appointment_index: AppointmentIntervalIndex,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    url = f'/api/profissionais/{healthcare_professional.id}/agendamentos'
+    headers = {'Authorization': f'Bearer {healthcare_professional_token}'}
+    series_queries = 0
+    pending_series = appointment_repository.pending_series
+
+    def counting_pending_series(*args: Any, **kwargs: Any) -> Any:
+        nonlocal series_queries
+        series_queries += 1
+        return pending_series(*args, **kwargs)
+
+    for module in (appointment_repository, async_appointment_repository):
+        monkeypatch.setattr(module, 'pending_series', counting_pending_series)
+
+    first = client.get(url, headers=headers)
+    second = client.get(url, headers=headers)
+    outside_range = client.get(
+        url, params={'start_date': (appointment.date_time + timedelta(minutes=1)).isoformat()}, headers=headers
+    )
+
+    assert first.status_code == HTTPStatus.OK
+    assert first.json() == second.json()
+    assert [appt['id'] for appt in second.json()] == [appointment.id]
+    assert outside_range.json() == []
+    assert (appointment_index.misses, appointment_index.hits) == (1, 2)
+    # Só a carga da agenda procura séries pendentes; sem elas, as leituras seguintes ficam no índice.
+    assert series_queries == 1
+
+
 def test_update_professional_success(
     client: TestClient, healthcare_professional: UserSchema, healthcare_professional_token: str
 ) -> None:
@@ -228,3 +273,92 @@ def test_delete_professional_not_found(client: TestClient, admin_token: str) ->
     fake_id = '00000000-0000-0000-0000-000000000000'
     response = client.delete(f'/api/profissionais/{fake_id}', headers={'Authorization': f'Bearer {admin_token}'})
     assert response.status_code == HTTPStatus.NOT_FOUND
+
+
+SLOTS_PER_WEEK = 5 * 37  # 08:00 a 17:00, de 15 em 15 minutos, de segunda a sexta
+
+
+def next_monday() -> datetime:
+    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    return today + timedelta(days=7 - today.weekday())
+
+
+def test_get_healthcare_professional_availability(
+    client: TestClient, patient: UserSchema, healthcare_professional: UserSchema, token: str
+) -> None:
+    monday = next_monday()
+    headers = {'Authorization': f'Bearer {token}'}
+    client.post(
+        '/api/agendamentos',
+        json={
+            'patient_id': str(patient.id),
+            'professional_id': str(healthcare_professional.id),
+            'date_time': (monday + timedelta(hours=9)).isoformat(),
+            'type': AppointmentTypes.CONSULTATION,
+            'status': AppointmentStatus.SCHEDULED,
+            'estimated_duration': 60,
+            'location': 'Sala 1',
+            'notes': 'Ocupado',
+        },
+        headers=headers,
+    )
+
+    response = client.get(
+        f'/api/profissionais/{healthcare_professional.id}/disponibilidade',
+        params={'start': monday.isoformat(), 'end': (monday + timedelta(days=1)).isoformat(), 'duration': 30},
+        headers=headers,
+    )
+    data = response.json()
+    slots = [datetime.fromisoformat(slot).replace(tzinfo=None) - monday for slot in data['slots']]
+
+    assert response.status_code == HTTPStatus.OK
+    assert data['professional_id'] == str(healthcare_professional.id)
+    assert slots[:3] == [timedelta(hours=8), timedelta(hours=8, minutes=15), timedelta(hours=8, minutes=30)]
+    assert timedelta(hours=9) not in slots
+    assert timedelta(hours=9, minutes=45) not in slots
+    assert timedelta(hours=10) in slots
+    assert slots[-1] == timedelta(hours=17, minutes=30)
+
+
+def test_get_healthcare_professionals_availability(
+    client: TestClient, admin: UserSchema, healthcare_professional: UserSchema, token: str
+) -> None:
+    monday = next_monday()
+
+    response = client.get(
+        '/api/profissionais/disponibilidade',
+        params={'start': monday.isoformat(), 'end': (monday + timedelta(days=7)).isoformat(), 'duration': 60},
+        headers={'Authorization': f'Bearer {token}'},
+    )
+    data = response.json()
+
+    assert response.status_code == HTTPStatus.OK
+    assert [availability['professional_id'] for availability in data] == [str(healthcare_professional.id)]
+    assert len(data[0]['slots']) == SLOTS_PER_WEEK
+
+
+def test_get_availability_with_invalid_range(
+    client: TestClient, healthcare_professional: UserSchema, token: str
+) -> None:
+    monday = next_monday()
+
+    response = client.get(
+        f'/api/profissionais/{healthcare_professional.id}/disponibilidade',
+        params={'start': monday.isoformat(), 'end': monday.isoformat(), 'duration': 30},
+        headers={'Authorization': f'Bearer {token}'},
+    )
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert response.json() == {'detail': 'Intervalo de busca de disponibilidade inválido'}
+
+
+def test_get_availability_of_unknown_professional(client: TestClient, patient: UserSchema, token: str) -> None:
+    monday = next_monday()
+
+    response = client.get(
+        f'/api/profissionais/{patient.id}/disponibilidade',
+        params={'start': monday.isoformat(), 'end': (monday + timedelta(days=1)).isoformat(), 'duration': 30},
+        headers={'Authorization': f'Bearer {token}'},
+    )
+
+    assert response.status_code == HTTPStatus.NOT_FOUND
@@ -8,6 +8,7 @@ from vidaplus.main.enums.roles import Roles
 from vidaplus.main.schemas.user import UserSchema
 from vidaplus.models.config.connection import DatabaseConnectionHandler
 from vidaplus.models.entities.user import User
+from vidaplus.services.password_hasher import check_password
 
 
 def test_register_new_patient(client: TestClient) -> None:
@@ -44,6 +45,18 @@ def test_register_new_patient_with_existing_email(client: TestClient, patient: U
     assert response_data['detail'] == 'O email já foi cadastrado'
 
 
+def test_register_new_patient_with_existing_email_in_other_case(client: TestClient, patient: UserSchema) -> None:
+    data = {'name': 'John Doe', 'email': patient.email.upper(), 'password': 'ilovepotatos'}
+
+    response = client.post('/api/pacientes', json=data)
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert response.json()['detail'] == 'O email já foi cadastrado'
+
+    with DatabaseConnectionHandler() as db:
+        assert db.session.query(User).count() == 1
+
+
 def test_register_new_patient_with_invalid_email(client: TestClient) -> None:
     data = {
         'name': 'John Doe',
@@ -56,28 +69,35 @@ def test_register_new_patient_with_invalid_email(client: TestClient) -> None:
     assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
 
 
-def test_patient_password_is_hashed(client: TestClient, patient: UserSchema) -> None:
+def test_patient_password_is_hashed(client: TestClient) -> None:
+    data = {'name': 'John Doe', 'email': 'johndoe@example.com', 'password': 'ilovepotatos'}
+    client.post('/api/pacientes', json=data)
+
     with DatabaseConnectionHandler() as db:
-        user_data = db.session.scalar(select(User).where(User.email == patient.email))
+        user_data = db.session.scalar(select(User).where(User.email == data['email']))
 
     assert user_data is not None
-    assert user_data.password != patient.password
-    assert patient.verify_password(user_data.password)
+    assert user_data.password != data['password']
+    assert check_password(data['password'], user_data.password)
+
+    login = client.post('/api/auth/token', json={'email': data['email'], 'password': data['password']})
+    assert login.status_code == HTTPStatus.OK
 
 
 def test_get_all_patients(client: TestClient, patient: UserSchema, another_patient: UserSchema) -> None:
     PATIENTS_COUNT = 2
 
     response = client.get('/api/pacientes')
-    response_data = response.json()
+    response_data = response.json()['items']
+    first, second = sorted([patient, another_patient], key=lambda user: user.id)
 
     assert response.status_code == HTTPStatus.OK
     assert len(response_data) == PATIENTS_COUNT
-    assert response_data[0]['name'] == patient.name
-    assert response_data[0]['email'] == patient.email
+    assert response_data[0]['name'] == first.name
+    assert response_data[0]['email'] == first.email
     assert response_data[0]['role'] == 'PATIENT'
-    assert response_data[1]['name'] == another_patient.name
-    assert response_data[1]['email'] == another_patient.email
+    assert response_data[1]['name'] == second.name
+    assert response_data[1]['email'] == second.email
     assert response_data[1]['role'] == Roles.PATIENT
     assert 'password' not in response_data[0]
     assert 'password' not in response_data[1]
@@ -89,7 +109,7 @@ def test_get_all_patients(client: TestClient, patient: UserSchema, another_patie
 
 def test_get_all_patients_with_no_patients(client: TestClient) -> None:
     response = client.get('/api/pacientes')
-    response_data = response.json()
+    response_data = response.json()['items']
 
     assert response.status_code == HTTPStatus.OK
     assert len(response_data) == 0
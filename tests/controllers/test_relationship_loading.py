@@ -0,0 +1,95 @@
+from http import HTTPStatus
+from typing import Any, Generator
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from vidaplus.main.schemas.appointment import AppointmentSchema
+from vidaplus.main.schemas.bed import BedSchema
+from vidaplus.main.schemas.user import UserSchema
+from vidaplus.models.config.base import Base
+from vidaplus.models.config.connection import DatabaseConnectionHandler
+from vidaplus.models.entities.admission import Admission
+from vidaplus.models.entities.appointment import Appointment
+from vidaplus.models.entities.bed import Bed
+from vidaplus.models.entities.supply import Supply
+from vidaplus.models.entities.unit import Unit
+from vidaplus.models.entities.user import User
+
+# Entidades que cada resposta serializa; carregar qualquer outra é trabalho jogado fora.
+RESPONSE_ENTITIES: dict[str, set[type[Base]]] = {
+    '/api/unidades/': {Unit},
+    '/api/unidades/{unit_id}': {Unit},
+    '/api/leitos/': {Bed, Unit},
+    '/api/leitos/{bed_id}': {Bed, Unit},
+    '/api/internacoes/': {Admission},
+    '/api/internacoes/{admission_id}': {Admission},
+    '/api/estoque/': {Supply},
+    '/api/estoque/{supply_id}': {Supply},
+}
+
+
+@pytest.fixture
+def loaded_entities() -> Generator[set[type[Base]], None, None]:
+    loaded: set[type[Base]] = set()
+
+    def record(target: Base, context: Any) -> None:
+        loaded.add(type(target))
+
+    event.listen(Base, 'load', record, propagate=True)
+    yield loaded
+    event.remove(Base, 'load', record)
+
+
+@pytest.fixture
+def hierarchy(bed: BedSchema, patient: UserSchema) -> dict[str, int]:
+    with DatabaseConnectionHandler() as db:
+        admission = Admission(patient_id=patient.id, bed_id=bed.id)
+        supply = Supply(unit_id=bed.unit_id, name='Luva', quantity=10, min_level=1)
+        db.session.add_all([admission, supply])
+        db.session.commit()
+
+        return {'unit_id': bed.unit_id, 'bed_id': bed.id, 'admission_id': admission.id, 'supply_id': supply.id}
+
+
+@pytest.mark.parametrize('url', RESPONSE_ENTITIES)
+def test_reads_load_only_serialized_relationships(
+    client: TestClient, hierarchy: dict[str, int], loaded_entities: set[type[Base]], url: str
+) -> None:
+    response = client.get(url.format(**hierarchy))
+
+    assert response.status_code == HTTPStatus.OK
+    assert loaded_entities <= RESPONSE_ENTITIES[url]
+
+
+def test_unit_delete_cascades_in_the_database(
+    client: TestClient, admin_token: str, hierarchy: dict[str, int], loaded_entities: set[type[Base]]
+) -> None:
+    response = client.delete(
+        f'/api/unidades/{hierarchy["unit_id"]}', headers={'Authorization': f'Bearer {admin_token}'}
+    )
+    assert response.status_code == HTTPStatus.NO_CONTENT
+    assert loaded_entities <= {Unit}
+
+    with DatabaseConnectionHandler() as db:
+        for entity in (Bed, Admission, Supply):
+            assert db.session.query(entity).count() == 0
+
+
+def test_patient_delete_cascades_in_the_database(
+    client: TestClient,
+    admin_token: str,
+    hierarchy: dict[str, int],
+    appointment: AppointmentSchema,
+    loaded_entities: set[type[Base]],
+) -> None:
+    response = client.delete(
+        f'/api/pacientes/{appointment.patient_id}', headers={'Authorization': f'Bearer {admin_token}'}
+    )
+    assert response.status_code == HTTPStatus.NO_CONTENT
+    assert loaded_entities <= {User}
+
+    with DatabaseConnectionHandler() as db:
+        for entity in (Appointment, Admission):
+            assert db.session.query(entity).count() == 0
@@ -6,7 +6,7 @@ from fastapi.testclient import TestClient
 def test_list_stock_empty(client: TestClient) -> None:
     response = client.get('/api/estoque/')
     assert response.status_code == HTTPStatus.OK
-    assert response.json() == []
+    assert response.json() == {'items': [], 'next_cursor': None}
 
 
 def test_create_stock_forbidden_for_non_admin(client: TestClient, token: str, unit_payload: dict) -> None:
@@ -48,7 +48,7 @@ def test_list_stock_with_data(client: TestClient, admin_token: str, unit_payload
 
     list_resp = client.get('/api/estoque/')
     assert list_resp.status_code == HTTPStatus.OK
-    data = list_resp.json()
+    data = list_resp.json()['items']
     ids = {i['id'] for i in data}
     assert set(items).issubset(ids)
     # all items belong to the same unit
@@ -129,3 +129,53 @@ def test_delete_stock_success(client: TestClient, admin_token: str, unit_payload
 
     get_resp = client.get(f'/api/estoque/{create["id"]}')
     assert get_resp.status_code == HTTPStatus.NOT_FOUND
+
+
+def test_get_supply_not_modified(client: TestClient, admin_token: str, unit_payload: dict) -> None:
+    unit = client.post('/api/unidades/', headers={'Authorization': f'Bearer {admin_token}'}, json=unit_payload).json()
+    supply = client.post(
+        '/api/estoque/',
+        headers={'Authorization': f'Bearer {admin_token}'},
+        json={'unit_id': unit['id'], 'name': 'Luva', 'quantity': 100, 'min_level': 20},
+    ).json()
+
+    response = client.get(f'/api/estoque/{supply["id"]}')
+    assert response.headers['ETag'] == f'"{supply["version"]}"'
+
+    cached = client.get(f'/api/estoque/{supply["id"]}', headers={'If-None-Match': response.headers['ETag']})
+    assert cached.status_code == HTTPStatus.NOT_MODIFIED
+    assert not cached.content
+
+    update = {'unit_id': unit['id'], 'name': 'Luva', 'quantity': 90, 'min_level': 20}
+    client.put(f'/api/estoque/{supply["id"]}', headers={'Authorization': f'Bearer {admin_token}'}, json=update)
+
+    modified = client.get(f'/api/estoque/{supply["id"]}', headers={'If-None-Match': response.headers['ETag']})
+    assert modified.status_code == HTTPStatus.OK
+    assert modified.json()['quantity'] == update['quantity']
+
+
+def test_update_stock_if_match(client: TestClient, admin_token: str, unit_payload: dict) -> None:
+    unit = client.post('/api/unidades/', headers={'Authorization': f'Bearer {admin_token}'}, json=unit_payload).json()
+    supply = client.post(
+        '/api/estoque/',
+        headers={'Authorization': f'Bearer {admin_token}'},
+        json={'unit_id': unit['id'], 'name': 'Gaze', 'quantity': 50, 'min_level': 10},
+    ).json()
+    headers = {'Authorization': f'Bearer {admin_token}', 'If-Match': f'"{supply["version"]}"'}
+    first = {'unit_id': unit['id'], 'name': 'Gaze', 'quantity': 40, 'min_level': 10}
+    second = {'unit_id': unit['id'], 'name': 'Gaze', 'quantity': 45, 'min_level': 10}
+
+    assert client.put(f'/api/estoque/{supply["id"]}', headers=headers, json=first).status_code == HTTPStatus.OK
+
+    stale = client.put(f'/api/estoque/{supply["id"]}', headers=headers, json=second)
+    assert stale.status_code == HTTPStatus.PRECONDITION_FAILED
+    assert client.get(f'/api/estoque/{supply["id"]}').json()['quantity'] == first['quantity']
+
+
+def test_update_missing_stock_if_match(client: TestClient, admin_token: str, unit_payload: dict) -> None:
+    unit = client.post('/api/unidades/', headers={'Authorization': f'Bearer {admin_token}'}, json=unit_payload).json()
+    headers = {'Authorization': f'Bearer {admin_token}', 'If-Match': '"1"'}
+    update = {'unit_id': unit['id'], 'name': 'X', 'quantity': 1, 'min_level': 1}
+
+    resp = client.put('/api/estoque/9999', headers=headers, json=update)
+    assert resp.status_code == HTTPStatus.NOT_FOUND
@@ -1,12 +1,14 @@
+import json
 from http import HTTPStatus
 
+import pytest
 from fastapi.testclient import TestClient
 
 
 def test_list_units_empty(client: TestClient) -> None:
     response = client.get('/api/unidades/')
     assert response.status_code == HTTPStatus.OK
-    assert response.json() == []
+    assert response.json() == {'items': [], 'next_cursor': None}
 
 
 def test_create_unit_unauthorized(client: TestClient) -> None:
@@ -39,11 +41,88 @@ def test_list_units_with_data(client: TestClient, admin_token: str) -> None:
     id2 = client.post('/api/unidades/', headers={'Authorization': f'Bearer {admin_token}'}, json=payload2).json()['id']
     response = client.get('/api/unidades/')
     assert response.status_code == HTTPStatus.OK
-    ids = {u['id'] for u in response.json()}
+    ids = {u['id'] for u in response.json()['items']}
     assert id1 in ids
     assert id2 in ids
 
 
+def test_list_units_paginated(client: TestClient, admin_token: str) -> None:
+    UNITS_COUNT = 3
+    PAGE_SIZE = 2
+    headers = {'Authorization': f'Bearer {admin_token}'}
+    ids = [
+        client.post('/api/unidades/', headers=headers, json={'name': f'Unidade {i}', 'address': f'Rua {i}'}).json()[
+            'id'
+        ]
+        for i in range(UNITS_COUNT)
+    ]
+
+    first = client.get('/api/unidades/', params={'limit': PAGE_SIZE}).json()
+    second = client.get('/api/unidades/', params={'limit': PAGE_SIZE, 'cursor': first['next_cursor']}).json()
+
+    assert [unit['id'] for unit in first['items']] == ids[:PAGE_SIZE]
+    assert first['next_cursor'] is not None
+    assert [unit['id'] for unit in second['items']] == ids[PAGE_SIZE:]
+    assert second['next_cursor'] is None
+
+
+@pytest.mark.parametrize('cursor', ['nao-e-um-cursor', 'WyJhIl0=', 'WzEsIDJd'])
+def test_list_units_invalid_cursor(client: TestClient, cursor: str) -> None:
+    response = client.get('/api/unidades/', params={'cursor': cursor})
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert response.json() == {'detail': 'Cursor de paginação inválido'}
+
+
+def test_list_units_invalid_limit(client: TestClient) -> None:
+    response = client.get('/api/unidades/', params={'limit': 0})
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+
+
+def test_stream_units_ndjson(client: TestClient, admin_token: str) -> None:
+    headers = {'Authorization': f'Bearer {admin_token}'}
+    units = [
+        client.post('/api/unidades/', headers=headers, json={'name': f'Unidade {i}', 'address': f'Rua {i}'}).json()
+        for i in range(3)
+    ]
+
+    response = client.get('/api/unidades/', headers={'Accept': 'application/x-ndjson'})
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers['content-type'] == 'application/x-ndjson'
+    assert [json.loads(line) for line in response.text.splitlines()] == units
+
+
+def test_stream_units_json_array(client: TestClient, admin_token: str) -> None:
+    headers = {'Authorization': f'Bearer {admin_token}'}
+    units = [
+        client.post('/api/unidades/', headers=headers, json={'name': f'Unidade {i}', 'address': f'Rua {i}'}).json()
+        for i in range(3)
+    ]
+
+    cursor = client.get('/api/unidades/', params={'limit': 1}).json()['next_cursor']
+
+    response = client.get('/api/unidades/', params={'stream': 1})
+    after_first = client.get('/api/unidades/', params={'stream': 1, 'cursor': cursor})
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers['content-type'] == 'application/json'
+    assert response.json() == units
+    assert after_first.json() == units[1:]
+
+
+def test_stream_units_empty(client: TestClient) -> None:
+    ndjson = client.get('/api/unidades/', headers={'Accept': 'application/x-ndjson'})
+    array = client.get('/api/unidades/', params={'stream': 1})
+
+    assert ndjson.text == ''
+    assert array.json() == []
+
+
+def test_stream_units_invalid_cursor(client: TestClient) -> None:
+    response = client.get('/api/unidades/', params={'stream': 1, 'cursor': 'nao-e-um-cursor'})
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
 def test_get_unit_success(client: TestClient, admin_token: str) -> None:
     payload = {'name': 'Unidade Y', 'address': 'Rua Y, 9'}
     unit_id = client.post('/api/unidades/', headers={'Authorization': f'Bearer {admin_token}'}, json=payload).json()[
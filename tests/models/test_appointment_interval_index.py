@@ -0,0 +1,127 @@
+import time
+from datetime import datetime, timedelta
+from uuid import UUID, uuid4
+
+from vidaplus.main.enums.appointment_status import AppointmentStatus
+from vidaplus.main.enums.appointment_types import AppointmentTypes
+from vidaplus.main.schemas.appointment import AppointmentSchema
+from vidaplus.models.cache.appointment_interval_index import AppointmentIntervalIndex, ProfessionalAgenda
+
+START = datetime(2030, 1, 1, 9)
+
+
+def make_appointment(
+    id: int,
+    professional_id: UUID,
+    minutes: int,
+    duration: int = 30,
+    status: AppointmentStatus = AppointmentStatus.SCHEDULED,
+) -> AppointmentSchema:
+    return AppointmentSchema(
+        id=id,
+        patient_id=uuid4(),
+        professional_id=professional_id,
+        date_time=START + timedelta(minutes=minutes),
+        type=AppointmentTypes.CONSULTATION,
+        status=status,
+        estimated_duration=duration,
+        location='Sala 1',
+        notes='',
+        created_at=START,
+        updated_at=START,
+    )
+
+
+def at(minutes: int) -> datetime:
+    return START + timedelta(minutes=minutes)
+
+
+def test_agenda_detects_overlaps_with_half_open_intervals() -> None:
+    professional_id = uuid4()
+    agenda = ProfessionalAgenda(
+        [
+            make_appointment(1, professional_id, 0),
+            make_appointment(2, professional_id, 60),
+            make_appointment(3, professional_id, 30, status=AppointmentStatus.CANCELED),
+        ],
+        loaded_at=0,
+    )
+
+    assert agenda.has_time_conflict(at(15), at(45))
+    assert agenda.has_time_conflict(at(-10), at(100))
+    assert not agenda.has_time_conflict(at(30), at(60))
+    assert not agenda.has_time_conflict(at(0), at(30), exclude_id=1)
+    assert [appointment.id for appointment in agenda.between(at(0), at(90))] == [3, 2]
+
+
+def test_index_evicts_least_recently_used_professionals() -> None:
+    index = AppointmentIntervalIndex(max_professionals=2, max_entries=100, reconcile_interval=60)
+    first, second, third = uuid4(), uuid4(), uuid4()
+
+    for professional_id in (first, second):
+        index.store(professional_id, ProfessionalAgenda([], time.monotonic()), index.epoch)
+
+    index.between(first)
+    index.store(third, ProfessionalAgenda([], time.monotonic()), index.epoch)
+
+    assert index.between(first) == []
+    assert index.between(second) is None
+    assert index.between(third) == []
+
+
+def test_index_bounds_the_total_number_of_entries() -> None:
+    index = AppointmentIntervalIndex(max_professionals=10, max_entries=2, reconcile_interval=60)
+    first, second = uuid4(), uuid4()
+
+    index.store(first, ProfessionalAgenda([make_appointment(1, first, 0)], time.monotonic()), index.epoch)
+    index.store(second, ProfessionalAgenda([make_appointment(2, second, 0)], time.monotonic()), index.epoch)
+    index.apply([make_appointment(3, second, 60)])
+
+    assert index.between(first) is None
+    assert [appointment.id for appointment in index.between(second) or []] == [2, 3]
+
+
+def test_index_applies_committed_writes_and_rejects_stale_loads() -> None:
+    index = AppointmentIntervalIndex(max_professionals=10, max_entries=100, reconcile_interval=60)
+    professional_id, other_professional_id = uuid4(), uuid4()
+    epoch = index.epoch
+
+    index.apply([make_appointment(1, professional_id, 0)])
+
+    assert not index.store(professional_id, ProfessionalAgenda([], time.monotonic()), epoch)
+    assert index.store(professional_id, ProfessionalAgenda([], time.monotonic()), index.epoch)
+
+    index.apply([make_appointment(1, professional_id, 0)])
+    assert index.has_time_conflict(professional_id, at(10), at(20))
+
+    index.store(other_professional_id, ProfessionalAgenda([], time.monotonic()), index.epoch)
+    index.apply([make_appointment(1, other_professional_id, 0)])
+
+    assert index.has_time_conflict(professional_id, at(10), at(20)) is False
+    assert index.has_time_conflict(other_professional_id, at(10), at(20)) is True
+
+
+def test_index_reconciles_expired_agendas() -> None:
+    index = AppointmentIntervalIndex(max_professionals=10, max_entries=100, reconcile_interval=0)
+    professional_id = uuid4()
+
+    index.store(professional_id, ProfessionalAgenda([], 0), index.epoch)
+
+    assert index.between(professional_id) is None
+    assert index.misses == 1
+
+
+def test_index_tracks_professionals_with_pending_series() -> None:
+    index = AppointmentIntervalIndex(max_professionals=10, max_entries=100, reconcile_interval=60)
+    professional_id, other_professional_id = uuid4(), uuid4()
+    epoch = index.epoch
+
+    assert index.has_series(professional_id)
+
+    index.store(professional_id, ProfessionalAgenda([], time.monotonic()), index.epoch)
+    assert not index.has_series(professional_id)
+
+    index.apply([], series=[professional_id, other_professional_id])
+
+    assert index.has_series(professional_id)
+    assert not index.store(other_professional_id, ProfessionalAgenda([], time.monotonic()), epoch)
@@ -0,0 +1,159 @@
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from typing import Any, Optional
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import Engine
+
+from vidaplus.main.enums.appointment_status import AppointmentStatus
+from vidaplus.main.enums.appointment_types import AppointmentTypes
+from vidaplus.main.enums.recurrence_frequencies import RecurrenceFrequencies
+from vidaplus.main.exceptions import AppointmentSeriesNotFoundError
+from vidaplus.main.schemas.user import UserSchema
+from vidaplus.models.config.unit_of_work import UnitOfWork
+from vidaplus.models.entities.appointment import Appointment
+from vidaplus.models.entities.appointment_series import AppointmentSeries, recurrence
+from vidaplus.models.repositories import appointment_repository
+from vidaplus.models.repositories.appointment_repository import (
+    APPOINTMENT_KEYSET,
+    AppointmentRepository,
+    appointment_key,
+    expand_series,
+    occurrences_after,
+    skipped_occurrences,
+)
+from vidaplus.models.repositories.appointment_series_repository import AppointmentSeriesRepository
+
+START = datetime(2026, 1, 31, 9, tzinfo=timezone.utc)
+
+
+def test_weekly_recurrence_with_interval_and_count() -> None:
+    occurrences = list(recurrence(START, RecurrenceFrequencies.WEEKLY, interval=2, count=3))
+
+    assert [occurrence.day for occurrence in occurrences] == [31, 14, 28]
+    assert [occurrence.month for occurrence in occurrences] == [1, 2, 2]
+
+
+def test_monthly_recurrence_skips_months_without_the_day() -> None:
+    occurrences = list(recurrence(START, RecurrenceFrequencies.MONTHLY, count=4))
+
+    assert [occurrence.month for occurrence in occurrences] == [1, 3, 5, 7]
+
+
+def test_recurrence_until_is_inclusive() -> None:
+    occurrences = list(
+        recurrence(START, RecurrenceFrequencies.DAILY, until=datetime(2026, 2, 2, 9, tzinfo=timezone.utc))
+    )
+
+    assert [occurrence.day for occurrence in occurrences] == [31, 1, 2]
+
+
+def test_recurrence_limit_stops_unbounded_rules() -> None:
+    LIMIT = 10
+
+    assert len(list(recurrence(START, RecurrenceFrequencies.DAILY, limit=LIMIT))) == LIMIT
+
+
+def test_occurrences_missing_from_returning_are_marked_canceled() -> None:
+    starts = [START + timedelta(weeks=week) for week in range(3)]
+    rows = [{'series_id': 1, 'date_time': start, 'status': AppointmentStatus.SCHEDULED} for start in starts]
+    # O ON CONFLICT pulou a segunda ocorrência; o banco devolve os horários em outro fuso.
+    inserted = [
+        Appointment(series_id=1, date_time=start.astimezone(timezone(timedelta(hours=-3))))
+        for start in (starts[0], starts[2])
+    ]
+
+    assert skipped_occurrences(rows, inserted) == [{**rows[1], 'status': AppointmentStatus.CANCELED}]
+
+
+def make_series(
+    series_id: Optional[int],
+    starts_at: datetime,
+    count: int,
+    patient: Optional[UserSchema] = None,
+    professional: Optional[UserSchema] = None,
+) -> AppointmentSeries:
+    return AppointmentSeries(
+        id=series_id,
+        patient_id=patient.id if patient else uuid4(),
+        professional_id=professional.id if professional else uuid4(),
+        type=AppointmentTypes.CONSULTATION,
+        status=AppointmentStatus.SCHEDULED,
+        estimated_duration=30,
+        location='Consultório 3',
+        notes='',
+        starts_at=starts_at,
+        frequency=RecurrenceFrequencies.DAILY,
+        interval=1,
+        count=count,
+        until=None,
+        materialized_until=starts_at,
+        ends_at=starts_at + timedelta(days=count),
+    )
+
+
+def test_occurrences_after_expands_series_lazily_in_key_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    OCCURRENCES = 260
+    PAGE_SIZE = 5
+    series = [make_series(series_id, START + timedelta(hours=series_id), OCCURRENCES) for series_id in (1, 2, 3)]
+    expected = sorted(expand_series(series), key=appointment_key)
+    created = 0
+    schema = appointment_repository.AppointmentOccurrenceSchema
+
+    def counting_schema(**values: Any) -> Any:
+        nonlocal created
+        created += 1
+        return schema(**values)
+
+    monkeypatch.setattr(appointment_repository, 'AppointmentOccurrenceSchema', counting_schema)
+    cursor = APPOINTMENT_KEYSET.encode(appointment_key(expected[PAGE_SIZE - 1]))
+    page = list(islice(occurrences_after(series, cursor=cursor), PAGE_SIZE))
+
+    assert page == expected[PAGE_SIZE : 2 * PAGE_SIZE]
+    # Uma ocorrência gerada além da página em cada série, para o `heapq.merge` comparar.
+    assert created <= PAGE_SIZE + len(series)
+
+
+def test_stream_generates_occurrences_as_they_are_consumed(
+    engine: Engine, patient: UserSchema, healthcare_professional: UserSchema, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    OCCURRENCES = 260
+    starts_at = datetime.now(timezone.utc) + timedelta(days=1)
+    created = 0
+    schema = appointment_repository.AppointmentOccurrenceSchema
+
+    def counting_schema(**values: Any) -> Any:
+        nonlocal created
+        created += 1
+        return schema(**values)
+
+    monkeypatch.setattr(appointment_repository, 'AppointmentOccurrenceSchema', counting_schema)
+
+    with UnitOfWork() as uow:
+        uow.session.add(make_series(None, starts_at, OCCURRENCES, patient, healthcare_professional))
+        uow.session.flush()
+
+        stream = AppointmentRepository(uow).stream(patient_id=patient.id)
+        first = next(stream)
+
+    assert first.date_time == starts_at
+    assert created == 1
+
+
+def test_cancel_series_in_a_single_update(
+    engine: Engine, patient: UserSchema, healthcare_professional: UserSchema
+) -> None:
+    with UnitOfWork() as uow:
+        series = make_series(None, datetime.now(timezone.utc) + timedelta(days=1), 3, patient, healthcare_professional)
+        uow.session.add(series)
+        uow.session.flush()
+        repository = AppointmentSeriesRepository(uow)
+
+        repository.cancel(series.id)
+
+        with pytest.raises(AppointmentSeriesNotFoundError):
+            repository.cancel(series.id + 1)
+
+        assert (canceled := repository.get_by_id(series.id))
+        assert canceled.status == AppointmentStatus.CANCELED
@@ -0,0 +1,13 @@
+from sqlalchemy.dialects import postgresql
+
+from vidaplus.main.enums.bed_types import BedTypes
+from vidaplus.models.entities.bed import Bed
+from vidaplus.models.repositories.bed_repository import available_bed, occupy_bed
+
+
+def test_claim_skips_beds_locked_by_other_allocations() -> None:
+    sql = str(occupy_bed(Bed.id == available_bed(1, BedTypes.ICU)).compile(dialect=postgresql.dialect()))
+
+    assert 'FOR UPDATE SKIP LOCKED' in sql
+    assert sql.startswith('UPDATE bed SET status=')
+    assert 'RETURNING' in sql
@@ -0,0 +1,42 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+from tests.models.test_token_cache import make_token_data
+from vidaplus.models.cache.appointment_interval_index import AppointmentIntervalIndex
+from vidaplus.models.cache.login_throttle import UnknownEmailCache
+from vidaplus.models.cache.stats import cache_stats
+from vidaplus.models.cache.token_cache import TokenCache
+from vidaplus.run import report_caches
+
+
+def test_cache_stats_reports_the_counters_of_enabled_caches(
+    token_cache: TokenCache, appointment_index: AppointmentIntervalIndex
+) -> None:
+    unknown_emails = UnknownEmailCache.get_instance()
+    assert unknown_emails is not None
+
+    token_cache.put('token', make_token_data(datetime.now(timezone.utc) + timedelta(minutes=5)))
+    token_cache.get('token')
+    token_cache.get('other-token')
+    appointment_index.between(uuid4())
+    unknown_emails.add('nobody@example.com')
+    assert 'nobody@example.com' in unknown_emails
+
+    assert cache_stats() == {
+        'token_cache': {'hits': 1, 'misses': 1},
+        'appointment_index': {'hits': 0, 'misses': 1},
+        'unknown_emails': {'hits': 1},
+    }
+
+
+def test_report_caches_logs_the_counters(token_cache: TokenCache, caplog: pytest.LogCaptureFixture) -> None:
+    token_cache.get('token')
+
+    with caplog.at_level(logging.INFO, logger='vidaplus.run'):
+        asyncio.run(report_caches(asynchronous=False))
+
+    assert 'token_cache hits=0, misses=1' in caplog.text
@@ -0,0 +1,39 @@
+import time
+import uuid
+
+import pytest
+
+from vidaplus.models.config.identifiers import MAX_COUNTER, UUID7Generator
+
+NOW_MS = 1_760_000_000_000
+VERSION = 7
+
+
+def test_uuid7_layout() -> None:
+    before = time.time_ns() // 1_000_000
+    value = UUID7Generator()()
+
+    assert value.version == VERSION
+    assert value.variant == uuid.RFC_4122
+    assert before <= value.int >> 80 <= time.time_ns() // 1_000_000
+
+
+def test_uuid7_is_strictly_increasing_within_a_millisecond(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(time, 'time_ns', lambda: NOW_MS * 1_000_000)
+    generate = UUID7Generator()
+
+    ids = [generate() for _ in range(MAX_COUNTER + 2)]
+
+    assert ids == sorted(ids)
+    assert len(set(ids)) == len(ids)
+    # O contador esgotado avança o timestamp em vez de repetir ids.
+    assert ids[-1].int >> 80 == NOW_MS + 1
+
+
+def test_uuid7_keeps_increasing_when_the_clock_goes_back(monkeypatch: pytest.MonkeyPatch) -> None:
+    generate = UUID7Generator()
+    monkeypatch.setattr(time, 'time_ns', lambda: NOW_MS * 1_000_000)
+    first = generate()
+    monkeypatch.setattr(time, 'time_ns', lambda: (NOW_MS - 1000) * 1_000_000)
+
+    assert generate() > first
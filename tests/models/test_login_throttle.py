@@ -0,0 +1,120 @@
+import time
+
+import pytest
+
+from vidaplus.models.cache.login_throttle import LoginThrottle, TokenBucket, UnknownEmailCache
+
+BURST = 3
+PER_MINUTE = 60
+MAX_KEYS = 4
+
+
+def make_throttle(client_burst: int = BURST, email_burst: int = BURST) -> LoginThrottle:
+    return LoginThrottle(client_burst, PER_MINUTE, email_burst, PER_MINUTE, MAX_KEYS)
+
+
+def test_bucket_refills_at_rate_up_to_capacity() -> None:
+    bucket = TokenBucket(capacity=2, rate=1, now=0)
+
+    bucket.take(0)
+    bucket.take(0)
+
+    assert bucket.available(0) == 0
+    assert bucket.available(0.5) == 0.5  # noqa: PLR2004
+    assert bucket.available(10) == 2  # noqa: PLR2004
+
+
+def test_throttle_limits_attempts_by_email() -> None:
+    throttle = make_throttle()
+
+    assert all(throttle.allow(f'10.0.0.{i}', 'johndoe@example.com') for i in range(BURST))
+    assert not throttle.allow('10.0.0.9', 'JohnDoe@example.com')
+    assert throttle.allow('10.0.0.9', 'janedoe@example.com')
+    assert throttle.rejected == 1
+
+
+def test_throttle_limits_attempts_by_client() -> None:
+    throttle = make_throttle(email_burst=BURST * 2)
+
+    assert all(throttle.allow('10.0.0.1', f'user{i}@example.com') for i in range(BURST))
+    assert not throttle.allow('10.0.0.1', 'another@example.com')
+    assert throttle.allow('10.0.0.2', 'another@example.com')
+
+
+def test_rejected_attempt_does_not_consume_other_bucket() -> None:
+    throttle = make_throttle(client_burst=1)
+
+    assert throttle.allow('10.0.0.1', 'johndoe@example.com')
+    assert not throttle.allow('10.0.0.1', 'janedoe@example.com')
+    assert throttle.allow('10.0.0.2', 'janedoe@example.com')
+    assert all(throttle.allow(f'10.0.0.{i}', 'janedoe@example.com') for i in range(3, BURST + 2))
+
+
+def test_throttle_refills_over_time(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = time.monotonic()
+    monkeypatch.setattr(time, 'monotonic', lambda: now)
+    throttle = make_throttle()
+
+    assert all(throttle.allow(None, 'johndoe@example.com') for _ in range(BURST))
+    assert not throttle.allow(None, 'johndoe@example.com')
+
+    now += 1
+    assert throttle.allow(None, 'johndoe@example.com')
+
+
+def test_throttle_evicts_least_recently_used_keys() -> None:
+    throttle = make_throttle()
+
+    for _ in range(BURST):
+        throttle.allow(None, 'johndoe@example.com')
+
+    for i in range(MAX_KEYS):
+        throttle.allow(None, f'user{i}@example.com')
+
+    # O balde descartado volta cheio.
+    assert throttle.allow(None, 'johndoe@example.com')
+
+
+def test_throttle_is_disabled_by_setting(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv('LOGIN_THROTTLE_ENABLED', 'false')
+    LoginThrottle.reset()
+
+    assert LoginThrottle.get_instance() is None
+
+
+def test_unknown_email_cache_expires_entries(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = time.monotonic()
+    monkeypatch.setattr(time, 'monotonic', lambda: now)
+    cache = UnknownEmailCache(MAX_KEYS, ttl=10)
+
+    cache.add('ghost@example.com')
+    assert 'ghost@example.com' in cache
+    assert 'other@example.com' not in cache
+
+    now += 10
+    assert 'ghost@example.com' not in cache
+    assert cache.hits == 1
+
+
+def test_unknown_email_cache_discards_and_evicts() -> None:
+    cache = UnknownEmailCache(MAX_KEYS, ttl=60)
+
+    for i in range(MAX_KEYS + 1):
+        cache.add(f'user{i}@example.com')
+
+    cache.discard(f'user{MAX_KEYS}@example.com')
+
+    assert 'user0@example.com' not in cache
+    assert f'user{MAX_KEYS}@example.com' not in cache
+    assert all(f'user{i}@example.com' in cache for i in range(1, MAX_KEYS))
+
+
+def test_unknown_email_cache_ignores_case() -> None:
+    cache = UnknownEmailCache(MAX_KEYS, ttl=60)
+    cache.add('Ghost@Example.com')
+
+    assert 'ghost@example.com' in cache
+
+    cache.discard('GHOST@example.com')
+
+    assert 'Ghost@Example.com' not in cache
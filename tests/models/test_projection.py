@@ -0,0 +1,29 @@
+from sqlalchemy import Engine
+
+from vidaplus.main.schemas.appointment import AppointmentSchema
+from vidaplus.main.schemas.bed import BedSchema
+from vidaplus.main.schemas.unit import UnitSchema
+from vidaplus.models.config.unit_of_work import UnitOfWork
+from vidaplus.models.repositories.appointment_repository import AppointmentRepository
+from vidaplus.models.repositories.bed_repository import BedRepository
+
+
+def test_bed_list_reads_rows_without_loading_entities(engine: Engine, bed: BedSchema, unit: UnitSchema) -> None:
+    with UnitOfWork() as uow:
+        page = BedRepository(uow).all()
+        streamed = list(BedRepository(uow).stream())
+
+        assert len(uow.session.identity_map) == 0
+
+    assert page.items == streamed == [bed]
+    assert page.items[0].unit == unit
+
+
+def test_appointment_list_reads_rows_without_loading_entities(engine: Engine, appointment: AppointmentSchema) -> None:
+    with UnitOfWork() as uow:
+        page = AppointmentRepository(uow).get()
+        streamed = list(AppointmentRepository(uow).stream())
+
+        assert len(uow.session.identity_map) == 0
+
+    assert page.items == streamed == [appointment]
@@ -0,0 +1,92 @@
+import time
+
+import pytest
+
+from vidaplus.models.cache.revocation_list import BloomFilter, RevocationList
+
+CAPACITY = 1000
+ERROR_RATE = 0.01
+
+
+def make_list(sync_interval: float = 0, rebuild_interval: float = 3600) -> RevocationList:
+    return RevocationList(CAPACITY, ERROR_RATE, sync_interval, rebuild_interval)
+
+
+def test_bloom_filter_has_no_false_negatives_and_few_false_positives() -> None:
+    bloom = BloomFilter(CAPACITY, ERROR_RATE)
+
+    for i in range(CAPACITY):
+        bloom.add(f'revoked-{i}')
+
+    assert all(f'revoked-{i}' in bloom for i in range(CAPACITY))
+
+    false_positives = sum(f'valid-{i}' in bloom for i in range(10 * CAPACITY))
+    assert false_positives <= 2 * ERROR_RATE * 10 * CAPACITY
+
+
+def test_list_counts_checks_and_lookups() -> None:
+    revocations = make_list()
+    revocations.add('revoked')
+
+    assert 'revoked' in revocations
+    assert 'valid' not in revocations
+    assert (revocations.checks, revocations.lookups) == (2, 1)
+
+
+def test_sync_is_claimed_by_one_caller_per_interval(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = time.monotonic()
+    monkeypatch.setattr(time, 'monotonic', lambda: now)
+    revocations = make_list(sync_interval=1)
+
+    assert revocations.claim_sync() == 0
+    assert revocations.claim_sync() is None
+
+    revocations.apply([(1, 'a'), (3, 'b')])
+    assert revocations.claim_sync() is None
+
+    now += 1
+    assert revocations.claim_sync() == 3  # noqa: PLR2004
+
+    revocations.release()
+    assert revocations.claim_sync() == 3  # noqa: PLR2004
+
+
+def test_sync_never_rebuilds_the_filter() -> None:
+    revocations = make_list(rebuild_interval=0)
+    revocations.add('local')
+
+    revocations.apply([(1, 'a')])
+    assert revocations.claim_sync() == 1
+    assert not revocations.claim_rebuild()
+
+    revocations.apply([(2, 'b')])
+    assert all(jti in revocations for jti in ('local', 'a', 'b'))
+    assert len(revocations) == 3  # noqa: PLR2004
+
+
+def test_rebuild_drops_expired_revocations_and_keeps_local_ones() -> None:
+    revocations = make_list(rebuild_interval=0)
+    assert revocations.claim_rebuild()
+    revocations.rebuild([(1, 'expired')])
+    revocations.add('local')
+
+    assert revocations.claim_rebuild()
+    revocations.rebuild([(2, 'still-valid')])
+
+    assert 'expired' not in revocations
+    assert 'local' in revocations
+    assert 'still-valid' in revocations
+    assert len(revocations) == 2  # noqa: PLR2004
+    assert revocations.claim_sync() == 2  # noqa: PLR2004
+
+
+def test_filter_over_capacity_is_rebuilt() -> None:
+    revocations = make_list()
+    assert revocations.claim_rebuild()
+    revocations.rebuild([])
+    assert not revocations.claim_rebuild()
+
+    for i in range(CAPACITY + 1):
+        revocations.add(f'revoked-{i}')
+
+    assert revocations.claim_rebuild()
@@ -0,0 +1,88 @@
+import time
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from starlette.requests import Request
+
+from vidaplus.main.enums.roles import Roles
+from vidaplus.main.exceptions import InvalidTokenError
+from vidaplus.main.schemas.auth import TokenData
+from vidaplus.models.cache.token_cache import TokenCache
+from vidaplus.services.auth_service import AuthService
+
+MAX_ENTRIES = 2
+
+
+def make_token_data(exp: datetime) -> TokenData:
+    return TokenData(
+        id=uuid4(),
+        name='John Doe',
+        email='johndoe@example.com',
+        role=Roles.PATIENT,
+        created_at=datetime.now(timezone.utc),
+        exp=exp,
+    )
+
+
+def test_cache_counts_hits_and_misses() -> None:
+    cache = TokenCache(MAX_ENTRIES)
+    data = make_token_data(datetime.now(timezone.utc) + timedelta(minutes=5))
+
+    assert cache.get('token') is None
+    cache.put('token', data)
+
+    assert cache.get('token') is data
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_cache_evicts_entries_at_expiration() -> None:
+    cache = TokenCache(MAX_ENTRIES)
+    cache.put('expired', make_token_data(datetime.now(timezone.utc) - timedelta(seconds=1)))
+    cache.put('expiring', make_token_data(datetime.now(timezone.utc) + timedelta(milliseconds=50)))
+
+    assert len(cache) == 1
+
+    time.sleep(0.1)
+
+    assert cache.get('expiring') is None
+    assert len(cache) == 0
+
+
+def test_cache_evicts_least_recently_used() -> None:
+    cache = TokenCache(MAX_ENTRIES)
+    exp = datetime.now(timezone.utc) + timedelta(minutes=5)
+
+    cache.put('a', make_token_data(exp))
+    cache.put('b', make_token_data(exp))
+    cache.get('a')
+    cache.put('c', make_token_data(exp))
+
+    assert cache.get('b') is None
+    assert cache.get('a') is not None
+    assert cache.get('c') is not None
+
+
+def test_decoded_tokens_are_cached(token_cache: TokenCache, token: str) -> None:
+    first = AuthService.decode_access_token(token)
+    second = AuthService.decode_access_token(token)
+
+    assert second is first
+    assert (token_cache.hits, token_cache.misses) == (1, 1)
+
+
+def test_token_is_decoded_once_per_request(token_cache: TokenCache, admin_token: str) -> None:
+    request = Request({'type': 'http'})
+
+    user = AuthService.get_current_user(request, admin_token)
+    AuthService.is_admin(request, admin_token)
+
+    assert AuthService.authenticate(request, admin_token) is user
+    assert (token_cache.hits, token_cache.misses) == (0, 1)
+
+
+def test_invalid_tokens_are_not_cached(token_cache: TokenCache) -> None:
+    with pytest.raises(InvalidTokenError):
+        AuthService.decode_access_token('invalid')
+
+    assert len(token_cache) == 0
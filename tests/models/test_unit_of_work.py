@@ -0,0 +1,43 @@
+import pytest
+from sqlalchemy import Engine, func, select
+
+from vidaplus.main.schemas.bed import CreateBedSchema
+from vidaplus.main.schemas.unit import CreateUnitSchema
+from vidaplus.models.config.connection import DatabaseConnectionHandler
+from vidaplus.models.config.unit_of_work import UnitOfWork
+from vidaplus.models.entities.bed import Bed
+from vidaplus.models.entities.unit import Unit
+from vidaplus.models.repositories.bed_repository import BedRepository
+from vidaplus.models.repositories.unit_repository import UnitRepository
+
+
+def count(entity: type) -> int:
+    with DatabaseConnectionHandler() as db:
+        return db.session.scalar(select(func.count()).select_from(entity)) or 0
+
+
+def test_repositories_share_the_same_transaction(engine: Engine) -> None:
+    with UnitOfWork() as uow:
+        unit = UnitRepository(uow).create(CreateUnitSchema(name='Unidade', address='Rua 1'))
+        bed = BedRepository(uow).create(CreateBedSchema(unit_id=unit.id, type='STANDARD', status='AVAILABLE'))
+
+        assert bed.unit.id == unit.id
+        assert UnitRepository(uow).get_by_id(unit.id) is not None
+
+    assert count(Unit) == 1
+    assert count(Bed) == 1
+
+
+def create_unit_with_bed_and_fail() -> None:
+    with UnitOfWork() as uow:
+        unit = UnitRepository(uow).create(CreateUnitSchema(name='Unidade', address='Rua 1'))
+        BedRepository(uow).create(CreateBedSchema(unit_id=unit.id, type='STANDARD', status='AVAILABLE'))
+        raise RuntimeError()
+
+
+def test_error_rolls_back_every_write(engine: Engine) -> None:
+    with pytest.raises(RuntimeError):
+        create_unit_with_bed_and_fail()
+
+    assert count(Unit) == 0
+    assert count(Bed) == 0
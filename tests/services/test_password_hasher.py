@@ -0,0 +1,114 @@
+import asyncio
+from http import HTTPStatus
+from typing import Any, Generator
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+
+from vidaplus.main.exceptions import PasswordHashingBusyError
+from vidaplus.main.schemas.user import UserSchema
+from vidaplus.models.config.connection import DatabaseConnectionHandler
+from vidaplus.models.entities.user import User
+from vidaplus.services.password_hasher import PasswordHasher, calibrate, hash_rounds
+
+PASSWORD_HASH_ROUNDS = 5
+MAX_ROUNDS = 16
+
+
+@pytest.fixture
+def password_hasher(monkeypatch: pytest.MonkeyPatch) -> Generator[type[PasswordHasher], None, None]:
+    monkeypatch.setenv('PASSWORD_HASH_ROUNDS', str(PASSWORD_HASH_ROUNDS))
+    monkeypatch.setenv('PASSWORD_HASH_WORKERS', '1')
+    monkeypatch.setenv('PASSWORD_HASH_TARGET_MS', '0')
+    PasswordHasher.shutdown()
+
+    yield PasswordHasher
+
+    PasswordHasher.shutdown()
+
+
+def test_hash_and_verify_in_the_pool(password_hasher: type[PasswordHasher]) -> None:
+    hashed = password_hasher.hash('ilovepotatos')
+
+    assert hashed.startswith(f'$2b$0{PASSWORD_HASH_ROUNDS}$')
+    assert password_hasher.verify('ilovepotatos', hashed)
+    assert not password_hasher.verify('iloveapples', hashed)
+
+
+def test_hash_and_verify_asynchronously(password_hasher: type[PasswordHasher]) -> None:
+    async def roundtrip() -> bool:
+        hashed = await password_hasher.hash_async('ilovepotatos')
+        return await password_hasher.verify_async('ilovepotatos', hashed)
+
+    assert asyncio.run(roundtrip())
+
+
+def test_saturated_pool_rejects_early(password_hasher: type[PasswordHasher], monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv('PASSWORD_HASH_MAX_PENDING', '0')
+
+    with pytest.raises(PasswordHashingBusyError):
+        password_hasher.hash('ilovepotatos')
+
+
+def test_login_when_pool_is_saturated(
+    client: TestClient, patient: UserSchema, password_hasher: type[PasswordHasher], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv('PASSWORD_HASH_MAX_PENDING', '0')
+
+    response = client.post('/api/auth/token', json={'email': patient.email, 'password': 'ilovepotatos'})
+
+    assert response.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+
+
+def test_routes_wait_for_the_pool_without_blocking_threads(
+    client: TestClient, patient: UserSchema, password_hasher: type[PasswordHasher], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def blocking(*args: Any) -> Any:
+        raise AssertionError('as rotas não devem prender uma thread do pool à espera do bcrypt')
+
+    monkeypatch.setattr(password_hasher, 'hash', blocking)
+    monkeypatch.setattr(password_hasher, 'verify', blocking)
+
+    login = client.post('/api/auth/token', json={'email': patient.email, 'password': 'ilovepotatos'})
+    register = client.post(
+        '/api/pacientes', json={'name': 'Mary Doe', 'email': 'marydoe@example.com', 'password': 'ilovepotatos'}
+    )
+
+    assert login.status_code == HTTPStatus.OK
+    assert register.status_code == HTTPStatus.CREATED
+
+
+def test_calibrate_picks_the_highest_cost_within_target() -> None:
+    # 10 ms no custo 10: 20 ms no 11, 40 ms no 12 e 80 ms no 13.
+    assert calibrate(0.01, 10, 0.05, MAX_ROUNDS) == 12  # noqa: PLR2004
+    assert calibrate(0.01, 10, 0.005, MAX_ROUNDS) == 10  # noqa: PLR2004
+    assert calibrate(0.01, 10, 1000, MAX_ROUNDS) == MAX_ROUNDS
+
+
+def test_start_calibrates_the_cost(password_hasher: type[PasswordHasher], monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv('PASSWORD_HASH_ROUNDS', '4')
+    monkeypatch.setenv('PASSWORD_HASH_MAX_ROUNDS', str(PASSWORD_HASH_ROUNDS))
+    monkeypatch.setenv('PASSWORD_HASH_TARGET_MS', '60000')
+
+    password_hasher.start()
+
+    assert password_hasher.rounds == PASSWORD_HASH_ROUNDS
+    assert hash_rounds(password_hasher.hash('ilovepotatos')) == PASSWORD_HASH_ROUNDS
+
+
+def test_login_rehashes_outdated_password(
+    client: TestClient, patient: UserSchema, password_hasher: type[PasswordHasher]
+) -> None:
+    assert hash_rounds(patient.password) < PASSWORD_HASH_ROUNDS
+
+    for _ in range(2):
+        response = client.post('/api/auth/token', json={'email': patient.email, 'password': 'ilovepotatos'})
+        assert response.status_code == HTTPStatus.OK
+
+    with DatabaseConnectionHandler() as db:
+        stored = db.session.scalar(select(User.password).where(User.id == patient.id))
+
+    assert stored is not None
+    assert hash_rounds(stored) == PASSWORD_HASH_ROUNDS
+    assert not password_hasher.needs_rehash(stored)
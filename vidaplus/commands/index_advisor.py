@@ -0,0 +1,210 @@
+"""Aponta índices que faltam para chaves estrangeiras e para os filtros das consultas mais custosas.
+
+Uso: `python -m vidaplus.commands.index_advisor [--statements N]`, com o banco de `DATABASE_URL`.
+
+As chaves estrangeiras são conferidas a partir de `Base.metadata`. No PostgreSQL, as consultas mais custosas de
+`pg_stat_statements` (quando a extensão está instalada) têm as colunas filtradas comparadas aos índices existentes.
+"""
+
+import argparse
+import re
+import warnings
+from collections import defaultdict
+from typing import Iterable, NamedTuple, Optional, Sequence
+
+from sqlalchemy import Connection, MetaData, PrimaryKeyConstraint, Table, UniqueConstraint, inspect, text
+from sqlalchemy.engine import Inspector
+from sqlalchemy.exc import SAWarning
+
+import vidaplus.models.entities  # noqa: F401 - registra as tabelas em Base.metadata
+from vidaplus.models.config.base import Base
+from vidaplus.models.config.connection import EngineRegistry
+
+# `tabela.coluna` seguida de um operador de comparação, como aparece em WHERE e ON.
+FILTER = re.compile(
+    r'"?(\w+)"?\s*\.\s*"?(\w+)"?\s*(?:=|<>|!=|<=|>=|<|>|\bIN\b|\bIS\b|\bNOT\b|\bI?LIKE\b|\bBETWEEN\b)', re.IGNORECASE
+)
+# `FROM tabela AS apelido` e `JOIN tabela apelido`, para resolver os apelidos usados pelo SQLAlchemy.
+ALIAS = re.compile(
+    r'\b(?:FROM|JOIN)\s+"?(\w+)"?\s+(?:AS\s+)?'
+    r'(?!(?:WHERE|JOIN|LEFT|RIGHT|INNER|OUTER|FULL|CROSS|ON|ORDER|GROUP|LIMIT|FOR)\b)"?(\w+)"?',
+    re.IGNORECASE,
+)
+
+SLOW_STATEMENTS = text(
+    'SELECT query, calls, total_exec_time FROM pg_stat_statements '
+    "WHERE query ~* '^\\s*(SELECT|UPDATE|DELETE)' ORDER BY total_exec_time DESC LIMIT :limit"
+)
+
+
+class Statement(NamedTuple):
+    query: str
+    calls: int
+    total_time: float
+
+
+class Finding(NamedTuple):
+    table: str
+    columns: tuple[str, ...]
+    reason: str
+
+    def __str__(self) -> str:
+        return f'{self.table} ({", ".join(self.columns)}): {self.reason}'
+
+
+def declared_indexes(table: Table, partial: bool = True) -> list[tuple[str, ...]]:
+    """Colunas de cada índice, chave primária e restrição única declarados na tabela."""
+    indexes = [
+        tuple(column.name for column in constraint.columns)
+        for constraint in table.constraints
+        if isinstance(constraint, (PrimaryKeyConstraint, UniqueConstraint))
+    ]
+
+    for index in table.indexes:
+        if partial or not any(options.get('where') is not None for options in index.dialect_options.values()):
+            indexes.append(tuple(column.name for column in index.columns))
+
+    return indexes
+
+
+def reflected_indexes(inspector: Inspector, table_name: str, partial: bool = True) -> list[tuple[str, ...]]:
+    """Colunas de cada índice, chave primária e restrição única existentes no banco."""
+    indexes = [tuple(inspector.get_pk_constraint(table_name)['constrained_columns'])]
+
+    # O SQLite não reflete índices sobre expressões, como `ix_user_lower_email`; eles não começam por uma coluna e não
+    # mudariam o resultado.
+    with warnings.catch_warnings():
+        warnings.filterwarnings('ignore', 'Skipped unsupported reflection of expression-based index', SAWarning)
+        uniques = inspector.get_unique_constraints(table_name)
+        reflected = inspector.get_indexes(table_name)
+
+    indexes.extend(tuple(unique['column_names']) for unique in uniques)
+
+    for index in reflected:
+        options = index.get('dialect_options', {})
+
+        if partial or not any(key.endswith('_where') and value is not None for key, value in options.items()):
+            indexes.append(tuple(column or '' for column in index['column_names']))
+
+    return indexes
+
+
+def table_indexes(table: Table, inspector: Optional[Inspector], partial: bool = True) -> list[tuple[str, ...]]:
+    if inspector is None:
+        return declared_indexes(table, partial)
+
+    return reflected_indexes(inspector, table.name, partial)
+
+
+def covers(index: tuple[str, ...], columns: Iterable[str]) -> bool:
+    """Se as colunas são as primeiras do índice, em qualquer ordem."""
+    columns = set(columns)
+    return set(index[: len(columns)]) == columns
+
+
+def missing_foreign_key_indexes(metadata: MetaData, inspector: Optional[Inspector] = None) -> list[Finding]:
+    """Chaves estrangeiras sem um índice completo que comece por elas.
+
+    Sem esse índice, os carregamentos de relacionamentos e as exclusões em cascata da tabela referenciada leem a
+    tabela inteira. Índices parciais não contam, já que não cobrem todas as linhas.
+    """
+    findings = []
+
+    for table in metadata.sorted_tables:
+        if inspector is not None and not inspector.has_table(table.name):
+            continue
+
+        indexes = table_indexes(table, inspector, partial=False)
+
+        for foreign_key in table.foreign_key_constraints:
+            columns = tuple(column.name for column in foreign_key.columns)
+
+            if not any(covers(index, columns) for index in indexes):
+                reason = f'chave estrangeira para {foreign_key.referred_table.name} sem índice'
+                findings.append(Finding(table.name, columns, reason))
+
+    return findings
+
+
+def filtered_columns(query: str, tables: Iterable[str]) -> dict[str, set[str]]:
+    """Colunas comparadas em uma consulta, agrupadas por tabela e com os apelidos resolvidos."""
+    tables = set(tables)
+    aliases = {alias: table for table, alias in ALIAS.findall(query) if table in tables}
+    columns: dict[str, set[str]] = defaultdict(set)
+
+    for qualifier, column in FILTER.findall(query):
+        table = qualifier if qualifier in tables else aliases.get(qualifier)
+
+        if table is not None:
+            columns[table].add(column)
+
+    return columns
+
+
+def missing_filter_indexes(
+    statements: Iterable[Statement], metadata: MetaData, inspector: Optional[Inspector] = None
+) -> list[Finding]:
+    """Filtros das consultas em que nenhuma coluna filtrada é a primeira de um índice.
+
+    Os achados são somados por tabela e conjunto de colunas e ordenados pelo tempo total das consultas.
+    """
+    indexes = {
+        name: table_indexes(table, inspector)
+        for name, table in metadata.tables.items()
+        if inspector is None or inspector.has_table(name)
+    }
+    totals: dict[tuple[str, tuple[str, ...]], list[float]] = defaultdict(lambda: [0, 0.0])
+
+    for statement in statements:
+        for table, columns in filtered_columns(statement.query, indexes).items():
+            if not any(index and index[0] in columns for index in indexes[table]):
+                total = totals[table, tuple(sorted(columns))]
+                total[0] += statement.calls
+                total[1] += statement.total_time
+
+    ranked = sorted(totals.items(), key=lambda item: item[1][1], reverse=True)
+    return [
+        Finding(table, columns, f'filtro sem índice em {calls:.0f} execuções, {time:.0f} ms no total')
+        for (table, columns), (calls, time) in ranked
+    ]
+
+
+def slow_statements(connection: Connection, limit: int) -> list[Statement]:
+    """Consultas mais custosas de `pg_stat_statements`, ou nenhuma se a extensão não estiver instalada."""
+    if connection.dialect.name != 'postgresql':
+        return []
+
+    if connection.scalar(text("SELECT to_regclass('pg_stat_statements')")) is None:
+        return []
+
+    return [Statement(*row) for row in connection.execute(SLOW_STATEMENTS, {'limit': limit})]
+
+
+def advise(connection: Connection, metadata: MetaData, limit: int) -> list[Finding]:
+    inspector = inspect(connection)
+    findings = missing_foreign_key_indexes(metadata, inspector)
+    findings.extend(missing_filter_indexes(slow_statements(connection, limit), metadata, inspector))
+    return findings
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Aponta índices que faltam no banco de DATABASE_URL.')
+    parser.add_argument(
+        '--statements', type=int, default=50, help='quantas consultas de pg_stat_statements analisar (padrão: 50)'
+    )
+    args = parser.parse_args(argv)
+
+    with EngineRegistry.get_engine().connect() as connection:
+        findings = advise(connection, Base.metadata, args.statements)
+
+    for finding in findings:
+        print(finding)
+
+    if not findings:
+        print('Nenhum índice faltando.')
+
+    return 1 if findings else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,78 @@
+"""Mede quantos hashes bcrypt por segundo este computador faz em cada custo.
+
+Uso: `python -m vidaplus.commands.password_benchmark [--min-rounds N] [--max-rounds N] [--seconds S] [--workers N]`.
+
+Para cada custo, mostra a latência de um hash, a vazão de um processo e a vazão do pool com `--workers` processos
+(padrão: `PASSWORD_HASH_WORKERS`), que é o limite de logins por segundo de uma instância. Ao final, indica o custo que a
+calibração escolheria para `PASSWORD_HASH_TARGET_MS`.
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple, Optional, Sequence
+
+from vidaplus.services.password_hasher import calibrate, create_executor, hash_password, hash_time
+from vidaplus.settings import Settings
+
+
+class Measurement(NamedTuple):
+    rounds: int
+    latency: float
+    pool_throughput: float
+
+    def __str__(self) -> str:
+        return f'{self.rounds:>5} {self.latency * 1000:>13.1f} {1 / self.latency:>14.1f} {self.pool_throughput:>13.1f}'
+
+
+HEADER = f'{"custo":>5} {"latência (ms)":>13} {"hashes/s (1)":>14} {"hashes/s pool":>13}'
+
+
+def measure(executor: ProcessPoolExecutor, workers: int, rounds: int, seconds: float) -> Measurement:
+    """Mede a latência de um hash e a vazão do pool com hashes suficientes para ocupá-lo por cerca de `seconds`."""
+    latency = executor.submit(hash_time, rounds).result()
+    count = max(workers, round(seconds / latency) * workers)
+
+    start = time.perf_counter()
+    list(executor.map(hash_password, ['benchmark'] * count, [rounds] * count))
+    return Measurement(rounds, latency, count / (time.perf_counter() - start))
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    settings = Settings()
+    parser = argparse.ArgumentParser(description='Mede a vazão do bcrypt em cada custo.')
+    parser.add_argument('--min-rounds', type=int, default=settings.PASSWORD_HASH_ROUNDS, help='menor custo medido')
+    parser.add_argument('--max-rounds', type=int, default=settings.PASSWORD_HASH_MAX_ROUNDS, help='maior custo medido')
+    parser.add_argument('--seconds', type=float, default=1.0, help='tempo aproximado de cada medição de vazão')
+    parser.add_argument('--workers', type=int, default=settings.PASSWORD_HASH_WORKERS, help='processos do pool')
+    args = parser.parse_args(argv)
+
+    if args.min_rounds > args.max_rounds:
+        parser.error('--min-rounds não pode ser maior que --max-rounds')
+
+    workers = args.workers or os.cpu_count() or 1
+    executor = create_executor(workers)
+
+    try:
+        print(f'{workers} processo(s)')
+        print(HEADER)
+        measurements = []
+
+        for rounds in range(args.min_rounds, args.max_rounds + 1):
+            measurements.append(measure(executor, workers, rounds, args.seconds))
+            print(measurements[-1])
+    finally:
+        executor.shutdown()
+
+    if settings.PASSWORD_HASH_TARGET_MS:
+        first = measurements[0]
+        target = settings.PASSWORD_HASH_TARGET_MS / 1000
+        rounds = calibrate(first.latency, first.rounds, target, args.max_rounds)
+        print(f'Custo calibrado para {settings.PASSWORD_HASH_TARGET_MS} ms: {rounds}')
+
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
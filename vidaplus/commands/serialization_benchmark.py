@@ -0,0 +1,104 @@
+"""Mede quanto custa, por usuário, montar e serializar uma página de `/api/pacientes`.
+
+Uso: `python -m vidaplus.commands.serialization_benchmark [--rows N ...] [--repeat N]`.
+
+Compara o caminho anterior (cada linha validada pelo repositório, convertida de novo em `PublicUserSchema` pelo
+serviço e a página validada e serializada outra vez pelo `response_model` do FastAPI) com o atual (validação em lote
+com `TypeAdapter` e serialização direta pelo pydantic-core em `model_response`). As linhas são entidades montadas em
+memória, para que o banco não entre na medida.
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import datetime
+from typing import Callable, NamedTuple, Optional, Sequence
+from uuid import uuid4
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from vidaplus.controllers.responses import model_response
+from vidaplus.main.enums.roles import Roles
+from vidaplus.main.schemas.page import PageSchema
+from vidaplus.main.schemas.user import PublicUserSchema, UserSchema
+from vidaplus.models.entities.user import User
+from vidaplus.models.repositories.user_repository import USER_LIST
+from vidaplus.services.user_service import PUBLIC_USER_LIST
+
+RESPONSE_FIELD = create_model_field('response', PageSchema[PublicUserSchema])
+
+
+class Measurement(NamedTuple):
+    rows: int
+    before: float
+    after: float
+
+    def __str__(self) -> str:
+        before, after = self.before / self.rows * 1e6, self.after / self.rows * 1e6
+        return f'{self.rows:>7} {before:>12.2f} {after:>12.2f} {before / after:>9.1f}x'
+
+
+HEADER = f'{"linhas":>7} {"antes (µs)":>12} {"depois (µs)":>12} {"ganho":>10}'
+
+
+def make_users(rows: int) -> list[User]:
+    now = datetime.now()
+    return [
+        User(
+            id=uuid4(),
+            name=f'Paciente {i}',
+            email=f'paciente{i}@example.com',
+            password='$2b$12$' + 'x' * 53,
+            role=Roles.PATIENT,
+            created_at=now,
+        )
+        for i in range(rows)
+    ]
+
+
+def before(users: list[User]) -> bytes:
+    items = [UserSchema.model_validate(user) for user in users]
+    page: PageSchema[PublicUserSchema] = PageSchema(items=[PublicUserSchema(**user.model_dump()) for user in items])
+    content = asyncio.run(serialize_response(field=RESPONSE_FIELD, response_content=page))
+    return JSONResponse(content).body
+
+
+def after(users: list[User]) -> bytes:
+    items = USER_LIST.validate_python(users, from_attributes=True)
+    return model_response(PageSchema(items=PUBLIC_USER_LIST.validate_python(items))).body
+
+
+def best_time(function: Callable[[list[User]], bytes], users: list[User], repeat: int) -> float:
+    times = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(users)
+        times.append(time.perf_counter() - start)
+
+    return min(times)
+
+
+def measure(rows: int, repeat: int) -> Measurement:
+    users = make_users(rows)
+    return Measurement(rows, best_time(before, users, repeat), best_time(after, users, repeat))
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Mede o custo por linha da serialização das listagens.')
+    parser.add_argument('--rows', type=int, nargs='+', default=[50, 500], help='tamanhos de página medidos')
+    parser.add_argument('--repeat', type=int, default=20, help='repetições de cada medida; vale a mais rápida')
+    args = parser.parse_args(argv)
+
+    print(HEADER)
+
+    for rows in args.rows:
+        print(measure(rows, args.repeat))
+
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
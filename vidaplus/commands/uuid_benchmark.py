@@ -0,0 +1,94 @@
+"""Compara a inserção de usuários com ids UUID versão 4 (aleatórios) e versão 7 (ordenados pelo tempo).
+
+Uso: `python -m vidaplus.commands.uuid_benchmark [--rows N ...] [--batch N]`.
+
+Para cada versão, insere `--rows` linhas em uma tabela com a mesma chave primária e o mesmo índice `(role, id)` da
+tabela `user`, em transações de `--batch` linhas, num banco SQLite em arquivo temporário. Mostra a vazão e o tamanho
+dos dois índices, lido de `dbstat`. Com ids aleatórios, cada inserção altera uma página qualquer dos índices, e a vazão
+cai quando eles passam do tamanho do cache; com ids ordenados, as alterações se concentram nas últimas páginas.
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, NamedTuple, Optional, Sequence
+from uuid import UUID, uuid4
+
+from sqlalchemy import UUID as SQLUUID
+from sqlalchemy import Column, Enum, Index, MetaData, NullPool, Table, create_engine, insert, text
+
+from vidaplus.main.enums.roles import Roles
+from vidaplus.models.config.identifiers import uuid7
+
+GENERATORS: dict[str, Callable[[], UUID]] = {'uuid4': uuid4, 'uuid7': uuid7}
+
+
+class Measurement(NamedTuple):
+    version: str
+    rows: int
+    seconds: float
+    index_bytes: int
+
+    def __str__(self) -> str:
+        return (
+            f'{self.version:>6} {self.rows:>9} {self.rows / self.seconds:>12.0f} '
+            f'{self.index_bytes / 2**20:>13.1f} {self.index_bytes / self.rows:>13.1f}'
+        )
+
+
+HEADER = f'{"versão":>6} {"linhas":>9} {"linhas/s":>12} {"índices (MiB)":>13} {"bytes/linha":>13}'
+
+
+def make_table() -> Table:
+    return Table(
+        'user',
+        MetaData(),
+        Column('id', SQLUUID(as_uuid=True), primary_key=True),
+        Column('role', Enum(Roles), nullable=False),
+        Index('ix_user_role_id', 'role', 'id'),
+    )
+
+
+def measure(version: str, rows: int, batch: int, directory: Path) -> Measurement:
+    engine = create_engine(f'sqlite:///{directory / f"{version}.db"}', poolclass=NullPool)
+    table = make_table()
+    table.metadata.create_all(engine)
+    generate = GENERATORS[version]
+
+    start = time.perf_counter()
+
+    for offset in range(0, rows, batch):
+        with engine.begin() as connection:
+            count = min(batch, rows - offset)
+            connection.execute(insert(table), [{'id': generate(), 'role': Roles.PATIENT} for _ in range(count)])
+
+    seconds = time.perf_counter() - start
+
+    with engine.connect() as connection:
+        index_bytes = connection.scalar(
+            text("SELECT sum(pgsize) FROM dbstat WHERE name IN ('sqlite_autoindex_user_1', 'ix_user_role_id')")
+        )
+
+    engine.dispose()
+    return Measurement(version, rows, seconds, index_bytes or 0)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Compara a inserção de ids UUID versão 4 e versão 7.')
+    parser.add_argument('--rows', type=int, nargs='+', default=[100_000, 1_000_000], help='linhas inseridas')
+    parser.add_argument('--batch', type=int, default=1000, help='linhas por transação')
+    args = parser.parse_args(argv)
+
+    print(HEADER)
+
+    with tempfile.TemporaryDirectory() as directory:
+        for rows in args.rows:
+            for version in GENERATORS:
+                print(measure(version, rows, args.batch, Path(directory)))
+
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -1,48 +1,84 @@
 from http import HTTPStatus
+from typing import Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request, Response
 
-from vidaplus.main.schemas.admission import AdmissionSchema, CreateAdmissionSchema, UpdateAdmissionSchema
+from vidaplus.controllers.responses import model_response
+from vidaplus.controllers.streaming import stream_response, wants_stream
+from vidaplus.main.schemas.admission import (
+    AdmissionSchema,
+    AllocateAdmissionSchema,
+    CreateAdmissionSchema,
+    UpdateAdmissionSchema,
+)
+from vidaplus.main.schemas.page import PageSchema
 from vidaplus.main.schemas.user import PublicUserSchema
+from vidaplus.models.config.unit_of_work import UnitOfWork, get_unit_of_work
 from vidaplus.models.repositories.admission_repository import AdmissionRepository
 from vidaplus.models.repositories.bed_repository import BedRepository
+from vidaplus.models.repositories.unit_repository import UnitRepository
 from vidaplus.models.repositories.user_repository import UserRepository
 from vidaplus.services.admission_service import AdmissionService
 from vidaplus.services.auth_service import AuthService
 
 router = APIRouter(prefix='/api/internacoes', tags=['Internações'])
-admission_repository = AdmissionRepository()
-user_repository = UserRepository()
-bed_repository = BedRepository()
-service = AdmissionService(admission_repository, user_repository, bed_repository)
 
 
-@router.get('/', status_code=HTTPStatus.OK, response_model=list[AdmissionSchema])
-def get_all() -> list[AdmissionSchema]:
-    return service.all()
+def get_service(uow: UnitOfWork = Depends(get_unit_of_work)) -> AdmissionService:
+    return AdmissionService(AdmissionRepository(uow), UserRepository(uow), BedRepository(uow), UnitRepository(uow))
+
+
+@router.get('/', status_code=HTTPStatus.OK, response_model=PageSchema[AdmissionSchema])
+def get_all(
+    request: Request,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1),
+    stream: bool = False,
+    service: AdmissionService = Depends(get_service),
+) -> Response:
+    if wants_stream(request, stream):
+        return stream_response(request, lambda stream_uow: get_service(stream_uow).stream(cursor))
+
+    return model_response(service.all(cursor, limit))
 
 
 @router.get('/{admission_id}', status_code=HTTPStatus.OK, response_model=AdmissionSchema)
-def get_by_id(admission_id: int) -> AdmissionSchema:
+def get_by_id(admission_id: int, service: AdmissionService = Depends(get_service)) -> AdmissionSchema:
     return service.get_by_id(admission_id)
 
 
 @router.post('/', status_code=HTTPStatus.CREATED, response_model=AdmissionSchema)
 def create(
-    admission: CreateAdmissionSchema, creator: PublicUserSchema = Depends(AuthService.get_current_user)
+    admission: CreateAdmissionSchema,
+    creator: PublicUserSchema = Depends(AuthService.get_current_user),
+    service: AdmissionService = Depends(get_service),
 ) -> AdmissionSchema:
     return service.create(admission, creator)
 
 
+@router.post('/alocacao', status_code=HTTPStatus.CREATED, response_model=AdmissionSchema)
+def allocate(
+    data: AllocateAdmissionSchema,
+    creator: PublicUserSchema = Depends(AuthService.get_current_user),
+    service: AdmissionService = Depends(get_service),
+) -> AdmissionSchema:
+    return service.allocate(data, creator)
+
+
 @router.put('/{admission_id}', status_code=HTTPStatus.OK, response_model=AdmissionSchema)
 def update(
     admission_id: int,
     admission: UpdateAdmissionSchema,
     executor: PublicUserSchema = Depends(AuthService.get_current_user),
+    service: AdmissionService = Depends(get_service),
 ) -> AdmissionSchema:
     return service.update(admission_id, admission, executor)
 
 
 @router.delete('/{admission_id}', status_code=HTTPStatus.NO_CONTENT)
-def delete(admission_id: int, executor: PublicUserSchema = Depends(AuthService.get_current_user)) -> None:
+def delete(
+    admission_id: int,
+    executor: PublicUserSchema = Depends(AuthService.get_current_user),
+    service: AdmissionService = Depends(get_service),
+) -> None:
     service.delete(admission_id, executor)
@@ -1,13 +1,27 @@
 from datetime import datetime
 from http import HTTPStatus
-from typing import Optional
+from typing import Iterator, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request, Response
 
-from vidaplus.main.schemas.appointment import AppointmentSchema, CreateAppointmentSchema
+from vidaplus.controllers.conditional import conditional_get, etag, if_match, page_etag
+from vidaplus.controllers.responses import model_response
+from vidaplus.controllers.streaming import stream_response, wants_stream
+from vidaplus.main.enums.batch_modes import BatchModes
+from vidaplus.main.schemas.appointment import (
+    AppointmentOccurrenceSchema,
+    AppointmentSchema,
+    BatchAppointmentResultSchema,
+    CreateAppointmentSchema,
+)
+from vidaplus.main.schemas.appointment_series import AppointmentSeriesSchema, CreateAppointmentSeriesSchema
+from vidaplus.main.schemas.page import PageSchema
 from vidaplus.main.schemas.user import PublicUserSchema
+from vidaplus.models.config.unit_of_work import UnitOfWork, get_unit_of_work
 from vidaplus.models.repositories.appointment_repository import AppointmentRepository
+from vidaplus.models.repositories.appointment_series_repository import AppointmentSeriesRepository
+from vidaplus.services.appointment_series_service import AppointmentSeriesService
 from vidaplus.services.appointment_service import AppointmentService
 from vidaplus.services.auth_service import AuthService
 
@@ -16,47 +30,130 @@ router = APIRouter(prefix='/api/agendamentos', tags=['Agendamentos'])
 
 @router.post('/', status_code=HTTPStatus.CREATED, response_model=AppointmentSchema)
 def create_appointment(
-    data: CreateAppointmentSchema, creator: PublicUserSchema = Depends(AuthService.get_current_user)
+    data: CreateAppointmentSchema,
+    creator: PublicUserSchema = Depends(AuthService.get_current_user),
+    uow: UnitOfWork = Depends(get_unit_of_work),
 ) -> AppointmentSchema:
-    repository = AppointmentRepository()
+    repository = AppointmentRepository(uow)
+    service = AppointmentService(repository)
+    return service.create(data, creator)
+
+
+@router.post('/lote', status_code=HTTPStatus.CREATED, response_model=BatchAppointmentResultSchema)
+def create_appointments_batch(
+    data: list[CreateAppointmentSchema],
+    response: Response,
+    mode: BatchModes = BatchModes.ALL_OR_NOTHING,
+    creator: PublicUserSchema = Depends(AuthService.get_current_user),
+    uow: UnitOfWork = Depends(get_unit_of_work),
+) -> BatchAppointmentResultSchema:
+    repository = AppointmentRepository(uow)
     service = AppointmentService(repository)
+    result = service.create_batch(data, creator, mode)
+
+    if result.created < len(data):
+        response.status_code = HTTPStatus.MULTI_STATUS if result.created else HTTPStatus.UNPROCESSABLE_ENTITY
+
+    return result
+
+
+@router.post('/series', status_code=HTTPStatus.CREATED, response_model=AppointmentSeriesSchema)
+def create_appointment_series(
+    data: CreateAppointmentSeriesSchema,
+    creator: PublicUserSchema = Depends(AuthService.get_current_user),
+    uow: UnitOfWork = Depends(get_unit_of_work),
+) -> AppointmentSeriesSchema:
+    service = AppointmentSeriesService(AppointmentSeriesRepository(uow), AppointmentRepository(uow))
     return service.create(data, creator)
 
 
-@router.get('/', status_code=HTTPStatus.OK, response_model=list[AppointmentSchema])
+@router.get('/series/{series_id}', status_code=HTTPStatus.OK, response_model=AppointmentSeriesSchema)
+def get_appointment_series(
+    series_id: int,
+    current_user: PublicUserSchema = Depends(AuthService.get_current_user),
+    uow: UnitOfWork = Depends(get_unit_of_work),
+) -> AppointmentSeriesSchema:
+    service = AppointmentSeriesService(AppointmentSeriesRepository(uow), AppointmentRepository(uow))
+    return service.get_by_id(series_id)
+
+
+@router.delete('/series/{series_id}', status_code=HTTPStatus.NO_CONTENT)
+def delete_appointment_series(
+    series_id: int,
+    user: PublicUserSchema = Depends(AuthService.get_current_user),
+    uow: UnitOfWork = Depends(get_unit_of_work),
+) -> None:
+    service = AppointmentSeriesService(AppointmentSeriesRepository(uow), AppointmentRepository(uow))
+    service.cancel(series_id, user)
+
+
+@router.get('/', status_code=HTTPStatus.OK, response_model=PageSchema[AppointmentSchema | AppointmentOccurrenceSchema])
 def get_appointments(  # noqa: PLR0913
+    request: Request,
+    response: Response,
     patient_id: Optional[UUID] = None,
     professional_id: Optional[UUID] = None,
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
     type: Optional[str] = None,
     status: Optional[str] = None,
-) -> list[AppointmentSchema]:
-    repository = AppointmentRepository()
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1),
+    stream: bool = False,
+    uow: UnitOfWork = Depends(get_unit_of_work),
+) -> Response:
+    def appointments(stream_uow: UnitOfWork) -> Iterator[AppointmentSchema | AppointmentOccurrenceSchema]:
+        service = AppointmentService(AppointmentRepository(stream_uow))
+        return service.stream(
+            patient_id=patient_id,
+            professional_id=professional_id,
+            start_date=start_date,
+            end_date=end_date,
+            type=type,
+            status=status,
+            cursor=cursor,
+        )
+
+    if wants_stream(request, stream):
+        return stream_response(request, appointments)
+
+    repository = AppointmentRepository(uow)
     service = AppointmentService(repository)
-    return service.get(
+    page = service.get(
         patient_id=patient_id,
         professional_id=professional_id,
         start_date=start_date,
         end_date=end_date,
         type=type,
         status=status,
+        cursor=cursor,
+        limit=limit,
     )
+    return conditional_get(request, response, page_etag(page)) or model_response(page, response)
 
 
 @router.delete('/{appointment_id}', status_code=HTTPStatus.NO_CONTENT)
-def delete_appointment(appointment_id: int, user: PublicUserSchema = Depends(AuthService.get_current_user)) -> None:
-    repository = AppointmentRepository()
+def delete_appointment(
+    appointment_id: int,
+    user: PublicUserSchema = Depends(AuthService.get_current_user),
+    uow: UnitOfWork = Depends(get_unit_of_work),
+) -> None:
+    repository = AppointmentRepository(uow)
     service = AppointmentService(repository)
     service.cancel(appointment_id, user)
 
 
 @router.put('/{appointment_id}', status_code=HTTPStatus.OK, response_model=AppointmentSchema)
-def update_appointment(
+def update_appointment(  # noqa: PLR0913
     appointment_id: int,
     data: CreateAppointmentSchema,
+    response: Response,
+    version: Optional[int] = Depends(if_match),
     user: PublicUserSchema = Depends(AuthService.get_current_user),
+    uow: UnitOfWork = Depends(get_unit_of_work),
 ) -> AppointmentSchema:
-    repository = AppointmentRepository()
+    repository = AppointmentRepository(uow)
     service = AppointmentService(repository)
-    return service.update(appointment_id, data, user)
+    updated = service.update(appointment_id, data, user, version)
+    response.headers['ETag'] = etag(updated)
+    return updated
@@ -0,0 +1,93 @@
+from http import HTTPStatus
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query, Request, Response
+
+from vidaplus.controllers.responses import model_response
+from vidaplus.controllers.streaming import async_stream_response, wants_stream
+from vidaplus.main.schemas.admission import (
+    AdmissionSchema,
+    AllocateAdmissionSchema,
+    CreateAdmissionSchema,
+    UpdateAdmissionSchema,
+)
+from vidaplus.main.schemas.page import PageSchema
+from vidaplus.main.schemas.user import PublicUserSchema
+from vidaplus.models.config.unit_of_work import AsyncUnitOfWork, get_async_unit_of_work
+from vidaplus.models.repositories.asynchronous.admission_repository import AsyncAdmissionRepository
+from vidaplus.models.repositories.asynchronous.bed_repository import AsyncBedRepository
+from vidaplus.models.repositories.asynchronous.unit_repository import AsyncUnitRepository
+from vidaplus.models.repositories.asynchronous.user_repository import AsyncUserRepository
+from vidaplus.services.asynchronous.admission_service import AsyncAdmissionService
+from vidaplus.services.asynchronous.auth_service import AsyncAuthService
+
+router = APIRouter(prefix='/api/internacoes', tags=['Internações'])
+
+
+def make_service(uow: AsyncUnitOfWork) -> AsyncAdmissionService:
+    return AsyncAdmissionService(
+        AsyncAdmissionRepository(uow), AsyncUserRepository(uow), AsyncBedRepository(uow), AsyncUnitRepository(uow)
+    )
+
+
+async def get_service(uow: AsyncUnitOfWork = Depends(get_async_unit_of_work)) -> AsyncAdmissionService:
+    return make_service(uow)
+
+
+@router.get('/', status_code=HTTPStatus.OK, response_model=PageSchema[AdmissionSchema])
+async def get_all(
+    request: Request,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1),
+    stream: bool = False,
+    service: AsyncAdmissionService = Depends(get_service),
+) -> Response:
+    if wants_stream(request, stream):
+        return await async_stream_response(
+            request,
+            lambda stream_uow: make_service(stream_uow).stream(cursor),
+        )
+
+    return model_response(await service.all(cursor, limit))
+
+
+@router.get('/{admission_id}', status_code=HTTPStatus.OK, response_model=AdmissionSchema)
+async def get_by_id(admission_id: int, service: AsyncAdmissionService = Depends(get_service)) -> AdmissionSchema:
+    return await service.get_by_id(admission_id)
+
+
+@router.post('/', status_code=HTTPStatus.CREATED, response_model=AdmissionSchema)
+async def create(
+    admission: CreateAdmissionSchema,
+    creator: PublicUserSchema = Depends(AsyncAuthService.get_current_user),
+    service: AsyncAdmissionService = Depends(get_service),
+) -> AdmissionSchema:
+    return await service.create(admission, creator)
+
+
+@router.post('/alocacao', status_code=HTTPStatus.CREATED, response_model=AdmissionSchema)
+async def allocate(
+    data: AllocateAdmissionSchema,
+    creator: PublicUserSchema = Depends(AsyncAuthService.get_current_user),
+    service: AsyncAdmissionService = Depends(get_service),
+) -> AdmissionSchema:
+    return await service.allocate(data, creator)
+
+
+@router.put('/{admission_id}', status_code=HTTPStatus.OK, response_model=AdmissionSchema)
+async def update(
+    admission_id: int,
+    admission: UpdateAdmissionSchema,
+    executor: PublicUserSchema = Depends(AsyncAuthService.get_current_user),
+    service: AsyncAdmissionService = Depends(get_service),
+) -> AdmissionSchema:
+    return await service.update(admission_id, admission, executor)
+
+
+@router.delete('/{admission_id}', status_code=HTTPStatus.NO_CONTENT)
+async def delete(
+    admission_id: int,
+    executor: PublicUserSchema = Depends(AsyncAuthService.get_current_user),
+    service: AsyncAdmissionService = Depends(get_service),
+) -> None:
+    await service.delete(admission_id, executor)
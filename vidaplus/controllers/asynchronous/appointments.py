@@ -0,0 +1,159 @@
+from datetime import datetime
+from http import HTTPStatus
+from typing import AsyncIterator, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query, Request, Response
+
+from vidaplus.controllers.conditional import conditional_get, etag, if_match, page_etag
+from vidaplus.controllers.responses import model_response
+from vidaplus.controllers.streaming import async_stream_response, wants_stream
+from vidaplus.main.enums.batch_modes import BatchModes
+from vidaplus.main.schemas.appointment import (
+    AppointmentOccurrenceSchema,
+    AppointmentSchema,
+    BatchAppointmentResultSchema,
+    CreateAppointmentSchema,
+)
+from vidaplus.main.schemas.appointment_series import AppointmentSeriesSchema, CreateAppointmentSeriesSchema
+from vidaplus.main.schemas.page import PageSchema
+from vidaplus.main.schemas.user import PublicUserSchema
+from vidaplus.models.config.unit_of_work import AsyncUnitOfWork, get_async_unit_of_work
+from vidaplus.models.repositories.asynchronous.appointment_repository import AsyncAppointmentRepository
+from vidaplus.models.repositories.asynchronous.appointment_series_repository import AsyncAppointmentSeriesRepository
+from vidaplus.services.asynchronous.appointment_series_service import AsyncAppointmentSeriesService
+from vidaplus.services.asynchronous.appointment_service import AsyncAppointmentService
+from vidaplus.services.asynchronous.auth_service import AsyncAuthService
+
+router = APIRouter(prefix='/api/agendamentos', tags=['Agendamentos'])
+
+
+@router.post('/', status_code=HTTPStatus.CREATED, response_model=AppointmentSchema)
+async def create_appointment(
+    data: CreateAppointmentSchema,
+    creator: PublicUserSchema = Depends(AsyncAuthService.get_current_user),
+    uow: AsyncUnitOfWork = Depends(get_async_unit_of_work),
+) -> AppointmentSchema:
+    repository = AsyncAppointmentRepository(uow)
+    service = AsyncAppointmentService(repository)
+    return await service.create(data, creator)
+
+
+@router.post('/lote', status_code=HTTPStatus.CREATED, response_model=BatchAppointmentResultSchema)
+async def create_appointments_batch(
+    data: list[CreateAppointmentSchema],
+    response: Response,
+    mode: BatchModes = BatchModes.ALL_OR_NOTHING,
+    creator: PublicUserSchema = Depends(AsyncAuthService.get_current_user),
+    uow: AsyncUnitOfWork = Depends(get_async_unit_of_work),
+) -> BatchAppointmentResultSchema:
+    repository = AsyncAppointmentRepository(uow)
+    service = AsyncAppointmentService(repository)
+    result = await service.create_batch(data, creator, mode)
+
+    if result.created < len(data):
+        response.status_code = HTTPStatus.MULTI_STATUS if result.created else HTTPStatus.UNPROCESSABLE_ENTITY
+
+    return result
+
+
+@router.post('/series', status_code=HTTPStatus.CREATED, response_model=AppointmentSeriesSchema)
+async def create_appointment_series(
+    data: CreateAppointmentSeriesSchema,
+    creator: PublicUserSchema = Depends(AsyncAuthService.get_current_user),
+    uow: AsyncUnitOfWork = Depends(get_async_unit_of_work),
+) -> AppointmentSeriesSchema:
+    service = AsyncAppointmentSeriesService(AsyncAppointmentSeriesRepository(uow), AsyncAppointmentRepository(uow))
+    return await service.create(data, creator)
+
+
+@router.get('/series/{series_id}', status_code=HTTPStatus.OK, response_model=AppointmentSeriesSchema)
+async def get_appointment_series(
+    series_id: int,
+    current_user: PublicUserSchema = Depends(AsyncAuthService.get_current_user),
+    uow: AsyncUnitOfWork = Depends(get_async_unit_of_work),
+) -> AppointmentSeriesSchema:
+    service = AsyncAppointmentSeriesService(AsyncAppointmentSeriesRepository(uow), AsyncAppointmentRepository(uow))
+    return await service.get_by_id(series_id)
+
+
+@router.delete('/series/{series_id}', status_code=HTTPStatus.NO_CONTENT)
+async def delete_appointment_series(
+    series_id: int,
+    user: PublicUserSchema = Depends(AsyncAuthService.get_current_user),
+    uow: AsyncUnitOfWork = Depends(get_async_unit_of_work),
+) -> None:
+    service = AsyncAppointmentSeriesService(AsyncAppointmentSeriesRepository(uow), AsyncAppointmentRepository(uow))
+    await service.cancel(series_id, user)
+
+
+@router.get('/', status_code=HTTPStatus.OK, response_model=PageSchema[AppointmentSchema | AppointmentOccurrenceSchema])
+async def get_appointments(  # noqa: PLR0913
+    request: Request,
+    response: Response,
+    patient_id: Optional[UUID] = None,
+    professional_id: Optional[UUID] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    type: Optional[str] = None,
+    status: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1),
+    stream: bool = False,
+    uow: AsyncUnitOfWork = Depends(get_async_unit_of_work),
+) -> Response:
+    def appointments(stream_uow: AsyncUnitOfWork) -> AsyncIterator[AppointmentSchema | AppointmentOccurrenceSchema]:
+        service = AsyncAppointmentService(AsyncAppointmentRepository(stream_uow))
+        return service.stream(
+            patient_id=patient_id,
+            professional_id=professional_id,
+            start_date=start_date,
+            end_date=end_date,
+            type=type,
+            status=status,
+            cursor=cursor,
+        )
+
+    if wants_stream(request, stream):
+        return await async_stream_response(request, appointments)
+
+    repository = AsyncAppointmentRepository(uow)
+    service = AsyncAppointmentService(repository)
+    page = await service.get(
+        patient_id=patient_id,
+        professional_id=professional_id,
+        start_date=start_date,
+        end_date=end_date,
+        type=type,
+        status=status,
+        cursor=cursor,
+        limit=limit,
+    )
+    return conditional_get(request, response, page_etag(page)) or model_response(page, response)
+
+
+@router.delete('/{appointment_id}', status_code=HTTPStatus.NO_CONTENT)
+async def delete_appointment(
+    appointment_id: int,
+    user: PublicUserSchema = Depends(AsyncAuthService.get_current_user),
+    uow: AsyncUnitOfWork = Depends(get_async_unit_of_work),
+) -> None:
+    repository = AsyncAppointmentRepository(uow)
+    service = AsyncAppointmentService(repository)
+    await service.cancel(appointment_id, user)
+
+
+@router.put('/{appointment_id}', status_code=HTTPStatus.OK, response_model=AppointmentSchema)
+async def update_appointment(  # noqa: PLR0913
+    appointment_id: int,
+    data: CreateAppointmentSchema,
+    response: Response,
+    version: Optional[int] = Depends(if_match),
+    user: PublicUserSchema = Depends(AsyncAuthService.get_current_user),
+    uow: AsyncUnitOfWork = Depends(get_async_unit_of_work),
+) -> AppointmentSchema:
+    repository = AsyncAppointmentRepository(uow)
+    service = AsyncAppointmentService(repository)
+    updated = await service.update(appointment_id, data, user, version)
+    response.headers['ETag'] = etag(updated)
+    return updated
@@ -0,0 +1,41 @@
+from http import HTTPStatus
+
+from fastapi import APIRouter, Depends, Request
+
+from vidaplus.main.schemas.auth import RequestAuthUserData, ResponseAuthToken, TokenData
+from vidaplus.models.config.unit_of_work import AsyncUnitOfWork, get_async_unit_of_work
+from vidaplus.models.repositories.asynchronous.revoked_token_repository import AsyncRevokedTokenRepository
+from vidaplus.models.repositories.asynchronous.user_repository import AsyncUserRepository
+from vidaplus.services.asynchronous.auth_service import AsyncAuthService
+from vidaplus.services.asynchronous.user_service import AsyncUserService
+from vidaplus.services.auth_service import AuthService
+
+router = APIRouter(prefix='/api/auth', tags=['Autenticação'])
+
+
+@router.post('/token', status_code=HTTPStatus.OK, response_model=ResponseAuthToken)
+async def get_access_token(
+    request: Request, data: RequestAuthUserData, uow: AsyncUnitOfWork = Depends(get_async_unit_of_work)
+) -> ResponseAuthToken:
+    user_repository = AsyncUserRepository(uow)
+    user_service = AsyncUserService(user_repository)
+    access_token = await user_service.authenticate(
+        data.email, data.password, request.client.host if request.client else None
+    )
+    return ResponseAuthToken(access_token=access_token)
+
+
+@router.post('/refresh', status_code=HTTPStatus.OK, response_model=ResponseAuthToken)
+async def refresh_token(
+    access_token: str = Depends(AuthService.oauth2_scheme), uow: AsyncUnitOfWork = Depends(get_async_unit_of_work)
+) -> ResponseAuthToken:
+    new_access_token = await AsyncAuthService.refresh_token(access_token, AsyncRevokedTokenRepository(uow))
+    return ResponseAuthToken(access_token=new_access_token)
+
+
+@router.post('/logout', status_code=HTTPStatus.NO_CONTENT)
+async def logout(
+    current_user: TokenData = Depends(AsyncAuthService.get_current_user),
+    uow: AsyncUnitOfWork = Depends(get_async_unit_of_work),
+) -> None:
+    await AsyncAuthService.revoke(current_user, AsyncRevokedTokenRepository(uow))
@@ -0,0 +1,94 @@
+from http import HTTPStatus
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query, Request, Response
+
+from vidaplus.controllers.conditional import conditional_get, etag, if_match, page_etag
+from vidaplus.controllers.responses import model_response
+from vidaplus.controllers.streaming import async_stream_response, wants_stream
+from vidaplus.main.schemas.bed import BedSchema, CreateBedSchema
+from vidaplus.main.schemas.page import PageSchema
+from vidaplus.main.schemas.user import PublicUserSchema
+from vidaplus.models.config.unit_of_work import AsyncUnitOfWork, get_async_unit_of_work
+from vidaplus.models.repositories.asynchronous.bed_repository import AsyncBedRepository
+from vidaplus.models.repositories.asynchronous.unit_repository import AsyncUnitRepository
+from vidaplus.services.asynchronous.auth_service import AsyncAuthService
+from vidaplus.services.asynchronous.bed_service import AsyncBedService
+
+router = APIRouter(prefix='/api/leitos', tags=['Leitos'])
+
+
+@router.get('/', status_code=HTTPStatus.OK, response_model=PageSchema[BedSchema])
+async def get_beds(  # noqa: PLR0913
+    request: Request,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1),
+    stream: bool = False,
+    uow: AsyncUnitOfWork = Depends(get_async_unit_of_work),
+) -> Response:
+    if wants_stream(request, stream):
+        return await async_stream_response(
+            request,
+            lambda stream_uow: AsyncBedService(AsyncBedRepository(stream_uow), AsyncUnitRepository(stream_uow)).stream(
+                cursor
+            ),
+        )
+
+    bed_repo = AsyncBedRepository(uow)
+    unit_repo = AsyncUnitRepository(uow)
+    service = AsyncBedService(bed_repo, unit_repo)
+    page = await service.all(cursor, limit)
+    return conditional_get(request, response, page_etag(page)) or model_response(page, response)
+
+
+@router.get('/{bed_id}', status_code=HTTPStatus.OK, response_model=BedSchema)
+async def get_bed(
+    bed_id: int, request: Request, response: Response, uow: AsyncUnitOfWork = Depends(get_async_unit_of_work)
+) -> BedSchema | Response:
+    bed_repo = AsyncBedRepository(uow)
+    unit_repo = AsyncUnitRepository(uow)
+    service = AsyncBedService(bed_repo, unit_repo)
+    bed = await service.get_by_id(bed_id)
+    return conditional_get(request, response, etag(bed)) or bed
+
+
+@router.post('/', status_code=HTTPStatus.CREATED, response_model=BedSchema)
+async def create_bed(
+    bed: CreateBedSchema,
+    creator: PublicUserSchema = Depends(AsyncAuthService.get_current_user),
+    uow: AsyncUnitOfWork = Depends(get_async_unit_of_work),
+) -> BedSchema:
+    bed_repo = AsyncBedRepository(uow)
+    unit_repo = AsyncUnitRepository(uow)
+    service = AsyncBedService(bed_repo, unit_repo)
+    return await service.create(bed, creator)
+
+
+@router.put('/{bed_id}', status_code=HTTPStatus.OK, response_model=BedSchema)
+async def update_bed(  # noqa: PLR0913
+    bed_id: int,
+    bed: CreateBedSchema,
+    response: Response,
+    version: Optional[int] = Depends(if_match),
+    executor: PublicUserSchema = Depends(AsyncAuthService.get_current_user),
+    uow: AsyncUnitOfWork = Depends(get_async_unit_of_work),
+) -> BedSchema:
+    bed_repo = AsyncBedRepository(uow)
+    unit_repo = AsyncUnitRepository(uow)
+    service = AsyncBedService(bed_repo, unit_repo)
+    updated = await service.update(bed_id, bed, executor, version)
+    response.headers['ETag'] = etag(updated)
+    return updated
+
+
+@router.delete('/{bed_id}', status_code=HTTPStatus.NO_CONTENT)
+async def delete_bed(
+    bed_id: int,
+    executor: PublicUserSchema = Depends(AsyncAuthService.get_current_user),
+    uow: AsyncUnitOfWork = Depends(get_async_unit_of_work),
+) -> None:
+    bed_repo = AsyncBedRepository(uow)
+    unit_repo = AsyncUnitRepository(uow)
+    service = AsyncBedService(bed_repo, unit_repo)
+    await service.delete(bed_id, executor)
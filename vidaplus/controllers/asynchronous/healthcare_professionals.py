@@ -0,0 +1,136 @@
+from datetime import datetime
+from http import HTTPStatus
+from typing import Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query, Request, Response
+
+from vidaplus.controllers.responses import model_response
+from vidaplus.controllers.streaming import async_stream_response, wants_stream
+from vidaplus.main.enums.roles import Roles
+from vidaplus.main.schemas.appointment import AppointmentOccurrenceSchema, AppointmentSchema
+from vidaplus.main.schemas.availability import AvailabilitySchema
+from vidaplus.main.schemas.page import PageSchema
+from vidaplus.main.schemas.user import CreateUserSchema, PublicUserSchema, RequestCreateUserSchema
+from vidaplus.models.config.unit_of_work import AsyncUnitOfWork, get_async_unit_of_work
+from vidaplus.models.repositories.asynchronous.appointment_repository import AsyncAppointmentRepository
+from vidaplus.models.repositories.asynchronous.user_repository import AsyncUserRepository
+from vidaplus.services.asynchronous.appointment_service import AsyncAppointmentService
+from vidaplus.services.asynchronous.auth_service import AsyncAuthService
+from vidaplus.services.asynchronous.availability_service import AsyncAvailabilityService
+from vidaplus.services.asynchronous.user_service import AsyncUserService
+
+router = APIRouter(prefix='/api/profissionais', tags=['Profissionais de Saúde'])
+
+
+@router.post('/', status_code=HTTPStatus.CREATED)
+async def create_healthcare_professional(
+    data: RequestCreateUserSchema,
+    creator: PublicUserSchema = Depends(AsyncAuthService.get_current_user),
+    uow: AsyncUnitOfWork = Depends(get_async_unit_of_work),
+) -> PublicUserSchema:
+    repository = AsyncUserRepository(uow)
+    service = AsyncUserService(repository)
+    return await service.new_healthcare_professional(data, creator)
+
+
+@router.get('/', status_code=HTTPStatus.OK, response_model=PageSchema[PublicUserSchema])
+async def get_healthcare_professionals(
+    request: Request,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1),
+    stream: bool = False,
+    uow: AsyncUnitOfWork = Depends(get_async_unit_of_work),
+) -> Response:
+    if wants_stream(request, stream):
+        return await async_stream_response(
+            request,
+            lambda stream_uow: AsyncUserService(AsyncUserRepository(stream_uow)).stream(
+                Roles.HEALTHCARE_PROFESSIONAL, cursor
+            ),
+        )
+
+    repository = AsyncUserRepository(uow)
+    service = AsyncUserService(repository)
+    return model_response(await service.all(Roles.HEALTHCARE_PROFESSIONAL, cursor, limit))
+
+
+@router.get('/disponibilidade', status_code=HTTPStatus.OK, response_model=list[AvailabilitySchema])
+async def get_healthcare_professionals_availability(  # noqa: PLR0913
+    start: datetime,
+    end: datetime,
+    duration: int,
+    professional_id: Optional[list[UUID]] = Query(None),
+    current_user: PublicUserSchema = Depends(AsyncAuthService.get_current_user),
+    uow: AsyncUnitOfWork = Depends(get_async_unit_of_work),
+) -> list[AvailabilitySchema]:
+    repository = AsyncAppointmentRepository(uow)
+    service = AsyncAvailabilityService(repository)
+    return await service.search(start, end, duration, professional_id)
+
+
+@router.get('/{healthcare_professional_id}', status_code=HTTPStatus.OK, response_model=PublicUserSchema)
+async def get_healthcare_professional(
+    healthcare_professional_id: UUID,
+    is_admin: bool = Depends(AsyncAuthService.is_admin),
+    uow: AsyncUnitOfWork = Depends(get_async_unit_of_work),
+) -> PublicUserSchema:
+    repository = AsyncUserRepository(uow)
+    service = AsyncUserService(repository)
+    return await service.get_by_id(healthcare_professional_id)
+
+
+@router.put('/{healthcare_professional_id}', status_code=HTTPStatus.OK, response_model=PublicUserSchema)
+async def update_healthcare_professional(
+    healthcare_professional_id: UUID,
+    data: CreateUserSchema,
+    executor: PublicUserSchema = Depends(AsyncAuthService.get_current_user),
+    uow: AsyncUnitOfWork = Depends(get_async_unit_of_work),
+) -> PublicUserSchema:
+    repository = AsyncUserRepository(uow)
+    service = AsyncUserService(repository)
+    return await service.update(healthcare_professional_id, data, executor)
+
+
+@router.delete('/{healthcare_professional_id}', status_code=HTTPStatus.NO_CONTENT)
+async def delete_healthcare_professional(
+    healthcare_professional_id: UUID,
+    executor: PublicUserSchema = Depends(AsyncAuthService.get_current_user),
+    uow: AsyncUnitOfWork = Depends(get_async_unit_of_work),
+) -> None:
+    repository = AsyncUserRepository(uow)
+    service = AsyncUserService(repository)
+    await service.delete(healthcare_professional_id, executor)
+
+
+@router.get(
+    '/{healthcare_professional_id}/agendamentos',
+    status_code=HTTPStatus.OK,
+    response_model=list[AppointmentSchema | AppointmentOccurrenceSchema],
+)
+async def get_healthcare_professional_appointments(
+    healthcare_professional_id: UUID,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    current_user: PublicUserSchema = Depends(AsyncAuthService.get_current_user),
+    uow: AsyncUnitOfWork = Depends(get_async_unit_of_work),
+) -> list[AppointmentSchema | AppointmentOccurrenceSchema]:
+    repository = AsyncAppointmentRepository(uow)
+    service = AsyncAppointmentService(repository)
+    return await service.get_agenda(healthcare_professional_id, start_date, end_date)
+
+
+@router.get(
+    '/{healthcare_professional_id}/disponibilidade', status_code=HTTPStatus.OK, response_model=AvailabilitySchema
+)
+async def get_healthcare_professional_availability(  # noqa: PLR0913
+    healthcare_professional_id: UUID,
+    start: datetime,
+    end: datetime,
+    duration: int,
+    current_user: PublicUserSchema = Depends(AsyncAuthService.get_current_user),
+    uow: AsyncUnitOfWork = Depends(get_async_unit_of_work),
+) -> AvailabilitySchema:
+    repository = AsyncAppointmentRepository(uow)
+    service = AsyncAvailabilityService(repository)
+    return await service.search_for_professional(healthcare_professional_id, start, end, duration)
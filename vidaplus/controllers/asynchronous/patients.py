@@ -0,0 +1,74 @@
+from http import HTTPStatus
+from typing import Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query, Request, Response
+
+from vidaplus.controllers.responses import model_response
+from vidaplus.controllers.streaming import async_stream_response, wants_stream
+from vidaplus.main.enums.roles import Roles
+from vidaplus.main.schemas.page import PageSchema
+from vidaplus.main.schemas.user import CreateUserSchema, PublicUserSchema, RequestCreateUserSchema
+from vidaplus.models.config.unit_of_work import AsyncUnitOfWork, get_async_unit_of_work
+from vidaplus.models.repositories.asynchronous.user_repository import AsyncUserRepository
+from vidaplus.services.asynchronous.auth_service import AsyncAuthService
+from vidaplus.services.asynchronous.user_service import AsyncUserService
+
+router = APIRouter(prefix='/api/pacientes', tags=['Pacientes'])
+
+
+@router.post('/', status_code=HTTPStatus.CREATED, response_model=PublicUserSchema)
+async def register_patient(
+    data: RequestCreateUserSchema, uow: AsyncUnitOfWork = Depends(get_async_unit_of_work)
+) -> PublicUserSchema:
+    user_repository = AsyncUserRepository(uow)
+    user_service = AsyncUserService(user_repository)
+    return await user_service.new_patient(data)
+
+
+@router.get('/', status_code=HTTPStatus.OK, response_model=PageSchema[PublicUserSchema])
+async def list_patients(
+    request: Request,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1),
+    stream: bool = False,
+    uow: AsyncUnitOfWork = Depends(get_async_unit_of_work),
+) -> Response:
+    if wants_stream(request, stream):
+        return await async_stream_response(
+            request, lambda stream_uow: AsyncUserService(AsyncUserRepository(stream_uow)).stream(Roles.PATIENT, cursor)
+        )
+
+    user_repository = AsyncUserRepository(uow)
+    user_service = AsyncUserService(user_repository)
+    return model_response(await user_service.all(Roles.PATIENT, cursor, limit))
+
+
+@router.get('/{patient_id}', status_code=HTTPStatus.OK, response_model=PublicUserSchema)
+async def get_patient(patient_id: UUID, uow: AsyncUnitOfWork = Depends(get_async_unit_of_work)) -> PublicUserSchema:
+    user_repository = AsyncUserRepository(uow)
+    user_service = AsyncUserService(user_repository)
+    return await user_service.get_by_id(patient_id)
+
+
+@router.put('/{patient_id}', status_code=HTTPStatus.OK, response_model=PublicUserSchema)
+async def update_patient(
+    patient_id: UUID,
+    data: CreateUserSchema,
+    executor: PublicUserSchema = Depends(AsyncAuthService.get_current_user),
+    uow: AsyncUnitOfWork = Depends(get_async_unit_of_work),
+) -> PublicUserSchema:
+    user_repository = AsyncUserRepository(uow)
+    user_service = AsyncUserService(user_repository)
+    return await user_service.update(patient_id, data, executor)
+
+
+@router.delete('/{patient_id}', status_code=HTTPStatus.NO_CONTENT)
+async def delete_patient(
+    patient_id: UUID,
+    executor: PublicUserSchema = Depends(AsyncAuthService.get_current_user),
+    uow: AsyncUnitOfWork = Depends(get_async_unit_of_work),
+) -> None:
+    user_repository = AsyncUserRepository(uow)
+    user_service = AsyncUserService(user_repository)
+    await user_service.delete(patient_id, executor)
@@ -0,0 +1,79 @@
+from http import HTTPStatus
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query, Request, Response
+
+from vidaplus.controllers.conditional import conditional_get, etag, if_match, page_etag
+from vidaplus.controllers.responses import model_response
+from vidaplus.controllers.streaming import async_stream_response, wants_stream
+from vidaplus.main.schemas.page import PageSchema
+from vidaplus.main.schemas.supply import CreateSupplySchema, SupplySchema
+from vidaplus.main.schemas.user import PublicUserSchema
+from vidaplus.models.config.unit_of_work import AsyncUnitOfWork, get_async_unit_of_work
+from vidaplus.models.repositories.asynchronous.supply_repository import AsyncSupplyRepository
+from vidaplus.services.asynchronous.auth_service import AsyncAuthService
+from vidaplus.services.asynchronous.supply_service import AsyncSupplyService
+
+router = APIRouter(prefix='/api/estoque', tags=['Estoque'])
+
+
+async def get_service(uow: AsyncUnitOfWork = Depends(get_async_unit_of_work)) -> AsyncSupplyService:
+    return AsyncSupplyService(AsyncSupplyRepository(uow))
+
+
+@router.get('/', status_code=HTTPStatus.OK, response_model=PageSchema[SupplySchema])
+async def get_all_supplies(  # noqa: PLR0913
+    request: Request,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1),
+    stream: bool = False,
+    service: AsyncSupplyService = Depends(get_service),
+) -> Response:
+    if wants_stream(request, stream):
+        return await async_stream_response(
+            request, lambda stream_uow: AsyncSupplyService(AsyncSupplyRepository(stream_uow)).stream(cursor)
+        )
+
+    page = await service.all(cursor, limit)
+    return conditional_get(request, response, page_etag(page)) or model_response(page, response)
+
+
+@router.get('/{supply_id}', status_code=HTTPStatus.OK, response_model=SupplySchema)
+async def get_supply_by_id(
+    supply_id: int, request: Request, response: Response, service: AsyncSupplyService = Depends(get_service)
+) -> SupplySchema | Response:
+    supply = await service.get_by_id(supply_id)
+    return conditional_get(request, response, etag(supply)) or supply
+
+
+@router.post('/', status_code=HTTPStatus.CREATED, response_model=SupplySchema)
+async def create_supply(
+    supply: CreateSupplySchema,
+    creator: PublicUserSchema = Depends(AsyncAuthService.get_current_user),
+    service: AsyncSupplyService = Depends(get_service),
+) -> SupplySchema:
+    return await service.create(supply, creator)
+
+
+@router.put('/{supply_id}', status_code=HTTPStatus.OK, response_model=SupplySchema)
+async def update_supply(  # noqa: PLR0913
+    supply_id: int,
+    supply: CreateSupplySchema,
+    response: Response,
+    version: Optional[int] = Depends(if_match),
+    executor: PublicUserSchema = Depends(AsyncAuthService.get_current_user),
+    service: AsyncSupplyService = Depends(get_service),
+) -> SupplySchema:
+    updated = await service.update(supply_id, supply, executor, version)
+    response.headers['ETag'] = etag(updated)
+    return updated
+
+
+@router.delete('/{supply_id}', status_code=HTTPStatus.NO_CONTENT)
+async def delete_supply(
+    supply_id: int,
+    executor: PublicUserSchema = Depends(AsyncAuthService.get_current_user),
+    service: AsyncSupplyService = Depends(get_service),
+) -> None:
+    await service.delete(supply_id, executor)
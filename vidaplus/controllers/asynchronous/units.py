@@ -0,0 +1,75 @@
+from http import HTTPStatus
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query, Request, Response
+
+from vidaplus.controllers.responses import model_response
+from vidaplus.controllers.streaming import async_stream_response, wants_stream
+from vidaplus.main.schemas.page import PageSchema
+from vidaplus.main.schemas.unit import CreateUnitSchema, UnitSchema
+from vidaplus.main.schemas.user import PublicUserSchema
+from vidaplus.models.config.unit_of_work import AsyncUnitOfWork, get_async_unit_of_work
+from vidaplus.models.repositories.asynchronous.unit_repository import AsyncUnitRepository
+from vidaplus.services.asynchronous.auth_service import AsyncAuthService
+from vidaplus.services.asynchronous.unit_service import AsyncUnitService
+
+router = APIRouter(prefix='/api/unidades', tags=['Unidades'])
+
+
+@router.get('/', status_code=HTTPStatus.OK, response_model=PageSchema[UnitSchema])
+async def list_units(
+    request: Request,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1),
+    stream: bool = False,
+    uow: AsyncUnitOfWork = Depends(get_async_unit_of_work),
+) -> Response:
+    if wants_stream(request, stream):
+        return await async_stream_response(
+            request, lambda stream_uow: AsyncUnitService(AsyncUnitRepository(stream_uow)).stream(cursor)
+        )
+
+    repository = AsyncUnitRepository(uow)
+    service = AsyncUnitService(repository)
+    return model_response(await service.get_all(cursor, limit))
+
+
+@router.get('/{unit_id}', status_code=HTTPStatus.OK, response_model=UnitSchema | None)
+async def get_unit(unit_id: int, uow: AsyncUnitOfWork = Depends(get_async_unit_of_work)) -> UnitSchema | None:
+    repository = AsyncUnitRepository(uow)
+    service = AsyncUnitService(repository)
+    return await service.get_by_id(unit_id)
+
+
+@router.post('/', status_code=HTTPStatus.CREATED)
+async def create_unit(
+    payload: CreateUnitSchema,
+    creator: PublicUserSchema = Depends(AsyncAuthService.get_current_user),
+    uow: AsyncUnitOfWork = Depends(get_async_unit_of_work),
+) -> UnitSchema:
+    repository = AsyncUnitRepository(uow)
+    service = AsyncUnitService(repository)
+    return await service.create(payload, creator)
+
+
+@router.put('/{unit_id}', status_code=HTTPStatus.OK, response_model=UnitSchema)
+async def update_unit(
+    unit_id: int,
+    payload: CreateUnitSchema,
+    executor: PublicUserSchema = Depends(AsyncAuthService.get_current_user),
+    uow: AsyncUnitOfWork = Depends(get_async_unit_of_work),
+) -> UnitSchema:
+    repository = AsyncUnitRepository(uow)
+    service = AsyncUnitService(repository)
+    return await service.update(unit_id, payload, executor)
+
+
+@router.delete('/{unit_id}', status_code=HTTPStatus.NO_CONTENT)
+async def delete_unit(
+    unit_id: int,
+    executor: PublicUserSchema = Depends(AsyncAuthService.get_current_user),
+    uow: AsyncUnitOfWork = Depends(get_async_unit_of_work),
+) -> None:
+    repository = AsyncUnitRepository(uow)
+    service = AsyncUnitService(repository)
+    await service.delete(unit_id, executor)
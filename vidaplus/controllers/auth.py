@@ -1,8 +1,10 @@
 from http import HTTPStatus
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 
-from vidaplus.main.schemas.auth import RequestAuthUserData, ResponseAuthToken
+from vidaplus.main.schemas.auth import RequestAuthUserData, ResponseAuthToken, TokenData
+from vidaplus.models.config.unit_of_work import UnitOfWork, get_unit_of_work
+from vidaplus.models.repositories.revoked_token_repository import RevokedTokenRepository
 from vidaplus.models.repositories.user_repository import UserRepository
 from vidaplus.services.auth_service import AuthService
 from vidaplus.services.user_service import UserService
@@ -11,14 +13,27 @@ router = APIRouter(prefix='/api/auth', tags=['Autenticação'])
 
 
 @router.post('/token', status_code=HTTPStatus.OK, response_model=ResponseAuthToken)
-def get_access_token(data: RequestAuthUserData) -> ResponseAuthToken:
-    user_repository = UserRepository()
+async def get_access_token(
+    request: Request, data: RequestAuthUserData, uow: UnitOfWork = Depends(get_unit_of_work)
+) -> ResponseAuthToken:
+    user_repository = UserRepository(uow)
     user_service = UserService(user_repository)
-    access_token = user_service.authenticate(data.email, data.password)
+    access_token = await user_service.authenticate(
+        data.email, data.password, request.client.host if request.client else None
+    )
     return ResponseAuthToken(access_token=access_token)
 
 
 @router.post('/refresh', status_code=HTTPStatus.OK, response_model=ResponseAuthToken)
-def refresh_token(access_token: str = Depends(AuthService.oauth2_scheme)) -> ResponseAuthToken:
-    new_access_token = AuthService.refresh_token(access_token=access_token)
+def refresh_token(
+    access_token: str = Depends(AuthService.oauth2_scheme), uow: UnitOfWork = Depends(get_unit_of_work)
+) -> ResponseAuthToken:
+    new_access_token = AuthService.refresh_token(access_token, RevokedTokenRepository(uow))
     return ResponseAuthToken(access_token=new_access_token)
+
+
+@router.post('/logout', status_code=HTTPStatus.NO_CONTENT)
+def logout(
+    current_user: TokenData = Depends(AuthService.get_current_user), uow: UnitOfWork = Depends(get_unit_of_work)
+) -> None:
+    AuthService.revoke(current_user, RevokedTokenRepository(uow))
@@ -1,9 +1,15 @@
 from http import HTTPStatus
+from typing import Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request, Response
 
+from vidaplus.controllers.conditional import conditional_get, etag, if_match, page_etag
+from vidaplus.controllers.responses import model_response
+from vidaplus.controllers.streaming import stream_response, wants_stream
 from vidaplus.main.schemas.bed import BedSchema, CreateBedSchema
+from vidaplus.main.schemas.page import PageSchema
 from vidaplus.main.schemas.user import PublicUserSchema
+from vidaplus.models.config.unit_of_work import UnitOfWork, get_unit_of_work
 from vidaplus.models.repositories.bed_repository import BedRepository
 from vidaplus.models.repositories.unit_repository import UnitRepository
 from vidaplus.services.auth_service import AuthService
@@ -12,43 +18,74 @@ from vidaplus.services.bed_service import BedService
 router = APIRouter(prefix='/api/leitos', tags=['Leitos'])
 
 
-@router.get('/', status_code=HTTPStatus.OK, response_model=list[BedSchema])
-def get_beds() -> list[BedSchema]:
-    bed_repo = BedRepository()
-    unit_repo = UnitRepository()
+@router.get('/', status_code=HTTPStatus.OK, response_model=PageSchema[BedSchema])
+def get_beds(  # noqa: PLR0913
+    request: Request,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1),
+    stream: bool = False,
+    uow: UnitOfWork = Depends(get_unit_of_work),
+) -> Response:
+    if wants_stream(request, stream):
+        return stream_response(
+            request, lambda stream_uow: BedService(BedRepository(stream_uow), UnitRepository(stream_uow)).stream(cursor)
+        )
+
+    bed_repo = BedRepository(uow)
+    unit_repo = UnitRepository(uow)
     service = BedService(bed_repo, unit_repo)
-    return service.all()
+    page = service.all(cursor, limit)
+    return conditional_get(request, response, page_etag(page)) or model_response(page, response)
 
 
 @router.get('/{bed_id}', status_code=HTTPStatus.OK, response_model=BedSchema)
-def get_bed(bed_id: int) -> BedSchema:
-    bed_repo = BedRepository()
-    unit_repo = UnitRepository()
+def get_bed(
+    bed_id: int, request: Request, response: Response, uow: UnitOfWork = Depends(get_unit_of_work)
+) -> BedSchema | Response:
+    bed_repo = BedRepository(uow)
+    unit_repo = UnitRepository(uow)
     service = BedService(bed_repo, unit_repo)
-    return service.get_by_id(bed_id)
+    bed = service.get_by_id(bed_id)
+    return conditional_get(request, response, etag(bed)) or bed
 
 
 @router.post('/', status_code=HTTPStatus.CREATED, response_model=BedSchema)
-def create_bed(bed: CreateBedSchema, creator: PublicUserSchema = Depends(AuthService.get_current_user)) -> BedSchema:
-    bed_repo = BedRepository()
-    unit_repo = UnitRepository()
+def create_bed(
+    bed: CreateBedSchema,
+    creator: PublicUserSchema = Depends(AuthService.get_current_user),
+    uow: UnitOfWork = Depends(get_unit_of_work),
+) -> BedSchema:
+    bed_repo = BedRepository(uow)
+    unit_repo = UnitRepository(uow)
     service = BedService(bed_repo, unit_repo)
     return service.create(bed, creator)
 
 
 @router.put('/{bed_id}', status_code=HTTPStatus.OK, response_model=BedSchema)
-def update_bed(
-    bed_id: int, bed: CreateBedSchema, executor: PublicUserSchema = Depends(AuthService.get_current_user)
+def update_bed(  # noqa: PLR0913
+    bed_id: int,
+    bed: CreateBedSchema,
+    response: Response,
+    version: Optional[int] = Depends(if_match),
+    executor: PublicUserSchema = Depends(AuthService.get_current_user),
+    uow: UnitOfWork = Depends(get_unit_of_work),
 ) -> BedSchema:
-    bed_repo = BedRepository()
-    unit_repo = UnitRepository()
+    bed_repo = BedRepository(uow)
+    unit_repo = UnitRepository(uow)
     service = BedService(bed_repo, unit_repo)
-    return service.update(bed_id, bed, executor)
+    updated = service.update(bed_id, bed, executor, version)
+    response.headers['ETag'] = etag(updated)
+    return updated
 
 
 @router.delete('/{bed_id}', status_code=HTTPStatus.NO_CONTENT)
-def delete_bed(bed_id: int, executor: PublicUserSchema = Depends(AuthService.get_current_user)) -> None:
-    bed_repo = BedRepository()
-    unit_repo = UnitRepository()
+def delete_bed(
+    bed_id: int,
+    executor: PublicUserSchema = Depends(AuthService.get_current_user),
+    uow: UnitOfWork = Depends(get_unit_of_work),
+) -> None:
+    bed_repo = BedRepository(uow)
+    unit_repo = UnitRepository(uow)
     service = BedService(bed_repo, unit_repo)
     service.delete(bed_id, executor)
@@ -0,0 +1,92 @@
+import re
+from hashlib import blake2b
+from http import HTTPStatus
+from typing import Optional
+from zlib import crc32
+
+from fastapi import Header, Request, Response
+from pydantic import BaseModel
+
+from vidaplus.main.exceptions import PreconditionFailedError
+from vidaplus.main.schemas.page import PageSchema
+
+# `"<versão>"` ou `"<versão>.<crc32 dos modelos aninhados>"`, como gerado por `etag`.
+STRONG_ETAG = re.compile(r'^"(\d+)(?:\.[0-9a-f]{8})?"$')
+
+
+def nested(item: BaseModel) -> list[BaseModel]:
+    return [value for _, value in item if isinstance(value, BaseModel)]
+
+
+def fingerprint(item: BaseModel) -> bytes:
+    """Identifica o estado do item sem serializá-lo por inteiro.
+
+    Itens versionados são identificados pelo id, pela versão e pelos modelos aninhados (como a unidade de um leito),
+    que mudam sem alterar a versão do item. Os demais, como as ocorrências ainda não gravadas de uma série, são
+    serializados.
+    """
+    version = getattr(item, 'version', None)
+
+    if version is None:
+        return item.model_dump_json().encode()
+
+    parts = [str(getattr(item, 'id', '')), str(version)]
+    parts.extend(model.model_dump_json() for model in nested(item))
+    return '\0'.join(parts).encode()
+
+
+def etag(item: BaseModel) -> str:
+    """ETag forte de um item versionado; aceita de volta em `If-Match`."""
+    version = item.version  # type: ignore[attr-defined]
+    models = nested(item)
+
+    if not models:
+        return f'"{version}"'
+
+    checksum = crc32(b'\0'.join(model.model_dump_json().encode() for model in models))
+    return f'"{version}.{checksum:08x}"'
+
+
+def page_etag(page: PageSchema) -> str:
+    """ETag fraca de uma página, calculada a partir das impressões dos itens e do próximo cursor."""
+    digest = blake2b(digest_size=16)
+
+    for item in page.items:
+        digest.update(fingerprint(item))
+        digest.update(b'\n')
+
+    digest.update((page.next_cursor or '').encode())
+    return f'W/"{digest.hexdigest()}"'
+
+
+def matches(if_none_match: str, tag: str) -> bool:
+    # `If-None-Match` usa comparação fraca: o prefixo `W/` é ignorado dos dois lados.
+    candidates = {candidate.strip().removeprefix('W/') for candidate in if_none_match.split(',')}
+    return '*' in candidates or tag.removeprefix('W/') in candidates
+
+
+def conditional_get(request: Request, response: Response, tag: str) -> Optional[Response]:
+    """Responde 304 quando `If-None-Match` casa com a ETag; caso contrário, a adiciona à resposta e retorna `None`."""
+    if_none_match = request.headers.get('if-none-match')
+
+    if if_none_match and matches(if_none_match, tag):
+        return Response(status_code=HTTPStatus.NOT_MODIFIED, headers={'ETag': tag})
+
+    response.headers['ETag'] = tag
+    return None
+
+
+def if_match(if_match: Optional[str] = Header(None)) -> Optional[int]:
+    """Versão esperada pelo cliente em `If-Match`, ou `None` quando o cabeçalho falta ou é `*`.
+
+    ETags fracas nunca satisfazem `If-Match`, e ETags que não foram geradas aqui também não.
+    """
+    if if_match is None or if_match.strip() == '*':
+        return None
+
+    match = STRONG_ETAG.match(if_match.strip())
+
+    if not match:
+        raise PreconditionFailedError()
+
+    return int(match.group(1))
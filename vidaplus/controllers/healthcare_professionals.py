@@ -1,73 +1,134 @@
+from datetime import datetime
 from http import HTTPStatus
+from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request, Response
 
+from vidaplus.controllers.responses import model_response
+from vidaplus.controllers.streaming import stream_response, wants_stream
 from vidaplus.main.enums.roles import Roles
-from vidaplus.main.schemas.appointment import AppointmentSchema
+from vidaplus.main.schemas.appointment import AppointmentOccurrenceSchema, AppointmentSchema
+from vidaplus.main.schemas.availability import AvailabilitySchema
+from vidaplus.main.schemas.page import PageSchema
 from vidaplus.main.schemas.user import CreateUserSchema, PublicUserSchema, RequestCreateUserSchema
+from vidaplus.models.config.unit_of_work import UnitOfWork, get_unit_of_work
 from vidaplus.models.repositories.appointment_repository import AppointmentRepository
 from vidaplus.models.repositories.user_repository import UserRepository
 from vidaplus.services.appointment_service import AppointmentService
 from vidaplus.services.auth_service import AuthService
+from vidaplus.services.availability_service import AvailabilityService
 from vidaplus.services.user_service import UserService
 
 router = APIRouter(prefix='/api/profissionais', tags=['Profissionais de Saúde'])
 
 
 @router.post('/', status_code=HTTPStatus.CREATED)
-def create_healthcare_professional(
-    data: RequestCreateUserSchema, creator: PublicUserSchema = Depends(AuthService.get_current_user)
+async def create_healthcare_professional(
+    data: RequestCreateUserSchema,
+    creator: PublicUserSchema = Depends(AuthService.get_current_user),
+    uow: UnitOfWork = Depends(get_unit_of_work),
 ) -> PublicUserSchema:
-    repository = UserRepository()
+    repository = UserRepository(uow)
     service = UserService(repository)
-    return service.new_healthcare_professional(data, creator)
+    return await service.new_healthcare_professional(data, creator)
 
 
-@router.get('/', status_code=HTTPStatus.OK, response_model=list[PublicUserSchema])
-def get_healthcare_professionals() -> list[PublicUserSchema]:
-    repository = UserRepository()
+@router.get('/', status_code=HTTPStatus.OK, response_model=PageSchema[PublicUserSchema])
+def get_healthcare_professionals(
+    request: Request,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1),
+    stream: bool = False,
+    uow: UnitOfWork = Depends(get_unit_of_work),
+) -> Response:
+    if wants_stream(request, stream):
+        return stream_response(
+            request,
+            lambda stream_uow: UserService(UserRepository(stream_uow)).stream(Roles.HEALTHCARE_PROFESSIONAL, cursor),
+        )
+
+    repository = UserRepository(uow)
     service = UserService(repository)
-    return service.all(Roles.HEALTHCARE_PROFESSIONAL)
+    return model_response(service.all(Roles.HEALTHCARE_PROFESSIONAL, cursor, limit))
+
+
+@router.get('/disponibilidade', status_code=HTTPStatus.OK, response_model=list[AvailabilitySchema])
+def get_healthcare_professionals_availability(  # noqa: PLR0913
+    start: datetime,
+    end: datetime,
+    duration: int,
+    professional_id: Optional[list[UUID]] = Query(None),
+    current_user: PublicUserSchema = Depends(AuthService.get_current_user),
+    uow: UnitOfWork = Depends(get_unit_of_work),
+) -> list[AvailabilitySchema]:
+    repository = AppointmentRepository(uow)
+    service = AvailabilityService(repository)
+    return service.search(start, end, duration, professional_id)
 
 
 @router.get('/{healthcare_professional_id}', status_code=HTTPStatus.OK, response_model=PublicUserSchema)
 def get_healthcare_professional(
-    healthcare_professional_id: UUID, is_admin: bool = Depends(AuthService.is_admin)
+    healthcare_professional_id: UUID,
+    is_admin: bool = Depends(AuthService.is_admin),
+    uow: UnitOfWork = Depends(get_unit_of_work),
 ) -> PublicUserSchema:
-    repository = UserRepository()
+    repository = UserRepository(uow)
     service = UserService(repository)
     return service.get_by_id(healthcare_professional_id)
 
 
 @router.put('/{healthcare_professional_id}', status_code=HTTPStatus.OK, response_model=PublicUserSchema)
-def update_healthcare_professional(
+async def update_healthcare_professional(
     healthcare_professional_id: UUID,
     data: CreateUserSchema,
     executor: PublicUserSchema = Depends(AuthService.get_current_user),
+    uow: UnitOfWork = Depends(get_unit_of_work),
 ) -> PublicUserSchema:
-    repository = UserRepository()
+    repository = UserRepository(uow)
     service = UserService(repository)
-    return service.update(healthcare_professional_id, data, executor)
+    return await service.update(healthcare_professional_id, data, executor)
 
 
 @router.delete('/{healthcare_professional_id}', status_code=HTTPStatus.NO_CONTENT)
 def delete_healthcare_professional(
     healthcare_professional_id: UUID,
     executor: PublicUserSchema = Depends(AuthService.get_current_user),
+    uow: UnitOfWork = Depends(get_unit_of_work),
 ) -> None:
-    repository = UserRepository()
+    repository = UserRepository(uow)
     service = UserService(repository)
     service.delete(healthcare_professional_id, executor)
 
 
 @router.get(
-    '/{healthcare_professional_id}/agendamentos', status_code=HTTPStatus.OK, response_model=list[AppointmentSchema]
+    '/{healthcare_professional_id}/agendamentos',
+    status_code=HTTPStatus.OK,
+    response_model=list[AppointmentSchema | AppointmentOccurrenceSchema],
 )
 def get_healthcare_professional_appointments(
     healthcare_professional_id: UUID,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
     current_user: PublicUserSchema = Depends(AuthService.get_current_user),
-) -> list[AppointmentSchema]:
-    repository = AppointmentRepository()
+    uow: UnitOfWork = Depends(get_unit_of_work),
+) -> list[AppointmentSchema | AppointmentOccurrenceSchema]:
+    repository = AppointmentRepository(uow)
     service = AppointmentService(repository)
-    return service.get(professional_id=healthcare_professional_id)
+    return service.get_agenda(healthcare_professional_id, start_date, end_date)
+
+
+@router.get(
+    '/{healthcare_professional_id}/disponibilidade', status_code=HTTPStatus.OK, response_model=AvailabilitySchema
+)
+def get_healthcare_professional_availability(  # noqa: PLR0913
+    healthcare_professional_id: UUID,
+    start: datetime,
+    end: datetime,
+    duration: int,
+    current_user: PublicUserSchema = Depends(AuthService.get_current_user),
+    uow: UnitOfWork = Depends(get_unit_of_work),
+) -> AvailabilitySchema:
+    repository = AppointmentRepository(uow)
+    service = AvailabilityService(repository)
+    return service.search_for_professional(healthcare_professional_id, start, end, duration)
@@ -1,10 +1,15 @@
 from http import HTTPStatus
+from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request, Response
 
+from vidaplus.controllers.responses import model_response
+from vidaplus.controllers.streaming import stream_response, wants_stream
 from vidaplus.main.enums.roles import Roles
+from vidaplus.main.schemas.page import PageSchema
 from vidaplus.main.schemas.user import CreateUserSchema, PublicUserSchema, RequestCreateUserSchema
+from vidaplus.models.config.unit_of_work import UnitOfWork, get_unit_of_work
 from vidaplus.models.repositories.user_repository import UserRepository
 from vidaplus.services.auth_service import AuthService
 from vidaplus.services.user_service import UserService
@@ -13,37 +18,57 @@ router = APIRouter(prefix='/api/pacientes', tags=['Pacientes'])
 
 
 @router.post('/', status_code=HTTPStatus.CREATED, response_model=PublicUserSchema)
-def register_patient(data: RequestCreateUserSchema) -> PublicUserSchema:
-    user_repository = UserRepository()
+async def register_patient(
+    data: RequestCreateUserSchema, uow: UnitOfWork = Depends(get_unit_of_work)
+) -> PublicUserSchema:
+    user_repository = UserRepository(uow)
     user_service = UserService(user_repository)
-    return user_service.new_patient(data)
+    return await user_service.new_patient(data)
+
 
+@router.get('/', status_code=HTTPStatus.OK, response_model=PageSchema[PublicUserSchema])
+def list_patients(
+    request: Request,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1),
+    stream: bool = False,
+    uow: UnitOfWork = Depends(get_unit_of_work),
+) -> Response:
+    if wants_stream(request, stream):
+        return stream_response(
+            request, lambda stream_uow: UserService(UserRepository(stream_uow)).stream(Roles.PATIENT, cursor)
+        )
 
-@router.get('/', status_code=HTTPStatus.OK, response_model=list[PublicUserSchema])
-def list_patients() -> list[PublicUserSchema]:
-    user_repository = UserRepository()
+    user_repository = UserRepository(uow)
     user_service = UserService(user_repository)
-    return user_service.all(Roles.PATIENT)
+    return model_response(user_service.all(Roles.PATIENT, cursor, limit))
 
 
 @router.get('/{patient_id}', status_code=HTTPStatus.OK, response_model=PublicUserSchema)
-def get_patient(patient_id: UUID) -> PublicUserSchema:
-    user_repository = UserRepository()
+def get_patient(patient_id: UUID, uow: UnitOfWork = Depends(get_unit_of_work)) -> PublicUserSchema:
+    user_repository = UserRepository(uow)
     user_service = UserService(user_repository)
     return user_service.get_by_id(patient_id)
 
 
 @router.put('/{patient_id}', status_code=HTTPStatus.OK, response_model=PublicUserSchema)
-def update_patient(
-    patient_id: UUID, data: CreateUserSchema, executor: PublicUserSchema = Depends(AuthService.get_current_user)
+async def update_patient(
+    patient_id: UUID,
+    data: CreateUserSchema,
+    executor: PublicUserSchema = Depends(AuthService.get_current_user),
+    uow: UnitOfWork = Depends(get_unit_of_work),
 ) -> PublicUserSchema:
-    user_repository = UserRepository()
+    user_repository = UserRepository(uow)
     user_service = UserService(user_repository)
-    return user_service.update(patient_id, data, executor)
+    return await user_service.update(patient_id, data, executor)
 
 
 @router.delete('/{patient_id}', status_code=HTTPStatus.NO_CONTENT)
-def delete_patient(patient_id: UUID, executor: PublicUserSchema = Depends(AuthService.get_current_user)) -> None:
-    user_repository = UserRepository()
+def delete_patient(
+    patient_id: UUID,
+    executor: PublicUserSchema = Depends(AuthService.get_current_user),
+    uow: UnitOfWork = Depends(get_unit_of_work),
+) -> None:
+    user_repository = UserRepository(uow)
     user_service = UserService(user_repository)
     user_service.delete(patient_id, executor)
@@ -0,0 +1,29 @@
+from typing import Any, Optional
+
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+class ModelResponse(JSONResponse):
+    """Resposta JSON padrão da aplicação.
+
+    Modelos Pydantic são serializados direto para JSON pelo pydantic-core, sem passar por dicionários nem pelo módulo
+    `json`; os demais conteúdos seguem o caminho do `JSONResponse`.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.model_dump_json().encode()
+
+        return super().render(content)
+
+
+def model_response(content: BaseModel, response: Optional[Response] = None) -> ModelResponse:
+    """Responde com um modelo já validado, sem passar pelo `response_model` da rota.
+
+    Com o modelo, o FastAPI o converteria em dicionário, validaria cada item de novo e só então serializaria o
+    resultado. O modelo deve ser do tipo declarado na rota, que continua documentando a resposta. Os cabeçalhos já
+    definidos em `response`, como a ETag, são mantidos.
+    """
+    return ModelResponse(content, headers=dict(response.headers) if response is not None else None)
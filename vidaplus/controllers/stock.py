@@ -1,42 +1,77 @@
 from http import HTTPStatus
+from typing import Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request, Response
 
+from vidaplus.controllers.conditional import conditional_get, etag, if_match, page_etag
+from vidaplus.controllers.responses import model_response
+from vidaplus.controllers.streaming import stream_response, wants_stream
+from vidaplus.main.schemas.page import PageSchema
 from vidaplus.main.schemas.supply import CreateSupplySchema, SupplySchema
 from vidaplus.main.schemas.user import PublicUserSchema
+from vidaplus.models.config.unit_of_work import UnitOfWork, get_unit_of_work
 from vidaplus.models.repositories.supply_repository import SupplyRepository
 from vidaplus.services.auth_service import AuthService
 from vidaplus.services.supply_service import SupplyService
 
 router = APIRouter(prefix='/api/estoque', tags=['Estoque'])
-repository = SupplyRepository()
-service = SupplyService(repository)
 
 
-@router.get('/', status_code=HTTPStatus.OK, response_model=list[SupplySchema])
-def get_all_supplies() -> list[SupplySchema]:
-    return service.all()
+def get_service(uow: UnitOfWork = Depends(get_unit_of_work)) -> SupplyService:
+    return SupplyService(SupplyRepository(uow))
+
+
+@router.get('/', status_code=HTTPStatus.OK, response_model=PageSchema[SupplySchema])
+def get_all_supplies(  # noqa: PLR0913
+    request: Request,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1),
+    stream: bool = False,
+    service: SupplyService = Depends(get_service),
+) -> Response:
+    if wants_stream(request, stream):
+        return stream_response(request, lambda stream_uow: get_service(stream_uow).stream(cursor))
+
+    page = service.all(cursor, limit)
+    return conditional_get(request, response, page_etag(page)) or model_response(page, response)
 
 
 @router.get('/{supply_id}', status_code=HTTPStatus.OK, response_model=SupplySchema)
-def get_supply_by_id(supply_id: int) -> SupplySchema:
-    return service.get_by_id(supply_id)
+def get_supply_by_id(
+    supply_id: int, request: Request, response: Response, service: SupplyService = Depends(get_service)
+) -> SupplySchema | Response:
+    supply = service.get_by_id(supply_id)
+    return conditional_get(request, response, etag(supply)) or supply
 
 
 @router.post('/', status_code=HTTPStatus.CREATED, response_model=SupplySchema)
 def create_supply(
-    supply: CreateSupplySchema, creator: PublicUserSchema = Depends(AuthService.get_current_user)
+    supply: CreateSupplySchema,
+    creator: PublicUserSchema = Depends(AuthService.get_current_user),
+    service: SupplyService = Depends(get_service),
 ) -> SupplySchema:
     return service.create(supply, creator)
 
 
 @router.put('/{supply_id}', status_code=HTTPStatus.OK, response_model=SupplySchema)
-def update_supply(
-    supply_id: int, supply: CreateSupplySchema, executor: PublicUserSchema = Depends(AuthService.get_current_user)
+def update_supply(  # noqa: PLR0913
+    supply_id: int,
+    supply: CreateSupplySchema,
+    response: Response,
+    version: Optional[int] = Depends(if_match),
+    executor: PublicUserSchema = Depends(AuthService.get_current_user),
+    service: SupplyService = Depends(get_service),
 ) -> SupplySchema:
-    return service.update(supply_id, supply, executor)
+    updated = service.update(supply_id, supply, executor, version)
+    response.headers['ETag'] = etag(updated)
+    return updated
 
 
 @router.delete('/{supply_id}', status_code=HTTPStatus.NO_CONTENT)
-def delete_supply(supply_id: int, executor: PublicUserSchema = Depends(AuthService.get_current_user)) -> None:
+def delete_supply(
+    supply_id: int,
+    executor: PublicUserSchema = Depends(AuthService.get_current_user),
+    service: SupplyService = Depends(get_service),
+) -> None:
     service.delete(supply_id, executor)
@@ -0,0 +1,88 @@
+from itertools import chain
+from typing import AsyncIterator, Callable, Iterable, Iterator, Optional, TypeVar
+
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from vidaplus.models.config.unit_of_work import AsyncUnitOfWork, UnitOfWork
+
+NDJSON = 'application/x-ndjson'
+
+T = TypeVar('T', bound=BaseModel)
+
+
+def wants_stream(request: Request, stream: bool) -> bool:
+    return stream or accepts_ndjson(request)
+
+
+def accepts_ndjson(request: Request) -> bool:
+    return NDJSON in request.headers.get('accept', '')
+
+
+def encode(item: BaseModel, position: int, ndjson: bool) -> bytes:
+    if ndjson:
+        return item.model_dump_json().encode() + b'\n'
+
+    return (b'[' if position == 0 else b',') + item.model_dump_json().encode()
+
+
+def closing(empty: bool, ndjson: bool) -> bytes:
+    if ndjson:
+        return b''
+
+    return b'[]' if empty else b']'
+
+
+def stream_response(request: Request, items: Callable[[UnitOfWork], Iterable[T]]) -> StreamingResponse:
+    """Resposta que serializa os itens à medida que são lidos, em NDJSON ou em um array JSON.
+
+    Os itens são lidos em uma unidade de trabalho própria, que dura até o fim do corpo: a da requisição é encerrada
+    antes de a resposta ser enviada. O primeiro item é lido antes de a resposta começar, para que erros como um cursor
+    inválido resultem em uma resposta de erro, e não em um corpo truncado.
+    """
+
+    def rows() -> Iterator[T]:
+        with UnitOfWork() as uow:
+            yield from items(uow)
+
+    iterator = rows()
+    first = next(iterator, None)
+    ndjson = accepts_ndjson(request)
+
+    def body() -> Iterator[bytes]:
+        if first is not None:
+            for position, item in enumerate(chain([first], iterator)):
+                yield encode(item, position, ndjson)
+
+        yield closing(first is None, ndjson)
+
+    return StreamingResponse(body(), media_type=NDJSON if ndjson else 'application/json')
+
+
+async def async_stream_response(
+    request: Request, items: Callable[[AsyncUnitOfWork], AsyncIterator[T]]
+) -> StreamingResponse:
+    """Equivalente assíncrono de `stream_response`."""
+
+    async def rows() -> AsyncIterator[T]:
+        async with AsyncUnitOfWork() as uow:
+            async for item in items(uow):
+                yield item
+
+    iterator = rows()
+    first: Optional[T] = await anext(iterator, None)
+    ndjson = accepts_ndjson(request)
+
+    async def body() -> AsyncIterator[bytes]:
+        if first is not None:
+            yield encode(first, 0, ndjson)
+
+            position = 1
+            async for item in iterator:
+                yield encode(item, position, ndjson)
+                position += 1
+
+        yield closing(first is None, ndjson)
+
+    return StreamingResponse(body(), media_type=NDJSON if ndjson else 'application/json')
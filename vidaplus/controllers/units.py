@@ -1,9 +1,14 @@
 from http import HTTPStatus
+from typing import Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request, Response
 
+from vidaplus.controllers.responses import model_response
+from vidaplus.controllers.streaming import stream_response, wants_stream
+from vidaplus.main.schemas.page import PageSchema
 from vidaplus.main.schemas.unit import CreateUnitSchema, UnitSchema
 from vidaplus.main.schemas.user import PublicUserSchema
+from vidaplus.models.config.unit_of_work import UnitOfWork, get_unit_of_work
 from vidaplus.models.repositories.unit_repository import UnitRepository
 from vidaplus.services.auth_service import AuthService
 from vidaplus.services.unit_service import UnitService
@@ -11,40 +16,58 @@ from vidaplus.services.unit_service import UnitService
 router = APIRouter(prefix='/api/unidades', tags=['Unidades'])
 
 
-@router.get('/', status_code=HTTPStatus.OK, response_model=list[UnitSchema])
-def list_units() -> list:
-    repository = UnitRepository()
+@router.get('/', status_code=HTTPStatus.OK, response_model=PageSchema[UnitSchema])
+def list_units(
+    request: Request,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1),
+    stream: bool = False,
+    uow: UnitOfWork = Depends(get_unit_of_work),
+) -> Response:
+    if wants_stream(request, stream):
+        return stream_response(request, lambda stream_uow: UnitService(UnitRepository(stream_uow)).stream(cursor))
+
+    repository = UnitRepository(uow)
     service = UnitService(repository)
-    return service.get_all()
+    return model_response(service.get_all(cursor, limit))
 
 
 @router.get('/{unit_id}', status_code=HTTPStatus.OK, response_model=UnitSchema | None)
-def get_unit(unit_id: int) -> UnitSchema | None:
-    repository = UnitRepository()
+def get_unit(unit_id: int, uow: UnitOfWork = Depends(get_unit_of_work)) -> UnitSchema | None:
+    repository = UnitRepository(uow)
     service = UnitService(repository)
     return service.get_by_id(unit_id)
 
 
 @router.post('/', status_code=HTTPStatus.CREATED)
 def create_unit(
-    payload: CreateUnitSchema, creator: PublicUserSchema = Depends(AuthService.get_current_user)
+    payload: CreateUnitSchema,
+    creator: PublicUserSchema = Depends(AuthService.get_current_user),
+    uow: UnitOfWork = Depends(get_unit_of_work),
 ) -> UnitSchema:
-    repository = UnitRepository()
+    repository = UnitRepository(uow)
     service = UnitService(repository)
     return service.create(payload, creator)
 
 
 @router.put('/{unit_id}', status_code=HTTPStatus.OK, response_model=UnitSchema)
 def update_unit(
-    unit_id: int, payload: CreateUnitSchema, executor: PublicUserSchema = Depends(AuthService.get_current_user)
+    unit_id: int,
+    payload: CreateUnitSchema,
+    executor: PublicUserSchema = Depends(AuthService.get_current_user),
+    uow: UnitOfWork = Depends(get_unit_of_work),
 ) -> UnitSchema:
-    repository = UnitRepository()
+    repository = UnitRepository(uow)
     service = UnitService(repository)
     return service.update(unit_id, payload, executor)
 
 
 @router.delete('/{unit_id}', status_code=HTTPStatus.NO_CONTENT)
-def delete_unit(unit_id: int, executor: PublicUserSchema = Depends(AuthService.get_current_user)) -> None:
-    repository = UnitRepository()
+def delete_unit(
+    unit_id: int,
+    executor: PublicUserSchema = Depends(AuthService.get_current_user),
+    uow: UnitOfWork = Depends(get_unit_of_work),
+) -> None:
+    repository = UnitRepository(uow)
     service = UnitService(repository)
     service.delete(unit_id, executor)
@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class BatchModes(str, Enum):
+    ALL_OR_NOTHING = 'ALL_OR_NOTHING'
+    BEST_EFFORT = 'BEST_EFFORT'
@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class RecurrenceFrequencies(str, Enum):
+    DAILY = 'DAILY'
+    WEEKLY = 'WEEKLY'
+    MONTHLY = 'MONTHLY'
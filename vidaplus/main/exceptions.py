@@ -33,6 +33,27 @@ class ExpiredTokenError(ApplicationError):
         super().__init__('Token expirado')
 
 
+class RevokedTokenError(ApplicationError):
+    code = HTTPStatus.UNAUTHORIZED
+
+    def __init__(self) -> None:
+        super().__init__('Token revogado')
+
+
+class PasswordHashingBusyError(ApplicationError):
+    code = HTTPStatus.SERVICE_UNAVAILABLE
+
+    def __init__(self) -> None:
+        super().__init__('Muitas autenticações em andamento, tente novamente em instantes')
+
+
+class TooManyLoginAttemptsError(ApplicationError):
+    code = HTTPStatus.TOO_MANY_REQUESTS
+
+    def __init__(self) -> None:
+        super().__init__('Muitas tentativas de login, tente novamente em instantes')
+
+
 class TokenRefreshError(ApplicationError):
     code = HTTPStatus.UNAUTHORIZED
 
@@ -61,6 +82,48 @@ class SchedulingTimeConflictError(ApplicationError):
         super().__init__('Já existe um agendamento no mesmo horário')
 
 
+class InvalidAvailabilityRangeError(ApplicationError):
+    code = HTTPStatus.BAD_REQUEST
+
+    def __init__(self) -> None:
+        super().__init__('Intervalo de busca de disponibilidade inválido')
+
+
+class BatchTooLargeError(ApplicationError):
+    code = HTTPStatus.BAD_REQUEST
+
+    def __init__(self) -> None:
+        super().__init__('O lote excede o tamanho máximo permitido')
+
+
+class InvalidRecurrenceError(ApplicationError):
+    code = HTTPStatus.BAD_REQUEST
+
+    def __init__(self) -> None:
+        super().__init__('A regra de recorrência não gera ocorrências ou excede o máximo permitido')
+
+
+class AppointmentSeriesNotFoundError(ApplicationError):
+    code = HTTPStatus.NOT_FOUND
+
+    def __init__(self) -> None:
+        super().__init__('Série de agendamentos não encontrada')
+
+
+class PreconditionFailedError(ApplicationError):
+    code = HTTPStatus.PRECONDITION_FAILED
+
+    def __init__(self) -> None:
+        super().__init__('O recurso foi alterado desde a versão informada em If-Match')
+
+
+class InvalidCursorError(ApplicationError):
+    code = HTTPStatus.BAD_REQUEST
+
+    def __init__(self) -> None:
+        super().__init__('Cursor de paginação inválido')
+
+
 class UserNotFoundError(ApplicationError):
     code = HTTPStatus.NOT_FOUND
 
@@ -108,3 +171,10 @@ class BedNotAvailableError(ApplicationError):
 
     def __init__(self) -> None:
         super().__init__('Leito não disponível')
+
+
+class NoAvailableBedError(ApplicationError):
+    code = HTTPStatus.CONFLICT
+
+    def __init__(self) -> None:
+        super().__init__('Nenhum leito disponível do tipo pedido na unidade')
@@ -3,6 +3,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict
 
+from vidaplus.main.enums.bed_types import BedTypes
+
 
 class CreateAdmissionSchema(BaseModel):
     patient_id: UUID
@@ -22,3 +24,9 @@ class UpdateAdmissionSchema(BaseModel):
     bed_id: int | None = None
     admitted_at: datetime | None = None
     discharged_at: datetime | None = None
+
+
+class AllocateAdmissionSchema(BaseModel):
+    patient_id: UUID
+    unit_id: int
+    type: BedTypes
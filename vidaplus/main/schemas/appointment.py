@@ -1,10 +1,12 @@
 from datetime import datetime
+from typing import Optional
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict
 
 from vidaplus.main.enums.appointment_status import AppointmentStatus
 from vidaplus.main.enums.appointment_types import AppointmentTypes
+from vidaplus.main.enums.batch_modes import BatchModes
 
 
 class CreateAppointmentSchema(BaseModel):
@@ -22,5 +24,26 @@ class CreateAppointmentSchema(BaseModel):
 
 class AppointmentSchema(CreateAppointmentSchema):
     id: int
+    series_id: Optional[int] = None
     created_at: datetime
     updated_at: datetime
+    version: int = 1
+
+
+class AppointmentOccurrenceSchema(CreateAppointmentSchema):
+    """Ocorrência de uma série que ainda não foi materializada no banco."""
+
+    id: None = None
+    series_id: int
+
+
+class BatchAppointmentItemSchema(BaseModel):
+    index: int
+    appointment: Optional[AppointmentSchema] = None
+    error: Optional[str] = None
+
+
+class BatchAppointmentResultSchema(BaseModel):
+    mode: BatchModes
+    created: int
+    results: list[BatchAppointmentItemSchema]
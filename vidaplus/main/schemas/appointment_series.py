@@ -0,0 +1,40 @@
+from datetime import datetime
+from typing import Optional, Self
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+from vidaplus.main.enums.appointment_status import AppointmentStatus
+from vidaplus.main.enums.appointment_types import AppointmentTypes
+from vidaplus.main.enums.recurrence_frequencies import RecurrenceFrequencies
+
+
+class CreateAppointmentSeriesSchema(BaseModel):
+    patient_id: UUID
+    professional_id: UUID
+    type: AppointmentTypes
+    estimated_duration: int
+    location: str
+    notes: str
+    starts_at: datetime
+    frequency: RecurrenceFrequencies
+    interval: int = Field(default=1, ge=1)
+    count: Optional[int] = Field(default=None, ge=1)
+    until: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+    @model_validator(mode='after')
+    def bounded(self) -> Self:
+        if self.count is None and self.until is None:
+            raise ValueError('Informe `count` ou `until` para limitar a série')
+
+        return self
+
+
+class AppointmentSeriesSchema(CreateAppointmentSeriesSchema):
+    id: int
+    status: AppointmentStatus
+    ends_at: datetime
+    materialized_until: datetime
+    created_at: datetime
@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Optional
 
 from pydantic import BaseModel, EmailStr
 
@@ -7,6 +8,7 @@ from vidaplus.main.schemas.user import PublicUserSchema
 
 class TokenData(PublicUserSchema):
     exp: datetime
+    jti: Optional[str] = None
 
 
 class RequestAuthUserData(BaseModel):
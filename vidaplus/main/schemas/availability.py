@@ -0,0 +1,10 @@
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class AvailabilitySchema(BaseModel):
+    professional_id: UUID
+    duration: int
+    slots: list[datetime]
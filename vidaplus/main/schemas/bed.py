@@ -15,4 +15,5 @@ class CreateBedSchema(BaseModel):
 
 class BedSchema(CreateBedSchema):
     id: int
+    version: int = 1
     unit: UnitSchema
@@ -0,0 +1,10 @@
+from typing import Generic, Optional, TypeVar
+
+from pydantic import BaseModel
+
+T = TypeVar('T')
+
+
+class PageSchema(BaseModel, Generic[T]):
+    items: list[T]
+    next_cursor: Optional[str] = None
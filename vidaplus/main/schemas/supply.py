@@ -12,3 +12,4 @@ class CreateSupplySchema(BaseModel):
 
 class SupplySchema(CreateSupplySchema):
     id: int
+    version: int = 1
@@ -1,8 +1,7 @@
 from datetime import datetime
 from uuid import UUID
 
-import bcrypt
-from pydantic import BaseModel, ConfigDict, EmailStr, field_validator
+from pydantic import BaseModel, ConfigDict, EmailStr
 
 from vidaplus.main.enums.roles import Roles
 
@@ -18,23 +17,20 @@ class RequestCreateUserSchema(BaseModel):
 class CreateUserSchema(RequestCreateUserSchema):
     role: Roles
 
-    @field_validator('password')
-    @classmethod
-    def hash_password(cls, password: str) -> str:
-        return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
-
 
+# Os esquemas de leitura recebem emails já validados na escrita. `EmailStr` os validaria de novo a cada linha lida, e
+# essa validação, feita em Python, custa mais que todo o resto da linha.
 class UserSchema(CreateUserSchema):
     id: UUID
+    email: str
     created_at: datetime
 
-    def verify_password(self, password: str) -> bool:
-        return bcrypt.checkpw(password.encode('utf-8'), self.password.encode('utf-8'))
-
 
 class PublicUserSchema(BaseModel):
     id: UUID
     name: str
-    email: EmailStr
+    email: str
     role: Roles
     created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
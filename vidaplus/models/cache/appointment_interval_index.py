@@ -0,0 +1,303 @@
+from __future__ import annotations
+
+import time
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from datetime import datetime
+from threading import Lock
+from typing import Iterable, Optional
+from uuid import UUID
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from vidaplus.main.enums.appointment_status import AppointmentStatus
+from vidaplus.main.schemas.appointment import AppointmentSchema
+from vidaplus.models.config.timezone import as_aware
+from vidaplus.models.entities.appointment import appointment_end
+from vidaplus.settings import Settings
+
+PENDING_KEY = 'appointment_interval_index.pending'
+PENDING_SERIES_KEY = 'appointment_interval_index.pending_series'
+
+
+class ProfessionalAgenda:
+    """Agendamentos de um profissional ordenados por horário.
+
+    Os intervalos ativos (não cancelados) ficam em listas paralelas ordenadas pelo início. Como a restrição de
+    exclusão do banco impede que eles se sobreponham, os fins também ficam ordenados e a busca por conflito para no
+    primeiro intervalo que termina antes do início pedido.
+
+    `has_series` indica se o profissional tinha séries com ocorrências ainda não materializadas quando a agenda foi
+    lida; sem elas, as consultas de conflito e de agenda não precisam expandir séries.
+    """
+
+    __slots__ = ('active_ends', 'active_ids', 'active_starts', 'appointments', 'has_series', 'loaded_at', 'starts')
+
+    def __init__(self, appointments: Iterable[AppointmentSchema], loaded_at: float, has_series: bool = False) -> None:
+        self.loaded_at = loaded_at
+        self.has_series = has_series
+        self.appointments: list[AppointmentSchema] = []
+        self.starts: list[tuple[datetime, int]] = []
+        self.active_starts: list[tuple[datetime, int]] = []
+        self.active_ends: list[datetime] = []
+        self.active_ids: list[int] = []
+
+        for appointment in appointments:
+            self.upsert(appointment)
+
+    def __len__(self) -> int:
+        return len(self.appointments)
+
+    def copy(self) -> ProfessionalAgenda:
+        return ProfessionalAgenda(self.appointments, self.loaded_at, self.has_series)
+
+    def upsert(self, appointment: AppointmentSchema) -> None:
+        self.remove(appointment.id)
+
+        key = (as_aware(appointment.date_time), appointment.id)
+        position = bisect_left(self.starts, key)
+        self.starts.insert(position, key)
+        self.appointments.insert(position, appointment)
+
+        if appointment.status != AppointmentStatus.CANCELED:
+            position = bisect_left(self.active_starts, key)
+            self.active_starts.insert(position, key)
+            self.active_ends.insert(position, as_aware(appointment_end(key[0], appointment.estimated_duration)))
+            self.active_ids.insert(position, appointment.id)
+
+    def remove(self, appointment_id: int) -> None:
+        for position, appointment in enumerate(self.appointments):
+            if appointment.id == appointment_id:
+                del self.appointments[position]
+                del self.starts[position]
+                break
+
+        if appointment_id in self.active_ids:
+            position = self.active_ids.index(appointment_id)
+            del self.active_starts[position]
+            del self.active_ends[position]
+            del self.active_ids[position]
+
+    def has_time_conflict(self, start: datetime, end: datetime, exclude_id: Optional[int] = None) -> bool:
+        start, end = as_aware(start), as_aware(end)
+        position = bisect_left(self.active_starts, (end,)) - 1
+
+        while position >= 0 and self.active_ends[position] > start:
+            if self.active_ids[position] != exclude_id:
+                return True
+            position -= 1
+
+        return False
+
+    def between(self, start: Optional[datetime] = None, end: Optional[datetime] = None) -> list[AppointmentSchema]:
+        # Mesma semântica do filtro `start_date < date_time < end_date` de `AppointmentRepository.get`.
+        first = bisect_right(self.starts, (as_aware(start), float('inf'))) if start else 0
+        last = bisect_left(self.starts, (as_aware(end),)) if end else len(self.starts)
+        return self.appointments[first:last]
+
+
+class AppointmentIntervalIndex:
+    """Índice em memória, por processo, dos agendamentos de cada profissional.
+
+    Os profissionais são carregados sob demanda pelos repositórios e mantidos em LRU, limitada pelo número de
+    profissionais e pelo total de agendamentos. Cada agenda é descartada após `reconcile_interval` segundos para ser
+    recarregada do banco, o que corrige escritas feitas por outros processos. Alterações feitas por este processo são
+    aplicadas somente depois do commit da sessão que as originou.
+    """
+
+    __instance: AppointmentIntervalIndex | None = None
+    __configured = False
+    __instance_lock = Lock()
+
+    def __init__(self, max_professionals: int, max_entries: int, reconcile_interval: float) -> None:
+        self.max_professionals = max_professionals
+        self.max_entries = max_entries
+        self.reconcile_interval = reconcile_interval
+        self.hits = 0
+        self.misses = 0
+
+        self.__agendas: OrderedDict[UUID, ProfessionalAgenda] = OrderedDict()
+        self.__owners: dict[int, UUID] = {}
+        self.__entries = 0
+        self.__epoch = 0
+        self.__last_writes: OrderedDict[UUID, int] = OrderedDict()
+        self.__forgotten_writes = 0
+        self.__lock = Lock()
+
+    @classmethod
+    def get_instance(cls) -> AppointmentIntervalIndex | None:
+        if not cls.__configured:
+            with cls.__instance_lock:
+                if not cls.__configured:
+                    settings = Settings()
+
+                    if settings.APPOINTMENT_INDEX_ENABLED:
+                        cls.__instance = cls(
+                            settings.APPOINTMENT_INDEX_MAX_PROFESSIONALS,
+                            settings.APPOINTMENT_INDEX_MAX_ENTRIES,
+                            settings.APPOINTMENT_INDEX_RECONCILE_SECONDS,
+                        )
+
+                    cls.__configured = True
+
+        return cls.__instance
+
+    @classmethod
+    def reset(cls) -> None:
+        with cls.__instance_lock:
+            cls.__instance = None
+            cls.__configured = False
+
+    @property
+    def epoch(self) -> int:
+        return self.__epoch
+
+    def has_time_conflict(
+        self, professional_id: UUID, start: datetime, end: datetime, exclude_id: Optional[int] = None
+    ) -> bool | None:
+        """Retorna `None` quando o profissional não está carregado (ou precisa ser reconciliado)."""
+        with self.__lock:
+            agenda = self.__lookup(professional_id)
+            return None if agenda is None else agenda.has_time_conflict(start, end, exclude_id)
+
+    def between(
+        self, professional_id: UUID, start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> list[AppointmentSchema] | None:
+        with self.__lock:
+            agenda = self.__lookup(professional_id)
+            return None if agenda is None else agenda.between(start, end)
+
+    def has_series(self, professional_id: UUID) -> bool:
+        """Se o profissional pode ter séries pendentes; na dúvida (agenda ausente ou expirada), responde `True`."""
+        with self.__lock:
+            agenda = self.__agendas.get(professional_id)
+            return agenda is None or agenda.has_series
+
+    def store(self, professional_id: UUID, agenda: ProfessionalAgenda, epoch: int) -> bool:
+        """Guarda uma agenda lida do banco quando `epoch` foi obtido.
+
+        A agenda é descartada se alguma escrita confirmada para o profissional foi aplicada depois disso, pois a
+        leitura pode não tê-la visto.
+        """
+        with self.__lock:
+            last_write = max(self.__last_writes.get(professional_id, 0), self.__forgotten_writes)
+
+            if last_write > epoch:
+                return False
+
+            self.__discard(professional_id)
+            agenda = agenda.copy()
+            self.__agendas[professional_id] = agenda
+            self.__entries += len(agenda)
+
+            for appointment in agenda.appointments:
+                self.__owners[appointment.id] = professional_id
+
+            self.__evict()
+            return professional_id in self.__agendas
+
+    def apply(self, appointments: Iterable[AppointmentSchema], series: Iterable[UUID] = ()) -> None:
+        """Aplica os agendamentos confirmados e marca os profissionais de `series` como donos de séries pendentes."""
+        with self.__lock:
+            self.__epoch += 1
+
+            for appointment in appointments:
+                self.__apply(appointment)
+
+            for professional_id in series:
+                if professional_id in self.__agendas:
+                    self.__agendas[professional_id].has_series = True
+
+                self.__touch(professional_id)
+
+            self.__evict()
+
+    def __apply(self, appointment: AppointmentSchema) -> None:
+        previous_owner = self.__owners.pop(appointment.id, None)
+
+        if previous_owner is not None and previous_owner in self.__agendas:
+            self.__agendas[previous_owner].remove(appointment.id)
+            self.__entries -= 1
+            self.__touch(previous_owner)
+
+        agenda = self.__agendas.get(appointment.professional_id)
+
+        if agenda is not None:
+            agenda.upsert(appointment)
+            self.__entries += 1
+            self.__owners[appointment.id] = appointment.professional_id
+
+        self.__touch(appointment.professional_id)
+
+    def __touch(self, professional_id: UUID) -> None:
+        self.__last_writes[professional_id] = self.__epoch
+        self.__last_writes.move_to_end(professional_id)
+
+        while len(self.__last_writes) > self.max_professionals:
+            _, epoch = self.__last_writes.popitem(last=False)
+            self.__forgotten_writes = max(self.__forgotten_writes, epoch)
+
+    def __lookup(self, professional_id: UUID) -> ProfessionalAgenda | None:
+        agenda = self.__agendas.get(professional_id)
+
+        if agenda is not None and time.monotonic() - agenda.loaded_at > self.reconcile_interval:
+            self.__discard(professional_id)
+            agenda = None
+
+        if agenda is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.__agendas.move_to_end(professional_id)
+        return agenda
+
+    def __discard(self, professional_id: UUID) -> None:
+        agenda = self.__agendas.pop(professional_id, None)
+
+        if agenda is not None:
+            self.__entries -= len(agenda)
+
+            for appointment in agenda.appointments:
+                self.__owners.pop(appointment.id, None)
+
+    def __evict(self) -> None:
+        while self.__agendas and (len(self.__agendas) > self.max_professionals or self.__entries > self.max_entries):
+            self.__discard(next(iter(self.__agendas)))
+
+
+def stage(session: Session, appointment: AppointmentSchema) -> None:
+    """Agenda a atualização do índice para quando a transação da sessão for confirmada."""
+    if AppointmentIntervalIndex.get_instance() is not None:
+        session.info.setdefault(PENDING_KEY, []).append(appointment)
+
+
+def stage_series(session: Session, professional_id: UUID) -> None:
+    """Agenda a marcação de `professional_id` como dono de séries pendentes para depois do commit da sessão."""
+    if AppointmentIntervalIndex.get_instance() is not None:
+        session.info.setdefault(PENDING_SERIES_KEY, set()).add(professional_id)
+
+
+def has_pending(session: Session, professional_id: UUID) -> bool:
+    return any(appointment.professional_id == professional_id for appointment in session.info.get(PENDING_KEY, []))
+
+
+def has_pending_series(session: Session, professional_id: UUID) -> bool:
+    return professional_id in session.info.get(PENDING_SERIES_KEY, set())
+
+
+@event.listens_for(Session, 'after_commit')
+def apply_pending(session: Session) -> None:
+    pending = session.info.pop(PENDING_KEY, None)
+    series = session.info.pop(PENDING_SERIES_KEY, None)
+    index = AppointmentIntervalIndex.get_instance()
+
+    if (pending or series) and index is not None:
+        index.apply(pending or [], series or ())
+
+
+@event.listens_for(Session, 'after_rollback')
+def discard_pending(session: Session) -> None:
+    session.info.pop(PENDING_KEY, None)
+    session.info.pop(PENDING_SERIES_KEY, None)
@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Optional
+
+from vidaplus.settings import Settings
+
+
+class TokenBucket:
+    """Balde de fichas: até `capacity` tentativas seguidas, repostas à razão de `rate` por segundo."""
+
+    __slots__ = ('capacity', 'rate', 'tokens', 'updated_at')
+
+    def __init__(self, capacity: float, rate: float, now: float) -> None:
+        self.capacity = capacity
+        self.rate = rate
+        self.tokens = capacity
+        self.updated_at = now
+
+    def available(self, now: float) -> float:
+        return min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+
+    def take(self, now: float) -> None:
+        self.tokens = self.available(now) - 1
+        self.updated_at = now
+
+
+class LoginThrottle:
+    """Limita, por processo, as tentativas de login por cliente e por email.
+
+    Cada chave tem um balde de fichas próprio, e uma tentativa só é aceita se houver ficha nos dois. Os baldes ficam
+    em LRU limitada por `max_keys`; descartar um balde equivale a enchê-lo, o que só favorece quem não fez tentativas
+    recentes.
+    """
+
+    __instance: LoginThrottle | None = None
+    __configured = False
+    __instance_lock = Lock()
+
+    def __init__(  # noqa: PLR0913
+        self,
+        client_burst: int,
+        client_per_minute: int,
+        email_burst: int,
+        email_per_minute: int,
+        max_keys: int,
+    ) -> None:
+        self.client_burst = client_burst
+        self.client_rate = client_per_minute / 60
+        self.email_burst = email_burst
+        self.email_rate = email_per_minute / 60
+        self.max_keys = max_keys
+        self.rejected = 0
+
+        self.__buckets: OrderedDict[tuple[str, str], TokenBucket] = OrderedDict()
+        self.__lock = Lock()
+
+    @classmethod
+    def get_instance(cls) -> LoginThrottle | None:
+        if not cls.__configured:
+            with cls.__instance_lock:
+                if not cls.__configured:
+                    settings = Settings()
+
+                    if settings.LOGIN_THROTTLE_ENABLED:
+                        cls.__instance = cls(
+                            settings.LOGIN_CLIENT_BURST,
+                            settings.LOGIN_CLIENT_PER_MINUTE,
+                            settings.LOGIN_EMAIL_BURST,
+                            settings.LOGIN_EMAIL_PER_MINUTE,
+                            settings.LOGIN_THROTTLE_MAX_KEYS,
+                        )
+
+                    cls.__configured = True
+
+        return cls.__instance
+
+    @classmethod
+    def reset(cls) -> None:
+        with cls.__instance_lock:
+            cls.__instance = None
+            cls.__configured = False
+
+    def allow(self, client: Optional[str], email: str) -> bool:
+        now = time.monotonic()
+
+        with self.__lock:
+            buckets = [self.__bucket(('email', email.lower()), self.email_burst, self.email_rate, now)]
+
+            if client:
+                buckets.append(self.__bucket(('client', client), self.client_burst, self.client_rate, now))
+
+            # As fichas só são gastas quando todos os baldes têm uma, para que um email bloqueado não consuma as do
+            # cliente, e vice-versa.
+            if all(bucket.available(now) >= 1 for bucket in buckets):
+                for bucket in buckets:
+                    bucket.take(now)
+
+                return True
+
+            self.rejected += 1
+            return False
+
+    def __bucket(self, key: tuple[str, str], capacity: float, rate: float, now: float) -> TokenBucket:
+        bucket = self.__buckets.get(key)
+
+        if bucket is None:
+            bucket = self.__buckets[key] = TokenBucket(capacity, rate, now)
+
+            while len(self.__buckets) > self.max_keys:
+                self.__buckets.popitem(last=False)
+        else:
+            self.__buckets.move_to_end(key)
+
+        return bucket
+
+
+class UnknownEmailCache:
+    """Emails que não pertencem a nenhum usuário, segundo o banco, por até `ttl` segundos.
+
+    Um login com um desses emails é recusado sem consultar o banco. Cadastros e mudanças de email feitos neste
+    processo retiram o email na hora; nos demais processos, ele sai quando a entrada expira.
+    """
+
+    __instance: UnknownEmailCache | None = None
+    __configured = False
+    __instance_lock = Lock()
+
+    def __init__(self, max_entries: int, ttl: float) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+
+        self.__entries: OrderedDict[str, float] = OrderedDict()
+        self.__lock = Lock()
+
+    @classmethod
+    def get_instance(cls) -> UnknownEmailCache | None:
+        if not cls.__configured:
+            with cls.__instance_lock:
+                if not cls.__configured:
+                    settings = Settings()
+
+                    if settings.UNKNOWN_EMAIL_CACHE_SECONDS > 0:
+                        cls.__instance = cls(
+                            settings.UNKNOWN_EMAIL_CACHE_MAX_ENTRIES, settings.UNKNOWN_EMAIL_CACHE_SECONDS
+                        )
+
+                    cls.__configured = True
+
+        return cls.__instance
+
+    @classmethod
+    def reset(cls) -> None:
+        with cls.__instance_lock:
+            cls.__instance = None
+            cls.__configured = False
+
+    # Os emails são guardados em minúsculas, como os compara o índice `ix_user_lower_email` da busca por email.
+    def __contains__(self, email: str) -> bool:
+        email = email.lower()
+
+        with self.__lock:
+            expires_at = self.__entries.get(email)
+
+            if expires_at is None:
+                return False
+
+            if expires_at <= time.monotonic():
+                del self.__entries[email]
+                return False
+
+            self.hits += 1
+            return True
+
+    def add(self, email: str) -> None:
+        email = email.lower()
+
+        with self.__lock:
+            self.__entries[email] = time.monotonic() + self.ttl
+            self.__entries.move_to_end(email)
+
+            while len(self.__entries) > self.max_entries:
+                self.__entries.popitem(last=False)
+
+    def discard(self, email: str) -> None:
+        with self.__lock:
+            self.__entries.pop(email.lower(), None)
+
+
+def forget_unknown_email(email: str) -> None:
+    """Retira o email do cache de emails desconhecidos, depois de um cadastro ou de uma mudança de email."""
+    cache = UnknownEmailCache.get_instance()
+
+    if cache is not None:
+        cache.discard(email)
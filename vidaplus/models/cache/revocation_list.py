@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import math
+import time
+from hashlib import blake2b
+from threading import Lock
+from typing import Iterable, Optional
+
+from vidaplus.settings import Settings
+
+
+class BloomFilter:
+    """Conjunto probabilístico: `key in filter` nunca erra para chaves adicionadas, e erra para as demais com
+    probabilidade de até `error_rate` enquanto o filtro tiver no máximo `capacity` chaves."""
+
+    __slots__ = ('bits', 'capacity', 'hashes', 'size')
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        self.capacity = capacity
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def __positions(self, key: str) -> Iterable[int]:
+        # Duplo hashing: as `hashes` posições saem de dois valores de 64 bits de um único resumo.
+        digest = blake2b(key.encode(), digest_size=16).digest()
+        first, second = int.from_bytes(digest[:8]), int.from_bytes(digest[8:]) | 1
+        return ((first + i * second) % self.size for i in range(self.hashes))
+
+    def add(self, key: str) -> None:
+        for position in self.__positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self.__positions(key))
+
+
+class RevocationList:
+    """Filtro de Bloom, por processo, dos ids (`jti`) dos tokens revogados na tabela `revoked_token`.
+
+    Um token fora do filtro certamente não foi revogado e é aceito sem consultar o banco; só os que caem no filtro
+    (os revogados e uma fração `error_rate` dos demais) são confirmados na tabela. As revogações feitas neste processo
+    entram no filtro na hora. As dos demais processos são buscadas pelo id a cada `sync_interval` segundos, pelas
+    próprias requisições. A reconstrução, que lê todas as revogações não expiradas a cada `rebuild_interval` segundos
+    (ou quando o filtro passa da capacidade) e também recupera linhas gravadas fora da ordem dos ids, fica com a
+    tarefa de fundo do `lifespan`, para não atrasar nenhuma requisição.
+    """
+
+    __instance: RevocationList | None = None
+    __instance_lock = Lock()
+
+    def __init__(self, capacity: int, error_rate: float, sync_interval: float, rebuild_interval: float) -> None:
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.sync_interval = sync_interval
+        self.rebuild_interval = rebuild_interval
+        self.checks = 0
+        self.lookups = 0
+
+        self.__filter = BloomFilter(capacity, error_rate)
+        self.__count = 0
+        self.__local: list[str] = []
+        self.__last_id = 0
+        self.__synced_at = -math.inf
+        self.__rebuilt_at = -math.inf
+        self.__syncing = False
+        self.__lock = Lock()
+
+    @classmethod
+    def get_instance(cls) -> RevocationList:
+        if cls.__instance is None:
+            with cls.__instance_lock:
+                if cls.__instance is None:
+                    settings = Settings()
+                    cls.__instance = cls(
+                        settings.REVOCATION_FILTER_CAPACITY,
+                        settings.REVOCATION_FILTER_ERROR_RATE,
+                        settings.REVOCATION_SYNC_SECONDS,
+                        settings.REVOCATION_REBUILD_SECONDS,
+                    )
+
+        return cls.__instance
+
+    @classmethod
+    def reset(cls) -> None:
+        with cls.__instance_lock:
+            cls.__instance = None
+
+    def __len__(self) -> int:
+        return self.__count
+
+    def __contains__(self, jti: str) -> bool:
+        self.checks += 1
+
+        if jti not in self.__filter:
+            return False
+
+        self.lookups += 1
+        return True
+
+    def add(self, jti: str) -> None:
+        with self.__lock:
+            self.__add(jti)
+            self.__local.append(jti)
+
+    def claim_sync(self) -> Optional[int]:
+        """Id a partir do qual quem chamou deve sincronizar, ou `None` quando não é hora ou outro já está fazendo.
+
+        Quem recebe um id deve chamar `apply` ou `release`.
+        """
+        now = time.monotonic()
+
+        with self.__lock:
+            if self.__syncing or now - self.__synced_at < self.sync_interval:
+                return None
+
+            self.__syncing = True
+            return self.__last_id
+
+    def claim_rebuild(self) -> bool:
+        """Se quem chamou deve reconstruir o filtro; quem recebe `True` deve chamar `rebuild` ou `release`."""
+        now = time.monotonic()
+
+        with self.__lock:
+            if self.__syncing or (
+                self.__count <= self.__filter.capacity and now - self.__rebuilt_at < self.rebuild_interval
+            ):
+                return False
+
+            self.__syncing = True
+            return True
+
+    def apply(self, revocations: list[tuple[int, str]]) -> None:
+        with self.__lock:
+            self.__apply(revocations)
+
+    def rebuild(self, revocations: list[tuple[int, str]]) -> None:
+        with self.__lock:
+            self.__filter = BloomFilter(max(self.capacity, 2 * len(revocations)), self.error_rate)
+            self.__count = 0
+            self.__last_id = 0
+            self.__rebuilt_at = time.monotonic()
+
+            # As revogações feitas aqui podem não estar na leitura, se a transação delas ainda não terminou.
+            for jti in self.__local:
+                self.__add(jti)
+
+            self.__local.clear()
+            self.__apply(revocations)
+
+    def release(self) -> None:
+        with self.__lock:
+            self.__syncing = False
+
+    def __apply(self, revocations: list[tuple[int, str]]) -> None:
+        for revocation_id, jti in revocations:
+            self.__add(jti)
+            self.__last_id = max(self.__last_id, revocation_id)
+
+        self.__synced_at = time.monotonic()
+        self.__syncing = False
+
+    def __add(self, jti: str) -> None:
+        self.__filter.add(jti)
+        self.__count += 1
@@ -0,0 +1,23 @@
+from vidaplus.models.cache.appointment_interval_index import AppointmentIntervalIndex
+from vidaplus.models.cache.login_throttle import UnknownEmailCache
+from vidaplus.models.cache.token_cache import TokenCache
+
+
+def cache_stats() -> dict[str, dict[str, int]]:
+    """Contadores de acertos e faltas dos caches em memória deste processo; caches desativados ficam de fora."""
+    stats: dict[str, dict[str, int]] = {}
+    token_cache = TokenCache.get_instance()
+    appointment_index = AppointmentIntervalIndex.get_instance()
+    unknown_emails = UnknownEmailCache.get_instance()
+
+    if token_cache is not None:
+        stats['token_cache'] = {'hits': token_cache.hits, 'misses': token_cache.misses}
+
+    if appointment_index is not None:
+        stats['appointment_index'] = {'hits': appointment_index.hits, 'misses': appointment_index.misses}
+
+    # Só os acertos são contados: uma falta é um login comum, que segue para o banco.
+    if unknown_emails is not None:
+        stats['unknown_emails'] = {'hits': unknown_emails.hits}
+
+    return stats
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from hashlib import blake2b
+from threading import Lock
+
+from vidaplus.main.schemas.auth import TokenData
+from vidaplus.settings import Settings
+
+
+class TokenCache:
+    """Cache em memória, por processo, dos tokens de acesso já decodificados e validados.
+
+    As entradas são indexadas por um resumo do token, para não manter os tokens em memória, e mantidas em LRU limitada
+    por `max_entries`. Uma entrada deixa de valer no `exp` do token: a partir daí o token volta a ser decodificado e
+    é recusado como expirado.
+    """
+
+    __instance: TokenCache | None = None
+    __configured = False
+    __instance_lock = Lock()
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+        self.__entries: OrderedDict[bytes, tuple[TokenData, float]] = OrderedDict()
+        self.__lock = Lock()
+
+    @classmethod
+    def get_instance(cls) -> TokenCache | None:
+        if not cls.__configured:
+            with cls.__instance_lock:
+                if not cls.__configured:
+                    max_entries = Settings().TOKEN_CACHE_MAX_ENTRIES
+
+                    if max_entries > 0:
+                        cls.__instance = cls(max_entries)
+
+                    cls.__configured = True
+
+        return cls.__instance
+
+    @classmethod
+    def reset(cls) -> None:
+        with cls.__instance_lock:
+            cls.__instance = None
+            cls.__configured = False
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def get(self, token: str) -> TokenData | None:
+        key = digest(token)
+
+        with self.__lock:
+            entry = self.__entries.get(key)
+
+            if entry is not None and entry[1] <= time.time():
+                del self.__entries[key]
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self.__entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, token: str, data: TokenData) -> None:
+        expires_at = data.exp.timestamp()
+
+        if expires_at <= time.time():
+            return
+
+        key = digest(token)
+
+        with self.__lock:
+            self.__entries[key] = (data, expires_at)
+            self.__entries.move_to_end(key)
+
+            while len(self.__entries) > self.max_entries:
+                self.__entries.popitem(last=False)
+
+
+def digest(token: str) -> bytes:
+    return blake2b(token.encode(), digest_size=32).digest()
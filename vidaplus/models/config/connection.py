@@ -1,26 +1,166 @@
+import os
+from threading import Lock
 from types import TracebackType
-from typing import Self, Type
+from typing import Any, Self, Type
 
-from sqlalchemy import Engine, create_engine
+from sqlalchemy import URL, Engine, create_engine, event, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from vidaplus.settings import Settings
 
+ASYNC_DRIVERS = {
+    'postgresql': 'postgresql+psycopg',
+    'postgresql+psycopg': 'postgresql+psycopg',
+    'postgresql+psycopg2': 'postgresql+psycopg',
+    'sqlite': 'sqlite+aiosqlite',
+    'sqlite+pysqlite': 'sqlite+aiosqlite',
+}
+
+
+def engine_options(url: URL, settings: Settings) -> dict[str, Any]:
+    options: dict[str, Any] = {'pool_pre_ping': settings.DATABASE_POOL_PRE_PING}
+
+    if url.get_backend_name() != 'sqlite':
+        options.update(
+            pool_size=settings.DATABASE_POOL_SIZE,
+            max_overflow=settings.DATABASE_MAX_OVERFLOW,
+            pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+            pool_recycle=settings.DATABASE_POOL_RECYCLE,
+        )
+
+    if url.get_backend_name() == 'postgresql' and settings.DATABASE_STATEMENT_TIMEOUT:
+        options['connect_args'] = {'options': f'-c statement_timeout={settings.DATABASE_STATEMENT_TIMEOUT}'}
+
+    return options
+
+
+class EngineRegistry:
+    """Mantém uma única Engine (e seu pool de conexões) por processo."""
+
+    __engine: Engine | None = None
+    __lock = Lock()
+    session_factory = sessionmaker()
+
+    @classmethod
+    def get_engine(cls) -> Engine:
+        if cls.__engine is None:
+            with cls.__lock:
+                if cls.__engine is None:
+                    cls.__engine = cls.__create_engine(Settings())
+
+        return cls.__engine
+
+    @classmethod
+    def warm_up(cls, engine: Engine | None = None) -> None:
+        engine = engine or cls.get_engine()
+        connections = [engine.connect() for _ in range(Settings().DATABASE_POOL_WARM_UP)]
+
+        for connection in connections:
+            connection.close()
+
+    @classmethod
+    def dispose(cls) -> None:
+        with cls.__lock:
+            if cls.__engine is not None:
+                cls.__engine.dispose()
+                cls.__engine = None
+
+    @classmethod
+    def _after_fork(cls) -> None:
+        # O processo filho não deve reutilizar as conexões herdadas do pai.
+        if cls.__engine is not None:
+            cls.__engine.dispose(close=False)
+
+    @staticmethod
+    def __create_engine(settings: Settings) -> Engine:
+        url = make_url(settings.DATABASE_URL)
+        return create_engine(url, **engine_options(url, settings))
+
+
+class AsyncEngineRegistry:
+    """Equivalente assíncrono do `EngineRegistry`, usado quando `DATABASE_ASYNC` está habilitado."""
+
+    __engine: AsyncEngine | None = None
+    __lock = Lock()
+    session_factory = async_sessionmaker(expire_on_commit=False)
+
+    @classmethod
+    def get_engine(cls) -> AsyncEngine:
+        if cls.__engine is None:
+            with cls.__lock:
+                if cls.__engine is None:
+                    cls.__engine = cls.__create_engine(Settings())
+
+        return cls.__engine
+
+    @classmethod
+    async def warm_up(cls, engine: AsyncEngine | None = None) -> None:
+        engine = engine or cls.get_engine()
+        connections = [await engine.connect() for _ in range(Settings().DATABASE_POOL_WARM_UP)]
+
+        for connection in connections:
+            await connection.close()
+
+    @classmethod
+    async def dispose(cls) -> None:
+        engine, cls.__engine = cls.__engine, None
+
+        if engine is not None:
+            await engine.dispose()
+
+    @classmethod
+    def _after_fork(cls) -> None:
+        if cls.__engine is not None:
+            cls.__engine.sync_engine.dispose(close=False)
+
+    @staticmethod
+    def __create_engine(settings: Settings) -> AsyncEngine:
+        url = make_url(settings.DATABASE_ASYNC_URL or settings.DATABASE_URL)
+        url = url.set(drivername=ASYNC_DRIVERS.get(url.drivername, url.drivername))
+        return create_async_engine(url, **engine_options(url, settings))
+
+
+os.register_at_fork(after_in_child=EngineRegistry._after_fork)
+os.register_at_fork(after_in_child=AsyncEngineRegistry._after_fork)
+
+
+@event.listens_for(Engine, 'connect')
+def enable_sqlite_foreign_keys(dbapi_connection: Any, connection_record: Any) -> None:
+    # O SQLite (`sqlite3` ou o adaptador do `aiosqlite`) só aplica as chaves estrangeiras, e o `ON DELETE CASCADE`
+    # das exclusões, com este PRAGMA ligado.
+    if 'sqlite' in type(dbapi_connection).__module__:
+        cursor = dbapi_connection.cursor()
+        cursor.execute('PRAGMA foreign_keys = ON')
+        cursor.close()
+
 
 class DatabaseConnectionHandler:
     def __init__(self) -> None:
-        self.__connection_string = Settings().DATABASE_URL
         self.__engine = self.__create_engine()
 
     def __create_engine(self) -> Engine:
-        return create_engine(self.__connection_string)
+        return EngineRegistry.get_engine()
 
     def __enter__(self) -> Self:
-        sessionmake = sessionmaker(bind=self.__engine)
-        self.session = sessionmake()
+        self.session = EngineRegistry.session_factory(bind=self.__engine)
         return self
 
     def __exit__(
         self, exc_type: Type[BaseException] | None, exc_val: BaseException | None, exc_tb: TracebackType | None
     ) -> None:
         self.session.close()
+
+
+class AsyncDatabaseConnectionHandler:
+    def __init__(self) -> None:
+        self.__engine = AsyncEngineRegistry.get_engine()
+
+    async def __aenter__(self) -> Self:
+        self.session = AsyncEngineRegistry.session_factory(bind=self.__engine)
+        return self
+
+    async def __aexit__(
+        self, exc_type: Type[BaseException] | None, exc_val: BaseException | None, exc_tb: TracebackType | None
+    ) -> None:
+        await self.session.close()
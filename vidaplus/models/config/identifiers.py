@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import os
+import time
+from threading import Lock
+from uuid import UUID
+
+MAX_COUNTER = 0xFFF
+
+
+class UUID7Generator:
+    """Gera UUIDs versão 7 (RFC 9562): 48 bits com o timestamp Unix em milissegundos, seguidos de bits aleatórios.
+
+    Como o prefixo é o instante da criação, ids novos entram no fim dos índices B-tree, em vez de em páginas
+    aleatórias como os da versão 4. Os 12 bits `rand_a` são um contador (método 1 da seção 6.2 da RFC), que começa em
+    um valor aleatório a cada milissegundo; assim os ids de um processo são estritamente crescentes, mesmo com vários
+    por milissegundo ou com o relógio voltando.
+    """
+
+    __slots__ = ('__counter', '__last_ms', '__lock')
+
+    def __init__(self) -> None:
+        self.__last_ms = 0
+        self.__counter = 0
+        self.__lock = Lock()
+
+    def __call__(self) -> UUID:
+        now_ms = time.time_ns() // 1_000_000
+
+        with self.__lock:
+            if now_ms > self.__last_ms:
+                # Metade de baixo do contador, para sobrar espaço para os ids seguintes do mesmo milissegundo.
+                self.__last_ms, self.__counter = now_ms, int.from_bytes(os.urandom(2)) & (MAX_COUNTER >> 1)
+            elif self.__counter < MAX_COUNTER:
+                self.__counter += 1
+            else:
+                self.__last_ms, self.__counter = self.__last_ms + 1, 0
+
+            timestamp, counter = self.__last_ms, self.__counter
+
+        rand_b = int.from_bytes(os.urandom(8)) & ((1 << 62) - 1)
+        return UUID(int=timestamp << 80 | 0x7 << 76 | counter << 64 | 0b10 << 62 | rand_b)
+
+
+uuid7 = UUID7Generator()
@@ -0,0 +1,15 @@
+from datetime import datetime
+from functools import cache
+from zoneinfo import ZoneInfo
+
+from vidaplus.settings import Settings
+
+
+@cache
+def local_timezone() -> ZoneInfo:
+    return ZoneInfo(Settings().TIMEZONE)
+
+
+def as_aware(value: datetime) -> datetime:
+    # O banco devolve `timestamptz` com fuso, enquanto as requisições podem trazer horários ingênuos.
+    return value if value.tzinfo else value.replace(tzinfo=local_timezone())
@@ -0,0 +1,46 @@
+from types import TracebackType
+from typing import AsyncGenerator, Generator, Type
+
+from vidaplus.models.config.connection import AsyncDatabaseConnectionHandler, DatabaseConnectionHandler
+
+
+class UnitOfWork(DatabaseConnectionHandler):
+    """Sessão e transação compartilhadas por todos os repositórios de uma requisição.
+
+    Os repositórios apenas fazem `flush`; o commit (ou rollback, em caso de erro) acontece uma única vez ao sair do
+    contexto.
+    """
+
+    def __exit__(
+        self, exc_type: Type[BaseException] | None, exc_val: BaseException | None, exc_tb: TracebackType | None
+    ) -> None:
+        try:
+            if exc_type is None:
+                self.session.commit()
+            else:
+                self.session.rollback()
+        finally:
+            super().__exit__(exc_type, exc_val, exc_tb)
+
+
+class AsyncUnitOfWork(AsyncDatabaseConnectionHandler):
+    async def __aexit__(
+        self, exc_type: Type[BaseException] | None, exc_val: BaseException | None, exc_tb: TracebackType | None
+    ) -> None:
+        try:
+            if exc_type is None:
+                await self.session.commit()
+            else:
+                await self.session.rollback()
+        finally:
+            await super().__aexit__(exc_type, exc_val, exc_tb)
+
+
+def get_unit_of_work() -> Generator[UnitOfWork, None, None]:
+    with UnitOfWork() as uow:
+        yield uow
+
+
+async def get_async_unit_of_work() -> AsyncGenerator[AsyncUnitOfWork, None]:
+    async with AsyncUnitOfWork() as uow:
+        yield uow
@@ -1,8 +1,10 @@
 from vidaplus.models.entities.admission import Admission
 from vidaplus.models.entities.appointment import Appointment
+from vidaplus.models.entities.appointment_series import AppointmentSeries
 from vidaplus.models.entities.bed import Bed
+from vidaplus.models.entities.revoked_token import RevokedToken
 from vidaplus.models.entities.supply import Supply
 from vidaplus.models.entities.unit import Unit
 from vidaplus.models.entities.user import User
 
-__all__ = ['Admission', 'Appointment', 'Bed', 'Supply', 'Unit', 'User']
+__all__ = ['Admission', 'Appointment', 'AppointmentSeries', 'Bed', 'RevokedToken', 'Supply', 'Unit', 'User']
@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import UUID, DateTime, ForeignKey, Integer, func
+from sqlalchemy import UUID, DateTime, ForeignKey, Index, Integer, func, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from vidaplus.models.config.base import Base
@@ -15,15 +15,24 @@ if TYPE_CHECKING:
 
 class Admission(Base):
     __tablename__ = 'admission'
+    __table_args__ = (
+        # Internação em andamento de cada leito.
+        Index(
+            'ix_admission_active_bed_id',
+            'bed_id',
+            postgresql_where=text('discharged_at IS NULL'),
+            sqlite_where=text('discharged_at IS NULL'),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     admitted_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
     discharged_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=True)
 
-    bed_id: Mapped[int] = mapped_column(Integer, ForeignKey('bed.id', ondelete='CASCADE'), nullable=False)
-    bed: Mapped['Bed'] = relationship('Bed', back_populates='admissions', lazy='joined')
+    bed_id: Mapped[int] = mapped_column(Integer, ForeignKey('bed.id', ondelete='CASCADE'), nullable=False, index=True)
+    bed: Mapped['Bed'] = relationship('Bed', back_populates='admissions', lazy='noload')
 
     patient_id: Mapped[UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey('user.id', ondelete='CASCADE'), nullable=False
+        UUID(as_uuid=True), ForeignKey('user.id', ondelete='CASCADE'), nullable=False, index=True
     )
-    patient: Mapped['User'] = relationship('User', back_populates='patient_admissions', lazy='joined')
+    patient: Mapped['User'] = relationship('User', back_populates='patient_admissions', lazy='noload')
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-from datetime import datetime
-from typing import TYPE_CHECKING
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, Optional
 from uuid import UUID
 
-from sqlalchemy import DateTime, Enum, ForeignKey, Integer, String, Text, func
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import ColumnElement, DateTime, Enum, ForeignKey, Index, Integer, String, Text, and_, event, func, text
+from sqlalchemy.dialects.postgresql import ExcludeConstraint
+from sqlalchemy.engine.default import DefaultExecutionContext
+from sqlalchemy.orm import Mapped, Mapper, mapped_column, relationship
 
 from vidaplus.main.enums.appointment_status import AppointmentStatus
 from vidaplus.main.enums.appointment_types import AppointmentTypes
@@ -15,25 +17,81 @@ if TYPE_CHECKING:
     from vidaplus.models.entities.user import User
 
 
+def appointment_end(date_time: datetime, estimated_duration: int) -> datetime:
+    return date_time + timedelta(minutes=estimated_duration)
+
+
+def default_ends_at(context: DefaultExecutionContext) -> datetime:
+    parameters = context.get_current_parameters()
+    return appointment_end(parameters['date_time'], parameters['estimated_duration'])
+
+
 class Appointment(Base):
     __tablename__ = 'appointment'
+    __table_args__ = (
+        # `timestamptz + interval` não é IMMUTABLE, por isso o fim do intervalo fica materializado em `ends_at`.
+        ExcludeConstraint(
+            ('professional_id', '='),
+            (text("tstzrange(date_time, ends_at, '[)')"), '&&'),
+            name='appointment_professional_time_excl',
+            using='gist',
+            where="status <> 'CANCELED'",
+        ).ddl_if(dialect='postgresql'),
+        # Chaves da paginação por cursor, com e sem os filtros de paciente e profissional.
+        Index('ix_appointment_date_time_id', 'date_time', 'id'),
+        Index('ix_appointment_patient_id_date_time_id', 'patient_id', 'date_time', 'id'),
+        Index('ix_appointment_professional_id_date_time_id', 'professional_id', 'date_time', 'id'),
+        Index('ix_appointment_status_date_time_id', 'status', 'date_time', 'id'),
+        Index('ix_appointment_type_date_time_id', 'type', 'date_time', 'id'),
+        # Agendas ocupadas (checagem de conflito fora do PostgreSQL e busca de horários livres).
+        Index(
+            'ix_appointment_active_professional_id_date_time',
+            'professional_id',
+            'date_time',
+            'ends_at',
+            postgresql_where=text("status <> 'CANCELED'"),
+            sqlite_where=text("status <> 'CANCELED'"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     date_time: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     type: Mapped[str] = mapped_column(Enum(AppointmentTypes), nullable=False)
     status: Mapped[str] = mapped_column(Enum(AppointmentStatus), nullable=False)
     estimated_duration: Mapped[int] = mapped_column(Integer, nullable=False)
+    ends_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=default_ends_at)
     location: Mapped[str] = mapped_column(String, nullable=False)
     notes: Mapped[str] = mapped_column(Text, nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now()
     )
+    # Incrementada a cada escrita; é a ETag do agendamento.
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=1, server_default='1')
 
-    patient_id: Mapped[UUID] = mapped_column(ForeignKey('user.id'))
-    professional_id: Mapped[UUID] = mapped_column(ForeignKey('user.id'))
+    patient_id: Mapped[UUID] = mapped_column(ForeignKey('user.id', ondelete='CASCADE'))
+    professional_id: Mapped[UUID] = mapped_column(ForeignKey('user.id', ondelete='CASCADE'))
+    series_id: Mapped[Optional[int]] = mapped_column(ForeignKey('appointment_series.id'), nullable=True, index=True)
 
     patient: Mapped['User'] = relationship('User', foreign_keys=[patient_id], back_populates='patient_appointments')
     professional: Mapped['User'] = relationship(
         'User', foreign_keys=[professional_id], back_populates='professional_appointments'
     )
+
+    @classmethod
+    def overlaps(cls, start: datetime, end: datetime, dialect: str) -> ColumnElement[bool]:
+        """Intervalos semiabertos `[date_time, ends_at)` que se sobrepõem a `[start, end)`.
+
+        No PostgreSQL a comparação usa `tstzrange && tstzrange`, a mesma expressão do índice GiST da restrição de
+        exclusão, para que o planner possa usá-lo.
+        """
+        if dialect == 'postgresql':
+            period = func.tstzrange(cls.date_time, cls.ends_at, '[)')
+            return period.op('&&')(func.tstzrange(start, end, '[)'))
+
+        return and_(cls.date_time < end, cls.ends_at > start)
+
+
+@event.listens_for(Appointment, 'before_update')
+def update_ends_at(mapper: Mapper[Any], connection: Any, target: Appointment) -> None:
+    target.ends_at = appointment_end(target.date_time, target.estimated_duration)
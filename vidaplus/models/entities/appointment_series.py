@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Iterator, Optional
+from uuid import UUID
+
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, Integer, String, Text, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from vidaplus.main.enums.appointment_status import AppointmentStatus
+from vidaplus.main.enums.appointment_types import AppointmentTypes
+from vidaplus.main.enums.recurrence_frequencies import RecurrenceFrequencies
+from vidaplus.models.config.base import Base
+from vidaplus.models.config.timezone import as_aware, local_timezone
+
+
+def recurrence(  # noqa: PLR0913
+    starts_at: datetime,
+    frequency: RecurrenceFrequencies,
+    interval: int = 1,
+    count: Optional[int] = None,
+    until: Optional[datetime] = None,
+    limit: Optional[int] = None,
+) -> Iterator[datetime]:
+    """Inícios das ocorrências de uma regra no estilo RRULE (`FREQ`, `INTERVAL`, `COUNT` e `UNTIL`).
+
+    A aritmética é feita no fuso de `starts_at`, então o horário de parede se mantém entre mudanças de horário de
+    verão. Na recorrência mensal, meses sem o dia de `starts_at` (31 de abril, por exemplo) são pulados, como na RFC
+    5545. `limit` interrompe regras que produziriam ocorrências demais.
+    """
+    produced, step = 0, 0
+
+    while (count is None or produced < count) and (limit is None or produced < limit):
+        occurrence = shift(starts_at, frequency, step * interval)
+        step += 1
+
+        if occurrence is None:
+            continue
+
+        if until is not None and occurrence > until:
+            return
+
+        produced += 1
+        yield occurrence
+
+
+def shift(starts_at: datetime, frequency: RecurrenceFrequencies, steps: int) -> datetime | None:
+    if frequency == RecurrenceFrequencies.DAILY:
+        return starts_at + timedelta(days=steps)
+
+    if frequency == RecurrenceFrequencies.WEEKLY:
+        return starts_at + timedelta(weeks=steps)
+
+    years, month = divmod(starts_at.month - 1 + steps, 12)
+
+    try:
+        return starts_at.replace(year=starts_at.year + years, month=month + 1)
+    except ValueError:
+        return None
+
+
+class AppointmentSeries(Base):
+    """Regra de recorrência de agendamentos.
+
+    Só as ocorrências que começam antes de `materialized_until` existem como linhas de `appointment` (com `series_id`);
+    as seguintes são expandidas a partir da regra quando consultadas. `ends_at` é o fim da última ocorrência.
+    """
+
+    __tablename__ = 'appointment_series'
+    __table_args__ = (
+        Index('ix_appointment_series_professional_id_status', 'professional_id', 'status'),
+        Index('ix_appointment_series_patient_id_status', 'patient_id', 'status'),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    type: Mapped[str] = mapped_column(Enum(AppointmentTypes), nullable=False)
+    status: Mapped[str] = mapped_column(Enum(AppointmentStatus), nullable=False)
+    estimated_duration: Mapped[int] = mapped_column(Integer, nullable=False)
+    location: Mapped[str] = mapped_column(String, nullable=False)
+    notes: Mapped[str] = mapped_column(Text, nullable=False)
+    starts_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    frequency: Mapped[str] = mapped_column(Enum(RecurrenceFrequencies), nullable=False)
+    interval: Mapped[int] = mapped_column(Integer, nullable=False)
+    count: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    until: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    ends_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    materialized_until: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+    patient_id: Mapped[UUID] = mapped_column(ForeignKey('user.id', ondelete='CASCADE'))
+    professional_id: Mapped[UUID] = mapped_column(ForeignKey('user.id', ondelete='CASCADE'))
+
+    def occurrences(self) -> Iterator[datetime]:
+        return recurrence(
+            as_aware(self.starts_at).astimezone(local_timezone()),
+            RecurrenceFrequencies(self.frequency),
+            self.interval,
+            self.count,
+            as_aware(self.until) if self.until else None,
+        )
+
+    def pending_occurrences(self) -> Iterator[datetime]:
+        """Ocorrências ainda não materializadas."""
+        materialized_until = as_aware(self.materialized_until)
+        return (start for start in self.occurrences() if start >= materialized_until)
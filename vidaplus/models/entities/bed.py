@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Enum, ForeignKey, Integer
+from sqlalchemy import Enum, ForeignKey, Index, Integer, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from vidaplus.main.enums.bed_status import BedStatus
@@ -16,21 +16,34 @@ if TYPE_CHECKING:
 
 class Bed(Base):
     __tablename__ = 'bed'
+    __table_args__ = (
+        # Busca de leitos livres de uma unidade.
+        Index(
+            'ix_bed_available_unit_id_id',
+            'unit_id',
+            'id',
+            postgresql_where=text("status = 'AVAILABLE'"),
+            sqlite_where=text("status = 'AVAILABLE'"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     type: Mapped[str] = mapped_column(Enum(BedTypes), nullable=False)
     status: Mapped[str] = mapped_column(Enum(BedStatus), nullable=False)
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=1, server_default='1')
 
-    unit_id: Mapped[int] = mapped_column(Integer, ForeignKey('unit.id', ondelete='CASCADE'), nullable=False)
+    unit_id: Mapped[int] = mapped_column(Integer, ForeignKey('unit.id', ondelete='CASCADE'), nullable=False, index=True)
     unit: Mapped['Unit'] = relationship(
         'Unit',
         back_populates='beds',
         lazy='joined',
     )
 
+    # Nenhuma resposta serializa as internações do leito; `noload` evita carregar o histórico inteiro.
     admissions: Mapped[list['Admission']] = relationship(
         'Admission',
         back_populates='bed',
         cascade='all, delete-orphan',
-        lazy='selectin',
+        passive_deletes=True,
+        lazy='noload',
     )
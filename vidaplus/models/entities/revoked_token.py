@@ -0,0 +1,15 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from vidaplus.models.config.base import Base
+
+
+class RevokedToken(Base):
+    __tablename__ = 'revoked_token'
+
+    # O id crescente serve de cursor para os processos buscarem só as revogações que ainda não viram.
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    jti: Mapped[str] = mapped_column(String(32), nullable=False, unique=True)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, index=True)
@@ -16,6 +16,7 @@ class Supply(Base):
     name: Mapped[str] = mapped_column(String, nullable=False)
     quantity: Mapped[int] = mapped_column(Integer, nullable=False)
     min_level: Mapped[int] = mapped_column(Integer, nullable=False)
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=1, server_default='1')
 
-    unit_id: Mapped[int] = mapped_column(Integer, ForeignKey('unit.id'), nullable=False)
+    unit_id: Mapped[int] = mapped_column(Integer, ForeignKey('unit.id', ondelete='CASCADE'), nullable=False, index=True)
     unit: Mapped['Unit'] = relationship('Unit', back_populates='supplies')
@@ -19,15 +19,18 @@ class Unit(Base):
     name: Mapped[str] = mapped_column(String, nullable=False)
     address: Mapped[str] = mapped_column(String, nullable=False)
 
+    # Nenhuma resposta serializa os leitos e insumos da unidade; `noload` evita carregá-los a cada leitura.
     beds: Mapped[list['Bed']] = relationship(
         'Bed',
         back_populates='unit',
         cascade='all, delete-orphan',
-        lazy='selectin',
+        passive_deletes=True,
+        lazy='noload',
     )
     supplies: Mapped[list['Supply']] = relationship(
         'Supply',
         back_populates='unit',
         cascade='all, delete-orphan',
-        lazy='selectin',
+        passive_deletes=True,
+        lazy='noload',
     )
@@ -2,13 +2,13 @@ from __future__ import annotations
 
 from datetime import datetime
 from typing import TYPE_CHECKING
-from uuid import uuid4
 
-from sqlalchemy import UUID, DateTime, Enum, String, func
+from sqlalchemy import UUID, DateTime, Enum, Index, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from vidaplus.main.enums.roles import Roles
 from vidaplus.models.config.base import Base
+from vidaplus.models.config.identifiers import uuid7
 
 if TYPE_CHECKING:
     from vidaplus.models.entities.admission import Admission
@@ -17,19 +17,28 @@ if TYPE_CHECKING:
 
 class User(Base):
     __tablename__ = 'user'
+    __table_args__ = (Index('ix_user_role_id', 'role', 'id'),)
 
-    id: Mapped[UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    id: Mapped[UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
-    email: Mapped[str] = mapped_column(String(255), nullable=False, unique=True)
+    email: Mapped[str] = mapped_column(String(255), nullable=False)
     password: Mapped[str] = mapped_column(String(255), nullable=False)
     role: Mapped[Roles] = mapped_column(Enum(Roles), nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
 
     patient_appointments: Mapped[list['Appointment']] = relationship(
-        'Appointment', back_populates='patient', foreign_keys='[Appointment.patient_id]', cascade='all, delete-orphan'
+        'Appointment',
+        back_populates='patient',
+        foreign_keys='[Appointment.patient_id]',
+        cascade='all, delete-orphan',
+        passive_deletes=True,
     )
     patient_admissions: Mapped['Admission'] = relationship(
-        'Admission', back_populates='patient', foreign_keys='[Admission.patient_id]', cascade='all, delete-orphan'
+        'Admission',
+        back_populates='patient',
+        foreign_keys='[Admission.patient_id]',
+        cascade='all, delete-orphan',
+        passive_deletes=True,
     )
 
     professional_appointments: Mapped[list['Appointment']] = relationship(
@@ -37,4 +46,10 @@ class User(Base):
         back_populates='professional',
         foreign_keys='[Appointment.professional_id]',
         cascade='all, delete-orphan',
+        passive_deletes=True,
     )
+
+
+# Emails são únicos sem diferenciar maiúsculas. O cadastro usa este índice como alvo do `ON CONFLICT`, e o login, na
+# busca por email.
+Index('ix_user_lower_email', func.lower(User.email), unique=True)
@@ -1,64 +1,54 @@
-from sqlalchemy import select
+from typing import Iterator, Optional
+
+from pydantic import TypeAdapter
+from sqlalchemy import delete, select, update
 
 from vidaplus.main.schemas.admission import AdmissionSchema, CreateAdmissionSchema, UpdateAdmissionSchema
-from vidaplus.models.config.connection import DatabaseConnectionHandler
+from vidaplus.main.schemas.page import PageSchema
+from vidaplus.models.config.unit_of_work import UnitOfWork
 from vidaplus.models.entities.admission import Admission
 from vidaplus.models.repositories.interfaces.admission_repository_interface import AdmissionRepositoryInterface
+from vidaplus.models.repositories.pagination import Keyset, page_limit
+
+ADMISSION_KEYSET = Keyset(Admission.id)
+ADMISSION_LIST = TypeAdapter(list[AdmissionSchema])
 
 
 class AdmissionRepository(AdmissionRepositoryInterface):
+    def __init__(self, uow: UnitOfWork) -> None:
+        self.uow = uow
+
     def create(self, data: CreateAdmissionSchema) -> AdmissionSchema:
-        with DatabaseConnectionHandler() as db:
-            try:
-                admission = Admission(**data.model_dump())
-                db.session.add(admission)
-                db.session.commit()
-                db.session.refresh(admission)
-                return AdmissionSchema.model_validate(admission)
-            except Exception as e:
-                db.session.rollback()
-                raise e
+        admission = Admission(**data.model_dump())
+        self.uow.session.add(admission)
+        self.uow.session.flush()
+        self.uow.session.refresh(admission)
+        return AdmissionSchema.model_validate(admission)
+
+    def all(self, cursor: Optional[str] = None, limit: Optional[int] = None) -> PageSchema[AdmissionSchema]:
+        limit = page_limit(limit)
+        admissions = self.uow.session.scalars(ADMISSION_KEYSET.apply(select(Admission), cursor, limit))
+        return ADMISSION_KEYSET.page(ADMISSION_LIST.validate_python(admissions.all(), from_attributes=True), limit)
 
-    def all(self) -> list[AdmissionSchema]:
-        with DatabaseConnectionHandler() as db:
-            try:
-                admissions = db.session.query(Admission).all()
-                return [AdmissionSchema.model_validate(admission) for admission in admissions]
-            except Exception as e:
-                db.session.rollback()
-                raise e
+    def stream(self, cursor: Optional[str] = None) -> Iterator[AdmissionSchema]:
+        for admission in self.uow.session.scalars(ADMISSION_KEYSET.stream(select(Admission), cursor)):
+            yield AdmissionSchema.model_validate(admission)
 
     def get_by_id(self, admission_id: int) -> AdmissionSchema | None:
-        with DatabaseConnectionHandler() as db:
-            try:
-                admission = db.session.scalar(select(Admission).where(Admission.id == admission_id))
-                return AdmissionSchema.model_validate(admission) if admission else None
-            except Exception as e:
-                db.session.rollback()
-                raise e
+        admission = self.uow.session.scalar(select(Admission).where(Admission.id == admission_id))
+        return AdmissionSchema.model_validate(admission) if admission else None
 
-    def update(self, admission_id: int, data: UpdateAdmissionSchema) -> AdmissionSchema:
-        with DatabaseConnectionHandler() as db:
-            try:
-                admission = db.session.scalar(select(Admission).where(Admission.id == admission_id))
+    def update(self, admission_id: int, data: UpdateAdmissionSchema) -> AdmissionSchema | None:
+        values = data.model_dump(exclude_none=True)
 
-                for key, value in data.model_dump().items():
-                    if value is not None:
-                        setattr(admission, key, value)
+        if not values:
+            return self.get_by_id(admission_id)
 
-                db.session.commit()
-                db.session.refresh(admission)
-                return AdmissionSchema.model_validate(admission)
-            except Exception as e:
-                db.session.rollback()
-                raise e
+        admission = self.uow.session.scalar(
+            update(Admission).where(Admission.id == admission_id).values(**values).returning(Admission)
+        )
+        return AdmissionSchema.model_validate(admission) if admission else None
 
-    def delete(self, admission_id: int) -> None:
-        with DatabaseConnectionHandler() as db:
-            try:
-                admission = db.session.scalar(select(Admission).where(Admission.id == admission_id))
-                db.session.delete(admission)
-                db.session.commit()
-            except Exception as e:
-                db.session.rollback()
-                raise e
+    def delete(self, admission_id: int) -> bool:
+        deleted = self.uow.session.scalar(delete(Admission).where(Admission.id == admission_id).returning(Admission.id))
+        return deleted is not None
@@ -1,29 +1,314 @@
-from datetime import datetime
-from typing import Optional
+import heapq
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from itertools import islice, takewhile
+from typing import Any, Iterable, Iterator, Optional, Sequence
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Insert, Select, and_, exists, insert, or_, select, update
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import IntegrityError
 
 from vidaplus.main.enums.appointment_status import AppointmentStatus
-from vidaplus.main.exceptions import AppointmentNotFountError
-from vidaplus.main.schemas.appointment import AppointmentSchema, CreateAppointmentSchema
-from vidaplus.models.config.connection import DatabaseConnectionHandler
-from vidaplus.models.entities.appointment import Appointment
+from vidaplus.main.enums.roles import Roles
+from vidaplus.main.exceptions import SchedulingTimeConflictError
+from vidaplus.main.schemas.appointment import AppointmentOccurrenceSchema, AppointmentSchema, CreateAppointmentSchema
+from vidaplus.main.schemas.page import PageSchema
+from vidaplus.models.cache.appointment_interval_index import (
+    AppointmentIntervalIndex,
+    ProfessionalAgenda,
+    has_pending,
+    has_pending_series,
+    stage,
+)
+from vidaplus.models.config.timezone import as_aware
+from vidaplus.models.config.unit_of_work import UnitOfWork
+from vidaplus.models.entities.appointment import Appointment, appointment_end
+from vidaplus.models.entities.appointment_series import AppointmentSeries
+from vidaplus.models.entities.user import User
 from vidaplus.models.repositories.interfaces.appointment_repository_interface import AppointmentRepositoryInterface
+from vidaplus.models.repositories.pagination import Keyset, R, page_limit
+from vidaplus.models.repositories.projection import Projection
+from vidaplus.settings import Settings
+
+EXCLUSION_VIOLATION = '23P01'
+APPOINTMENT_KEYSET = Keyset(Appointment.date_time, Appointment.id)
+APPOINTMENT_PROJECTION = Projection(AppointmentSchema, Appointment)
+Interval = tuple[datetime, datetime]
+
+
+@contextmanager
+def exclusion_violation_as_conflict() -> Iterator[None]:
+    # A restrição de exclusão pega conflitos que passaram pela checagem prévia em transações concorrentes.
+    try:
+        yield
+    except IntegrityError as e:
+        if getattr(e.orig, 'sqlstate', None) == EXCLUSION_VIOLATION:
+            raise SchedulingTimeConflictError() from e
+        raise
+
+
+def materialization_horizon() -> datetime:
+    return as_aware(datetime.now()) + timedelta(days=Settings().APPOINTMENT_SERIES_WINDOW_DAYS)
+
+
+def pending_series(
+    patient_id: Optional[UUID] = None,
+    professional_id: Optional[UUID] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    type: Optional[str] = None,
+) -> Select[tuple[AppointmentSeries]]:
+    """Séries ativas com ocorrências ainda não materializadas que podem cair entre `start` e `end`."""
+    query = select(AppointmentSeries).where(
+        AppointmentSeries.status == AppointmentStatus.SCHEDULED,
+        AppointmentSeries.materialized_until < AppointmentSeries.ends_at,
+    )
+
+    if patient_id:
+        query = query.where(AppointmentSeries.patient_id == patient_id)
+
+    if professional_id:
+        query = query.where(AppointmentSeries.professional_id == professional_id)
+
+    if start:
+        query = query.where(AppointmentSeries.ends_at > start)
+
+    if end:
+        query = query.where(AppointmentSeries.starts_at < end)
+
+    if type:
+        query = query.where(AppointmentSeries.type == type)
+
+    return query
+
+
+def insert_occurrences(dialect: str) -> Insert:
+    # No PostgreSQL, uma ocorrência que perdeu a corrida para um agendamento avulso concorrente fica de fora (a
+    # restrição de exclusão serve de árbitro do ON CONFLICT) em vez de impedir a materialização do resto da série;
+    # `skipped_occurrences` acha essas linhas, que são gravadas como canceladas.
+    if dialect == 'postgresql':
+        return postgresql.insert(Appointment).on_conflict_do_nothing()
+
+    return insert(Appointment)
+
+
+def skipped_occurrences(rows: list[dict[str, Any]], inserted: Iterable[Appointment]) -> list[dict[str, Any]]:
+    """Linhas pedidas que não voltaram no RETURNING, já com o status `CANCELED`."""
+    keys = {(appointment.series_id, as_aware(appointment.date_time)) for appointment in inserted}
+    return [
+        {**row, 'status': AppointmentStatus.CANCELED}
+        for row in rows
+        if (row['series_id'], as_aware(row['date_time'])) not in keys
+    ]
+
+
+def materialize(series: AppointmentSeries, horizon: datetime) -> list[dict[str, Any]]:
+    """Linhas das ocorrências pendentes que começam antes de `horizon`.
+
+    `materialized_until` avança até o início da próxima ocorrência (ou até o fim da série), para que a série só volte a
+    ser tocada quando uma nova ocorrência entrar na janela.
+    """
+    rows = []
+
+    for start in series.pending_occurrences():
+        if start >= horizon:
+            series.materialized_until = start
+            break
+
+        rows.append(
+            {
+                'patient_id': series.patient_id,
+                'professional_id': series.professional_id,
+                'series_id': series.id,
+                'date_time': start,
+                'ends_at': appointment_end(start, series.estimated_duration),
+                'type': series.type,
+                'status': AppointmentStatus.SCHEDULED,
+                'estimated_duration': series.estimated_duration,
+                'location': series.location,
+                'notes': series.notes,
+            }
+        )
+    else:
+        series.materialized_until = series.ends_at
+
+    return rows
+
+
+def series_occurrences(
+    series: AppointmentSeries,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    after: Optional[tuple[datetime, int]] = None,
+) -> Iterator[AppointmentOccurrenceSchema]:
+    """Ocorrências não materializadas da série com início em `(start, end)` e chave depois de `after`, em ordem.
+
+    São geradas à medida que são consumidas: antes do cursor só os horários são calculados, e nada depois do que o
+    consumidor pedir.
+    """
+    for date_time in series.pending_occurrences():
+        if end is not None and date_time >= end:
+            return
+
+        if (start is not None and date_time <= start) or (after is not None and (date_time, -series.id) <= after):
+            continue
+
+        yield AppointmentOccurrenceSchema(
+            series_id=series.id,
+            patient_id=series.patient_id,
+            professional_id=series.professional_id,
+            date_time=date_time,
+            type=series.type,
+            status=series.status,
+            estimated_duration=series.estimated_duration,
+            location=series.location,
+            notes=series.notes,
+        )
+
+
+def expand_series(
+    series: Iterable[AppointmentSeries], start: Optional[datetime] = None, end: Optional[datetime] = None
+) -> list[AppointmentOccurrenceSchema]:
+    """Ocorrências não materializadas com início em `(start, end)`, a mesma semântica do filtro de `get`."""
+    start, end = as_aware(start) if start else None, as_aware(end) if end else None
+    return [occurrence for item in series for occurrence in series_occurrences(item, start, end)]
+
+
+def series_intervals(
+    series: Iterable[AppointmentSeries], start: datetime, end: datetime
+) -> Iterator[tuple[UUID, Interval]]:
+    """Intervalos das ocorrências não materializadas que se sobrepõem a `[start, end)`."""
+    start, end = as_aware(start), as_aware(end)
+
+    for item in series:
+        for date_time in takewhile(lambda date_time: date_time < end, item.pending_occurrences()):
+            ends_at = appointment_end(date_time, item.estimated_duration)
+
+            if ends_at > start:
+                yield item.professional_id, (date_time, ends_at)
+
+
+def add_series_intervals(busy: dict[UUID, list[Interval]], intervals: Iterable[tuple[UUID, Interval]]) -> None:
+    changed = set()
+
+    for professional_id, interval in intervals:
+        busy[professional_id].append(interval)
+        changed.add(professional_id)
+
+    for professional_id in changed:
+        busy[professional_id].sort(key=lambda interval: as_aware(interval[0]))
+
+
+def scheduling_users(
+    professional_ids: Optional[list[UUID]], patient_ids: list[UUID]
+) -> tuple[Select[tuple[UUID]], Select[tuple[UUID, Roles]]]:
+    """Consulta dos profissionais de saúde pedidos e consulta única deles com os pacientes de `patient_ids`."""
+    is_professional = User.role == Roles.HEALTHCARE_PROFESSIONAL
+
+    if professional_ids is not None:
+        is_professional = and_(is_professional, User.id.in_(professional_ids))
+
+    is_patient = and_(User.role == Roles.PATIENT, User.id.in_(patient_ids))
+    return select(User.id).where(is_professional), select(User.id, User.role).where(or_(is_professional, is_patient))
+
+
+def filter_appointments(  # noqa: PLR0913
+    query: Select[R],
+    patient_id: Optional[UUID] = None,
+    professional_id: Optional[UUID] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    type: Optional[str] = None,
+    status: Optional[str] = None,
+) -> Select[R]:
+    if patient_id:
+        query = query.filter(Appointment.patient_id == patient_id)
+
+    if professional_id:
+        query = query.filter(Appointment.professional_id == professional_id)
+
+    if start_date:
+        query = query.filter(Appointment.date_time > start_date)
+
+    if end_date:
+        query = query.filter(Appointment.date_time < end_date)
+
+    if type:
+        query = query.filter(Appointment.type == type)
+
+    if status:
+        query = query.filter(Appointment.status == status)
+
+    return query
+
+
+def appointment_key(appointment: AppointmentSchema | AppointmentOccurrenceSchema) -> tuple[datetime, int]:
+    # Ocorrências virtuais não têm `id`; `-series_id` as põe antes das linhas do mesmo horário, mantendo a ordem total.
+    if appointment.id is not None:
+        return as_aware(appointment.date_time), appointment.id
+
+    return as_aware(appointment.date_time), -(appointment.series_id or 0)
+
+
+def occurrences_after(
+    series: Iterable[AppointmentSeries],
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    cursor: Optional[str] = None,
+) -> Iterator[AppointmentOccurrenceSchema]:
+    """Ocorrências virtuais posteriores ao cursor, na ordem da chave de paginação.
+
+    Cada série é expandida sob demanda e `heapq.merge` intercala as séries, então uma página com `limit` itens só
+    gera da ordem de `limit` ocorrências, por mais longas ou numerosas que sejam as séries.
+    """
+    start, end = as_aware(start) if start else None, as_aware(end) if end else None
+    after = None
+
+    if cursor:
+        date_time, key = APPOINTMENT_KEYSET.decode(cursor)
+        after = (as_aware(date_time), key)
+
+    yield from heapq.merge(*(series_occurrences(item, start, end, after) for item in series), key=appointment_key)
+
+
+def appointments_page(
+    appointments: list[AppointmentSchema], occurrences: Iterable[AppointmentOccurrenceSchema], limit: int
+) -> PageSchema[AppointmentSchema | AppointmentOccurrenceSchema]:
+    """Intercala a página lida do banco com as ocorrências virtuais, na ordem da chave."""
+    rows: list[AppointmentSchema | AppointmentOccurrenceSchema] = [*appointments]
+    merged = heapq.merge(rows, occurrences, key=appointment_key)
+    return APPOINTMENT_KEYSET.page(list(islice(merged, limit + 1)), limit, key=appointment_key)
 
 
 class AppointmentRepository(AppointmentRepositoryInterface):
+    def __init__(self, uow: UnitOfWork) -> None:
+        self.uow = uow
+
     def create(self, new_appointment: CreateAppointmentSchema) -> AppointmentSchema:
-        with DatabaseConnectionHandler() as db:
-            try:
-                appointment = Appointment(**new_appointment.model_dump())
-                db.session.add(appointment)
-                db.session.commit()
-                db.session.refresh(appointment)
-                return AppointmentSchema.model_validate(appointment)
-            except Exception as e:
-                db.session.rollback()
-                raise e
+        appointment = Appointment(**new_appointment.model_dump())
+        self.uow.session.add(appointment)
+        self.__flush()
+        self.uow.session.refresh(appointment)
+        return self.__staged(appointment)
+
+    def create_many(self, new_appointments: list[CreateAppointmentSchema]) -> list[AppointmentSchema]:
+        if not new_appointments:
+            return []
+
+        rows = [
+            {**item.model_dump(), 'ends_at': appointment_end(item.date_time, item.estimated_duration)}
+            for item in new_appointments
+        ]
+
+        # O SQLAlchemy agrupa as linhas em INSERTs de múltiplos VALUES com RETURNING, preservando a ordem do lote.
+        with exclusion_violation_as_conflict():
+            appointments = self.uow.session.scalars(
+                insert(Appointment).returning(Appointment, sort_by_parameter_order=True), rows
+            )
+
+        return [self.__staged(appointment) for appointment in appointments.all()]
 
     def get(  # noqa: PLR0913
         self,
@@ -33,70 +318,293 @@ class AppointmentRepository(AppointmentRepositoryInterface):
         end_date: Optional[datetime] = None,
         type: Optional[str] = None,
         status: Optional[str] = None,
-    ) -> list[AppointmentSchema]:
-        query = select(Appointment)
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> PageSchema[AppointmentSchema | AppointmentOccurrenceSchema]:
+        limit = page_limit(limit)
+        query = filter_appointments(
+            APPOINTMENT_PROJECTION.select(), patient_id, professional_id, start_date, end_date, type, status
+        )
+        rows = self.uow.session.execute(APPOINTMENT_KEYSET.apply(query, cursor, limit))
+        appointments = APPOINTMENT_PROJECTION.all(rows)
+        occurrences = self.__occurrences(patient_id, professional_id, start_date, end_date, type, status, cursor)
+        return appointments_page(appointments, occurrences, limit)
+
+    def stream(  # noqa: PLR0913
+        self,
+        patient_id: Optional[UUID] = None,
+        professional_id: Optional[UUID] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        type: Optional[str] = None,
+        status: Optional[str] = None,
+        cursor: Optional[str] = None,
+    ) -> Iterator[AppointmentSchema | AppointmentOccurrenceSchema]:
+        query = filter_appointments(
+            APPOINTMENT_PROJECTION.select(), patient_id, professional_id, start_date, end_date, type, status
+        )
+        occurrences = self.__occurrences(patient_id, professional_id, start_date, end_date, type, status, cursor)
+        appointments: Iterator[AppointmentSchema | AppointmentOccurrenceSchema] = (
+            APPOINTMENT_PROJECTION.one(row)
+            for row in self.uow.session.execute(APPOINTMENT_KEYSET.stream(query, cursor))
+        )
+        yield from heapq.merge(appointments, occurrences, key=appointment_key)
+
+    def update(  # noqa: PLR0913
+        self,
+        appointment_id: int,
+        appointment: CreateAppointmentSchema,
+        patient_id: Optional[UUID] = None,
+        not_before: Optional[datetime] = None,
+        version: Optional[int] = None,
+    ) -> AppointmentSchema | None:
+        """Atualiza o agendamento com um único `UPDATE ... RETURNING`.
+
+        `patient_id` e `not_before` restringem a atualização aos agendamentos do paciente e aos que começam a partir
+        desse horário, e `version` à versão informada em `If-Match`. A versão é sempre incrementada. Retorna `None`
+        quando nenhuma linha é atualizada.
+        """
+        query = update(Appointment).where(Appointment.id == appointment_id)
 
         if patient_id:
-            query = query.filter(Appointment.patient_id == patient_id)
+            query = query.where(Appointment.patient_id == patient_id)
+
+        if not_before:
+            query = query.where(Appointment.date_time >= not_before)
+
+        if version is not None:
+            query = query.where(Appointment.version == version)
+
+        # O evento `before_update` não roda em UPDATEs em massa, então o fim é calculado aqui.
+        ends_at = appointment_end(appointment.date_time, appointment.estimated_duration)
+
+        with exclusion_violation_as_conflict():
+            appointment_db = self.uow.session.scalar(
+                query.values(**appointment.model_dump(), ends_at=ends_at, version=Appointment.version + 1).returning(
+                    Appointment
+                )
+            )
+
+        return self.__staged(appointment_db) if appointment_db else None
+
+    def has_time_conflict(
+        self, professional_id: UUID, start: datetime, duration: int, exclude_id: Optional[int] = None
+    ) -> bool:
+        end = appointment_end(start, duration)
+        index = AppointmentIntervalIndex.get_instance()
+        has_series = True
+
+        if index is not None:
+            conflict = index.has_time_conflict(professional_id, start, end, exclude_id)
+
+            if conflict is None:
+                agenda = self.__load_agenda(index, professional_id)
+                conflict = agenda.has_time_conflict(start, end, exclude_id)
+                has_series = agenda.has_series
+            else:
+                has_series = index.has_series(professional_id)
+        else:
+            dialect = self.uow.session.get_bind().dialect.name
+            query = exists().where(
+                Appointment.professional_id == professional_id,
+                Appointment.status != AppointmentStatus.CANCELED,
+                Appointment.overlaps(start, end, dialect),
+            )
+
+            if exclude_id is not None:
+                query = query.where(Appointment.id != exclude_id)
+
+            conflict = bool(self.uow.session.scalar(select(query)))
 
-        if professional_id:
-            query = query.filter(Appointment.professional_id == professional_id)
+        if conflict:
+            return True
 
-        if start_date:
-            query = query.filter(Appointment.date_time > start_date)
+        if not has_series and not has_pending_series(self.uow.session, professional_id):
+            return False
 
-        if end_date:
-            query = query.filter(Appointment.date_time < end_date)
+        series = self.uow.session.scalars(pending_series(professional_id=professional_id, start=start, end=end))
+        return any(series_intervals(series, start, end))
 
-        if type:
-            query = query.filter(Appointment.type == type)
+    def get_agenda(
+        self, professional_id: UUID, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None
+    ) -> list[AppointmentSchema | AppointmentOccurrenceSchema]:
+        index = AppointmentIntervalIndex.get_instance()
+        appointments: list[AppointmentSchema] | None = None
+        has_series = True
 
-        if status:
-            query = query.filter(Appointment.status == status)
+        if index is None:
+            query = filter_appointments(
+                select(Appointment), professional_id=professional_id, start_date=start_date, end_date=end_date
+            )
+            appointments = [
+                AppointmentSchema.model_validate(appointment)
+                for appointment in self.uow.session.scalars(query.order_by(*APPOINTMENT_KEYSET.columns))
+            ]
+        else:
+            appointments = index.between(professional_id, start_date, end_date)
 
-        with DatabaseConnectionHandler() as db:
-            try:
-                appointments = db.session.scalars(query).all()
-                return [AppointmentSchema.model_validate(appointment) for appointment in appointments]
-            except Exception as e:
-                db.session.rollback()
-                raise e
+            if appointments is None:
+                agenda = self.__load_agenda(index, professional_id)
+                appointments = agenda.between(start_date, end_date)
+                has_series = agenda.has_series
+            else:
+                has_series = index.has_series(professional_id)
 
-    def update(self, appointment_id: int, appointment: CreateAppointmentSchema) -> AppointmentSchema:
-        with DatabaseConnectionHandler() as db:
-            try:
-                appointment_db = db.session.get(Appointment, appointment_id)
+        # Sem séries pendentes, o índice já respondeu sozinho e a consulta às séries é dispensada.
+        if not has_series and not has_pending_series(self.uow.session, professional_id):
+            return [*appointments]
 
-                for key, value in appointment.model_dump().items():
-                    setattr(appointment_db, key, value)
+        series = self.uow.session.scalars(
+            pending_series(professional_id=professional_id, start=start_date, end=end_date)
+        )
+        return [*appointments, *expand_series(series, start_date, end_date)]
 
-                db.session.commit()
-                db.session.refresh(appointment_db)
+    def get_busy_intervals(
+        self, start: datetime, end: datetime, professional_ids: Optional[list[UUID]] = None
+    ) -> dict[UUID, list[tuple[datetime, datetime]]]:
+        busy, _ = self.get_batch_schedule(start, end, professional_ids, [])
+        return busy
 
-                return AppointmentSchema.model_validate(appointment_db)
-            except Exception as e:
-                db.session.rollback()
-                raise e
+    def get_batch_schedule(
+        self, start: datetime, end: datetime, professional_ids: Optional[list[UUID]], patient_ids: list[UUID]
+    ) -> tuple[dict[UUID, list[tuple[datetime, datetime]]], set[UUID]]:
+        """Intervalos ocupados dos profissionais, como em `get_busy_intervals`, e os ids de `patient_ids` que existem
+        e são pacientes, lidos na mesma consulta que os profissionais."""
+        professionals, users = scheduling_users(professional_ids, patient_ids)
+        busy: dict[UUID, list[tuple[datetime, datetime]]] = {}
+        patients: set[UUID] = set()
+
+        for user_id, role in self.uow.session.execute(users):
+            if role == Roles.PATIENT:
+                patients.add(user_id)
+            else:
+                busy[user_id] = []
+
+        dialect = self.uow.session.get_bind().dialect.name
+        rows = self.uow.session.execute(
+            select(Appointment.professional_id, Appointment.date_time, Appointment.ends_at)
+            .where(
+                Appointment.professional_id.in_(professionals),
+                Appointment.status != AppointmentStatus.CANCELED,
+                Appointment.overlaps(start, end, dialect),
+            )
+            .order_by(Appointment.professional_id, Appointment.date_time)
+        )
+
+        for professional_id, date_time, ends_at in rows:
+            busy[professional_id].append((date_time, ends_at))
+
+        series = self.uow.session.scalars(
+            pending_series(start=start, end=end).where(AppointmentSeries.professional_id.in_(professionals))
+        )
+        add_series_intervals(busy, series_intervals(series, start, end))
+
+        return busy, patients
+
+    def materialize_series(
+        self, professional_id: Optional[UUID] = None, patient_id: Optional[UUID] = None
+    ) -> list[AppointmentSchema]:
+        """Cria as ocorrências das séries que entraram na janela de materialização.
+
+        Chamado na criação de uma série e pela tarefa de fundo, nunca pelas leituras, que só expandem a regra. Séries
+        travadas por outra transação que as está materializando são puladas. Retorna as ocorrências que conflitavam
+        com outro agendamento do profissional: em vez de sumirem, elas são gravadas como canceladas.
+        """
+        horizon = materialization_horizon()
+        query = pending_series(patient_id, professional_id).where(AppointmentSeries.materialized_until < horizon)
+        rows = []
+
+        for series in self.uow.session.scalars(query.with_for_update(skip_locked=True)):
+            rows.extend(materialize(series, horizon))
+
+        self.uow.session.flush()
+
+        if not rows:
+            return []
+
+        dialect = self.uow.session.get_bind().dialect.name
+        appointments = self.uow.session.scalars(insert_occurrences(dialect).returning(Appointment), rows).all()
+        skipped = skipped_occurrences(rows, appointments)
+        canceled: Sequence[Appointment] = []
+
+        if skipped:
+            canceled = self.uow.session.scalars(insert(Appointment).returning(Appointment), skipped).all()
+
+        for appointment in appointments:
+            self.__staged(appointment)
+
+        return [self.__staged(appointment) for appointment in canceled]
+
+    def cancel_series(self, series_id: int, after: datetime) -> None:
+        appointments = self.uow.session.scalars(
+            update(Appointment)
+            .where(
+                Appointment.series_id == series_id,
+                Appointment.date_time > after,
+                Appointment.status != AppointmentStatus.CANCELED,
+            )
+            .values(status=AppointmentStatus.CANCELED, version=Appointment.version + 1)
+            .returning(Appointment)
+        )
+
+        for appointment in appointments.all():
+            self.__staged(appointment)
 
     def get_by_id(self, appointment_id: int) -> AppointmentSchema | None:
-        with DatabaseConnectionHandler() as db:
-            try:
-                appointment = db.session.get(Appointment, appointment_id)
-                return AppointmentSchema.model_validate(appointment) if appointment else None
-            except Exception as e:
-                db.session.rollback()
-                raise e
-
-    def cancel(self, appointment_id: int) -> None:
-        with DatabaseConnectionHandler() as db:
-            try:
-                appointment = self.get_by_id(appointment_id)
-
-                if not appointment:
-                    raise AppointmentNotFountError()
-
-                appointment.status = AppointmentStatus.CANCELED
-                db.session.commit()
-            except Exception as e:
-                db.session.rollback()
-                raise e
+        appointment = self.uow.session.get(Appointment, appointment_id)
+        return AppointmentSchema.model_validate(appointment) if appointment else None
+
+    def cancel(self, appointment_id: int, patient_id: Optional[UUID] = None) -> AppointmentSchema | None:
+        query = update(Appointment).where(Appointment.id == appointment_id)
+
+        if patient_id:
+            query = query.where(Appointment.patient_id == patient_id)
+
+        appointment = self.uow.session.scalar(
+            query.values(status=AppointmentStatus.CANCELED, version=Appointment.version + 1).returning(Appointment)
+        )
+        return self.__staged(appointment) if appointment else None
+
+    def __occurrences(  # noqa: PLR0913
+        self,
+        patient_id: Optional[UUID],
+        professional_id: Optional[UUID],
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        type: Optional[str],
+        status: Optional[str],
+        cursor: Optional[str],
+    ) -> Iterator[AppointmentOccurrenceSchema]:
+        if status and status != AppointmentStatus.SCHEDULED:
+            return iter(())
+
+        series_start = APPOINTMENT_KEYSET.decode(cursor)[0] if cursor else start_date
+        series = self.uow.session.scalars(pending_series(patient_id, professional_id, series_start, end_date, type))
+        return occurrences_after(series.all(), start_date, end_date, cursor)
+
+    def __load_agenda(self, index: AppointmentIntervalIndex, professional_id: UUID) -> ProfessionalAgenda:
+        epoch = index.epoch
+        appointments = self.uow.session.scalars(
+            select(Appointment).where(Appointment.professional_id == professional_id)
+        )
+        has_series = self.uow.session.scalar(select(pending_series(professional_id=professional_id).exists()))
+        agenda = ProfessionalAgenda(
+            (AppointmentSchema.model_validate(appointment) for appointment in appointments),
+            time.monotonic(),
+            bool(has_series),
+        )
+
+        # Escritas ainda não confirmadas desta transação não podem ir para o índice compartilhado.
+        if not has_pending(self.uow.session, professional_id):
+            index.store(professional_id, agenda, epoch)
+
+        return agenda
+
+    def __staged(self, appointment: Appointment) -> AppointmentSchema:
+        schema = AppointmentSchema.model_validate(appointment)
+        stage(self.uow.session, schema)
+        return schema
+
+    def __flush(self) -> None:
+        with exclusion_violation_as_conflict():
+            self.uow.session.flush()
@@ -0,0 +1,49 @@
+from datetime import datetime
+
+from sqlalchemy import update
+
+from vidaplus.main.enums.appointment_status import AppointmentStatus
+from vidaplus.main.exceptions import AppointmentSeriesNotFoundError
+from vidaplus.main.schemas.appointment_series import AppointmentSeriesSchema, CreateAppointmentSeriesSchema
+from vidaplus.models.cache.appointment_interval_index import stage_series
+from vidaplus.models.config.unit_of_work import UnitOfWork
+from vidaplus.models.entities.appointment_series import AppointmentSeries
+from vidaplus.models.repositories.interfaces.appointment_series_repository_interface import (
+    AppointmentSeriesRepositoryInterface,
+)
+
+
+class AppointmentSeriesRepository(AppointmentSeriesRepositoryInterface):
+    def __init__(self, uow: UnitOfWork) -> None:
+        self.uow = uow
+
+    def create(self, series: CreateAppointmentSeriesSchema, ends_at: datetime) -> AppointmentSeriesSchema:
+        # Nada é materializado aqui; o serviço materializa logo depois, e a tarefa de fundo segue a janela.
+        series_db = AppointmentSeries(
+            **series.model_dump(),
+            status=AppointmentStatus.SCHEDULED,
+            ends_at=ends_at,
+            materialized_until=series.starts_at,
+        )
+        self.uow.session.add(series_db)
+        stage_series(self.uow.session, series.professional_id)
+        self.uow.session.flush()
+        self.uow.session.refresh(series_db)
+
+        return AppointmentSeriesSchema.model_validate(series_db)
+
+    def get_by_id(self, series_id: int) -> AppointmentSeriesSchema | None:
+        series = self.uow.session.get(AppointmentSeries, series_id)
+        return AppointmentSeriesSchema.model_validate(series) if series else None
+
+    def cancel(self, series_id: int) -> None:
+        # A série não tem coluna de versão: só o status muda, num único UPDATE.
+        series = self.uow.session.scalar(
+            update(AppointmentSeries)
+            .where(AppointmentSeries.id == series_id)
+            .values(status=AppointmentStatus.CANCELED)
+            .returning(AppointmentSeries)
+        )
+
+        if not series:
+            raise AppointmentSeriesNotFoundError()
@@ -0,0 +1,57 @@
+from typing import AsyncIterator, Optional
+
+from sqlalchemy import delete, select, update
+
+from vidaplus.main.schemas.admission import AdmissionSchema, CreateAdmissionSchema, UpdateAdmissionSchema
+from vidaplus.main.schemas.page import PageSchema
+from vidaplus.models.config.unit_of_work import AsyncUnitOfWork
+from vidaplus.models.entities.admission import Admission
+from vidaplus.models.repositories.admission_repository import ADMISSION_KEYSET, ADMISSION_LIST
+from vidaplus.models.repositories.interfaces.asynchronous.admission_repository_interface import (
+    AsyncAdmissionRepositoryInterface,
+)
+from vidaplus.models.repositories.pagination import page_limit
+
+
+class AsyncAdmissionRepository(AsyncAdmissionRepositoryInterface):
+    def __init__(self, uow: AsyncUnitOfWork) -> None:
+        self.uow = uow
+
+    async def create(self, data: CreateAdmissionSchema) -> AdmissionSchema:
+        admission = Admission(**data.model_dump())
+        self.uow.session.add(admission)
+        await self.uow.session.flush()
+        await self.uow.session.refresh(admission)
+        return AdmissionSchema.model_validate(admission)
+
+    async def all(self, cursor: Optional[str] = None, limit: Optional[int] = None) -> PageSchema[AdmissionSchema]:
+        limit = page_limit(limit)
+        admissions = await self.uow.session.scalars(ADMISSION_KEYSET.apply(select(Admission), cursor, limit))
+        return ADMISSION_KEYSET.page(ADMISSION_LIST.validate_python(admissions.all(), from_attributes=True), limit)
+
+    async def stream(self, cursor: Optional[str] = None) -> AsyncIterator[AdmissionSchema]:
+        async for admission in await self.uow.session.stream_scalars(
+            ADMISSION_KEYSET.stream(select(Admission), cursor)
+        ):
+            yield AdmissionSchema.model_validate(admission)
+
+    async def get_by_id(self, admission_id: int) -> AdmissionSchema | None:
+        admission = await self.uow.session.scalar(select(Admission).where(Admission.id == admission_id))
+        return AdmissionSchema.model_validate(admission) if admission else None
+
+    async def update(self, admission_id: int, data: UpdateAdmissionSchema) -> AdmissionSchema | None:
+        values = data.model_dump(exclude_none=True)
+
+        if not values:
+            return await self.get_by_id(admission_id)
+
+        admission = await self.uow.session.scalar(
+            update(Admission).where(Admission.id == admission_id).values(**values).returning(Admission)
+        )
+        return AdmissionSchema.model_validate(admission) if admission else None
+
+    async def delete(self, admission_id: int) -> bool:
+        deleted = await self.uow.session.scalar(
+            delete(Admission).where(Admission.id == admission_id).returning(Admission.id)
+        )
+        return deleted is not None
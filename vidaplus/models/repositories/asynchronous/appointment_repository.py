@@ -0,0 +1,371 @@
+import time
+from datetime import datetime
+from typing import AsyncIterator, Iterator, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import exists, insert, select, update
+
+from vidaplus.main.enums.appointment_status import AppointmentStatus
+from vidaplus.main.enums.roles import Roles
+from vidaplus.main.schemas.appointment import AppointmentOccurrenceSchema, AppointmentSchema, CreateAppointmentSchema
+from vidaplus.main.schemas.page import PageSchema
+from vidaplus.models.cache.appointment_interval_index import (
+    AppointmentIntervalIndex,
+    ProfessionalAgenda,
+    has_pending,
+    has_pending_series,
+    stage,
+)
+from vidaplus.models.config.unit_of_work import AsyncUnitOfWork
+from vidaplus.models.entities.appointment import Appointment, appointment_end
+from vidaplus.models.entities.appointment_series import AppointmentSeries
+from vidaplus.models.repositories.appointment_repository import (
+    APPOINTMENT_KEYSET,
+    APPOINTMENT_PROJECTION,
+    add_series_intervals,
+    appointment_key,
+    appointments_page,
+    exclusion_violation_as_conflict,
+    expand_series,
+    filter_appointments,
+    insert_occurrences,
+    materialization_horizon,
+    materialize,
+    occurrences_after,
+    pending_series,
+    scheduling_users,
+    series_intervals,
+    skipped_occurrences,
+)
+from vidaplus.models.repositories.interfaces.asynchronous.appointment_repository_interface import (
+    AsyncAppointmentRepositoryInterface,
+)
+from vidaplus.models.repositories.pagination import page_limit
+
+
+class AsyncAppointmentRepository(AsyncAppointmentRepositoryInterface):
+    def __init__(self, uow: AsyncUnitOfWork) -> None:
+        self.uow = uow
+
+    async def create(self, new_appointment: CreateAppointmentSchema) -> AppointmentSchema:
+        appointment = Appointment(**new_appointment.model_dump())
+        self.uow.session.add(appointment)
+        await self.__flush()
+        await self.uow.session.refresh(appointment)
+        return self.__staged(appointment)
+
+    async def create_many(self, new_appointments: list[CreateAppointmentSchema]) -> list[AppointmentSchema]:
+        if not new_appointments:
+            return []
+
+        rows = [
+            {**item.model_dump(), 'ends_at': appointment_end(item.date_time, item.estimated_duration)}
+            for item in new_appointments
+        ]
+
+        # O SQLAlchemy agrupa as linhas em INSERTs de múltiplos VALUES com RETURNING, preservando a ordem do lote.
+        with exclusion_violation_as_conflict():
+            appointments = await self.uow.session.scalars(
+                insert(Appointment).returning(Appointment, sort_by_parameter_order=True), rows
+            )
+
+        return [self.__staged(appointment) for appointment in appointments.all()]
+
+    async def get(  # noqa: PLR0913
+        self,
+        patient_id: Optional[UUID] = None,
+        professional_id: Optional[UUID] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        type: Optional[str] = None,
+        status: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> PageSchema[AppointmentSchema | AppointmentOccurrenceSchema]:
+        limit = page_limit(limit)
+        query = filter_appointments(
+            APPOINTMENT_PROJECTION.select(), patient_id, professional_id, start_date, end_date, type, status
+        )
+        rows = await self.uow.session.execute(APPOINTMENT_KEYSET.apply(query, cursor, limit))
+        appointments = APPOINTMENT_PROJECTION.all(rows)
+        occurrences = await self.__occurrences(patient_id, professional_id, start_date, end_date, type, status, cursor)
+        return appointments_page(appointments, occurrences, limit)
+
+    async def stream(  # noqa: PLR0913
+        self,
+        patient_id: Optional[UUID] = None,
+        professional_id: Optional[UUID] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        type: Optional[str] = None,
+        status: Optional[str] = None,
+        cursor: Optional[str] = None,
+    ) -> AsyncIterator[AppointmentSchema | AppointmentOccurrenceSchema]:
+        query = filter_appointments(
+            APPOINTMENT_PROJECTION.select(), patient_id, professional_id, start_date, end_date, type, status
+        )
+        occurrences = await self.__occurrences(patient_id, professional_id, start_date, end_date, type, status, cursor)
+        occurrence = next(occurrences, None)
+
+        # Equivalente a `heapq.merge` para as linhas lidas de forma assíncrona; as ocorrências são geradas sob demanda.
+        async for row in await self.uow.session.stream(APPOINTMENT_KEYSET.stream(query, cursor)):
+            item = APPOINTMENT_PROJECTION.one(row)
+
+            while occurrence is not None and appointment_key(occurrence) < appointment_key(item):
+                yield occurrence
+                occurrence = next(occurrences, None)
+
+            yield item
+
+        if occurrence is not None:
+            yield occurrence
+
+        for occurrence in occurrences:
+            yield occurrence
+
+    async def update(  # noqa: PLR0913
+        self,
+        appointment_id: int,
+        appointment: CreateAppointmentSchema,
+        patient_id: Optional[UUID] = None,
+        not_before: Optional[datetime] = None,
+        version: Optional[int] = None,
+    ) -> AppointmentSchema | None:
+        query = update(Appointment).where(Appointment.id == appointment_id)
+
+        if patient_id:
+            query = query.where(Appointment.patient_id == patient_id)
+
+        if not_before:
+            query = query.where(Appointment.date_time >= not_before)
+
+        if version is not None:
+            query = query.where(Appointment.version == version)
+
+        # O evento `before_update` não roda em UPDATEs em massa, então o fim é calculado aqui.
+        ends_at = appointment_end(appointment.date_time, appointment.estimated_duration)
+
+        with exclusion_violation_as_conflict():
+            appointment_db = await self.uow.session.scalar(
+                query.values(**appointment.model_dump(), ends_at=ends_at, version=Appointment.version + 1).returning(
+                    Appointment
+                )
+            )
+
+        return self.__staged(appointment_db) if appointment_db else None
+
+    async def has_time_conflict(
+        self, professional_id: UUID, start: datetime, duration: int, exclude_id: Optional[int] = None
+    ) -> bool:
+        end = appointment_end(start, duration)
+        index = AppointmentIntervalIndex.get_instance()
+        has_series = True
+
+        if index is not None:
+            conflict = index.has_time_conflict(professional_id, start, end, exclude_id)
+
+            if conflict is None:
+                agenda = await self.__load_agenda(index, professional_id)
+                conflict = agenda.has_time_conflict(start, end, exclude_id)
+                has_series = agenda.has_series
+            else:
+                has_series = index.has_series(professional_id)
+        else:
+            dialect = self.uow.session.get_bind().dialect.name
+            query = exists().where(
+                Appointment.professional_id == professional_id,
+                Appointment.status != AppointmentStatus.CANCELED,
+                Appointment.overlaps(start, end, dialect),
+            )
+
+            if exclude_id is not None:
+                query = query.where(Appointment.id != exclude_id)
+
+            conflict = bool(await self.uow.session.scalar(select(query)))
+
+        if conflict:
+            return True
+
+        if not has_series and not has_pending_series(self.uow.session.sync_session, professional_id):
+            return False
+
+        series = await self.uow.session.scalars(pending_series(professional_id=professional_id, start=start, end=end))
+        return any(series_intervals(series, start, end))
+
+    async def get_agenda(
+        self, professional_id: UUID, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None
+    ) -> list[AppointmentSchema | AppointmentOccurrenceSchema]:
+        index = AppointmentIntervalIndex.get_instance()
+        appointments: list[AppointmentSchema] | None = None
+        has_series = True
+
+        if index is None:
+            query = filter_appointments(
+                select(Appointment), professional_id=professional_id, start_date=start_date, end_date=end_date
+            )
+            appointments = [
+                AppointmentSchema.model_validate(appointment)
+                for appointment in await self.uow.session.scalars(query.order_by(*APPOINTMENT_KEYSET.columns))
+            ]
+        else:
+            appointments = index.between(professional_id, start_date, end_date)
+
+            if appointments is None:
+                agenda = await self.__load_agenda(index, professional_id)
+                appointments = agenda.between(start_date, end_date)
+                has_series = agenda.has_series
+            else:
+                has_series = index.has_series(professional_id)
+
+        # Sem séries pendentes, o índice já respondeu sozinho e a consulta às séries é dispensada.
+        if not has_series and not has_pending_series(self.uow.session.sync_session, professional_id):
+            return [*appointments]
+
+        series = await self.uow.session.scalars(
+            pending_series(professional_id=professional_id, start=start_date, end=end_date)
+        )
+        return [*appointments, *expand_series(series, start_date, end_date)]
+
+    async def get_busy_intervals(
+        self, start: datetime, end: datetime, professional_ids: Optional[list[UUID]] = None
+    ) -> dict[UUID, list[tuple[datetime, datetime]]]:
+        busy, _ = await self.get_batch_schedule(start, end, professional_ids, [])
+        return busy
+
+    async def get_batch_schedule(
+        self, start: datetime, end: datetime, professional_ids: Optional[list[UUID]], patient_ids: list[UUID]
+    ) -> tuple[dict[UUID, list[tuple[datetime, datetime]]], set[UUID]]:
+        professionals, users = scheduling_users(professional_ids, patient_ids)
+        busy: dict[UUID, list[tuple[datetime, datetime]]] = {}
+        patients: set[UUID] = set()
+
+        for user_id, role in await self.uow.session.execute(users):
+            if role == Roles.PATIENT:
+                patients.add(user_id)
+            else:
+                busy[user_id] = []
+
+        dialect = self.uow.session.get_bind().dialect.name
+        rows = await self.uow.session.execute(
+            select(Appointment.professional_id, Appointment.date_time, Appointment.ends_at)
+            .where(
+                Appointment.professional_id.in_(professionals),
+                Appointment.status != AppointmentStatus.CANCELED,
+                Appointment.overlaps(start, end, dialect),
+            )
+            .order_by(Appointment.professional_id, Appointment.date_time)
+        )
+
+        for professional_id, date_time, ends_at in rows:
+            busy[professional_id].append((date_time, ends_at))
+
+        series = await self.uow.session.scalars(
+            pending_series(start=start, end=end).where(AppointmentSeries.professional_id.in_(professionals))
+        )
+        add_series_intervals(busy, series_intervals(series, start, end))
+
+        return busy, patients
+
+    async def materialize_series(
+        self, professional_id: Optional[UUID] = None, patient_id: Optional[UUID] = None
+    ) -> list[AppointmentSchema]:
+        horizon = materialization_horizon()
+        query = pending_series(patient_id, professional_id).where(AppointmentSeries.materialized_until < horizon)
+        rows = []
+
+        for series in await self.uow.session.scalars(query.with_for_update(skip_locked=True)):
+            rows.extend(materialize(series, horizon))
+
+        await self.uow.session.flush()
+
+        if not rows:
+            return []
+
+        dialect = self.uow.session.get_bind().dialect.name
+        appointments = (await self.uow.session.scalars(insert_occurrences(dialect).returning(Appointment), rows)).all()
+        skipped = skipped_occurrences(rows, appointments)
+        canceled: Sequence[Appointment] = []
+
+        if skipped:
+            canceled = (await self.uow.session.scalars(insert(Appointment).returning(Appointment), skipped)).all()
+
+        for appointment in appointments:
+            self.__staged(appointment)
+
+        return [self.__staged(appointment) for appointment in canceled]
+
+    async def cancel_series(self, series_id: int, after: datetime) -> None:
+        appointments = await self.uow.session.scalars(
+            update(Appointment)
+            .where(
+                Appointment.series_id == series_id,
+                Appointment.date_time > after,
+                Appointment.status != AppointmentStatus.CANCELED,
+            )
+            .values(status=AppointmentStatus.CANCELED, version=Appointment.version + 1)
+            .returning(Appointment)
+        )
+
+        for appointment in appointments.all():
+            self.__staged(appointment)
+
+    async def get_by_id(self, appointment_id: int) -> AppointmentSchema | None:
+        appointment = await self.uow.session.get(Appointment, appointment_id)
+        return AppointmentSchema.model_validate(appointment) if appointment else None
+
+    async def cancel(self, appointment_id: int, patient_id: Optional[UUID] = None) -> AppointmentSchema | None:
+        query = update(Appointment).where(Appointment.id == appointment_id)
+
+        if patient_id:
+            query = query.where(Appointment.patient_id == patient_id)
+
+        appointment = await self.uow.session.scalar(
+            query.values(status=AppointmentStatus.CANCELED, version=Appointment.version + 1).returning(Appointment)
+        )
+        return self.__staged(appointment) if appointment else None
+
+    async def __occurrences(  # noqa: PLR0913
+        self,
+        patient_id: Optional[UUID],
+        professional_id: Optional[UUID],
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        type: Optional[str],
+        status: Optional[str],
+        cursor: Optional[str],
+    ) -> Iterator[AppointmentOccurrenceSchema]:
+        if status and status != AppointmentStatus.SCHEDULED:
+            return iter(())
+
+        series_start = APPOINTMENT_KEYSET.decode(cursor)[0] if cursor else start_date
+        series = await self.uow.session.scalars(
+            pending_series(patient_id, professional_id, series_start, end_date, type)
+        )
+        return occurrences_after(series.all(), start_date, end_date, cursor)
+
+    async def __load_agenda(self, index: AppointmentIntervalIndex, professional_id: UUID) -> ProfessionalAgenda:
+        epoch = index.epoch
+        appointments = await self.uow.session.scalars(
+            select(Appointment).where(Appointment.professional_id == professional_id)
+        )
+        has_series = await self.uow.session.scalar(select(pending_series(professional_id=professional_id).exists()))
+        agenda = ProfessionalAgenda(
+            (AppointmentSchema.model_validate(appointment) for appointment in appointments),
+            time.monotonic(),
+            bool(has_series),
+        )
+
+        # Escritas ainda não confirmadas desta transação não podem ir para o índice compartilhado.
+        if not has_pending(self.uow.session.sync_session, professional_id):
+            index.store(professional_id, agenda, epoch)
+
+        return agenda
+
+    def __staged(self, appointment: Appointment) -> AppointmentSchema:
+        schema = AppointmentSchema.model_validate(appointment)
+        stage(self.uow.session.sync_session, schema)
+        return schema
+
+    async def __flush(self) -> None:
+        with exclusion_violation_as_conflict():
+            await self.uow.session.flush()
@@ -0,0 +1,63 @@
+from typing import AsyncIterator, Optional
+
+from sqlalchemy import delete, select, update
+
+from vidaplus.main.enums.bed_status import BedStatus
+from vidaplus.main.enums.bed_types import BedTypes
+from vidaplus.main.schemas.bed import BedSchema, CreateBedSchema
+from vidaplus.main.schemas.page import PageSchema
+from vidaplus.models.config.unit_of_work import AsyncUnitOfWork
+from vidaplus.models.entities.bed import Bed
+from vidaplus.models.repositories.bed_repository import BED_KEYSET, BED_PROJECTION, available_bed, occupy_bed
+from vidaplus.models.repositories.interfaces.asynchronous.bed_repository_interface import AsyncBedRepositoryInterface
+from vidaplus.models.repositories.loaders import WITH_UNIT
+from vidaplus.models.repositories.pagination import page_limit
+
+
+class AsyncBedRepository(AsyncBedRepositoryInterface):
+    def __init__(self, uow: AsyncUnitOfWork) -> None:
+        self.uow = uow
+
+    async def create(self, bed: CreateBedSchema) -> BedSchema:
+        bed_db = Bed(**bed.model_dump())
+        self.uow.session.add(bed_db)
+        await self.uow.session.flush()
+        await self.uow.session.refresh(bed_db)
+        return BedSchema.model_validate(bed_db)
+
+    async def all(self, cursor: Optional[str] = None, limit: Optional[int] = None) -> PageSchema[BedSchema]:
+        limit = page_limit(limit)
+        rows = await self.uow.session.execute(BED_KEYSET.apply(BED_PROJECTION.select(), cursor, limit))
+        return BED_KEYSET.page(BED_PROJECTION.all(rows), limit)
+
+    async def stream(self, cursor: Optional[str] = None) -> AsyncIterator[BedSchema]:
+        async for row in await self.uow.session.stream(BED_KEYSET.stream(BED_PROJECTION.select(), cursor)):
+            yield BED_PROJECTION.one(row)
+
+    async def get_by_id(self, bed_id: int) -> BedSchema | None:
+        bed = await self.uow.session.scalar(select(Bed).where(Bed.id == bed_id))
+
+        return BedSchema.model_validate(bed) if bed else None
+
+    async def update(self, bed_id: int, bed: CreateBedSchema, version: Optional[int] = None) -> BedSchema | None:
+        query = update(Bed).where(Bed.id == bed_id)
+
+        if version is not None:
+            query = query.where(Bed.version == version)
+
+        bed_db = await self.uow.session.scalar(
+            query.values(**bed.model_dump(), version=Bed.version + 1).returning(Bed).options(WITH_UNIT)
+        )
+        return BedSchema.model_validate(bed_db) if bed_db else None
+
+    async def occupy(self, bed_id: int) -> BedSchema | None:
+        bed = await self.uow.session.scalar(occupy_bed(Bed.id == bed_id, Bed.status == BedStatus.AVAILABLE))
+        return BedSchema.model_validate(bed) if bed else None
+
+    async def claim(self, unit_id: int, type: BedTypes) -> BedSchema | None:
+        bed = await self.uow.session.scalar(occupy_bed(Bed.id == available_bed(unit_id, type)))
+        return BedSchema.model_validate(bed) if bed else None
+
+    async def delete(self, bed_id: int) -> bool:
+        deleted = await self.uow.session.scalar(delete(Bed).where(Bed.id == bed_id).returning(Bed.id))
+        return deleted is not None
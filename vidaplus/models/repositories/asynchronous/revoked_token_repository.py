@@ -0,0 +1,42 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import delete, select
+
+from vidaplus.models.config.unit_of_work import AsyncUnitOfWork
+from vidaplus.models.entities.revoked_token import RevokedToken
+from vidaplus.models.repositories.interfaces.asynchronous.revoked_token_repository_interface import (
+    AsyncRevokedTokenRepositoryInterface,
+)
+from vidaplus.models.repositories.revoked_token_repository import insert_revocation
+
+
+class AsyncRevokedTokenRepository(AsyncRevokedTokenRepositoryInterface):
+    def __init__(self, uow: AsyncUnitOfWork) -> None:
+        self.uow = uow
+
+    async def add(self, jti: str, expires_at: datetime) -> bool:
+        """Retorna `False` se o token já estava revogado."""
+        dialect = self.uow.session.get_bind().dialect.name
+        revocation_id = await self.uow.session.scalar(
+            insert_revocation(dialect)
+            .values(jti=jti, expires_at=expires_at.astimezone(timezone.utc))
+            .returning(RevokedToken.id)
+        )
+        return revocation_id is not None
+
+    async def exists(self, jti: str) -> bool:
+        return await self.uow.session.scalar(select(RevokedToken.id).where(RevokedToken.jti == jti)) is not None
+
+    async def since(self, last_id: int) -> list[tuple[int, str]]:
+        rows = await self.uow.session.execute(
+            select(RevokedToken.id, RevokedToken.jti)
+            .where(RevokedToken.id > last_id, RevokedToken.expires_at > datetime.now(timezone.utc))
+            .order_by(RevokedToken.id)
+        )
+        return [(row.id, row.jti) for row in rows]
+
+    async def delete_expired(self) -> int:
+        result = await self.uow.session.execute(
+            delete(RevokedToken).where(RevokedToken.expires_at <= datetime.now(timezone.utc))
+        )
+        return result.rowcount
@@ -0,0 +1,55 @@
+from typing import AsyncIterator, Optional
+
+from sqlalchemy import delete, select, update
+
+from vidaplus.main.schemas.page import PageSchema
+from vidaplus.main.schemas.supply import CreateSupplySchema, SupplySchema
+from vidaplus.models.config.unit_of_work import AsyncUnitOfWork
+from vidaplus.models.entities.supply import Supply
+from vidaplus.models.repositories.interfaces.asynchronous.supply_repository_interface import (
+    AsyncSupplyRepositoryInterface,
+)
+from vidaplus.models.repositories.pagination import page_limit
+from vidaplus.models.repositories.supply_repository import SUPPLY_KEYSET, SUPPLY_LIST
+
+
+class AsyncSupplyRepository(AsyncSupplyRepositoryInterface):
+    def __init__(self, uow: AsyncUnitOfWork) -> None:
+        self.uow = uow
+
+    async def create(self, data: CreateSupplySchema) -> SupplySchema:
+        supply = Supply(**data.model_dump())
+        self.uow.session.add(supply)
+        await self.uow.session.flush()
+        await self.uow.session.refresh(supply)
+        return SupplySchema.model_validate(supply)
+
+    async def all(self, cursor: Optional[str] = None, limit: Optional[int] = None) -> PageSchema[SupplySchema]:
+        limit = page_limit(limit)
+        supplies = await self.uow.session.scalars(SUPPLY_KEYSET.apply(select(Supply), cursor, limit))
+        return SUPPLY_KEYSET.page(SUPPLY_LIST.validate_python(supplies.all(), from_attributes=True), limit)
+
+    async def stream(self, cursor: Optional[str] = None) -> AsyncIterator[SupplySchema]:
+        async for supply in await self.uow.session.stream_scalars(SUPPLY_KEYSET.stream(select(Supply), cursor)):
+            yield SupplySchema.model_validate(supply)
+
+    async def get_by_id(self, supply_id: int) -> SupplySchema | None:
+        supply = await self.uow.session.scalar(select(Supply).where(Supply.id == supply_id))
+        return SupplySchema.model_validate(supply) if supply else None
+
+    async def update(
+        self, supply_id: int, data: CreateSupplySchema, version: Optional[int] = None
+    ) -> SupplySchema | None:
+        query = update(Supply).where(Supply.id == supply_id)
+
+        if version is not None:
+            query = query.where(Supply.version == version)
+
+        supply = await self.uow.session.scalar(
+            query.values(**data.model_dump(), version=Supply.version + 1).returning(Supply)
+        )
+        return SupplySchema.model_validate(supply) if supply else None
+
+    async def delete(self, supply_id: int) -> bool:
+        deleted = await self.uow.session.scalar(delete(Supply).where(Supply.id == supply_id).returning(Supply.id))
+        return deleted is not None
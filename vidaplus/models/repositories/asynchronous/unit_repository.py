@@ -0,0 +1,54 @@
+from typing import AsyncIterator, Optional
+
+from sqlalchemy import delete, select, update
+
+from vidaplus.main.schemas.page import PageSchema
+from vidaplus.main.schemas.unit import CreateUnitSchema, UnitSchema
+from vidaplus.models.config.unit_of_work import AsyncUnitOfWork
+from vidaplus.models.entities.unit import Unit
+from vidaplus.models.repositories.interfaces.asynchronous.unit_repository_interface import (
+    AsyncUnitRepositoryInterface,
+)
+from vidaplus.models.repositories.pagination import page_limit
+from vidaplus.models.repositories.unit_repository import UNIT_KEYSET, UNIT_LIST
+
+
+class AsyncUnitRepository(AsyncUnitRepositoryInterface):
+    def __init__(self, uow: AsyncUnitOfWork) -> None:
+        self.uow = uow
+
+    async def create(self, unit: CreateUnitSchema) -> UnitSchema:
+        unit_db = Unit(**unit.model_dump())
+        self.uow.session.add(unit_db)
+        await self.uow.session.flush()
+        await self.uow.session.refresh(unit_db)
+
+        return UnitSchema.model_validate(unit_db)
+
+    async def all(self, cursor: Optional[str] = None, limit: Optional[int] = None) -> PageSchema[UnitSchema]:
+        limit = page_limit(limit)
+        units = await self.uow.session.scalars(UNIT_KEYSET.apply(select(Unit), cursor, limit))
+        return UNIT_KEYSET.page(UNIT_LIST.validate_python(units.all(), from_attributes=True), limit)
+
+    async def stream(self, cursor: Optional[str] = None) -> AsyncIterator[UnitSchema]:
+        async for unit in await self.uow.session.stream_scalars(UNIT_KEYSET.stream(select(Unit), cursor)):
+            yield UnitSchema.model_validate(unit)
+
+    async def get_by_id(self, unit_id: int) -> UnitSchema | None:
+        unit = await self.uow.session.scalar(select(Unit).where(Unit.id == unit_id))
+
+        if not unit:
+            return None
+
+        return UnitSchema.model_validate(unit)
+
+    async def update(self, unit_id: int, unit: CreateUnitSchema) -> UnitSchema | None:
+        unit_db = await self.uow.session.scalar(
+            update(Unit).where(Unit.id == unit_id).values(**unit.model_dump()).returning(Unit)
+        )
+        return UnitSchema.model_validate(unit_db) if unit_db else None
+
+    async def delete(self, unit_id: int) -> bool:
+        # Leitos, internações e insumos são removidos pelo `ON DELETE CASCADE` do banco.
+        deleted = await self.uow.session.scalar(delete(Unit).where(Unit.id == unit_id).returning(Unit.id))
+        return deleted is not None
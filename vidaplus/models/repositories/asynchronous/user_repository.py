@@ -0,0 +1,73 @@
+from typing import AsyncIterator, Optional
+from uuid import UUID
+
+from sqlalchemy import delete, func, select, update
+
+from vidaplus.main.enums.roles import Roles
+from vidaplus.main.schemas.page import PageSchema
+from vidaplus.main.schemas.user import CreateUserSchema, UserSchema
+from vidaplus.models.config.unit_of_work import AsyncUnitOfWork
+from vidaplus.models.entities.user import User
+from vidaplus.models.repositories.interfaces.asynchronous.user_repository_interface import (
+    AsyncUserRepositoryInterface,
+)
+from vidaplus.models.repositories.pagination import page_limit
+from vidaplus.models.repositories.user_repository import USER_KEYSET, USER_LIST, insert_user
+
+
+class AsyncUserRepository(AsyncUserRepositoryInterface):
+    def __init__(self, uow: AsyncUnitOfWork) -> None:
+        self.uow = uow
+
+    async def create(self, new_user: CreateUserSchema) -> UserSchema | None:
+        """Retorna `None` se já existe um usuário com o email, sem diferenciar maiúsculas."""
+        dialect = self.uow.session.get_bind().dialect.name
+        user = await self.uow.session.scalar(insert_user(dialect).values(**new_user.model_dump()).returning(User))
+        return UserSchema.model_validate(user) if user else None
+
+    async def get_all(
+        self, role: Optional[Roles] = None, cursor: Optional[str] = None, limit: Optional[int] = None
+    ) -> PageSchema[UserSchema]:
+        limit = page_limit(limit)
+        query = select(User)
+
+        if role:
+            query = query.filter(User.role == role)
+
+        users = await self.uow.session.scalars(USER_KEYSET.apply(query, cursor, limit))
+        return USER_KEYSET.page(USER_LIST.validate_python(users.all(), from_attributes=True), limit)
+
+    async def stream(self, role: Optional[Roles] = None, cursor: Optional[str] = None) -> AsyncIterator[UserSchema]:
+        query = select(User)
+
+        if role:
+            query = query.filter(User.role == role)
+
+        async for user in await self.uow.session.stream_scalars(USER_KEYSET.stream(query, cursor)):
+            yield UserSchema.model_validate(user)
+
+    async def get_by_email(self, email: str) -> UserSchema | None:
+        user = await self.uow.session.scalar(select(User).where(func.lower(User.email) == func.lower(email)))
+        return UserSchema.model_validate(user) if user else None
+
+    async def get_by_id(self, user_id: UUID) -> UserSchema | None:
+        user = await self.uow.session.scalar(select(User).where(User.id == user_id))
+        return UserSchema.model_validate(user) if user else None
+
+    async def update(self, user_id: UUID, user: CreateUserSchema, role: Optional[Roles] = None) -> UserSchema | None:
+        """Retorna `None` se o usuário não existe ou, quando `role` é informado, se tem outro papel."""
+        query = update(User).where(User.id == user_id)
+
+        if role:
+            query = query.where(User.role == role)
+
+        user_db = await self.uow.session.scalar(query.values(**user.model_dump()).returning(User))
+        return UserSchema.model_validate(user_db) if user_db else None
+
+    async def update_password(self, user_id: UUID, password: str) -> None:
+        await self.uow.session.execute(update(User).where(User.id == user_id).values(password=password))
+
+    async def delete(self, user_id: UUID) -> bool:
+        # Agendamentos, séries e internações são removidos pelo `ON DELETE CASCADE` do banco.
+        deleted = await self.uow.session.scalar(delete(User).where(User.id == user_id).returning(User.id))
+        return deleted is not None
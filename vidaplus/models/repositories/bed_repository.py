@@ -1,66 +1,95 @@
-from sqlalchemy import select
+from typing import Iterator, Optional
 
+from sqlalchemy import ColumnElement, ScalarSelect, Update, delete, select, update
+
+from vidaplus.main.enums.bed_status import BedStatus
+from vidaplus.main.enums.bed_types import BedTypes
 from vidaplus.main.schemas.bed import BedSchema, CreateBedSchema
-from vidaplus.models.config.connection import DatabaseConnectionHandler
+from vidaplus.main.schemas.page import PageSchema
+from vidaplus.models.config.unit_of_work import UnitOfWork
 from vidaplus.models.entities.bed import Bed
 from vidaplus.models.repositories.interfaces.bed_repository_interface import BedRepositoryInterface
+from vidaplus.models.repositories.loaders import WITH_UNIT
+from vidaplus.models.repositories.pagination import Keyset, page_limit
+from vidaplus.models.repositories.projection import Projection
+
+BED_KEYSET = Keyset(Bed.id)
+BED_PROJECTION = Projection(BedSchema, Bed, unit=Bed.unit)
+
+
+def available_bed(unit_id: int, type: BedTypes) -> ScalarSelect[int]:
+    """Id do primeiro leito livre do tipo na unidade, travado para a transação atual.
+
+    `SKIP LOCKED` pula os leitos que outras alocações já travaram, em vez de esperar por eles, então alocações
+    concorrentes na mesma unidade pegam leitos diferentes sem se enfileirar. A busca percorre o índice parcial
+    `ix_bed_available_unit_id_id`. No SQLite, que não tem `FOR UPDATE`, as escritas já são serializadas.
+    """
+    return (
+        select(Bed.id)
+        .where(Bed.unit_id == unit_id, Bed.status == BedStatus.AVAILABLE, Bed.type == type)
+        .order_by(Bed.id)
+        .limit(1)
+        .with_for_update(skip_locked=True)
+        .scalar_subquery()
+    )
+
+
+def occupy_bed(*where: ColumnElement[bool]) -> Update:
+    return (
+        update(Bed)
+        .where(*where)
+        .values(status=BedStatus.OCCUPIED, version=Bed.version + 1)
+        .returning(Bed)
+        .options(WITH_UNIT)
+    )
 
 
 class BedRepository(BedRepositoryInterface):
+    def __init__(self, uow: UnitOfWork) -> None:
+        self.uow = uow
+
     def create(self, bed: CreateBedSchema) -> BedSchema:
-        with DatabaseConnectionHandler() as db:
-            try:
-                bed_db = Bed(**bed.model_dump())
-                db.session.add(bed_db)
-                db.session.commit()
-                db.session.refresh(bed_db)
-                return BedSchema.model_validate(bed_db)
-            except Exception as e:
-                db.session.rollback()
-                raise e
-
-    def all(self) -> list[BedSchema]:
-        with DatabaseConnectionHandler() as db:
-            try:
-                beds = db.session.query(Bed).all()
-                return [BedSchema.model_validate(bed) for bed in beds]
-            except Exception as e:
-                db.session.rollback()
-                raise e
+        bed_db = Bed(**bed.model_dump())
+        self.uow.session.add(bed_db)
+        self.uow.session.flush()
+        self.uow.session.refresh(bed_db)
+        return BedSchema.model_validate(bed_db)
+
+    def all(self, cursor: Optional[str] = None, limit: Optional[int] = None) -> PageSchema[BedSchema]:
+        limit = page_limit(limit)
+        rows = self.uow.session.execute(BED_KEYSET.apply(BED_PROJECTION.select(), cursor, limit))
+        return BED_KEYSET.page(BED_PROJECTION.all(rows), limit)
+
+    def stream(self, cursor: Optional[str] = None) -> Iterator[BedSchema]:
+        for row in self.uow.session.execute(BED_KEYSET.stream(BED_PROJECTION.select(), cursor)):
+            yield BED_PROJECTION.one(row)
 
     def get_by_id(self, bed_id: int) -> BedSchema | None:
-        with DatabaseConnectionHandler() as db:
-            try:
-                bed = db.session.scalar(select(Bed).where(Bed.id == bed_id))
-
-                return BedSchema.model_validate(bed) if bed else None
-            except Exception as e:
-                db.session.rollback()
-                raise e
-
-    def update(self, bed_id: int, bed: CreateBedSchema) -> BedSchema:
-        with DatabaseConnectionHandler() as db:
-            try:
-                bed_db = db.session.scalar(select(Bed).where(Bed.id == bed_id))
-
-                for k, v in bed.model_dump().items():
-                    setattr(bed_db, k, v)
-
-                db.session.commit()
-                db.session.refresh(bed_db)
-
-                return BedSchema.model_validate(bed_db)
-            except Exception as e:
-                db.session.rollback()
-                raise e
-
-    def delete(self, bed_id: int) -> None:
-        with DatabaseConnectionHandler() as db:
-            try:
-                bed = db.session.scalar(select(Bed).where(Bed.id == bed_id))
-
-                db.session.delete(bed)
-                db.session.commit()
-            except Exception as e:
-                db.session.rollback()
-                raise e
+        bed = self.uow.session.scalar(select(Bed).where(Bed.id == bed_id))
+
+        return BedSchema.model_validate(bed) if bed else None
+
+    def update(self, bed_id: int, bed: CreateBedSchema, version: Optional[int] = None) -> BedSchema | None:
+        query = update(Bed).where(Bed.id == bed_id)
+
+        if version is not None:
+            query = query.where(Bed.version == version)
+
+        bed_db = self.uow.session.scalar(
+            query.values(**bed.model_dump(), version=Bed.version + 1).returning(Bed).options(WITH_UNIT)
+        )
+        return BedSchema.model_validate(bed_db) if bed_db else None
+
+    def occupy(self, bed_id: int) -> BedSchema | None:
+        """Ocupa o leito se ele estiver disponível; retorna `None` se não existe ou não está disponível."""
+        bed = self.uow.session.scalar(occupy_bed(Bed.id == bed_id, Bed.status == BedStatus.AVAILABLE))
+        return BedSchema.model_validate(bed) if bed else None
+
+    def claim(self, unit_id: int, type: BedTypes) -> BedSchema | None:
+        """Ocupa um leito disponível do tipo na unidade; retorna `None` se não há nenhum."""
+        bed = self.uow.session.scalar(occupy_bed(Bed.id == available_bed(unit_id, type)))
+        return BedSchema.model_validate(bed) if bed else None
+
+    def delete(self, bed_id: int) -> bool:
+        deleted = self.uow.session.scalar(delete(Bed).where(Bed.id == bed_id).returning(Bed.id))
+        return deleted is not None
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
+from typing import Iterator, Optional
 
 from vidaplus.main.schemas.admission import AdmissionSchema, CreateAdmissionSchema, UpdateAdmissionSchema
+from vidaplus.main.schemas.page import PageSchema
 
 
 class AdmissionRepositoryInterface(ABC):
@@ -9,7 +11,11 @@ class AdmissionRepositoryInterface(ABC):
         pass
 
     @abstractmethod
-    def all(self) -> list[AdmissionSchema]:
+    def all(self, cursor: Optional[str] = None, limit: Optional[int] = None) -> PageSchema[AdmissionSchema]:
+        pass
+
+    @abstractmethod
+    def stream(self, cursor: Optional[str] = None) -> Iterator[AdmissionSchema]:
         pass
 
     @abstractmethod
@@ -17,9 +23,9 @@ class AdmissionRepositoryInterface(ABC):
         pass
 
     @abstractmethod
-    def update(self, admission_id: int, data: UpdateAdmissionSchema) -> AdmissionSchema:
+    def update(self, admission_id: int, data: UpdateAdmissionSchema) -> AdmissionSchema | None:
         pass
 
     @abstractmethod
-    def delete(self, admission_id: int) -> None:
+    def delete(self, admission_id: int) -> bool:
         pass
@@ -1,9 +1,10 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Optional
+from typing import Iterator, Optional
 from uuid import UUID
 
-from vidaplus.main.schemas.appointment import AppointmentSchema, CreateAppointmentSchema
+from vidaplus.main.schemas.appointment import AppointmentOccurrenceSchema, AppointmentSchema, CreateAppointmentSchema
+from vidaplus.main.schemas.page import PageSchema
 
 
 class AppointmentRepositoryInterface(ABC):
@@ -11,6 +12,10 @@ class AppointmentRepositoryInterface(ABC):
     def create(self, new_appointment: CreateAppointmentSchema) -> AppointmentSchema:
         pass
 
+    @abstractmethod
+    def create_many(self, new_appointments: list[CreateAppointmentSchema]) -> list[AppointmentSchema]:
+        pass
+
     @abstractmethod
     def get(  # noqa: PLR0913
         self,
@@ -20,11 +25,67 @@ class AppointmentRepositoryInterface(ABC):
         end_date: Optional[datetime] = None,
         type: Optional[str] = None,
         status: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> PageSchema[AppointmentSchema | AppointmentOccurrenceSchema]:
+        pass
+
+    @abstractmethod
+    def stream(  # noqa: PLR0913
+        self,
+        patient_id: Optional[UUID] = None,
+        professional_id: Optional[UUID] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        type: Optional[str] = None,
+        status: Optional[str] = None,
+        cursor: Optional[str] = None,
+    ) -> Iterator[AppointmentSchema | AppointmentOccurrenceSchema]:
+        pass
+
+    @abstractmethod
+    def update(  # noqa: PLR0913
+        self,
+        appointment_id: int,
+        appointment: CreateAppointmentSchema,
+        patient_id: Optional[UUID] = None,
+        not_before: Optional[datetime] = None,
+        version: Optional[int] = None,
+    ) -> AppointmentSchema | None:
+        pass
+
+    @abstractmethod
+    def has_time_conflict(
+        self, professional_id: UUID, start: datetime, duration: int, exclude_id: Optional[int] = None
+    ) -> bool:
+        pass
+
+    @abstractmethod
+    def get_agenda(
+        self, professional_id: UUID, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None
+    ) -> list[AppointmentSchema | AppointmentOccurrenceSchema]:
+        pass
+
+    @abstractmethod
+    def get_busy_intervals(
+        self, start: datetime, end: datetime, professional_ids: Optional[list[UUID]] = None
+    ) -> dict[UUID, list[tuple[datetime, datetime]]]:
+        pass
+
+    @abstractmethod
+    def get_batch_schedule(
+        self, start: datetime, end: datetime, professional_ids: Optional[list[UUID]], patient_ids: list[UUID]
+    ) -> tuple[dict[UUID, list[tuple[datetime, datetime]]], set[UUID]]:
+        pass
+
+    @abstractmethod
+    def materialize_series(
+        self, professional_id: Optional[UUID] = None, patient_id: Optional[UUID] = None
     ) -> list[AppointmentSchema]:
         pass
 
     @abstractmethod
-    def update(self, appointment_id: int, appointment: CreateAppointmentSchema) -> AppointmentSchema:
+    def cancel_series(self, series_id: int, after: datetime) -> None:
         pass
 
     @abstractmethod
@@ -32,5 +93,5 @@ class AppointmentRepositoryInterface(ABC):
         pass
 
     @abstractmethod
-    def cancel(self, appointment_id: int) -> None:
+    def cancel(self, appointment_id: int, patient_id: Optional[UUID] = None) -> AppointmentSchema | None:
         pass
@@ -0,0 +1,18 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from vidaplus.main.schemas.appointment_series import AppointmentSeriesSchema, CreateAppointmentSeriesSchema
+
+
+class AppointmentSeriesRepositoryInterface(ABC):
+    @abstractmethod
+    def create(self, series: CreateAppointmentSeriesSchema, ends_at: datetime) -> AppointmentSeriesSchema:
+        pass
+
+    @abstractmethod
+    def get_by_id(self, series_id: int) -> AppointmentSeriesSchema | None:
+        pass
+
+    @abstractmethod
+    def cancel(self, series_id: int) -> None:
+        pass
@@ -0,0 +1,31 @@
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, Optional
+
+from vidaplus.main.schemas.admission import AdmissionSchema, CreateAdmissionSchema, UpdateAdmissionSchema
+from vidaplus.main.schemas.page import PageSchema
+
+
+class AsyncAdmissionRepositoryInterface(ABC):
+    @abstractmethod
+    async def create(self, data: CreateAdmissionSchema) -> AdmissionSchema:
+        pass
+
+    @abstractmethod
+    async def all(self, cursor: Optional[str] = None, limit: Optional[int] = None) -> PageSchema[AdmissionSchema]:
+        pass
+
+    @abstractmethod
+    def stream(self, cursor: Optional[str] = None) -> AsyncIterator[AdmissionSchema]:
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, admission_id: int) -> AdmissionSchema | None:
+        pass
+
+    @abstractmethod
+    async def update(self, admission_id: int, data: UpdateAdmissionSchema) -> AdmissionSchema | None:
+        pass
+
+    @abstractmethod
+    async def delete(self, admission_id: int) -> bool:
+        pass
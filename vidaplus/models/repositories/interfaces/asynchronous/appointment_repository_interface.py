@@ -0,0 +1,97 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import AsyncIterator, Optional
+from uuid import UUID
+
+from vidaplus.main.schemas.appointment import AppointmentOccurrenceSchema, AppointmentSchema, CreateAppointmentSchema
+from vidaplus.main.schemas.page import PageSchema
+
+
+class AsyncAppointmentRepositoryInterface(ABC):
+    @abstractmethod
+    async def create(self, new_appointment: CreateAppointmentSchema) -> AppointmentSchema:
+        pass
+
+    @abstractmethod
+    async def create_many(self, new_appointments: list[CreateAppointmentSchema]) -> list[AppointmentSchema]:
+        pass
+
+    @abstractmethod
+    async def get(  # noqa: PLR0913
+        self,
+        patient_id: Optional[UUID] = None,
+        professional_id: Optional[UUID] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        type: Optional[str] = None,
+        status: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> PageSchema[AppointmentSchema | AppointmentOccurrenceSchema]:
+        pass
+
+    @abstractmethod
+    def stream(  # noqa: PLR0913
+        self,
+        patient_id: Optional[UUID] = None,
+        professional_id: Optional[UUID] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        type: Optional[str] = None,
+        status: Optional[str] = None,
+        cursor: Optional[str] = None,
+    ) -> AsyncIterator[AppointmentSchema | AppointmentOccurrenceSchema]:
+        pass
+
+    @abstractmethod
+    async def update(  # noqa: PLR0913
+        self,
+        appointment_id: int,
+        appointment: CreateAppointmentSchema,
+        patient_id: Optional[UUID] = None,
+        not_before: Optional[datetime] = None,
+        version: Optional[int] = None,
+    ) -> AppointmentSchema | None:
+        pass
+
+    @abstractmethod
+    async def has_time_conflict(
+        self, professional_id: UUID, start: datetime, duration: int, exclude_id: Optional[int] = None
+    ) -> bool:
+        pass
+
+    @abstractmethod
+    async def get_agenda(
+        self, professional_id: UUID, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None
+    ) -> list[AppointmentSchema | AppointmentOccurrenceSchema]:
+        pass
+
+    @abstractmethod
+    async def get_busy_intervals(
+        self, start: datetime, end: datetime, professional_ids: Optional[list[UUID]] = None
+    ) -> dict[UUID, list[tuple[datetime, datetime]]]:
+        pass
+
+    @abstractmethod
+    async def get_batch_schedule(
+        self, start: datetime, end: datetime, professional_ids: Optional[list[UUID]], patient_ids: list[UUID]
+    ) -> tuple[dict[UUID, list[tuple[datetime, datetime]]], set[UUID]]:
+        pass
+
+    @abstractmethod
+    async def materialize_series(
+        self, professional_id: Optional[UUID] = None, patient_id: Optional[UUID] = None
+    ) -> list[AppointmentSchema]:
+        pass
+
+    @abstractmethod
+    async def cancel_series(self, series_id: int, after: datetime) -> None:
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, appointment_id: int) -> AppointmentSchema | None:
+        pass
+
+    @abstractmethod
+    async def cancel(self, appointment_id: int, patient_id: Optional[UUID] = None) -> AppointmentSchema | None:
+        pass
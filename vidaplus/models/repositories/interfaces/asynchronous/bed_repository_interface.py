@@ -0,0 +1,40 @@
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, Optional
+
+from vidaplus.main.enums.bed_types import BedTypes
+from vidaplus.main.schemas.bed import BedSchema, CreateBedSchema
+from vidaplus.main.schemas.page import PageSchema
+
+
+class AsyncBedRepositoryInterface(ABC):
+    @abstractmethod
+    async def create(self, bed: CreateBedSchema) -> BedSchema:
+        pass
+
+    @abstractmethod
+    async def all(self, cursor: Optional[str] = None, limit: Optional[int] = None) -> PageSchema[BedSchema]:
+        pass
+
+    @abstractmethod
+    def stream(self, cursor: Optional[str] = None) -> AsyncIterator[BedSchema]:
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, bed_id: int) -> BedSchema | None:
+        pass
+
+    @abstractmethod
+    async def update(self, bed_id: int, bed: CreateBedSchema, version: Optional[int] = None) -> BedSchema | None:
+        pass
+
+    @abstractmethod
+    async def occupy(self, bed_id: int) -> BedSchema | None:
+        pass
+
+    @abstractmethod
+    async def claim(self, unit_id: int, type: BedTypes) -> BedSchema | None:
+        pass
+
+    @abstractmethod
+    async def delete(self, bed_id: int) -> bool:
+        pass
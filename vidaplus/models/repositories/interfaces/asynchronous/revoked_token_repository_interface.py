@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+
+class AsyncRevokedTokenRepositoryInterface(ABC):
+    @abstractmethod
+    async def add(self, jti: str, expires_at: datetime) -> bool:
+        pass
+
+    @abstractmethod
+    async def exists(self, jti: str) -> bool:
+        pass
+
+    @abstractmethod
+    async def since(self, last_id: int) -> list[tuple[int, str]]:
+        pass
+
+    @abstractmethod
+    async def delete_expired(self) -> int:
+        pass
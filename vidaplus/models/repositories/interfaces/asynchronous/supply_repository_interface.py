@@ -0,0 +1,33 @@
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, Optional
+
+from vidaplus.main.schemas.page import PageSchema
+from vidaplus.main.schemas.supply import CreateSupplySchema, SupplySchema
+
+
+class AsyncSupplyRepositoryInterface(ABC):
+    @abstractmethod
+    async def create(self, supply: CreateSupplySchema) -> SupplySchema:
+        pass
+
+    @abstractmethod
+    async def all(self, cursor: Optional[str] = None, limit: Optional[int] = None) -> PageSchema[SupplySchema]:
+        pass
+
+    @abstractmethod
+    def stream(self, cursor: Optional[str] = None) -> AsyncIterator[SupplySchema]:
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, supply_id: int) -> SupplySchema | None:
+        pass
+
+    @abstractmethod
+    async def update(
+        self, supply_id: int, supply: CreateSupplySchema, version: Optional[int] = None
+    ) -> SupplySchema | None:
+        pass
+
+    @abstractmethod
+    async def delete(self, supply_id: int) -> bool:
+        pass
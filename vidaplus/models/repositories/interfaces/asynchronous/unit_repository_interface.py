@@ -0,0 +1,31 @@
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, Optional
+
+from vidaplus.main.schemas.page import PageSchema
+from vidaplus.main.schemas.unit import CreateUnitSchema, UnitSchema
+
+
+class AsyncUnitRepositoryInterface(ABC):
+    @abstractmethod
+    async def create(self, unit: CreateUnitSchema) -> UnitSchema:
+        pass
+
+    @abstractmethod
+    async def all(self, cursor: Optional[str] = None, limit: Optional[int] = None) -> PageSchema[UnitSchema]:
+        pass
+
+    @abstractmethod
+    def stream(self, cursor: Optional[str] = None) -> AsyncIterator[UnitSchema]:
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, id: int) -> UnitSchema | None:
+        pass
+
+    @abstractmethod
+    async def update(self, id: int, unit: CreateUnitSchema) -> UnitSchema | None:
+        pass
+
+    @abstractmethod
+    async def delete(self, id: int) -> bool:
+        pass
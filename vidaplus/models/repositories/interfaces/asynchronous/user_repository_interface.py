@@ -0,0 +1,43 @@
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, Optional
+from uuid import UUID
+
+from vidaplus.main.enums.roles import Roles
+from vidaplus.main.schemas.page import PageSchema
+from vidaplus.main.schemas.user import CreateUserSchema, UserSchema
+
+
+class AsyncUserRepositoryInterface(ABC):
+    @abstractmethod
+    async def create(self, new_user: CreateUserSchema) -> UserSchema | None:
+        pass
+
+    @abstractmethod
+    async def get_by_email(self, email: str) -> UserSchema | None:
+        pass
+
+    @abstractmethod
+    async def get_all(
+        self, role: Optional[Roles], cursor: Optional[str] = None, limit: Optional[int] = None
+    ) -> PageSchema[UserSchema]:
+        pass
+
+    @abstractmethod
+    def stream(self, role: Optional[Roles] = None, cursor: Optional[str] = None) -> AsyncIterator[UserSchema]:
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, user_id: UUID) -> UserSchema | None:
+        pass
+
+    @abstractmethod
+    async def update(self, user_id: UUID, user: CreateUserSchema, role: Optional[Roles] = None) -> UserSchema | None:
+        pass
+
+    @abstractmethod
+    async def update_password(self, user_id: UUID, password: str) -> None:
+        pass
+
+    @abstractmethod
+    async def delete(self, user_id: UUID) -> bool:
+        pass
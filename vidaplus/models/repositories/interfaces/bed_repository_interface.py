@@ -1,6 +1,9 @@
 from abc import ABC, abstractmethod
+from typing import Iterator, Optional
 
+from vidaplus.main.enums.bed_types import BedTypes
 from vidaplus.main.schemas.bed import BedSchema, CreateBedSchema
+from vidaplus.main.schemas.page import PageSchema
 
 
 class BedRepositoryInterface(ABC):
@@ -9,7 +12,11 @@ class BedRepositoryInterface(ABC):
         pass
 
     @abstractmethod
-    def all(self) -> list[BedSchema]:
+    def all(self, cursor: Optional[str] = None, limit: Optional[int] = None) -> PageSchema[BedSchema]:
+        pass
+
+    @abstractmethod
+    def stream(self, cursor: Optional[str] = None) -> Iterator[BedSchema]:
         pass
 
     @abstractmethod
@@ -17,9 +24,17 @@ class BedRepositoryInterface(ABC):
         pass
 
     @abstractmethod
-    def update(self, bed_id: int, bed: CreateBedSchema) -> BedSchema:
+    def update(self, bed_id: int, bed: CreateBedSchema, version: Optional[int] = None) -> BedSchema | None:
+        pass
+
+    @abstractmethod
+    def occupy(self, bed_id: int) -> BedSchema | None:
+        pass
+
+    @abstractmethod
+    def claim(self, unit_id: int, type: BedTypes) -> BedSchema | None:
         pass
 
     @abstractmethod
-    def delete(self, bed_id: int) -> None:
+    def delete(self, bed_id: int) -> bool:
         pass
@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+
+class RevokedTokenRepositoryInterface(ABC):
+    @abstractmethod
+    def add(self, jti: str, expires_at: datetime) -> bool:
+        pass
+
+    @abstractmethod
+    def exists(self, jti: str) -> bool:
+        pass
+
+    @abstractmethod
+    def since(self, last_id: int) -> list[tuple[int, str]]:
+        pass
+
+    @abstractmethod
+    def delete_expired(self) -> int:
+        pass
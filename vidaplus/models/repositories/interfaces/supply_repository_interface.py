@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
+from typing import Iterator, Optional
 
+from vidaplus.main.schemas.page import PageSchema
 from vidaplus.main.schemas.supply import CreateSupplySchema, SupplySchema
 
 
@@ -9,7 +11,11 @@ class SupplyRepositoryInterface(ABC):
         pass
 
     @abstractmethod
-    def all(self) -> list[SupplySchema]:
+    def all(self, cursor: Optional[str] = None, limit: Optional[int] = None) -> PageSchema[SupplySchema]:
+        pass
+
+    @abstractmethod
+    def stream(self, cursor: Optional[str] = None) -> Iterator[SupplySchema]:
         pass
 
     @abstractmethod
@@ -17,9 +23,9 @@ class SupplyRepositoryInterface(ABC):
         pass
 
     @abstractmethod
-    def update(self, supply_id: int, supply: CreateSupplySchema) -> SupplySchema:
+    def update(self, supply_id: int, supply: CreateSupplySchema, version: Optional[int] = None) -> SupplySchema | None:
         pass
 
     @abstractmethod
-    def delete(self, supply_id: int) -> None:
+    def delete(self, supply_id: int) -> bool:
         pass
@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
+from typing import Iterator, Optional
 
+from vidaplus.main.schemas.page import PageSchema
 from vidaplus.main.schemas.unit import CreateUnitSchema, UnitSchema
 
 
@@ -9,7 +11,11 @@ class UnitRepositoryInterface(ABC):
         pass
 
     @abstractmethod
-    def all(self) -> list[UnitSchema]:
+    def all(self, cursor: Optional[str] = None, limit: Optional[int] = None) -> PageSchema[UnitSchema]:
+        pass
+
+    @abstractmethod
+    def stream(self, cursor: Optional[str] = None) -> Iterator[UnitSchema]:
         pass
 
     @abstractmethod
@@ -17,9 +23,9 @@ class UnitRepositoryInterface(ABC):
         pass
 
     @abstractmethod
-    def update(self, id: int, unit: CreateUnitSchema) -> UnitSchema:
+    def update(self, id: int, unit: CreateUnitSchema) -> UnitSchema | None:
         pass
 
     @abstractmethod
-    def delete(self, id: int) -> None:
+    def delete(self, id: int) -> bool:
         pass
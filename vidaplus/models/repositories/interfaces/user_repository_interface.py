@@ -1,14 +1,15 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Iterator, Optional
 from uuid import UUID
 
 from vidaplus.main.enums.roles import Roles
+from vidaplus.main.schemas.page import PageSchema
 from vidaplus.main.schemas.user import CreateUserSchema, UserSchema
 
 
 class UserRepositoryInterface(ABC):
     @abstractmethod
-    def create(self, new_user: CreateUserSchema) -> UserSchema:
+    def create(self, new_user: CreateUserSchema) -> UserSchema | None:
         pass
 
     @abstractmethod
@@ -16,7 +17,13 @@ class UserRepositoryInterface(ABC):
         pass
 
     @abstractmethod
-    def get_all(self, role: Optional[Roles]) -> list[UserSchema]:
+    def get_all(
+        self, role: Optional[Roles], cursor: Optional[str] = None, limit: Optional[int] = None
+    ) -> PageSchema[UserSchema]:
+        pass
+
+    @abstractmethod
+    def stream(self, role: Optional[Roles] = None, cursor: Optional[str] = None) -> Iterator[UserSchema]:
         pass
 
     @abstractmethod
@@ -24,9 +31,13 @@ class UserRepositoryInterface(ABC):
         pass
 
     @abstractmethod
-    def update(self, user_id: UUID, user: CreateUserSchema) -> UserSchema:
+    def update(self, user_id: UUID, user: CreateUserSchema, role: Optional[Roles] = None) -> UserSchema | None:
+        pass
+
+    @abstractmethod
+    def update_password(self, user_id: UUID, password: str) -> None:
         pass
 
     @abstractmethod
-    def delete(self, user_id: UUID) -> None:
+    def delete(self, user_id: UUID) -> bool:
         pass
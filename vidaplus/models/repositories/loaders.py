@@ -0,0 +1,14 @@
+"""Perfis de carregamento dos relacionamentos.
+
+Os relacionamentos que nenhum esquema de resposta serializa (`Unit.beds`, `Unit.supplies`, `Bed.admissions`,
+`Admission.bed` e `Admission.patient`) são mapeados com `lazy='noload'` e não são carregados. `Bed.unit` continua com
+JOIN, porque `BedSchema` inclui a unidade; como o JOIN não vale para `UPDATE ... RETURNING`, essas escritas pedem
+`WITH_UNIT`. Uma leitura que passe a precisar de outro relacionamento declara aqui o seu perfil e o pede em
+`options(...)`.
+"""
+
+from sqlalchemy.orm import selectinload
+
+from vidaplus.models.entities.bed import Bed
+
+WITH_UNIT = selectinload(Bed.unit)
@@ -0,0 +1,78 @@
+import base64
+import binascii
+import json
+from typing import Any, Callable, Optional, Sequence, TypeVar
+
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import Select, tuple_
+from sqlalchemy.orm import InstrumentedAttribute
+
+from vidaplus.main.exceptions import InvalidCursorError
+from vidaplus.main.schemas.page import PageSchema
+from vidaplus.settings import Settings
+
+T = TypeVar('T')
+R = TypeVar('R', bound=tuple[Any, ...])
+
+
+def page_limit(limit: Optional[int]) -> int:
+    settings = Settings()
+    return min(limit or settings.PAGINATION_DEFAULT_LIMIT, settings.PAGINATION_MAX_LIMIT)
+
+
+class Keyset:
+    """Paginação por chave (keyset) sobre colunas que formam uma ordem total, como `(date_time, id)`.
+
+    Cada página continua a partir da chave do último item da anterior (`WHERE (colunas) > (cursor)`), usando o índice
+    composto das colunas; o custo não depende da profundidade da página, ao contrário de `OFFSET`. O cursor é a chave
+    serializada em JSON e codificada em base64, opaca para o cliente.
+    """
+
+    def __init__(self, *columns: InstrumentedAttribute[Any]) -> None:
+        self.columns = columns
+        self.adapters = [TypeAdapter(column.type.python_type) for column in columns]
+
+    def encode(self, key: tuple[Any, ...]) -> str:
+        values = [adapter.dump_python(value, mode='json') for adapter, value in zip(self.adapters, key)]
+        return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+    def decode(self, cursor: str) -> tuple[Any, ...]:
+        try:
+            values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+
+            if not isinstance(values, list) or len(values) != len(self.adapters):
+                raise InvalidCursorError()
+
+            return tuple(adapter.validate_python(value) for adapter, value in zip(self.adapters, values))
+        except (binascii.Error, UnicodeError, ValueError, ValidationError) as e:
+            raise InvalidCursorError() from e
+
+    def key(self, item: Any) -> tuple[Any, ...]:
+        return tuple(getattr(item, column.key) for column in self.columns)
+
+    def after(self, query: Select[R], cursor: Optional[str]) -> Select[R]:
+        """Ordena pela chave, começando depois do cursor quando ele é informado."""
+        if cursor:
+            query = query.where(tuple_(*self.columns) > tuple_(*self.decode(cursor)))
+
+        return query.order_by(*self.columns)
+
+    def apply(self, query: Select[R], cursor: Optional[str], limit: int) -> Select[R]:
+        """Busca um item além do limite, para saber se há próxima página."""
+        return self.after(query, cursor).limit(limit + 1)
+
+    def stream(self, query: Select[R], cursor: Optional[str]) -> Select[R]:
+        """Todos os itens depois do cursor, lidos do banco em lotes de `STREAM_YIELD_PER` linhas.
+
+        `yield_per` faz a sessão usar um cursor do lado do servidor (quando o driver oferece) e descartar cada lote
+        depois de entregue, de modo que a memória não cresce com o tamanho do resultado.
+        """
+        return self.after(query, cursor).execution_options(yield_per=Settings().STREAM_YIELD_PER)
+
+    def page(
+        self, items: Sequence[T], limit: int, key: Optional[Callable[[T], tuple[Any, ...]]] = None
+    ) -> PageSchema[T]:
+        if len(items) <= limit:
+            return PageSchema(items=list(items))
+
+        return PageSchema(items=list(items[:limit]), next_cursor=self.encode((key or self.key)(items[limit - 1])))
@@ -0,0 +1,62 @@
+from typing import Any, Generic, Iterable, Sequence, TypeVar
+
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import Row, Select, select
+from sqlalchemy.orm import InstrumentedAttribute
+
+from vidaplus.models.config.base import Base
+
+S = TypeVar('S', bound=BaseModel)
+
+
+class Projection(Generic[S]):
+    """Leitura só das colunas que um esquema usa, com linhas que não passam pelo ORM.
+
+    Selecionar colunas, e não entidades, dispensa o identity map, os carregadores de relacionamentos e a criação de
+    objetos que seriam descartados logo após a conversão. Cada linha vira um dicionário com os campos do esquema,
+    validado em lote. Esquemas aninhados, como a unidade de um leito, são lidos com um JOIN pelo relacionamento
+    informado em `nested`. As escritas continuam usando as entidades.
+    """
+
+    def __init__(self, schema: type[S], entity: type[Base], **nested: InstrumentedAttribute[Any]) -> None:
+        self.fields = columns(schema, entity)
+        self.nested: list[tuple[str, list[str]]] = []
+        self.joins = list(nested.values())
+        self.columns = [getattr(entity, name) for name in self.fields]
+        self.adapter = TypeAdapter(list[schema])  # type: ignore[valid-type]
+        self.item_adapter = TypeAdapter(schema)
+
+        for field, relationship in nested.items():
+            target = relationship.property.mapper.class_
+            names = columns(schema.model_fields[field].annotation, target)  # type: ignore[arg-type]
+            self.nested.append((field, names))
+            self.columns.extend(getattr(target, name).label(f'{field}__{name}') for name in names)
+
+    def select(self) -> Select[Any]:
+        query = select(*self.columns)
+
+        for relationship in self.joins:
+            query = query.join(relationship)
+
+        return query
+
+    def record(self, row: Row[Any]) -> dict[str, Any]:
+        values = iter(row)
+        record = dict(zip(self.fields, values))
+
+        for field, names in self.nested:
+            record[field] = dict(zip(names, values))
+
+        return record
+
+    def one(self, row: Row[Any]) -> S:
+        return self.item_adapter.validate_python(self.record(row))
+
+    def all(self, rows: Iterable[Row[Any]]) -> list[S]:
+        return self.adapter.validate_python([self.record(row) for row in rows])
+
+
+def columns(schema: type[BaseModel], entity: type[Base]) -> list[str]:
+    """Campos do esquema que são colunas da entidade, na ordem do esquema."""
+    table_columns: Sequence[str] = entity.__table__.columns.keys()
+    return [name for name in schema.model_fields if name in table_columns]
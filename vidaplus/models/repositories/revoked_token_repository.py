@@ -0,0 +1,50 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import Insert, delete, select
+from sqlalchemy.dialects import postgresql, sqlite
+
+from vidaplus.models.config.unit_of_work import UnitOfWork
+from vidaplus.models.entities.revoked_token import RevokedToken
+from vidaplus.models.repositories.interfaces.revoked_token_repository_interface import (
+    RevokedTokenRepositoryInterface,
+)
+
+
+def insert_revocation(dialect: str) -> Insert:
+    # Duas revogações concorrentes do mesmo token passam pela verificação; a segunda esbarra no `jti` único.
+    dialect_insert = postgresql.insert if dialect == 'postgresql' else sqlite.insert
+    return dialect_insert(RevokedToken).on_conflict_do_nothing(index_elements=[RevokedToken.jti])
+
+
+class RevokedTokenRepository(RevokedTokenRepositoryInterface):
+    def __init__(self, uow: UnitOfWork) -> None:
+        self.uow = uow
+
+    def add(self, jti: str, expires_at: datetime) -> bool:
+        """Retorna `False` se o token já estava revogado."""
+        dialect = self.uow.session.get_bind().dialect.name
+        # Gravado em UTC, para que a comparação com `now` funcione também em bancos sem fuso, como o SQLite.
+        revocation_id = self.uow.session.scalar(
+            insert_revocation(dialect)
+            .values(jti=jti, expires_at=expires_at.astimezone(timezone.utc))
+            .returning(RevokedToken.id)
+        )
+        return revocation_id is not None
+
+    def exists(self, jti: str) -> bool:
+        return self.uow.session.scalar(select(RevokedToken.id).where(RevokedToken.jti == jti)) is not None
+
+    def since(self, last_id: int) -> list[tuple[int, str]]:
+        """Revogações ainda válidas com id maior que `last_id`, em ordem de id."""
+        rows = self.uow.session.execute(
+            select(RevokedToken.id, RevokedToken.jti)
+            .where(RevokedToken.id > last_id, RevokedToken.expires_at > datetime.now(timezone.utc))
+            .order_by(RevokedToken.id)
+        )
+        return [(row.id, row.jti) for row in rows]
+
+    def delete_expired(self) -> int:
+        result = self.uow.session.execute(
+            delete(RevokedToken).where(RevokedToken.expires_at <= datetime.now(timezone.utc))
+        )
+        return result.rowcount
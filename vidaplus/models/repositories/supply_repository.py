@@ -1,64 +1,54 @@
-from sqlalchemy import select
+from typing import Iterator, Optional
 
+from pydantic import TypeAdapter
+from sqlalchemy import delete, select, update
+
+from vidaplus.main.schemas.page import PageSchema
 from vidaplus.main.schemas.supply import CreateSupplySchema, SupplySchema
-from vidaplus.models.config.connection import DatabaseConnectionHandler
+from vidaplus.models.config.unit_of_work import UnitOfWork
 from vidaplus.models.entities.supply import Supply
 from vidaplus.models.repositories.interfaces.supply_repository_interface import SupplyRepositoryInterface
+from vidaplus.models.repositories.pagination import Keyset, page_limit
+
+SUPPLY_KEYSET = Keyset(Supply.id)
+SUPPLY_LIST = TypeAdapter(list[SupplySchema])
 
 
 class SupplyRepository(SupplyRepositoryInterface):
+    def __init__(self, uow: UnitOfWork) -> None:
+        self.uow = uow
+
     def create(self, data: CreateSupplySchema) -> SupplySchema:
-        with DatabaseConnectionHandler() as db:
-            try:
-                supply = Supply(**data.model_dump())
-                db.session.add(supply)
-                db.session.commit()
-                db.session.refresh(supply)
-                return SupplySchema.model_validate(supply)
-            except Exception as ex:
-                db.session.rollback()
-                raise ex
+        supply = Supply(**data.model_dump())
+        self.uow.session.add(supply)
+        self.uow.session.flush()
+        self.uow.session.refresh(supply)
+        return SupplySchema.model_validate(supply)
 
-    def all(self) -> list[SupplySchema]:
-        with DatabaseConnectionHandler() as db:
-            try:
-                supplies = db.session.query(Supply).all()
-                return [SupplySchema.model_validate(supply) for supply in supplies]
-            except Exception as ex:
-                db.session.rollback()
-                raise ex
+    def all(self, cursor: Optional[str] = None, limit: Optional[int] = None) -> PageSchema[SupplySchema]:
+        limit = page_limit(limit)
+        supplies = self.uow.session.scalars(SUPPLY_KEYSET.apply(select(Supply), cursor, limit))
+        return SUPPLY_KEYSET.page(SUPPLY_LIST.validate_python(supplies.all(), from_attributes=True), limit)
 
-    def get_by_id(self, supply_id: int) -> SupplySchema | None:
-        with DatabaseConnectionHandler() as db:
-            try:
-                supply = db.session.scalar(select(Supply).where(Supply.id == supply_id))
-                return SupplySchema.model_validate(supply) if supply else None
-            except Exception as ex:
-                db.session.rollback()
-                raise ex
+    def stream(self, cursor: Optional[str] = None) -> Iterator[SupplySchema]:
+        for supply in self.uow.session.scalars(SUPPLY_KEYSET.stream(select(Supply), cursor)):
+            yield SupplySchema.model_validate(supply)
 
-    def update(self, supply_id: int, data: CreateSupplySchema) -> SupplySchema:
-        with DatabaseConnectionHandler() as db:
-            try:
-                supply = db.session.scalar(select(Supply).where(Supply.id == supply_id))
+    def get_by_id(self, supply_id: int) -> SupplySchema | None:
+        supply = self.uow.session.scalar(select(Supply).where(Supply.id == supply_id))
+        return SupplySchema.model_validate(supply) if supply else None
 
-                for key, value in data.model_dump().items():
-                    setattr(supply, key, value)
+    def update(self, supply_id: int, data: CreateSupplySchema, version: Optional[int] = None) -> SupplySchema | None:
+        query = update(Supply).where(Supply.id == supply_id)
 
-                db.session.commit()
-                db.session.refresh(supply)
+        if version is not None:
+            query = query.where(Supply.version == version)
 
-                return SupplySchema.model_validate(supply)
-            except Exception as ex:
-                db.session.rollback()
-                raise ex
+        supply = self.uow.session.scalar(
+            query.values(**data.model_dump(), version=Supply.version + 1).returning(Supply)
+        )
+        return SupplySchema.model_validate(supply) if supply else None
 
-    def delete(self, supply_id: int) -> None:
-        with DatabaseConnectionHandler() as db:
-            try:
-                supply = db.session.scalar(select(Supply).where(Supply.id == supply_id))
-                db.session.delete(supply)
-                db.session.commit()
-            except Exception as ex:
-                db.session.rollback()
-                raise ex
+    def delete(self, supply_id: int) -> bool:
+        deleted = self.uow.session.scalar(delete(Supply).where(Supply.id == supply_id).returning(Supply.id))
+        return deleted is not None
@@ -1,69 +1,55 @@
-from sqlalchemy import select
+from typing import Iterator, Optional
 
+from pydantic import TypeAdapter
+from sqlalchemy import delete, select, update
+
+from vidaplus.main.schemas.page import PageSchema
 from vidaplus.main.schemas.unit import CreateUnitSchema, UnitSchema
-from vidaplus.models.config.connection import DatabaseConnectionHandler
+from vidaplus.models.config.unit_of_work import UnitOfWork
 from vidaplus.models.entities.unit import Unit
 from vidaplus.models.repositories.interfaces.unit_repository_interface import UnitRepositoryInterface
+from vidaplus.models.repositories.pagination import Keyset, page_limit
 
+UNIT_KEYSET = Keyset(Unit.id)
+UNIT_LIST = TypeAdapter(list[UnitSchema])
 
-class UnitRepository(UnitRepositoryInterface):
-    def create(self, unit: CreateUnitSchema) -> UnitSchema:
-        with DatabaseConnectionHandler() as db:
-            try:
-                unit_db = Unit(**unit.model_dump())
-                db.session.add(unit_db)
-                db.session.commit()
-                db.session.refresh(unit_db)
 
-                return UnitSchema.model_validate(unit_db)
-            except Exception as ex:
-                db.session.rollback()
-                raise ex
+class UnitRepository(UnitRepositoryInterface):
+    def __init__(self, uow: UnitOfWork) -> None:
+        self.uow = uow
 
-    def all(self) -> list[UnitSchema]:
-        with DatabaseConnectionHandler() as db:
-            try:
-                units = db.session.scalars(select(Unit))
-                return [UnitSchema.model_validate(unit) for unit in units]
-            except Exception as ex:
-                db.session.rollback()
-                raise ex
+    def create(self, unit: CreateUnitSchema) -> UnitSchema:
+        unit_db = Unit(**unit.model_dump())
+        self.uow.session.add(unit_db)
+        self.uow.session.flush()
+        self.uow.session.refresh(unit_db)
 
-    def get_by_id(self, unit_id: int) -> UnitSchema | None:
-        with DatabaseConnectionHandler() as db:
-            try:
-                unit = db.session.scalar(select(Unit).where(Unit.id == unit_id))
+        return UnitSchema.model_validate(unit_db)
 
-                if not unit:
-                    return None
+    def all(self, cursor: Optional[str] = None, limit: Optional[int] = None) -> PageSchema[UnitSchema]:
+        limit = page_limit(limit)
+        units = self.uow.session.scalars(UNIT_KEYSET.apply(select(Unit), cursor, limit))
+        return UNIT_KEYSET.page(UNIT_LIST.validate_python(units.all(), from_attributes=True), limit)
 
-                return UnitSchema.model_validate(unit)
-            except Exception as ex:
-                db.session.rollback()
-                raise ex
+    def stream(self, cursor: Optional[str] = None) -> Iterator[UnitSchema]:
+        for unit in self.uow.session.scalars(UNIT_KEYSET.stream(select(Unit), cursor)):
+            yield UnitSchema.model_validate(unit)
 
-    def update(self, unit_id: int, unit: CreateUnitSchema) -> UnitSchema:
-        with DatabaseConnectionHandler() as db:
-            try:
-                unit_db = db.session.scalar(select(Unit).where(Unit.id == unit_id))
+    def get_by_id(self, unit_id: int) -> UnitSchema | None:
+        unit = self.uow.session.scalar(select(Unit).where(Unit.id == unit_id))
 
-                for k, v in unit.model_dump().items():
-                    setattr(unit_db, k, v)
+        if not unit:
+            return None
 
-                db.session.commit()
-                db.session.refresh(unit_db)
+        return UnitSchema.model_validate(unit)
 
-                return UnitSchema.model_validate(unit_db)
-            except Exception as ex:
-                db.session.rollback()
-                raise ex
+    def update(self, unit_id: int, unit: CreateUnitSchema) -> UnitSchema | None:
+        unit_db = self.uow.session.scalar(
+            update(Unit).where(Unit.id == unit_id).values(**unit.model_dump()).returning(Unit)
+        )
+        return UnitSchema.model_validate(unit_db) if unit_db else None
 
-    def delete(self, unit_id: int) -> None:
-        with DatabaseConnectionHandler() as db:
-            try:
-                unit = db.session.get(Unit, unit_id)
-                db.session.delete(unit)
-                db.session.commit()
-            except Exception as ex:
-                db.session.rollback()
-                raise ex
+    def delete(self, unit_id: int) -> bool:
+        # Leitos, internações e insumos são removidos pelo `ON DELETE CASCADE` do banco.
+        deleted = self.uow.session.scalar(delete(Unit).where(Unit.id == unit_id).returning(Unit.id))
+        return deleted is not None
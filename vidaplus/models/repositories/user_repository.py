@@ -1,82 +1,82 @@
-from typing import Optional
+from typing import Iterator, Optional
 from uuid import UUID
 
-from sqlalchemy import select
+from pydantic import TypeAdapter
+from sqlalchemy import Insert, delete, func, select, update
+from sqlalchemy.dialects import postgresql, sqlite
 
 from vidaplus.main.enums.roles import Roles
+from vidaplus.main.schemas.page import PageSchema
 from vidaplus.main.schemas.user import CreateUserSchema, UserSchema
-from vidaplus.models.config.connection import DatabaseConnectionHandler
+from vidaplus.models.config.unit_of_work import UnitOfWork
 from vidaplus.models.entities.user import User
 from vidaplus.models.repositories.interfaces.user_repository_interface import UserRepositoryInterface
+from vidaplus.models.repositories.pagination import Keyset, page_limit
+
+USER_KEYSET = Keyset(User.id)
+USER_LIST = TypeAdapter(list[UserSchema])
+
+
+def insert_user(dialect: str) -> Insert:
+    # Um email já cadastrado, em qualquer combinação de maiúsculas, esbarra em `ix_user_lower_email` e não gera linha
+    # nem erro, o que torna o cadastro uma única instrução, sem corrida entre a verificação e a inserção.
+    dialect_insert = postgresql.insert if dialect == 'postgresql' else sqlite.insert
+    return dialect_insert(User).on_conflict_do_nothing(index_elements=[func.lower(User.email)])
 
 
 class UserRepository(UserRepositoryInterface):
-    def create(self, new_user: CreateUserSchema) -> UserSchema:
-        with DatabaseConnectionHandler() as db:
-            try:
-                user = User(**new_user.model_dump())
-                db.session.add(user)
-                db.session.commit()
-                db.session.refresh(user)
-                return UserSchema.model_validate(user)
-            except Exception as ex:
-                db.session.rollback()
-                raise ex
-
-    def get_all(self, role: Optional[Roles] = None) -> list[UserSchema]:
-        with DatabaseConnectionHandler() as db:
-            try:
-                query = select(User)
-
-                if role:
-                    query = query.filter(User.role == role)
-
-                users = db.session.scalars(query).all()
-                return [UserSchema.model_validate(user) for user in users]
-            except Exception as ex:
-                db.session.rollback()
-                raise ex
+    def __init__(self, uow: UnitOfWork) -> None:
+        self.uow = uow
+
+    def create(self, new_user: CreateUserSchema) -> UserSchema | None:
+        """Retorna `None` se já existe um usuário com o email, sem diferenciar maiúsculas."""
+        dialect = self.uow.session.get_bind().dialect.name
+        user = self.uow.session.scalar(insert_user(dialect).values(**new_user.model_dump()).returning(User))
+        return UserSchema.model_validate(user) if user else None
+
+    def get_all(
+        self, role: Optional[Roles] = None, cursor: Optional[str] = None, limit: Optional[int] = None
+    ) -> PageSchema[UserSchema]:
+        limit = page_limit(limit)
+        query = select(User)
+
+        if role:
+            query = query.filter(User.role == role)
+
+        users = self.uow.session.scalars(USER_KEYSET.apply(query, cursor, limit))
+        return USER_KEYSET.page(USER_LIST.validate_python(users.all(), from_attributes=True), limit)
+
+    def stream(self, role: Optional[Roles] = None, cursor: Optional[str] = None) -> Iterator[UserSchema]:
+        query = select(User)
+
+        if role:
+            query = query.filter(User.role == role)
+
+        for user in self.uow.session.scalars(USER_KEYSET.stream(query, cursor)):
+            yield UserSchema.model_validate(user)
 
     def get_by_email(self, email: str) -> UserSchema | None:
-        with DatabaseConnectionHandler() as db:
-            try:
-                user = db.session.scalar(select(User).where(User.email == email))
-                return UserSchema.model_validate(user) if user else None
-            except Exception as ex:
-                db.session.rollback()
-                raise ex
+        user = self.uow.session.scalar(select(User).where(func.lower(User.email) == func.lower(email)))
+        return UserSchema.model_validate(user) if user else None
 
     def get_by_id(self, user_id: UUID) -> UserSchema | None:
-        with DatabaseConnectionHandler() as db:
-            try:
-                user = db.session.scalar(select(User).where(User.id == user_id))
-                return UserSchema.model_validate(user) if user else None
-            except Exception as ex:
-                db.session.rollback()
-                raise ex
-
-    def update(self, user_id: UUID, user: CreateUserSchema) -> UserSchema:
-        with DatabaseConnectionHandler() as db:
-            try:
-                user_db = db.session.get(User, user_id)
-
-                for k, v in user.model_dump().items():
-                    setattr(user_db, k, v)
-
-                db.session.commit()
-                db.session.refresh(user_db)
-
-                return UserSchema.model_validate(user_db)
-            except Exception as ex:
-                db.session.rollback()
-                raise ex
-
-    def delete(self, user_id: UUID) -> None:
-        with DatabaseConnectionHandler() as db:
-            try:
-                user = db.session.get(User, user_id)
-                db.session.delete(user)
-                db.session.commit()
-            except Exception as ex:
-                db.session.rollback()
-                raise ex
+        user = self.uow.session.scalar(select(User).where(User.id == user_id))
+        return UserSchema.model_validate(user) if user else None
+
+    def update(self, user_id: UUID, user: CreateUserSchema, role: Optional[Roles] = None) -> UserSchema | None:
+        """Retorna `None` se o usuário não existe ou, quando `role` é informado, se tem outro papel."""
+        query = update(User).where(User.id == user_id)
+
+        if role:
+            query = query.where(User.role == role)
+
+        user_db = self.uow.session.scalar(query.values(**user.model_dump()).returning(User))
+        return UserSchema.model_validate(user_db) if user_db else None
+
+    def update_password(self, user_id: UUID, password: str) -> None:
+        self.uow.session.execute(update(User).where(User.id == user_id).values(password=password))
+
+    def delete(self, user_id: UUID) -> bool:
+        # Agendamentos, séries e internações são removidos pelo `ON DELETE CASCADE` do banco.
+        deleted = self.uow.session.scalar(delete(User).where(User.id == user_id).returning(User.id))
+        return deleted is not None
@@ -1,19 +1,149 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager, suppress
+from typing import AsyncIterator, Awaitable, Callable
+
 from fastapi import FastAPI, HTTPException, Request
+from starlette.concurrency import run_in_threadpool
 
 from vidaplus.controllers import admissions, appointments, auth, beds, healthcare_professionals, patients, stock, units
+from vidaplus.controllers.asynchronous import admissions as async_admissions
+from vidaplus.controllers.asynchronous import appointments as async_appointments
+from vidaplus.controllers.asynchronous import auth as async_auth
+from vidaplus.controllers.asynchronous import beds as async_beds
+from vidaplus.controllers.asynchronous import healthcare_professionals as async_healthcare_professionals
+from vidaplus.controllers.asynchronous import patients as async_patients
+from vidaplus.controllers.asynchronous import stock as async_stock
+from vidaplus.controllers.asynchronous import units as async_units
+from vidaplus.controllers.responses import ModelResponse
 from vidaplus.main.exceptions import ApplicationError
+from vidaplus.models.cache.stats import cache_stats
+from vidaplus.models.config.connection import AsyncEngineRegistry, EngineRegistry
+from vidaplus.services.appointment_series_service import materialize_due_series
+from vidaplus.services.asynchronous.appointment_series_service import (
+    materialize_due_series as async_materialize_due_series,
+)
+from vidaplus.services.asynchronous.auth_service import AsyncAuthService
+from vidaplus.services.auth_service import AuthService
+from vidaplus.services.password_hasher import PasswordHasher
+from vidaplus.settings import Settings
+
+SYNC_CONTROLLERS = [admissions, appointments, auth, beds, healthcare_professionals, patients, stock, units]
+ASYNC_CONTROLLERS = [
+    async_admissions,
+    async_appointments,
+    async_auth,
+    async_beds,
+    async_healthcare_professionals,
+    async_patients,
+    async_stock,
+    async_units,
+]
+
+# De quanto em quanto tempo a tarefa de fundo verifica se o filtro de revogações deve ser reconstruído.
+REVOCATION_REBUILD_CHECK_SECONDS = 1.0
+
+logger = logging.getLogger(__name__)
+
+
+async def rebuild_revocations(asynchronous: bool) -> None:
+    if asynchronous:
+        await AsyncAuthService.rebuild_revocations()
+    else:
+        await run_in_threadpool(AuthService.rebuild_revocations)
+
+
+async def materialize_series(asynchronous: bool) -> None:
+    if asynchronous:
+        canceled = await async_materialize_due_series()
+    else:
+        canceled = await run_in_threadpool(materialize_due_series)
+
+    if canceled:
+        logger.warning(
+            'Ocorrências de séries em conflito com outros agendamentos foram gravadas como canceladas: %s',
+            ', '.join(str(appointment.id) for appointment in canceled),
+        )
+
+
+async def report_caches(asynchronous: bool) -> None:
+    stats = cache_stats()
+
+    if stats:
+        logger.info(
+            'Caches em memória: %s',
+            '; '.join(
+                f'{name} ' + ', '.join(f'{counter}={value}' for counter, value in counters.items())
+                for name, counters in stats.items()
+            ),
+        )
+
+
+async def repeat(job: Callable[[bool], Awaitable[None]], asynchronous: bool, seconds: float) -> None:
+    """Roda `job` a cada `seconds` segundos, fora das requisições, até a aplicação parar."""
+    while True:
+        await asyncio.sleep(seconds)
+
+        try:
+            await job(asynchronous)
+        except Exception:
+            # A próxima execução tenta de novo; até lá, as leituras continuam corretas sem este trabalho.
+            logger.exception('Falha na tarefa de fundo %s', job.__name__)
+
 
-app = FastAPI(title='SSGHSS VidaPlus')
-app.include_router(admissions.router)
-app.include_router(appointments.router)
-app.include_router(auth.router)
-app.include_router(beds.router)
-app.include_router(healthcare_professionals.router)
-app.include_router(patients.router)
-app.include_router(stock.router)
-app.include_router(units.router)
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    asynchronous = app.state.asynchronous
+
+    if asynchronous:
+        await AsyncEngineRegistry.warm_up()
+    else:
+        await run_in_threadpool(EngineRegistry.warm_up)
+
+    await run_in_threadpool(PasswordHasher.start)
+    await rebuild_revocations(asynchronous)
+    await materialize_series(asynchronous)
+    settings = Settings()
+    jobs = [
+        asyncio.create_task(repeat(rebuild_revocations, asynchronous, REVOCATION_REBUILD_CHECK_SECONDS)),
+        asyncio.create_task(repeat(materialize_series, asynchronous, settings.APPOINTMENT_SERIES_MATERIALIZE_SECONDS)),
+    ]
+
+    if settings.CACHE_STATS_LOG_SECONDS > 0:
+        jobs.append(asyncio.create_task(repeat(report_caches, asynchronous, settings.CACHE_STATS_LOG_SECONDS)))
+
+    yield
+
+    for job in jobs:
+        job.cancel()
+
+        with suppress(asyncio.CancelledError):
+            await job
+
+    if asynchronous:
+        await AsyncEngineRegistry.dispose()
+    else:
+        await run_in_threadpool(EngineRegistry.dispose)
+
+    await run_in_threadpool(PasswordHasher.shutdown)
 
 
-@app.exception_handler(ApplicationError)
 def application_error_handler(request: Request, exc: ApplicationError) -> None:
     raise HTTPException(status_code=exc.code, detail=str(exc))
+
+
+def create_app(asynchronous: bool | None = None) -> FastAPI:
+    if asynchronous is None:
+        asynchronous = Settings().DATABASE_ASYNC
+
+    app = FastAPI(title='SSGHSS VidaPlus', lifespan=lifespan, default_response_class=ModelResponse)
+    app.state.asynchronous = asynchronous
+
+    for controller in ASYNC_CONTROLLERS if asynchronous else SYNC_CONTROLLERS:
+        app.include_router(controller.router)
+
+    app.exception_handler(ApplicationError)(application_error_handler)
+    return app
+
+
+app = create_app()
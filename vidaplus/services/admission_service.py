@@ -1,16 +1,26 @@
-from vidaplus.main.enums.bed_status import BedStatus
+from typing import Iterator, Optional
+
 from vidaplus.main.enums.roles import Roles
 from vidaplus.main.exceptions import (
     AdmissionNotFoundError,
     BedNotAvailableError,
     BedNotFoundError,
+    NoAvailableBedError,
     PermissionRequiredError,
+    UnitNotFoundError,
     UserNotFoundError,
 )
-from vidaplus.main.schemas.admission import AdmissionSchema, CreateAdmissionSchema, UpdateAdmissionSchema
+from vidaplus.main.schemas.admission import (
+    AdmissionSchema,
+    AllocateAdmissionSchema,
+    CreateAdmissionSchema,
+    UpdateAdmissionSchema,
+)
+from vidaplus.main.schemas.page import PageSchema
 from vidaplus.main.schemas.user import PublicUserSchema
 from vidaplus.models.repositories.interfaces.admission_repository_interface import AdmissionRepositoryInterface
 from vidaplus.models.repositories.interfaces.bed_repository_interface import BedRepositoryInterface
+from vidaplus.models.repositories.interfaces.unit_repository_interface import UnitRepositoryInterface
 from vidaplus.models.repositories.interfaces.user_repository_interface import UserRepositoryInterface
 
 
@@ -20,10 +30,12 @@ class AdmissionService:
         admission_repository: AdmissionRepositoryInterface,
         user_repository: UserRepositoryInterface,
         bed_repository: BedRepositoryInterface,
+        unit_repository: UnitRepositoryInterface,
     ) -> None:
         self.admission_repository = admission_repository
         self.user_repository = user_repository
         self.bed_repository = bed_repository
+        self.unit_repository = unit_repository
 
     def create(self, admission: CreateAdmissionSchema, creator: PublicUserSchema) -> AdmissionSchema:
         if creator.role not in [Roles.ADMIN, Roles.HEALTHCARE_PROFESSIONAL]:
@@ -33,17 +45,39 @@ class AdmissionService:
         if not patient or not patient.role == Roles.PATIENT:
             raise UserNotFoundError()
 
-        bed = self.bed_repository.get_by_id(admission.bed_id)
-        if not bed:
-            raise BedNotFoundError()
+        # O leito passa a ocupado na mesma transação da internação, e só se ainda estiver disponível.
+        if not self.bed_repository.occupy(admission.bed_id):
+            if self.bed_repository.get_by_id(admission.bed_id):
+                raise BedNotAvailableError()
 
-        if not bed.status == BedStatus.AVAILABLE:
-            raise BedNotAvailableError()
+            raise BedNotFoundError()
 
         return self.admission_repository.create(admission)
 
-    def all(self) -> list[AdmissionSchema]:
-        return self.admission_repository.all()
+    def allocate(self, data: AllocateAdmissionSchema, creator: PublicUserSchema) -> AdmissionSchema:
+        """Interna o paciente no primeiro leito disponível do tipo pedido na unidade."""
+        if creator.role not in [Roles.ADMIN, Roles.HEALTHCARE_PROFESSIONAL]:
+            raise PermissionRequiredError()
+
+        patient = self.user_repository.get_by_id(data.patient_id)
+        if not patient or not patient.role == Roles.PATIENT:
+            raise UserNotFoundError()
+
+        bed = self.bed_repository.claim(data.unit_id, data.type)
+
+        if not bed:
+            if not self.unit_repository.get_by_id(data.unit_id):
+                raise UnitNotFoundError()
+
+            raise NoAvailableBedError()
+
+        return self.admission_repository.create(CreateAdmissionSchema(patient_id=data.patient_id, bed_id=bed.id))
+
+    def all(self, cursor: Optional[str] = None, limit: Optional[int] = None) -> PageSchema[AdmissionSchema]:
+        return self.admission_repository.all(cursor, limit)
+
+    def stream(self, cursor: Optional[str] = None) -> Iterator[AdmissionSchema]:
+        return self.admission_repository.stream(cursor)
 
     def get_by_id(self, admission_id: int) -> AdmissionSchema:
         admission = self.admission_repository.get_by_id(admission_id)
@@ -57,20 +91,16 @@ class AdmissionService:
         if not executor.role == Roles.ADMIN:
             raise PermissionRequiredError()
 
-        admission = self.admission_repository.get_by_id(admission_id)
+        admission = self.admission_repository.update(admission_id, data)
 
         if not admission:
             raise AdmissionNotFoundError()
 
-        return self.admission_repository.update(admission_id, data)
+        return admission
 
     def delete(self, admission_id: int, executor: PublicUserSchema) -> None:
         if not executor.role == Roles.ADMIN:
             raise PermissionRequiredError()
 
-        admission = self.admission_repository.get_by_id(admission_id)
-
-        if not admission:
+        if not self.admission_repository.delete(admission_id):
             raise AdmissionNotFoundError()
-
-        self.admission_repository.delete(admission_id)
@@ -0,0 +1,114 @@
+from datetime import datetime
+
+from vidaplus.main.enums.appointment_status import AppointmentStatus
+from vidaplus.main.enums.recurrence_frequencies import RecurrenceFrequencies
+from vidaplus.main.enums.roles import Roles
+from vidaplus.main.exceptions import (
+    AppointmentSeriesNotFoundError,
+    InvalidRecurrenceError,
+    PermissionRequiredError,
+    SchedulingInPastError,
+    UserNotFoundError,
+)
+from vidaplus.main.schemas.appointment import AppointmentSchema, CreateAppointmentSchema
+from vidaplus.main.schemas.appointment_series import AppointmentSeriesSchema, CreateAppointmentSeriesSchema
+from vidaplus.main.schemas.user import PublicUserSchema
+from vidaplus.models.config.timezone import as_aware, local_timezone
+from vidaplus.models.config.unit_of_work import UnitOfWork
+from vidaplus.models.entities.appointment_series import recurrence
+from vidaplus.models.repositories.appointment_repository import AppointmentRepository
+from vidaplus.models.repositories.interfaces.appointment_repository_interface import AppointmentRepositoryInterface
+from vidaplus.models.repositories.interfaces.appointment_series_repository_interface import (
+    AppointmentSeriesRepositoryInterface,
+)
+from vidaplus.services.appointment_service import batch_conflicts, batch_range
+from vidaplus.settings import Settings
+
+
+class AppointmentSeriesService:
+    def __init__(
+        self,
+        series_repository: AppointmentSeriesRepositoryInterface,
+        appointment_repository: AppointmentRepositoryInterface,
+    ) -> None:
+        self.series_repository = series_repository
+        self.appointment_repository = appointment_repository
+
+    def create(self, series: CreateAppointmentSeriesSchema, creator: PublicUserSchema) -> AppointmentSeriesSchema:
+        occurrences = validate_series(series, creator)
+        start, end = batch_range(occurrences)
+        busy, patients = self.appointment_repository.get_batch_schedule(
+            start, end, [series.professional_id], [series.patient_id]
+        )
+
+        if series.patient_id not in patients:
+            raise UserNotFoundError()
+
+        errors = batch_conflicts(dict(enumerate(occurrences)), busy)
+
+        # A série é aceita ou recusada como um todo.
+        if errors:
+            raise next(iter(errors.values()))
+
+        created = self.series_repository.create(series, end)
+        self.appointment_repository.materialize_series(professional_id=series.professional_id)
+        return self.get_by_id(created.id)
+
+    def get_by_id(self, series_id: int) -> AppointmentSeriesSchema:
+        series = self.series_repository.get_by_id(series_id)
+
+        if not series:
+            raise AppointmentSeriesNotFoundError()
+
+        return series
+
+    def cancel(self, series_id: int, user: PublicUserSchema) -> None:
+        series = self.get_by_id(series_id)
+
+        if series.patient_id != user.id and user.role == Roles.PATIENT:
+            raise PermissionRequiredError()
+
+        self.series_repository.cancel(series_id)
+        self.appointment_repository.cancel_series(series_id, as_aware(datetime.now()))
+
+
+def materialize_due_series() -> list[AppointmentSchema]:
+    """Materializa, numa transação própria, as ocorrências que entraram na janela; chamada pela tarefa de fundo."""
+    with UnitOfWork() as uow:
+        return AppointmentRepository(uow).materialize_series()
+
+
+def validate_series(series: CreateAppointmentSeriesSchema, creator: PublicUserSchema) -> list[CreateAppointmentSchema]:
+    """Valida a série e retorna todas as suas ocorrências, usadas na checagem de conflito em grupo."""
+    if series.patient_id != creator.id and creator.role == Roles.PATIENT:
+        raise PermissionRequiredError()
+
+    if not as_aware(series.starts_at) > as_aware(datetime.now()):
+        raise SchedulingInPastError()
+
+    max_occurrences = Settings().APPOINTMENT_SERIES_MAX_OCCURRENCES
+    occurrences = [
+        CreateAppointmentSchema(
+            patient_id=series.patient_id,
+            professional_id=series.professional_id,
+            date_time=date_time,
+            type=series.type,
+            status=AppointmentStatus.SCHEDULED,
+            estimated_duration=series.estimated_duration,
+            location=series.location,
+            notes=series.notes,
+        )
+        for date_time in recurrence(
+            as_aware(series.starts_at).astimezone(local_timezone()),
+            RecurrenceFrequencies(series.frequency),
+            series.interval,
+            series.count,
+            as_aware(series.until) if series.until else None,
+            max_occurrences + 1,
+        )
+    ]
+
+    if not occurrences or len(occurrences) > max_occurrences:
+        raise InvalidRecurrenceError()
+
+    return occurrences
@@ -1,17 +1,33 @@
-from datetime import datetime, timedelta
-from typing import Optional
+from collections import defaultdict
+from datetime import datetime
+from typing import Iterable, Iterator, Optional
 from uuid import UUID
 
+from vidaplus.main.enums.batch_modes import BatchModes
 from vidaplus.main.enums.roles import Roles
 from vidaplus.main.exceptions import (
+    ApplicationError,
     AppointmentNotFountError,
+    BatchTooLargeError,
     PermissionRequiredError,
+    PreconditionFailedError,
     SchedulingInPastError,
     SchedulingTimeConflictError,
+    UserNotFoundError,
 )
-from vidaplus.main.schemas.appointment import AppointmentSchema, CreateAppointmentSchema
+from vidaplus.main.schemas.appointment import (
+    AppointmentOccurrenceSchema,
+    AppointmentSchema,
+    BatchAppointmentItemSchema,
+    BatchAppointmentResultSchema,
+    CreateAppointmentSchema,
+)
+from vidaplus.main.schemas.page import PageSchema
 from vidaplus.main.schemas.user import PublicUserSchema
+from vidaplus.models.config.timezone import as_aware
+from vidaplus.models.entities.appointment import appointment_end
 from vidaplus.models.repositories.interfaces.appointment_repository_interface import AppointmentRepositoryInterface
+from vidaplus.settings import Settings
 
 
 class AppointmentService:
@@ -30,6 +46,28 @@ class AppointmentService:
 
         return self.repository.create(appointment)
 
+    def create_batch(
+        self, appointments: list[CreateAppointmentSchema], creator: PublicUserSchema, mode: BatchModes
+    ) -> BatchAppointmentResultSchema:
+        if len(appointments) > Settings().APPOINTMENT_BATCH_MAX_SIZE:
+            raise BatchTooLargeError()
+
+        errors = validate_batch(appointments, creator)
+        candidates = {index: item for index, item in enumerate(appointments) if index not in errors}
+
+        if candidates:
+            start, end = batch_range(candidates.values())
+            professional_ids = list({item.professional_id for item in candidates.values()})
+            patient_ids = list({item.patient_id for item in candidates.values()})
+            busy, patients = self.repository.get_batch_schedule(start, end, professional_ids, patient_ids)
+            errors.update(unknown_patients(candidates, patients))
+            errors.update(batch_conflicts({i: item for i, item in candidates.items() if i not in errors}, busy))
+
+        accepted = [] if errors and mode == BatchModes.ALL_OR_NOTHING else [i for i in candidates if i not in errors]
+        created = self.repository.create_many([appointments[index] for index in accepted])
+
+        return build_batch_result(len(appointments), mode, dict(zip(accepted, created)), errors)
+
     def get(  # noqa: PLR0913
         self,
         patient_id: Optional[UUID] = None,
@@ -38,7 +76,9 @@ class AppointmentService:
         end_date: Optional[datetime] = None,
         type: Optional[str] = None,
         status: Optional[str] = None,
-    ) -> list[AppointmentSchema]:
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> PageSchema[AppointmentSchema | AppointmentOccurrenceSchema]:
         return self.repository.get(
             patient_id=patient_id,
             professional_id=professional_id,
@@ -46,51 +86,171 @@ class AppointmentService:
             end_date=end_date,
             type=type,
             status=status,
+            cursor=cursor,
+            limit=limit,
         )
 
-    def cancel(self, appointment_id: int, user: PublicUserSchema) -> None:
-        appointment = self.repository.get_by_id(appointment_id)
-
-        if not appointment:
-            raise AppointmentNotFountError()
+    def stream(  # noqa: PLR0913
+        self,
+        patient_id: Optional[UUID] = None,
+        professional_id: Optional[UUID] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        type: Optional[str] = None,
+        status: Optional[str] = None,
+        cursor: Optional[str] = None,
+    ) -> Iterator[AppointmentSchema | AppointmentOccurrenceSchema]:
+        return self.repository.stream(
+            patient_id=patient_id,
+            professional_id=professional_id,
+            start_date=start_date,
+            end_date=end_date,
+            type=type,
+            status=status,
+            cursor=cursor,
+        )
 
-        if appointment.patient_id != user.id and user.role == Roles.PATIENT:
-            raise PermissionRequiredError()
+    def get_agenda(
+        self, professional_id: UUID, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None
+    ) -> list[AppointmentSchema | AppointmentOccurrenceSchema]:
+        return self.repository.get_agenda(professional_id, start_date, end_date)
 
-        self.repository.cancel(appointment_id)
+    def cancel(self, appointment_id: int, user: PublicUserSchema) -> None:
+        if not self.repository.cancel(appointment_id, own_appointments(user)):
+            raise self.__write_error(appointment_id, user)
 
     def update(
-        self, appointment_id: int, appointment: CreateAppointmentSchema, user: PublicUserSchema
+        self,
+        appointment_id: int,
+        appointment: CreateAppointmentSchema,
+        user: PublicUserSchema,
+        version: Optional[int] = None,
     ) -> AppointmentSchema:
-        appointment_to_update = self.repository.get_by_id(appointment_id)
-
-        if not appointment_to_update:
-            raise AppointmentNotFountError()
+        updated = self.repository.update(appointment_id, appointment, own_appointments(user), datetime.now(), version)
 
-        if appointment_to_update.patient_id != user.id and user.role == Roles.PATIENT:
-            raise PermissionRequiredError()
-
-        if appointment_to_update.date_time < datetime.now():
-            raise SchedulingInPastError()
+        if not updated:
+            raise self.__write_error(appointment_id, user, version)
 
+        # A atualização já foi feita; um conflito desfaz a transação ao sair da unidade de trabalho.
         if self.has_time_conflict(
-            appointment_to_update.professional_id, appointment.date_time, appointment.estimated_duration
+            appointment.professional_id, appointment.date_time, appointment.estimated_duration, appointment_id
         ):
             raise SchedulingTimeConflictError()
 
-        return self.repository.update(appointment_id, appointment)
+        return updated
 
-    def has_time_conflict(self, professional_id: UUID, appointment_start: datetime, duration: int) -> bool:
-        appointment_end = appointment_start + timedelta(minutes=duration)
-        existing_appointments = self.repository.get(professional_id=professional_id)
+    def has_time_conflict(
+        self, professional_id: UUID, appointment_start: datetime, duration: int, exclude_id: Optional[int] = None
+    ) -> bool:
+        return self.repository.has_time_conflict(professional_id, appointment_start, duration, exclude_id)
 
-        for existing_appointment in existing_appointments:
-            existing_appointment_start = existing_appointment.date_time
-            existing_appointment_end = existing_appointment_start + timedelta(
-                minutes=existing_appointment.estimated_duration
-            )
+    def __write_error(
+        self, appointment_id: int, user: PublicUserSchema, version: Optional[int] = None
+    ) -> ApplicationError:
+        # Só quando a escrita não alterou nada o agendamento é lido, para explicar o motivo.
+        return write_error(self.repository.get_by_id(appointment_id), user, version)
+
+
+def own_appointments(user: PublicUserSchema) -> Optional[UUID]:
+    """Paciente a que as escritas do usuário ficam restritas, ou `None` quando ele pode alterar qualquer agendamento."""
+    return user.id if user.role == Roles.PATIENT else None
+
+
+def write_error(
+    appointment: Optional[AppointmentSchema], user: PublicUserSchema, version: Optional[int] = None
+) -> ApplicationError:
+    if not appointment:
+        return AppointmentNotFountError()
+
+    if appointment.patient_id != user.id and user.role == Roles.PATIENT:
+        return PermissionRequiredError()
+
+    if version is not None and appointment.version != version:
+        return PreconditionFailedError()
+
+    return SchedulingInPastError()
+
+
+def validate_batch(
+    appointments: list[CreateAppointmentSchema], creator: PublicUserSchema
+) -> dict[int, ApplicationError]:
+    now = as_aware(datetime.now())
+    errors: dict[int, ApplicationError] = {}
+
+    for index, appointment in enumerate(appointments):
+        if appointment.patient_id != creator.id and creator.role == Roles.PATIENT:
+            errors[index] = PermissionRequiredError()
+        elif not as_aware(appointment.date_time) > now:
+            errors[index] = SchedulingInPastError()
+
+    return errors
+
+
+def batch_range(appointments: Iterable[CreateAppointmentSchema]) -> tuple[datetime, datetime]:
+    intervals = [
+        (as_aware(item.date_time), appointment_end(as_aware(item.date_time), item.estimated_duration))
+        for item in appointments
+    ]
+    return min(start for start, _ in intervals), max(end for _, end in intervals)
 
-            if (appointment_start <= existing_appointment_start) and (appointment_end >= existing_appointment_end):
-                return True
 
-        return False
+def unknown_patients(
+    candidates: dict[int, CreateAppointmentSchema], patients: set[UUID]
+) -> dict[int, ApplicationError]:
+    return {index: UserNotFoundError() for index, item in candidates.items() if item.patient_id not in patients}
+
+
+def batch_conflicts(
+    candidates: dict[int, CreateAppointmentSchema], busy: dict[UUID, list[tuple[datetime, datetime]]]
+) -> dict[int, ApplicationError]:
+    """Confere, numa única varredura por profissional, conflitos com o banco e entre os itens do próprio lote.
+
+    Entre itens do lote que se sobrepõem, fica o que começa primeiro (ou, no empate, o que vem antes no lote).
+    Profissionais ausentes de `busy` não existem ou não são profissionais de saúde.
+    """
+    requested: dict[UUID, list[tuple[datetime, int, datetime]]] = defaultdict(list)
+
+    for index, item in candidates.items():
+        start = as_aware(item.date_time)
+        requested[item.professional_id].append((start, index, appointment_end(start, item.estimated_duration)))
+
+    errors: dict[int, ApplicationError] = {}
+
+    for professional_id, items in requested.items():
+        if professional_id not in busy:
+            errors.update((index, UserNotFoundError()) for _, index, _ in items)
+            continue
+
+        existing = [(as_aware(start), as_aware(end)) for start, end in busy[professional_id]]
+        position, accepted_end = 0, None
+
+        for start, index, end in sorted(items):
+            while position < len(existing) and existing[position][1] <= start:
+                position += 1
+
+            overlaps_existing = position < len(existing) and existing[position][0] < end
+            overlaps_batch = accepted_end is not None and start < accepted_end
+
+            if overlaps_existing or overlaps_batch:
+                errors[index] = SchedulingTimeConflictError()
+            else:
+                accepted_end = end if accepted_end is None else max(accepted_end, end)
+
+    return errors
+
+
+def build_batch_result(
+    size: int, mode: BatchModes, created: dict[int, AppointmentSchema], errors: dict[int, ApplicationError]
+) -> BatchAppointmentResultSchema:
+    return BatchAppointmentResultSchema(
+        mode=mode,
+        created=len(created),
+        results=[
+            BatchAppointmentItemSchema(
+                index=index,
+                appointment=created.get(index),
+                error=str(errors[index]) if index in errors else None,
+            )
+            for index in range(size)
+        ],
+    )
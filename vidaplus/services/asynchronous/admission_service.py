@@ -0,0 +1,114 @@
+from typing import AsyncIterator, Optional
+
+from vidaplus.main.enums.roles import Roles
+from vidaplus.main.exceptions import (
+    AdmissionNotFoundError,
+    BedNotAvailableError,
+    BedNotFoundError,
+    NoAvailableBedError,
+    PermissionRequiredError,
+    UnitNotFoundError,
+    UserNotFoundError,
+)
+from vidaplus.main.schemas.admission import (
+    AdmissionSchema,
+    AllocateAdmissionSchema,
+    CreateAdmissionSchema,
+    UpdateAdmissionSchema,
+)
+from vidaplus.main.schemas.page import PageSchema
+from vidaplus.main.schemas.user import PublicUserSchema
+from vidaplus.models.repositories.interfaces.asynchronous.admission_repository_interface import (
+    AsyncAdmissionRepositoryInterface,
+)
+from vidaplus.models.repositories.interfaces.asynchronous.bed_repository_interface import AsyncBedRepositoryInterface
+from vidaplus.models.repositories.interfaces.asynchronous.unit_repository_interface import (
+    AsyncUnitRepositoryInterface,
+)
+from vidaplus.models.repositories.interfaces.asynchronous.user_repository_interface import (
+    AsyncUserRepositoryInterface,
+)
+
+
+class AsyncAdmissionService:
+    def __init__(
+        self,
+        admission_repository: AsyncAdmissionRepositoryInterface,
+        user_repository: AsyncUserRepositoryInterface,
+        bed_repository: AsyncBedRepositoryInterface,
+        unit_repository: AsyncUnitRepositoryInterface,
+    ) -> None:
+        self.admission_repository = admission_repository
+        self.user_repository = user_repository
+        self.bed_repository = bed_repository
+        self.unit_repository = unit_repository
+
+    async def create(self, admission: CreateAdmissionSchema, creator: PublicUserSchema) -> AdmissionSchema:
+        if creator.role not in [Roles.ADMIN, Roles.HEALTHCARE_PROFESSIONAL]:
+            raise PermissionRequiredError()
+
+        patient = await self.user_repository.get_by_id(admission.patient_id)
+        if not patient or not patient.role == Roles.PATIENT:
+            raise UserNotFoundError()
+
+        # O leito passa a ocupado na mesma transação da internação, e só se ainda estiver disponível.
+        if not await self.bed_repository.occupy(admission.bed_id):
+            if await self.bed_repository.get_by_id(admission.bed_id):
+                raise BedNotAvailableError()
+
+            raise BedNotFoundError()
+
+        return await self.admission_repository.create(admission)
+
+    async def allocate(self, data: AllocateAdmissionSchema, creator: PublicUserSchema) -> AdmissionSchema:
+        """Interna o paciente no primeiro leito disponível do tipo pedido na unidade."""
+        if creator.role not in [Roles.ADMIN, Roles.HEALTHCARE_PROFESSIONAL]:
+            raise PermissionRequiredError()
+
+        patient = await self.user_repository.get_by_id(data.patient_id)
+        if not patient or not patient.role == Roles.PATIENT:
+            raise UserNotFoundError()
+
+        bed = await self.bed_repository.claim(data.unit_id, data.type)
+
+        if not bed:
+            if not await self.unit_repository.get_by_id(data.unit_id):
+                raise UnitNotFoundError()
+
+            raise NoAvailableBedError()
+
+        return await self.admission_repository.create(CreateAdmissionSchema(patient_id=data.patient_id, bed_id=bed.id))
+
+    async def all(self, cursor: Optional[str] = None, limit: Optional[int] = None) -> PageSchema[AdmissionSchema]:
+        return await self.admission_repository.all(cursor, limit)
+
+    def stream(self, cursor: Optional[str] = None) -> AsyncIterator[AdmissionSchema]:
+        return self.admission_repository.stream(cursor)
+
+    async def get_by_id(self, admission_id: int) -> AdmissionSchema:
+        admission = await self.admission_repository.get_by_id(admission_id)
+
+        if not admission:
+            raise AdmissionNotFoundError()
+
+        return admission
+
+    async def update(
+        self, admission_id: int, data: UpdateAdmissionSchema, executor: PublicUserSchema
+    ) -> AdmissionSchema:
+        if not executor.role == Roles.ADMIN:
+            raise PermissionRequiredError()
+
+        admission = await self.admission_repository.update(admission_id, data)
+
+        if not admission:
+            raise AdmissionNotFoundError()
+
+        return admission
+
+    async def delete(self, admission_id: int, executor: PublicUserSchema) -> None:
+        if not executor.role == Roles.ADMIN:
+            raise PermissionRequiredError()
+
+        if not await self.admission_repository.delete(admission_id):
+            raise AdmissionNotFoundError()
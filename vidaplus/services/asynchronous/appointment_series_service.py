@@ -0,0 +1,70 @@
+from datetime import datetime
+
+from vidaplus.main.enums.roles import Roles
+from vidaplus.main.exceptions import AppointmentSeriesNotFoundError, PermissionRequiredError, UserNotFoundError
+from vidaplus.main.schemas.appointment import AppointmentSchema
+from vidaplus.main.schemas.appointment_series import AppointmentSeriesSchema, CreateAppointmentSeriesSchema
+from vidaplus.main.schemas.user import PublicUserSchema
+from vidaplus.models.config.timezone import as_aware
+from vidaplus.models.config.unit_of_work import AsyncUnitOfWork
+from vidaplus.models.repositories.asynchronous.appointment_repository import AsyncAppointmentRepository
+from vidaplus.models.repositories.interfaces.asynchronous.appointment_repository_interface import (
+    AsyncAppointmentRepositoryInterface,
+)
+from vidaplus.models.repositories.interfaces.asynchronous.appointment_series_repository_interface import (
+    AsyncAppointmentSeriesRepositoryInterface,
+)
+from vidaplus.services.appointment_series_service import validate_series
+from vidaplus.services.appointment_service import batch_conflicts, batch_range
+
+
+class AsyncAppointmentSeriesService:
+    def __init__(
+        self,
+        series_repository: AsyncAppointmentSeriesRepositoryInterface,
+        appointment_repository: AsyncAppointmentRepositoryInterface,
+    ) -> None:
+        self.series_repository = series_repository
+        self.appointment_repository = appointment_repository
+
+    async def create(self, series: CreateAppointmentSeriesSchema, creator: PublicUserSchema) -> AppointmentSeriesSchema:
+        occurrences = validate_series(series, creator)
+        start, end = batch_range(occurrences)
+        busy, patients = await self.appointment_repository.get_batch_schedule(
+            start, end, [series.professional_id], [series.patient_id]
+        )
+
+        if series.patient_id not in patients:
+            raise UserNotFoundError()
+
+        errors = batch_conflicts(dict(enumerate(occurrences)), busy)
+
+        # A série é aceita ou recusada como um todo.
+        if errors:
+            raise next(iter(errors.values()))
+
+        created = await self.series_repository.create(series, end)
+        await self.appointment_repository.materialize_series(professional_id=series.professional_id)
+        return await self.get_by_id(created.id)
+
+    async def get_by_id(self, series_id: int) -> AppointmentSeriesSchema:
+        series = await self.series_repository.get_by_id(series_id)
+
+        if not series:
+            raise AppointmentSeriesNotFoundError()
+
+        return series
+
+    async def cancel(self, series_id: int, user: PublicUserSchema) -> None:
+        series = await self.get_by_id(series_id)
+
+        if series.patient_id != user.id and user.role == Roles.PATIENT:
+            raise PermissionRequiredError()
+
+        await self.series_repository.cancel(series_id)
+        await self.appointment_repository.cancel_series(series_id, as_aware(datetime.now()))
+
+
+async def materialize_due_series() -> list[AppointmentSchema]:
+    async with AsyncUnitOfWork() as uow:
+        return await AsyncAppointmentRepository(uow).materialize_series()
@@ -0,0 +1,158 @@
+from datetime import datetime
+from typing import AsyncIterator, Optional
+from uuid import UUID
+
+from vidaplus.main.enums.batch_modes import BatchModes
+from vidaplus.main.enums.roles import Roles
+from vidaplus.main.exceptions import (
+    ApplicationError,
+    BatchTooLargeError,
+    PermissionRequiredError,
+    SchedulingInPastError,
+    SchedulingTimeConflictError,
+)
+from vidaplus.main.schemas.appointment import (
+    AppointmentOccurrenceSchema,
+    AppointmentSchema,
+    BatchAppointmentResultSchema,
+    CreateAppointmentSchema,
+)
+from vidaplus.main.schemas.page import PageSchema
+from vidaplus.main.schemas.user import PublicUserSchema
+from vidaplus.models.repositories.interfaces.asynchronous.appointment_repository_interface import (
+    AsyncAppointmentRepositoryInterface,
+)
+from vidaplus.services.appointment_service import (
+    batch_conflicts,
+    batch_range,
+    build_batch_result,
+    own_appointments,
+    unknown_patients,
+    validate_batch,
+    write_error,
+)
+from vidaplus.settings import Settings
+
+
+class AsyncAppointmentService:
+    def __init__(self, repository: AsyncAppointmentRepositoryInterface) -> None:
+        self.repository = repository
+
+    async def create(self, appointment: CreateAppointmentSchema, creator: PublicUserSchema) -> AppointmentSchema:
+        if appointment.patient_id != creator.id and creator.role == Roles.PATIENT:
+            raise PermissionRequiredError()
+
+        if not appointment.date_time > datetime.now():
+            raise SchedulingInPastError()
+
+        if await self.has_time_conflict(
+            appointment.professional_id, appointment.date_time, appointment.estimated_duration
+        ):
+            raise SchedulingTimeConflictError()
+
+        return await self.repository.create(appointment)
+
+    async def create_batch(
+        self, appointments: list[CreateAppointmentSchema], creator: PublicUserSchema, mode: BatchModes
+    ) -> BatchAppointmentResultSchema:
+        if len(appointments) > Settings().APPOINTMENT_BATCH_MAX_SIZE:
+            raise BatchTooLargeError()
+
+        errors = validate_batch(appointments, creator)
+        candidates = {index: item for index, item in enumerate(appointments) if index not in errors}
+
+        if candidates:
+            start, end = batch_range(candidates.values())
+            professional_ids = list({item.professional_id for item in candidates.values()})
+            patient_ids = list({item.patient_id for item in candidates.values()})
+            busy, patients = await self.repository.get_batch_schedule(start, end, professional_ids, patient_ids)
+            errors.update(unknown_patients(candidates, patients))
+            errors.update(batch_conflicts({i: item for i, item in candidates.items() if i not in errors}, busy))
+
+        accepted = [] if errors and mode == BatchModes.ALL_OR_NOTHING else [i for i in candidates if i not in errors]
+        created = await self.repository.create_many([appointments[index] for index in accepted])
+
+        return build_batch_result(len(appointments), mode, dict(zip(accepted, created)), errors)
+
+    async def get(  # noqa: PLR0913
+        self,
+        patient_id: Optional[UUID] = None,
+        professional_id: Optional[UUID] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        type: Optional[str] = None,
+        status: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> PageSchema[AppointmentSchema | AppointmentOccurrenceSchema]:
+        return await self.repository.get(
+            patient_id=patient_id,
+            professional_id=professional_id,
+            start_date=start_date,
+            end_date=end_date,
+            type=type,
+            status=status,
+            cursor=cursor,
+            limit=limit,
+        )
+
+    def stream(  # noqa: PLR0913
+        self,
+        patient_id: Optional[UUID] = None,
+        professional_id: Optional[UUID] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        type: Optional[str] = None,
+        status: Optional[str] = None,
+        cursor: Optional[str] = None,
+    ) -> AsyncIterator[AppointmentSchema | AppointmentOccurrenceSchema]:
+        return self.repository.stream(
+            patient_id=patient_id,
+            professional_id=professional_id,
+            start_date=start_date,
+            end_date=end_date,
+            type=type,
+            status=status,
+            cursor=cursor,
+        )
+
+    async def get_agenda(
+        self, professional_id: UUID, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None
+    ) -> list[AppointmentSchema | AppointmentOccurrenceSchema]:
+        return await self.repository.get_agenda(professional_id, start_date, end_date)
+
+    async def cancel(self, appointment_id: int, user: PublicUserSchema) -> None:
+        if not await self.repository.cancel(appointment_id, own_appointments(user)):
+            raise await self.__write_error(appointment_id, user)
+
+    async def update(
+        self,
+        appointment_id: int,
+        appointment: CreateAppointmentSchema,
+        user: PublicUserSchema,
+        version: Optional[int] = None,
+    ) -> AppointmentSchema:
+        updated = await self.repository.update(
+            appointment_id, appointment, own_appointments(user), datetime.now(), version
+        )
+
+        if not updated:
+            raise await self.__write_error(appointment_id, user, version)
+
+        # A atualização já foi feita; um conflito desfaz a transação ao sair da unidade de trabalho.
+        if await self.has_time_conflict(
+            appointment.professional_id, appointment.date_time, appointment.estimated_duration, appointment_id
+        ):
+            raise SchedulingTimeConflictError()
+
+        return updated
+
+    async def has_time_conflict(
+        self, professional_id: UUID, appointment_start: datetime, duration: int, exclude_id: Optional[int] = None
+    ) -> bool:
+        return await self.repository.has_time_conflict(professional_id, appointment_start, duration, exclude_id)
+
+    async def __write_error(
+        self, appointment_id: int, user: PublicUserSchema, version: Optional[int] = None
+    ) -> ApplicationError:
+        return write_error(await self.repository.get_by_id(appointment_id), user, version)
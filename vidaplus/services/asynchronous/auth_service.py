@@ -0,0 +1,111 @@
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+from fastapi import Depends, Request
+
+from vidaplus.main.enums.roles import Roles
+from vidaplus.main.exceptions import ExpiredTokenError, PermissionRequiredError, RevokedTokenError, TokenRefreshError
+from vidaplus.main.schemas.auth import TokenData
+from vidaplus.models.cache.revocation_list import RevocationList
+from vidaplus.models.config.unit_of_work import AsyncUnitOfWork
+from vidaplus.models.repositories.asynchronous.revoked_token_repository import AsyncRevokedTokenRepository
+from vidaplus.models.repositories.interfaces.asynchronous.revoked_token_repository_interface import (
+    AsyncRevokedTokenRepositoryInterface,
+)
+from vidaplus.services.auth_service import AuthService
+
+
+class AsyncAuthService:
+    """Dependências de autenticação como corrotinas, para não ocupar o thread pool nas rotas assíncronas."""
+
+    @classmethod
+    async def authenticate(cls, request: Request, token: str) -> TokenData:
+        memoized: tuple[str, TokenData] | None = getattr(request.state, 'token_data', None)
+
+        if memoized is not None and memoized[0] == token:
+            return memoized[1]
+
+        data = AuthService.decode_access_token(token)
+
+        if await cls.is_revoked(data):
+            raise RevokedTokenError()
+
+        request.state.token_data = (token, data)
+        return data
+
+    @classmethod
+    async def is_revoked(cls, data: TokenData) -> bool:
+        if data.jti is None:
+            return False
+
+        revocations = RevocationList.get_instance()
+        last_id = revocations.claim_sync()
+
+        if last_id is not None:
+            async with AsyncUnitOfWork() as uow:
+                try:
+                    revocations.apply(await AsyncRevokedTokenRepository(uow).since(last_id))
+                except BaseException:
+                    revocations.release()
+                    raise
+
+        if data.jti not in revocations:
+            return False
+
+        async with AsyncUnitOfWork() as uow:
+            return await AsyncRevokedTokenRepository(uow).exists(data.jti)
+
+    @classmethod
+    async def rebuild_revocations(cls) -> None:
+        revocations = RevocationList.get_instance()
+
+        if not revocations.claim_rebuild():
+            return
+
+        async with AsyncUnitOfWork() as uow:
+            try:
+                revocations.rebuild(await AsyncRevokedTokenRepository(uow).since(0))
+            except BaseException:
+                revocations.release()
+                raise
+
+    @classmethod
+    async def revoke(cls, data: TokenData, repository: AsyncRevokedTokenRepositoryInterface) -> bool:
+        if data.jti is None:
+            return True
+
+        await repository.delete_expired()
+        revoked = await repository.add(data.jti, data.exp)
+        RevocationList.get_instance().add(data.jti)
+        return revoked
+
+    @classmethod
+    async def refresh_token(cls, access_token: str, repository: AsyncRevokedTokenRepositoryInterface) -> str:
+        try:
+            payload = AuthService.decode_access_token(access_token)
+
+            if payload.exp < datetime.now(ZoneInfo(AuthService.settings.TIMEZONE)):
+                raise ExpiredTokenError()
+
+            if await cls.is_revoked(payload):
+                raise RevokedTokenError()
+
+            new_access_token = AuthService.create_access_token(payload.model_dump())
+        except Exception:
+            raise TokenRefreshError()
+
+        if not await cls.revoke(payload, repository):
+            raise TokenRefreshError()
+
+        return new_access_token
+
+    @classmethod
+    async def get_current_user(cls, request: Request, token: str = Depends(AuthService.oauth2_scheme)) -> TokenData:
+        return await cls.authenticate(request, token)
+
+    @classmethod
+    async def is_admin(cls, request: Request, token: str = Depends(AuthService.oauth2_scheme)) -> None:
+        payload = await cls.authenticate(request, token)
+
+        if not payload.role == Roles.ADMIN:
+            raise PermissionRequiredError()
@@ -0,0 +1,34 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from vidaplus.main.exceptions import UserNotFoundError
+from vidaplus.main.schemas.availability import AvailabilitySchema
+from vidaplus.models.repositories.interfaces.asynchronous.appointment_repository_interface import (
+    AsyncAppointmentRepositoryInterface,
+)
+from vidaplus.services.availability_service import build_availability, working_windows
+from vidaplus.settings import Settings
+
+
+class AsyncAvailabilityService:
+    def __init__(self, repository: AsyncAppointmentRepositoryInterface) -> None:
+        self.repository = repository
+
+    async def search(
+        self, start: datetime, end: datetime, duration: int, professional_ids: Optional[list[UUID]] = None
+    ) -> list[AvailabilitySchema]:
+        settings = Settings()
+        windows = working_windows(start, end, duration, settings)
+        busy = await self.repository.get_busy_intervals(start, end, professional_ids)
+        return build_availability(windows, busy, duration, settings.AVAILABILITY_SLOT_MINUTES)
+
+    async def search_for_professional(
+        self, professional_id: UUID, start: datetime, end: datetime, duration: int
+    ) -> AvailabilitySchema:
+        availability = await self.search(start, end, duration, [professional_id])
+
+        if not availability:
+            raise UserNotFoundError()
+
+        return availability[0]
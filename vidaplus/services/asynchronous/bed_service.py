@@ -0,0 +1,76 @@
+from typing import AsyncIterator, Optional
+
+from vidaplus.main.enums.roles import Roles
+from vidaplus.main.exceptions import (
+    BedNotFoundError,
+    PermissionRequiredError,
+    PreconditionFailedError,
+    UnitNotFoundError,
+)
+from vidaplus.main.schemas.bed import BedSchema, CreateBedSchema
+from vidaplus.main.schemas.page import PageSchema
+from vidaplus.main.schemas.user import PublicUserSchema
+from vidaplus.models.repositories.interfaces.asynchronous.bed_repository_interface import AsyncBedRepositoryInterface
+from vidaplus.models.repositories.interfaces.asynchronous.unit_repository_interface import (
+    AsyncUnitRepositoryInterface,
+)
+
+
+class AsyncBedService:
+    def __init__(
+        self, bed_repository: AsyncBedRepositoryInterface, unit_repository: AsyncUnitRepositoryInterface
+    ) -> None:
+        self.bed_repository = bed_repository
+        self.unit_repository = unit_repository
+
+    async def create(self, bed: CreateBedSchema, creator: PublicUserSchema) -> BedSchema:
+        if not creator.role == Roles.ADMIN:
+            raise PermissionRequiredError()
+
+        unit = await self.unit_repository.get_by_id(bed.unit_id)
+
+        if not unit:
+            raise UnitNotFoundError()
+
+        return await self.bed_repository.create(bed)
+
+    async def all(self, cursor: Optional[str] = None, limit: Optional[int] = None) -> PageSchema[BedSchema]:
+        return await self.bed_repository.all(cursor, limit)
+
+    def stream(self, cursor: Optional[str] = None) -> AsyncIterator[BedSchema]:
+        return self.bed_repository.stream(cursor)
+
+    async def get_by_id(self, bed_id: int) -> BedSchema:
+        bed = await self.bed_repository.get_by_id(bed_id)
+
+        if not bed:
+            raise BedNotFoundError()
+
+        return bed
+
+    async def update(
+        self, bed_id: int, bed: CreateBedSchema, executor: PublicUserSchema, version: Optional[int] = None
+    ) -> BedSchema:
+        if not executor.role == Roles.ADMIN:
+            raise PermissionRequiredError()
+
+        unit = await self.unit_repository.get_by_id(bed.unit_id)
+        if not unit:
+            raise UnitNotFoundError()
+
+        updated = await self.bed_repository.update(bed_id, bed, version)
+
+        if not updated:
+            if version is not None and await self.bed_repository.get_by_id(bed_id):
+                raise PreconditionFailedError()
+
+            raise BedNotFoundError()
+
+        return updated
+
+    async def delete(self, bed_id: int, executor: PublicUserSchema) -> None:
+        if not executor.role == Roles.ADMIN:
+            raise PermissionRequiredError()
+
+        if not await self.bed_repository.delete(bed_id):
+            raise BedNotFoundError()
@@ -0,0 +1,58 @@
+from typing import AsyncIterator, Optional
+
+from vidaplus.main.enums.roles import Roles
+from vidaplus.main.exceptions import PermissionRequiredError, PreconditionFailedError, SupplyNotFoundError
+from vidaplus.main.schemas.page import PageSchema
+from vidaplus.main.schemas.supply import CreateSupplySchema, SupplySchema
+from vidaplus.main.schemas.user import PublicUserSchema
+from vidaplus.models.repositories.interfaces.asynchronous.supply_repository_interface import (
+    AsyncSupplyRepositoryInterface,
+)
+
+
+class AsyncSupplyService:
+    def __init__(self, supply_repository: AsyncSupplyRepositoryInterface) -> None:
+        self.supply_repository = supply_repository
+
+    async def create(self, data: CreateSupplySchema, creator: PublicUserSchema) -> SupplySchema:
+        if not creator.role == Roles.ADMIN:
+            raise PermissionRequiredError()
+
+        return await self.supply_repository.create(data)
+
+    async def all(self, cursor: Optional[str] = None, limit: Optional[int] = None) -> PageSchema[SupplySchema]:
+        return await self.supply_repository.all(cursor, limit)
+
+    def stream(self, cursor: Optional[str] = None) -> AsyncIterator[SupplySchema]:
+        return self.supply_repository.stream(cursor)
+
+    async def get_by_id(self, supply_id: int) -> SupplySchema:
+        supply = await self.supply_repository.get_by_id(supply_id)
+
+        if not supply:
+            raise SupplyNotFoundError()
+
+        return supply
+
+    async def update(
+        self, supply_id: int, data: CreateSupplySchema, executor: PublicUserSchema, version: Optional[int] = None
+    ) -> SupplySchema:
+        if not executor.role == Roles.ADMIN:
+            raise PermissionRequiredError()
+
+        supply = await self.supply_repository.update(supply_id, data, version)
+
+        if not supply:
+            if version is not None and await self.supply_repository.get_by_id(supply_id):
+                raise PreconditionFailedError()
+
+            raise SupplyNotFoundError()
+
+        return supply
+
+    async def delete(self, supply_id: int, executor: PublicUserSchema) -> None:
+        if not executor.role == Roles.ADMIN:
+            raise PermissionRequiredError()
+
+        if not await self.supply_repository.delete(supply_id):
+            raise SupplyNotFoundError()
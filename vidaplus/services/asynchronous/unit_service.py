@@ -0,0 +1,53 @@
+from typing import AsyncIterator, Optional
+
+from vidaplus.main.enums.roles import Roles
+from vidaplus.main.exceptions import PermissionRequiredError, UnitNotFoundError
+from vidaplus.main.schemas.page import PageSchema
+from vidaplus.main.schemas.unit import CreateUnitSchema, UnitSchema
+from vidaplus.main.schemas.user import PublicUserSchema
+from vidaplus.models.repositories.interfaces.asynchronous.unit_repository_interface import (
+    AsyncUnitRepositoryInterface,
+)
+
+
+class AsyncUnitService:
+    def __init__(self, repository: AsyncUnitRepositoryInterface) -> None:
+        self.repository = repository
+
+    async def create(self, data: CreateUnitSchema, creator: PublicUserSchema) -> UnitSchema:
+        if not creator.role == Roles.ADMIN:
+            raise PermissionRequiredError()
+
+        return await self.repository.create(data)
+
+    async def get_all(self, cursor: Optional[str] = None, limit: Optional[int] = None) -> PageSchema[UnitSchema]:
+        return await self.repository.all(cursor, limit)
+
+    def stream(self, cursor: Optional[str] = None) -> AsyncIterator[UnitSchema]:
+        return self.repository.stream(cursor)
+
+    async def get_by_id(self, unit_id: int) -> UnitSchema:
+        unit = await self.repository.get_by_id(unit_id)
+
+        if not unit:
+            raise UnitNotFoundError()
+
+        return unit
+
+    async def update(self, unit_id: int, data: CreateUnitSchema, executor: PublicUserSchema) -> UnitSchema:
+        if not executor.role == Roles.ADMIN:
+            raise PermissionRequiredError()
+
+        unit = await self.repository.update(unit_id, data)
+
+        if not unit:
+            raise UnitNotFoundError()
+
+        return unit
+
+    async def delete(self, unit_id: int, executor: PublicUserSchema) -> None:
+        if not executor.role == Roles.ADMIN:
+            raise PermissionRequiredError()
+
+        if not await self.repository.delete(unit_id):
+            raise UnitNotFoundError()
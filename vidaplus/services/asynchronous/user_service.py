@@ -0,0 +1,134 @@
+from typing import AsyncIterator, Optional
+from uuid import UUID
+
+from vidaplus.main.enums.roles import Roles
+from vidaplus.main.exceptions import (
+    AuthenticationError,
+    EmailAlreadyExistsError,
+    PermissionRequiredError,
+    TooManyLoginAttemptsError,
+    UserNotFoundError,
+)
+from vidaplus.main.schemas.page import PageSchema
+from vidaplus.main.schemas.user import CreateUserSchema, PublicUserSchema, RequestCreateUserSchema
+from vidaplus.models.cache.login_throttle import LoginThrottle, UnknownEmailCache, forget_unknown_email
+from vidaplus.models.repositories.interfaces.asynchronous.user_repository_interface import (
+    AsyncUserRepositoryInterface,
+)
+from vidaplus.services.auth_service import AuthService
+from vidaplus.services.password_hasher import PasswordHasher
+from vidaplus.services.user_service import PUBLIC_USER_LIST
+
+
+class AsyncUserService:
+    def __init__(self, repository: AsyncUserRepositoryInterface) -> None:
+        self.repository = repository
+
+    async def new_patient(self, new_user: RequestCreateUserSchema) -> PublicUserSchema:
+        user_with_role = CreateUserSchema(
+            **new_user.model_dump(exclude={'password'}),
+            password=await PasswordHasher.hash_async(new_user.password),
+            role=Roles.PATIENT,
+        )
+        created_user = await self.repository.create(user_with_role)
+
+        if not created_user:
+            raise EmailAlreadyExistsError()
+
+        forget_unknown_email(created_user.email)
+        return PublicUserSchema.model_validate(created_user)
+
+    async def new_healthcare_professional(
+        self, new_user: RequestCreateUserSchema, creator: PublicUserSchema
+    ) -> PublicUserSchema:
+        if not creator.role == Roles.ADMIN:
+            raise PermissionRequiredError()
+
+        user_with_role = CreateUserSchema(
+            **new_user.model_dump(exclude={'password'}),
+            password=await PasswordHasher.hash_async(new_user.password),
+            role=Roles.HEALTHCARE_PROFESSIONAL,
+        )
+        created_user = await self.repository.create(user_with_role)
+
+        if not created_user:
+            raise EmailAlreadyExistsError()
+
+        forget_unknown_email(created_user.email)
+        return PublicUserSchema.model_validate(created_user)
+
+    async def update(self, user_id: UUID, data: CreateUserSchema, executor: PublicUserSchema) -> PublicUserSchema:
+        user = None
+
+        if executor.role == Roles.ADMIN or user_id == executor.id:
+            data = data.model_copy(update={'password': await PasswordHasher.hash_async(data.password)})
+
+        # Quem não é administrador só atualiza a si mesmo e sem mudar de papel.
+        if executor.role == Roles.ADMIN:
+            user = await self.repository.update(user_id, data)
+        elif user_id == executor.id:
+            user = await self.repository.update(user_id, data, role=data.role)
+
+        if not user:
+            if not await self.repository.get_by_id(user_id):
+                raise UserNotFoundError()
+
+            raise PermissionRequiredError()
+
+        forget_unknown_email(user.email)
+        return PublicUserSchema.model_validate(user)
+
+    async def delete(self, user_id: UUID, executor: PublicUserSchema) -> None:
+        if not executor.role == Roles.ADMIN:
+            raise PermissionRequiredError()
+
+        if not await self.repository.delete(user_id):
+            raise UserNotFoundError()
+
+    async def authenticate(self, email: str, password: str, client: Optional[str] = None) -> str:
+        throttle = LoginThrottle.get_instance()
+
+        if throttle is not None and not throttle.allow(client, email):
+            raise TooManyLoginAttemptsError()
+
+        # Emails que o banco acabou de confirmar como desconhecidos são recusados sem nova consulta.
+        unknown_emails = UnknownEmailCache.get_instance()
+
+        if unknown_emails is not None and email in unknown_emails:
+            raise AuthenticationError()
+
+        user = await self.repository.get_by_email(email)
+
+        if not user:
+            if unknown_emails is not None:
+                unknown_emails.add(email)
+
+            raise AuthenticationError()
+
+        if not await PasswordHasher.verify_async(password, user.password):
+            raise AuthenticationError()
+
+        if PasswordHasher.needs_rehash(user.password):
+            await self.repository.update_password(user.id, await PasswordHasher.hash_async(password))
+
+        public_user = PublicUserSchema.model_validate(user)
+        access_token = AuthService.create_access_token(public_user.model_dump())
+        return access_token
+
+    async def all(
+        self, role: Roles, cursor: Optional[str] = None, limit: Optional[int] = None
+    ) -> PageSchema[PublicUserSchema]:
+        users = await self.repository.get_all(role, cursor, limit)
+        return PageSchema(items=PUBLIC_USER_LIST.validate_python(users.items), next_cursor=users.next_cursor)
+
+    async def stream(self, role: Roles, cursor: Optional[str] = None) -> AsyncIterator[PublicUserSchema]:
+        async for user in self.repository.stream(role, cursor):
+            yield PublicUserSchema.model_validate(user)
+
+    async def get_by_id(self, user_id: UUID) -> PublicUserSchema:
+        user = await self.repository.get_by_id(user_id)
+
+        if not user:
+            raise UserNotFoundError()
+
+        return PublicUserSchema.model_validate(user)
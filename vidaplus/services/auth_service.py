@@ -1,13 +1,27 @@
 from datetime import datetime, timedelta
+from uuid import uuid4
 from zoneinfo import ZoneInfo
 
 import jwt
-from fastapi import Depends
+from fastapi import Depends, Request
 from fastapi.security import OAuth2PasswordBearer
 
 from vidaplus.main.enums.roles import Roles
-from vidaplus.main.exceptions import ExpiredTokenError, InvalidTokenError, PermissionRequiredError, TokenRefreshError
+from vidaplus.main.exceptions import (
+    ExpiredTokenError,
+    InvalidTokenError,
+    PermissionRequiredError,
+    RevokedTokenError,
+    TokenRefreshError,
+)
 from vidaplus.main.schemas.auth import TokenData
+from vidaplus.models.cache.revocation_list import RevocationList
+from vidaplus.models.cache.token_cache import TokenCache
+from vidaplus.models.config.unit_of_work import UnitOfWork
+from vidaplus.models.repositories.interfaces.revoked_token_repository_interface import (
+    RevokedTokenRepositoryInterface,
+)
+from vidaplus.models.repositories.revoked_token_repository import RevokedTokenRepository
 from vidaplus.settings import Settings
 
 
@@ -20,6 +34,7 @@ class AuthService:
         to_encode = data.copy()
         to_encode['id'] = str(data['id'])
         to_encode['created_at'] = data['created_at'].isoformat()
+        to_encode['jti'] = uuid4().hex
         expire = datetime.now(ZoneInfo(cls.settings.TIMEZONE)) + timedelta(
             minutes=cls.settings.ACCESS_TOKEN_EXPIRE_MINUTES
         )
@@ -28,34 +43,120 @@ class AuthService:
 
     @classmethod
     def decode_access_token(cls, token: str) -> TokenData:
+        cache = TokenCache.get_instance()
+        data = cache.get(token) if cache is not None else None
+
+        if data is not None:
+            return data
+
         try:
             payload = jwt.decode(token, cls.settings.SECRET_KEY, algorithms=[cls.settings.ALGORITHM])
-            return TokenData(**payload)
+            data = TokenData(**payload)
         except jwt.ExpiredSignatureError:
             raise ExpiredTokenError()
         except jwt.DecodeError:
             raise InvalidTokenError()
 
+        if cache is not None:
+            cache.put(token, data)
+
+        return data
+
+    @classmethod
+    def authenticate(cls, request: Request, token: str) -> TokenData:
+        """Decodifica o token no máximo uma vez por requisição, mesmo quando várias dependências precisam dele."""
+        memoized: tuple[str, TokenData] | None = getattr(request.state, 'token_data', None)
+
+        if memoized is not None and memoized[0] == token:
+            return memoized[1]
+
+        data = cls.decode_access_token(token)
+
+        if cls.is_revoked(data):
+            raise RevokedTokenError()
+
+        request.state.token_data = (token, data)
+        return data
+
     @classmethod
-    def refresh_token(cls, access_token: str) -> str:
+    def is_revoked(cls, data: TokenData) -> bool:
+        """Consulta o banco só para buscar as revogações novas ou confirmar um token que caiu no filtro."""
+        if data.jti is None:
+            return False
+
+        revocations = RevocationList.get_instance()
+        last_id = revocations.claim_sync()
+
+        if last_id is not None:
+            with UnitOfWork() as uow:
+                try:
+                    revocations.apply(RevokedTokenRepository(uow).since(last_id))
+                except BaseException:
+                    revocations.release()
+                    raise
+
+        if data.jti not in revocations:
+            return False
+
+        with UnitOfWork() as uow:
+            return RevokedTokenRepository(uow).exists(data.jti)
+
+    @classmethod
+    def rebuild_revocations(cls) -> None:
+        """Reconstrói o filtro de revogações quando é a hora; chamado pela tarefa de fundo, fora das requisições."""
+        revocations = RevocationList.get_instance()
+
+        if not revocations.claim_rebuild():
+            return
+
+        with UnitOfWork() as uow:
+            try:
+                revocations.rebuild(RevokedTokenRepository(uow).since(0))
+            except BaseException:
+                revocations.release()
+                raise
+
+    @classmethod
+    def revoke(cls, data: TokenData, repository: RevokedTokenRepositoryInterface) -> bool:
+        """Retorna `False` se outra requisição já revogou o token, por exemplo num logout ou renovação concorrente."""
+        # Tokens emitidos antes dos ids não podem ser revogados; valem até expirar.
+        if data.jti is None:
+            return True
+
+        repository.delete_expired()
+        revoked = repository.add(data.jti, data.exp)
+        RevocationList.get_instance().add(data.jti)
+        return revoked
+
+    @classmethod
+    def refresh_token(cls, access_token: str, repository: RevokedTokenRepositoryInterface) -> str:
+        """Emite um novo token e revoga o atual, para que cada token só possa ser renovado uma vez."""
         try:
             payload = cls.decode_access_token(access_token)
 
             if payload.exp < datetime.now(ZoneInfo(cls.settings.TIMEZONE)):
                 raise ExpiredTokenError()
 
+            if cls.is_revoked(payload):
+                raise RevokedTokenError()
+
             new_access_token = cls.create_access_token(payload.model_dump())
-            return new_access_token
         except Exception:
             raise TokenRefreshError()
 
+        # Uma renovação concorrente do mesmo token pode ter passado por `is_revoked` junto com esta; só uma vence.
+        if not cls.revoke(payload, repository):
+            raise TokenRefreshError()
+
+        return new_access_token
+
     @classmethod
-    def get_current_user(cls, token: str = Depends(oauth2_scheme)) -> TokenData:
-        return cls.decode_access_token(token)
+    def get_current_user(cls, request: Request, token: str = Depends(oauth2_scheme)) -> TokenData:
+        return cls.authenticate(request, token)
 
     @classmethod
-    def is_admin(cls, token: str = Depends(oauth2_scheme)) -> None:
-        payload = cls.decode_access_token(token)
+    def is_admin(cls, request: Request, token: str = Depends(oauth2_scheme)) -> None:
+        payload = cls.authenticate(request, token)
 
         if not payload.role == Roles.ADMIN:
             raise PermissionRequiredError()
@@ -0,0 +1,114 @@
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import Optional
+from uuid import UUID
+
+from vidaplus.main.exceptions import InvalidAvailabilityRangeError, UserNotFoundError
+from vidaplus.main.schemas.availability import AvailabilitySchema
+from vidaplus.models.config.timezone import as_aware, local_timezone
+from vidaplus.models.repositories.interfaces.appointment_repository_interface import AppointmentRepositoryInterface
+from vidaplus.settings import Settings
+
+Interval = tuple[datetime, datetime]
+Window = tuple[datetime, datetime, datetime]
+
+
+class AvailabilityService:
+    def __init__(self, repository: AppointmentRepositoryInterface) -> None:
+        self.repository = repository
+
+    def search(
+        self, start: datetime, end: datetime, duration: int, professional_ids: Optional[list[UUID]] = None
+    ) -> list[AvailabilitySchema]:
+        settings = Settings()
+        windows = working_windows(start, end, duration, settings)
+        busy = self.repository.get_busy_intervals(start, end, professional_ids)
+        return build_availability(windows, busy, duration, settings.AVAILABILITY_SLOT_MINUTES)
+
+    def search_for_professional(
+        self, professional_id: UUID, start: datetime, end: datetime, duration: int
+    ) -> AvailabilitySchema:
+        availability = self.search(start, end, duration, [professional_id])
+
+        if not availability:
+            raise UserNotFoundError()
+
+        return availability[0]
+
+
+def working_windows(start: datetime, end: datetime, duration: int, settings: Settings) -> list[Window]:
+    """Janelas de expediente dentro de `[start, end)`, no formato `(início do expediente, início, fim)`.
+
+    O início do expediente, mesmo quando `start` cai no meio dele, é a origem da grade de horários, para que os
+    horários sugeridos fiquem alinhados (08:00, 08:15, ...).
+    """
+    start, end = as_aware(start), as_aware(end)
+    start = max(start, as_aware(datetime.now()))
+
+    if duration <= 0 or end <= start or end - start > timedelta(days=settings.AVAILABILITY_MAX_DAYS):
+        raise InvalidAvailabilityRangeError()
+
+    timezone = local_timezone()
+    day = start.astimezone(timezone).date()
+    last_day = end.astimezone(timezone).date()
+    windows: list[Window] = []
+
+    while day <= last_day:
+        if day.weekday() in settings.WORKING_DAYS:
+            opening = datetime.combine(day, settings.WORKING_HOURS_START, tzinfo=timezone)
+            closing = datetime.combine(day, settings.WORKING_HOURS_END, tzinfo=timezone)
+
+            if max(opening, start) < min(closing, end):
+                windows.append((opening, max(opening, start), min(closing, end)))
+
+        day += timedelta(days=1)
+
+    return windows
+
+
+def free_slots(windows: list[Window], busy: list[Interval], duration: int, step: int) -> list[datetime]:
+    """Horários livres de `duration` minutos, varrendo em conjunto as janelas e os intervalos ocupados ordenados.
+
+    Cada trecho livre é convertido em horários de uma vez, somando ao seu primeiro horário uma lista de deslocamentos
+    calculada previamente, em vez de avançar a grade de passo em passo.
+    """
+    length, grid = timedelta(minutes=duration), timedelta(minutes=step)
+    longest_window = max((window_end - origin for origin, _, window_end in windows), default=timedelta())
+    offsets = [grid * i for i in range(longest_window // grid + 1)]
+    slots: list[datetime] = []
+    first_busy = 0
+
+    def add_slots(origin: datetime, gap_start: datetime, gap_end: datetime) -> None:
+        slot = origin - ((origin - gap_start) // grid) * grid
+
+        if slot + length <= gap_end:
+            slots.extend(map(slot.__add__, islice(offsets, (gap_end - length - slot) // grid + 1)))
+
+    for origin, window_start, window_end in windows:
+        while first_busy < len(busy) and busy[first_busy][1] <= window_start:
+            first_busy += 1
+
+        cursor, position = window_start, first_busy
+
+        while position < len(busy) and busy[position][0] < window_end:
+            busy_start, busy_end = busy[position]
+            add_slots(origin, cursor, min(busy_start, window_end))
+            cursor = max(cursor, busy_end)
+            position += 1
+
+        add_slots(origin, cursor, window_end)
+
+    return slots
+
+
+def build_availability(
+    windows: list[Window], busy: dict[UUID, list[Interval]], duration: int, step: int
+) -> list[AvailabilitySchema]:
+    return [
+        AvailabilitySchema(
+            professional_id=professional_id,
+            duration=duration,
+            slots=free_slots(windows, [(as_aware(s), as_aware(e)) for s, e in intervals], duration, step),
+        )
+        for professional_id, intervals in busy.items()
+    ]
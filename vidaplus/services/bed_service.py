@@ -1,6 +1,14 @@
+from typing import Iterator, Optional
+
 from vidaplus.main.enums.roles import Roles
-from vidaplus.main.exceptions import BedNotFoundError, PermissionRequiredError, UnitNotFoundError
+from vidaplus.main.exceptions import (
+    BedNotFoundError,
+    PermissionRequiredError,
+    PreconditionFailedError,
+    UnitNotFoundError,
+)
 from vidaplus.main.schemas.bed import BedSchema, CreateBedSchema
+from vidaplus.main.schemas.page import PageSchema
 from vidaplus.main.schemas.user import PublicUserSchema
 from vidaplus.models.repositories.interfaces.bed_repository_interface import BedRepositoryInterface
 from vidaplus.models.repositories.interfaces.unit_repository_interface import UnitRepositoryInterface
@@ -22,8 +30,11 @@ class BedService:
 
         return self.bed_repository.create(bed)
 
-    def all(self) -> list[BedSchema]:
-        return self.bed_repository.all()
+    def all(self, cursor: Optional[str] = None, limit: Optional[int] = None) -> PageSchema[BedSchema]:
+        return self.bed_repository.all(cursor, limit)
+
+    def stream(self, cursor: Optional[str] = None) -> Iterator[BedSchema]:
+        return self.bed_repository.stream(cursor)
 
     def get_by_id(self, bed_id: int) -> BedSchema:
         bed = self.bed_repository.get_by_id(bed_id)
@@ -33,7 +44,9 @@ class BedService:
 
         return bed
 
-    def update(self, bed_id: int, bed: CreateBedSchema, executor: PublicUserSchema) -> BedSchema:
+    def update(
+        self, bed_id: int, bed: CreateBedSchema, executor: PublicUserSchema, version: Optional[int] = None
+    ) -> BedSchema:
         if not executor.role == Roles.ADMIN:
             raise PermissionRequiredError()
 
@@ -41,14 +54,19 @@ class BedService:
         if not unit:
             raise UnitNotFoundError()
 
-        return self.bed_repository.update(bed_id, bed)
+        updated = self.bed_repository.update(bed_id, bed, version)
+
+        if not updated:
+            if version is not None and self.bed_repository.get_by_id(bed_id):
+                raise PreconditionFailedError()
+
+            raise BedNotFoundError()
+
+        return updated
 
     def delete(self, bed_id: int, executor: PublicUserSchema) -> None:
         if not executor.role == Roles.ADMIN:
             raise PermissionRequiredError()
 
-        bed = self.bed_repository.get_by_id(bed_id)
-        if not bed:
+        if not self.bed_repository.delete(bed_id):
             raise BedNotFoundError()
-
-        return self.bed_repository.delete(bed_id)
@@ -0,0 +1,158 @@
+import asyncio
+import multiprocessing
+import os
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from threading import Lock
+from typing import Any, Callable, TypeVar
+
+import bcrypt
+
+from vidaplus.main.exceptions import PasswordHashingBusyError
+from vidaplus.settings import Settings
+
+T = TypeVar('T')
+
+
+def hash_password(password: str, rounds: int) -> str:
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds)).decode('utf-8')
+
+
+def check_password(password: str, hashed: str) -> bool:
+    return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
+
+
+def hash_time(rounds: int) -> float:
+    """Segundos que um hash com o custo `rounds` leva no processo atual."""
+    start = time.perf_counter()
+    hash_password('calibração', rounds)
+    return time.perf_counter() - start
+
+
+def hash_rounds(hashed: str) -> int:
+    """Custo de um hash bcrypt, no formato `$2b$<custo>$<sal e hash>`."""
+    return int(hashed.split('$')[2])
+
+
+def calibrate(measured: float, measured_rounds: int, target: float, max_rounds: int) -> int:
+    """Maior custo, a partir de `measured_rounds`, cujo tempo estimado não passa de `target` segundos.
+
+    Cada unidade de custo dobra o trabalho do bcrypt, então o tempo é estimado a partir de uma única medição.
+    """
+    rounds = measured_rounds
+
+    while rounds < max_rounds and measured * 2 ** (rounds + 1 - measured_rounds) <= target:
+        rounds += 1
+
+    return rounds
+
+
+class PasswordHasher:
+    """Executa o bcrypt em um pool de processos próprio, um por processo da aplicação.
+
+    Assim, rajadas de logins e cadastros usam os núcleos disponíveis sem ocupar o thread pool nem o event loop, que
+    só aguardam o resultado. Quando há `PASSWORD_HASH_MAX_PENDING` operações na fila ou em execução, novas operações
+    são recusadas na hora com `PasswordHashingBusyError`, em vez de se acumularem.
+
+    As rotas, nas duas pilhas, usam `hash_async` e `verify_async`. `hash` e `verify` bloqueiam a thread que os chama
+    até o fim da operação e ficam para scripts e testes: chamados do thread pool do AnyIO, cada operação pendente
+    prenderia uma das suas threads (40 por padrão, menos que o padrão de `PASSWORD_HASH_MAX_PENDING`).
+
+    Com `PASSWORD_HASH_TARGET_MS`, o custo é calibrado ao iniciar o pool: o maior entre `PASSWORD_HASH_ROUNDS` e
+    `PASSWORD_HASH_MAX_ROUNDS` cujo hash leva até esse tempo neste hardware. A calibração é feita uma vez por processo.
+    """
+
+    __executor: ProcessPoolExecutor | None = None
+    __max_pending = 0
+    __pending = 0
+    __lock = Lock()
+    __calibrations: dict[tuple[int, int, int], int] = {}
+    rounds = 12
+
+    @classmethod
+    def start(cls) -> None:
+        if cls.__executor is None:
+            with cls.__lock:
+                if cls.__executor is None:
+                    cls.__executor = cls.__create_executor(Settings())
+
+    @classmethod
+    def hash(cls, password: str) -> str:
+        cls.start()
+        return cls.__submit(hash_password, password, cls.rounds).result()
+
+    @classmethod
+    def needs_rehash(cls, hashed: str) -> bool:
+        """Se o hash foi gerado com um custo menor que o atual e deve ser refeito no próximo login."""
+        cls.start()
+        return hash_rounds(hashed) < cls.rounds
+
+    @classmethod
+    def verify(cls, password: str, hashed: str) -> bool:
+        return cls.__submit(check_password, password, hashed).result()
+
+    @classmethod
+    async def hash_async(cls, password: str) -> str:
+        cls.start()
+        return await asyncio.wrap_future(cls.__submit(hash_password, password, cls.rounds))
+
+    @classmethod
+    async def verify_async(cls, password: str, hashed: str) -> bool:
+        return await asyncio.wrap_future(cls.__submit(check_password, password, hashed))
+
+    @classmethod
+    def shutdown(cls) -> None:
+        with cls.__lock:
+            executor, cls.__executor = cls.__executor, None
+
+        # Fora da trava: cancelar as operações na fila chama `__release`, que também a usa.
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+    @classmethod
+    def __submit(cls, function: Callable[..., T], *args: Any) -> Future[T]:
+        cls.start()
+
+        with cls.__lock:
+            if cls.__executor is None or cls.__pending >= cls.__max_pending:
+                raise PasswordHashingBusyError()
+
+            cls.__pending += 1
+            future = cls.__executor.submit(function, *args)
+
+        future.add_done_callback(cls.__release)
+        return future
+
+    @classmethod
+    def __release(cls, future: Future[Any]) -> None:
+        with cls.__lock:
+            cls.__pending -= 1
+
+    @classmethod
+    def __create_executor(cls, settings: Settings) -> ProcessPoolExecutor:
+        cls.__max_pending = settings.PASSWORD_HASH_MAX_PENDING
+        executor = create_executor(settings.PASSWORD_HASH_WORKERS)
+
+        if settings.PASSWORD_HASH_TARGET_MS:
+            key = (settings.PASSWORD_HASH_ROUNDS, settings.PASSWORD_HASH_MAX_ROUNDS, settings.PASSWORD_HASH_TARGET_MS)
+
+            if key not in cls.__calibrations:
+                # Medido em um processo do pool, onde os hashes de fato rodam.
+                measured = executor.submit(hash_time, settings.PASSWORD_HASH_ROUNDS).result()
+                target = settings.PASSWORD_HASH_TARGET_MS / 1000
+                cls.__calibrations[key] = calibrate(
+                    measured, settings.PASSWORD_HASH_ROUNDS, target, settings.PASSWORD_HASH_MAX_ROUNDS
+                )
+
+            cls.rounds = cls.__calibrations[key]
+        else:
+            cls.rounds = settings.PASSWORD_HASH_ROUNDS
+
+        return executor
+
+
+def create_executor(workers: int) -> ProcessPoolExecutor:
+    # `forkserver`, e não `fork`: o processo da aplicação tem threads, e um fork no meio delas pode travar.
+    return ProcessPoolExecutor(
+        max_workers=workers or os.cpu_count(), mp_context=multiprocessing.get_context('forkserver')
+    )
@@ -1,5 +1,8 @@
+from typing import Iterator, Optional
+
 from vidaplus.main.enums.roles import Roles
-from vidaplus.main.exceptions import PermissionRequiredError, SupplyNotFoundError
+from vidaplus.main.exceptions import PermissionRequiredError, PreconditionFailedError, SupplyNotFoundError
+from vidaplus.main.schemas.page import PageSchema
 from vidaplus.main.schemas.supply import CreateSupplySchema, SupplySchema
 from vidaplus.main.schemas.user import PublicUserSchema
 from vidaplus.models.repositories.interfaces.supply_repository_interface import SupplyRepositoryInterface
@@ -15,8 +18,11 @@ class SupplyService:
 
         return self.supply_repository.create(data)
 
-    def all(self) -> list[SupplySchema]:
-        return self.supply_repository.all()
+    def all(self, cursor: Optional[str] = None, limit: Optional[int] = None) -> PageSchema[SupplySchema]:
+        return self.supply_repository.all(cursor, limit)
+
+    def stream(self, cursor: Optional[str] = None) -> Iterator[SupplySchema]:
+        return self.supply_repository.stream(cursor)
 
     def get_by_id(self, supply_id: int) -> SupplySchema:
         supply = self.supply_repository.get_by_id(supply_id)
@@ -26,22 +32,25 @@ class SupplyService:
 
         return supply
 
-    def update(self, supply_id: int, data: CreateSupplySchema, executor: PublicUserSchema) -> SupplySchema:
+    def update(
+        self, supply_id: int, data: CreateSupplySchema, executor: PublicUserSchema, version: Optional[int] = None
+    ) -> SupplySchema:
         if not executor.role == Roles.ADMIN:
             raise PermissionRequiredError()
 
-        supply = self.supply_repository.get_by_id(supply_id)
+        supply = self.supply_repository.update(supply_id, data, version)
+
         if not supply:
+            if version is not None and self.supply_repository.get_by_id(supply_id):
+                raise PreconditionFailedError()
+
             raise SupplyNotFoundError()
 
-        return self.supply_repository.update(supply_id, data)
+        return supply
 
     def delete(self, supply_id: int, executor: PublicUserSchema) -> None:
         if not executor.role == Roles.ADMIN:
             raise PermissionRequiredError()
 
-        supply = self.supply_repository.get_by_id(supply_id)
-        if not supply:
+        if not self.supply_repository.delete(supply_id):
             raise SupplyNotFoundError()
-
-        self.supply_repository.delete(supply_id)
@@ -1,5 +1,8 @@
+from typing import Iterator, Optional
+
 from vidaplus.main.enums.roles import Roles
 from vidaplus.main.exceptions import PermissionRequiredError, UnitNotFoundError
+from vidaplus.main.schemas.page import PageSchema
 from vidaplus.main.schemas.unit import CreateUnitSchema, UnitSchema
 from vidaplus.main.schemas.user import PublicUserSchema
 from vidaplus.models.repositories.interfaces.unit_repository_interface import UnitRepositoryInterface
@@ -15,8 +18,11 @@ class UnitService:
 
         return self.repository.create(data)
 
-    def get_all(self) -> list[UnitSchema]:
-        return self.repository.all()
+    def get_all(self, cursor: Optional[str] = None, limit: Optional[int] = None) -> PageSchema[UnitSchema]:
+        return self.repository.all(cursor, limit)
+
+    def stream(self, cursor: Optional[str] = None) -> Iterator[UnitSchema]:
+        return self.repository.stream(cursor)
 
     def get_by_id(self, unit_id: int) -> UnitSchema:
         unit = self.repository.get_by_id(unit_id)
@@ -27,22 +33,19 @@ class UnitService:
         return unit
 
     def update(self, unit_id: int, data: CreateUnitSchema, executor: PublicUserSchema) -> UnitSchema:
-        unit = self.repository.get_by_id(unit_id)
-
         if not executor.role == Roles.ADMIN:
             raise PermissionRequiredError()
 
+        unit = self.repository.update(unit_id, data)
+
         if not unit:
             raise UnitNotFoundError()
 
-        return self.repository.update(unit_id, data)
+        return unit
 
     def delete(self, unit_id: int, executor: PublicUserSchema) -> None:
         if not executor.role == Roles.ADMIN:
             raise PermissionRequiredError()
 
-        unit = self.repository.get_by_id(unit_id)
-        if not unit:
+        if not self.repository.delete(unit_id):
             raise UnitNotFoundError()
-
-        return self.repository.delete(unit_id)
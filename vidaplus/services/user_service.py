@@ -1,96 +1,147 @@
+from typing import Iterator, Optional
 from uuid import UUID
 
+from pydantic import TypeAdapter
+from starlette.concurrency import run_in_threadpool
+
 from vidaplus.main.enums.roles import Roles
 from vidaplus.main.exceptions import (
     AuthenticationError,
     EmailAlreadyExistsError,
     PermissionRequiredError,
+    TooManyLoginAttemptsError,
     UserNotFoundError,
 )
+from vidaplus.main.schemas.page import PageSchema
 from vidaplus.main.schemas.user import CreateUserSchema, PublicUserSchema, RequestCreateUserSchema
+from vidaplus.models.cache.login_throttle import LoginThrottle, UnknownEmailCache, forget_unknown_email
 from vidaplus.models.repositories.interfaces.user_repository_interface import UserRepositoryInterface
 from vidaplus.services.auth_service import AuthService
+from vidaplus.services.password_hasher import PasswordHasher
+
+# Valida os usuários de uma página de uma só vez, lendo os atributos de `UserSchema` sem convertê-los em dicionários.
+PUBLIC_USER_LIST = TypeAdapter(list[PublicUserSchema])
 
 
 class UserService:
     def __init__(self, repository: UserRepositoryInterface) -> None:
         self.repository = repository
 
-    def new_patient(self, new_user: RequestCreateUserSchema) -> PublicUserSchema:
+    # Os métodos que calculam hashes são assíncronos: aguardam o pool de processos do `PasswordHasher` no event loop
+    # e levam só as chamadas ao repositório para o thread pool, que assim não fica parado à espera do bcrypt.
+    async def new_patient(self, new_user: RequestCreateUserSchema) -> PublicUserSchema:
         try:
-            email_already_exists = self.repository.get_by_email(new_user.email)
-
-            if email_already_exists:
+            user_with_role = CreateUserSchema(
+                **new_user.model_dump(exclude={'password'}),
+                password=await PasswordHasher.hash_async(new_user.password),
+                role=Roles.PATIENT,
+            )
+            created_user = await run_in_threadpool(self.repository.create, user_with_role)
+
+            if not created_user:
                 raise EmailAlreadyExistsError()
 
-            user_with_role = CreateUserSchema(**new_user.model_dump(), role=Roles.PATIENT)
-            created_user = self.repository.create(user_with_role)
-            return PublicUserSchema(**created_user.model_dump())
+            forget_unknown_email(created_user.email)
+            return PublicUserSchema.model_validate(created_user)
         except Exception as e:
             raise e
 
-    def new_healthcare_professional(
+    async def new_healthcare_professional(
         self, new_user: RequestCreateUserSchema, creator: PublicUserSchema
     ) -> PublicUserSchema:
         try:
             if not creator.role == Roles.ADMIN:
                 raise PermissionRequiredError()
 
-            email_already_exists = self.repository.get_by_email(new_user.email)
-            if email_already_exists:
+            user_with_role = CreateUserSchema(
+                **new_user.model_dump(exclude={'password'}),
+                password=await PasswordHasher.hash_async(new_user.password),
+                role=Roles.HEALTHCARE_PROFESSIONAL,
+            )
+            created_user = await run_in_threadpool(self.repository.create, user_with_role)
+
+            if not created_user:
                 raise EmailAlreadyExistsError()
 
-            user_with_role = CreateUserSchema(**new_user.model_dump(), role=Roles.HEALTHCARE_PROFESSIONAL)
-            created_user = self.repository.create(user_with_role)
-            return PublicUserSchema(**created_user.model_dump())
+            forget_unknown_email(created_user.email)
+            return PublicUserSchema.model_validate(created_user)
         except Exception as e:
             raise e
 
-    def update(self, user_id: UUID, data: CreateUserSchema, executor: PublicUserSchema) -> PublicUserSchema:
+    async def update(self, user_id: UUID, data: CreateUserSchema, executor: PublicUserSchema) -> PublicUserSchema:
         try:
-            user = self.repository.get_by_id(user_id)
+            user = None
 
-            if not user:
-                raise UserNotFoundError()
+            if executor.role == Roles.ADMIN or user_id == executor.id:
+                data = data.model_copy(update={'password': await PasswordHasher.hash_async(data.password)})
 
-            if not executor.role == Roles.ADMIN and user.id != executor.id:
-                raise PermissionRequiredError()
+            # Quem não é administrador só atualiza a si mesmo e sem mudar de papel.
+            if executor.role == Roles.ADMIN:
+                user = await run_in_threadpool(self.repository.update, user_id, data)
+            elif user_id == executor.id:
+                user = await run_in_threadpool(self.repository.update, user_id, data, role=data.role)
 
-            if not executor.role == Roles.ADMIN and not user.role == data.role:
-                raise PermissionRequiredError()
+            if not user:
+                if not await run_in_threadpool(self.repository.get_by_id, user_id):
+                    raise UserNotFoundError()
 
-            user = self.repository.update(user_id, data)
+                raise PermissionRequiredError()
 
-            return PublicUserSchema(**user.model_dump())
+            forget_unknown_email(user.email)
+            return PublicUserSchema.model_validate(user)
         except Exception as e:
             raise e
 
     def delete(self, user_id: UUID, executor: PublicUserSchema) -> None:
         try:
-            user = self.repository.get_by_id(user_id)
-            if not user:
-                raise UserNotFoundError()
-
             if not executor.role == Roles.ADMIN:
                 raise PermissionRequiredError()
 
-            self.repository.delete(user_id)
+            if not self.repository.delete(user_id):
+                raise UserNotFoundError()
         except Exception as e:
             raise e
 
-    def authenticate(self, email: str, password: str) -> str:
-        user = self.repository.get_by_email(email)
+    async def authenticate(self, email: str, password: str, client: Optional[str] = None) -> str:
+        throttle = LoginThrottle.get_instance()
+
+        if throttle is not None and not throttle.allow(client, email):
+            raise TooManyLoginAttemptsError()
+
+        # Emails que o banco acabou de confirmar como desconhecidos são recusados sem nova consulta.
+        unknown_emails = UnknownEmailCache.get_instance()
+
+        if unknown_emails is not None and email in unknown_emails:
+            raise AuthenticationError()
+
+        user = await run_in_threadpool(self.repository.get_by_email, email)
 
-        if not user or not user.verify_password(password):
+        if not user:
+            if unknown_emails is not None:
+                unknown_emails.add(email)
+
+            raise AuthenticationError()
+
+        if not await PasswordHasher.verify_async(password, user.password):
             raise AuthenticationError()
 
-        public_user = PublicUserSchema(**user.model_dump())
+        # Senhas gravadas com um custo menor que o calibrado são refeitas agora, enquanto a senha está disponível.
+        if PasswordHasher.needs_rehash(user.password):
+            await run_in_threadpool(self.repository.update_password, user.id, await PasswordHasher.hash_async(password))
+
+        public_user = PublicUserSchema.model_validate(user)
         access_token = AuthService.create_access_token(public_user.model_dump())
         return access_token
 
-    def all(self, role: Roles) -> list[PublicUserSchema]:
-        users = self.repository.get_all(role)
-        return [PublicUserSchema(**user.model_dump()) for user in users]
+    def all(
+        self, role: Roles, cursor: Optional[str] = None, limit: Optional[int] = None
+    ) -> PageSchema[PublicUserSchema]:
+        users = self.repository.get_all(role, cursor, limit)
+        return PageSchema(items=PUBLIC_USER_LIST.validate_python(users.items), next_cursor=users.next_cursor)
+
+    def stream(self, role: Roles, cursor: Optional[str] = None) -> Iterator[PublicUserSchema]:
+        for user in self.repository.stream(role, cursor):
+            yield PublicUserSchema.model_validate(user)
 
     def get_by_id(self, user_id: UUID) -> PublicUserSchema:
         user = self.repository.get_by_id(user_id)
@@ -98,4 +149,4 @@ class UserService:
         if not user:
             raise UserNotFoundError()
 
-        return PublicUserSchema(**user.model_dump())
+        return PublicUserSchema.model_validate(user)
@@ -1,12 +1,61 @@
+from datetime import time
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
     DATABASE_URL: str
+    DATABASE_POOL_SIZE: int = 10
+    DATABASE_MAX_OVERFLOW: int = 20
+    DATABASE_POOL_TIMEOUT: int = 30
+    DATABASE_POOL_RECYCLE: int = 1800
+    DATABASE_POOL_PRE_PING: bool = True
+    DATABASE_POOL_WARM_UP: int = 2
+    DATABASE_STATEMENT_TIMEOUT: int = 0
+    DATABASE_ASYNC: bool = False
+    DATABASE_ASYNC_URL: str | None = None
+
+    APPOINTMENT_INDEX_ENABLED: bool = False
+    APPOINTMENT_INDEX_MAX_PROFESSIONALS: int = 1000
+    APPOINTMENT_INDEX_MAX_ENTRIES: int = 100_000
+    APPOINTMENT_INDEX_RECONCILE_SECONDS: int = 60
+    APPOINTMENT_BATCH_MAX_SIZE: int = 5000
+    APPOINTMENT_SERIES_WINDOW_DAYS: int = 28
+    APPOINTMENT_SERIES_MAX_OCCURRENCES: int = 260
+    APPOINTMENT_SERIES_MATERIALIZE_SECONDS: float = 600.0
+
+    PAGINATION_DEFAULT_LIMIT: int = 50
+    PAGINATION_MAX_LIMIT: int = 500
+    STREAM_YIELD_PER: int = 500
+
+    WORKING_HOURS_START: time = time(8)
+    WORKING_HOURS_END: time = time(18)
+    WORKING_DAYS: list[int] = [0, 1, 2, 3, 4]
+    AVAILABILITY_SLOT_MINUTES: int = 15
+    AVAILABILITY_MAX_DAYS: int = 31
 
     SECRET_KEY: str
     ALGORITHM: str
     ACCESS_TOKEN_EXPIRE_MINUTES: int
+    TOKEN_CACHE_MAX_ENTRIES: int = 10_000
+    REVOCATION_FILTER_CAPACITY: int = 100_000
+    REVOCATION_FILTER_ERROR_RATE: float = 0.01
+    REVOCATION_SYNC_SECONDS: float = 1.0
+    REVOCATION_REBUILD_SECONDS: float = 60.0
+    PASSWORD_HASH_ROUNDS: int = 12
+    PASSWORD_HASH_MAX_ROUNDS: int = 16
+    PASSWORD_HASH_TARGET_MS: int = 250
+    PASSWORD_HASH_WORKERS: int = 0
+    PASSWORD_HASH_MAX_PENDING: int = 64
+    LOGIN_THROTTLE_ENABLED: bool = True
+    LOGIN_CLIENT_BURST: int = 20
+    LOGIN_CLIENT_PER_MINUTE: int = 60
+    LOGIN_EMAIL_BURST: int = 5
+    LOGIN_EMAIL_PER_MINUTE: int = 10
+    LOGIN_THROTTLE_MAX_KEYS: int = 100_000
+    UNKNOWN_EMAIL_CACHE_SECONDS: int = 60
+    UNKNOWN_EMAIL_CACHE_MAX_ENTRIES: int = 100_000
+    CACHE_STATS_LOG_SECONDS: float = 300.0
     TIMEZONE: str
 
     model_config = SettingsConfigDict(env_file='.env')